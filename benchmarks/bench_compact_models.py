@@ -0,0 +1,122 @@
+# coding=utf-8
+"""
+数据模型内存基准：普通 dataclass vs __slots__ 紧凑模型
+
+构造连续多天的热榜日库后，分别用原 dataclass 定义（每个实例带 __dict__、
+ranks 为列表、字符串不驻留）和当前紧凑模型加载整个日期范围
+（每天 get_today_all_data），用 tracemalloc 统计常驻内存，并校验内容一致。
+
+用法:
+    python -m benchmarks.bench_compact_models [--days 30] [--platforms 10] [--crawls 12] [--per-crawl 30]
+"""
+
+import argparse
+import contextlib
+import gc
+import io
+import random
+import shutil
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Any, Callable, List, Tuple
+from unittest.mock import patch
+
+from benchmarks.bench_keyword_matcher import CHARS
+from trendradar.storage import StorageManager
+from trendradar.storage.base import NewsData, NewsItem
+
+
+@dataclass
+class LegacyNewsItem:
+    """改造前的 NewsItem 定义（对照组）"""
+
+    title: str
+    source_id: str
+    source_name: str = ""
+    rank: int = 0
+    url: str = ""
+    mobile_url: str = ""
+    crawl_time: str = ""
+    ranks: List[int] = field(default_factory=list)
+    first_time: str = ""
+    last_time: str = ""
+    count: int = 1
+
+
+def load_range(storage: StorageManager, dates: List[str]) -> List[Any]:
+    return [storage.get_today_all_data(day) for day in dates]
+
+
+def measure(func: Callable[[], Any]) -> Tuple[Any, float, int]:
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, current
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="数据模型内存基准")
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--platforms", type=int, default=10)
+    parser.add_argument("--crawls", type=int, default=12)
+    parser.add_argument("--per-crawl", type=int, default=30, help="每个平台每次抓取的条目数")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    data_dir = tempfile.mkdtemp()
+    start_day = date(2026, 1, 1)
+    dates = [(start_day + timedelta(days=i)).isoformat() for i in range(args.days)]
+
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            storage = StorageManager(backend_type="local", data_dir=data_dir, timezone="Asia/Shanghai")
+            platform_ids = [f"p{i}" for i in range(args.platforms)]
+            for day in dates:
+                pools = {pid: [] for pid in platform_ids}
+                for crawl in range(args.crawls):
+                    crawl_time = f"{crawl * 2:02d}-00"
+                    items = {}
+                    for pid in platform_ids:
+                        pool = pools[pid]
+                        keep = rng.sample(pool, min(len(pool), args.per_crawl * 7 // 10))
+                        while len(keep) < args.per_crawl:
+                            title = "".join(rng.choice(CHARS) for _ in range(rng.randint(12, 30)))
+                            pool.append((title, f"https://{pid}.example.com/{day}/{len(pool)}"))
+                            keep.append(pool[-1])
+                        items[pid] = [
+                            NewsItem(title=t, source_id=pid, source_name=pid, rank=r, url=u, crawl_time=crawl_time)
+                            for r, (t, u) in enumerate(keep, 1)
+                        ]
+                    storage.save_news_data(NewsData(date=day, crawl_time=crawl_time, items=items,
+                                                    id_to_name={pid: pid for pid in platform_ids}, failed_ids=[]))
+
+            with patch("trendradar.storage.local.NewsItem", LegacyNewsItem):
+                legacy, legacy_time, legacy_size = measure(lambda: load_range(storage, dates))
+            compact, compact_time, compact_size = measure(lambda: load_range(storage, dates))
+            storage.cleanup()
+
+        for old, new in zip(legacy, compact):
+            assert list(old.items) == list(new.items)
+            for source_id, news_list in old.items.items():
+                assert [vars(item) for item in news_list] == [item.to_dict() for item in new.items[source_id]], \
+                    "紧凑模型与原模型内容不一致"
+
+        total = sum(data.get_total_count() for data in compact)
+        print(f"日期 {args.days} 天，平台 {args.platforms} 个，共 {total} 条")
+        print(f"普通 dataclass: 常驻 {legacy_size / 1e6:.1f}MB，{legacy_time:.3f}s")
+        print(f"紧凑模型:       常驻 {compact_size / 1e6:.1f}MB，{compact_time:.3f}s")
+        print(f"内存节省: {1 - compact_size / legacy_size:.0%}")
+    finally:
+        shutil.rmtree(data_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+# coding=utf-8
+"""
+当日汇总基准：整天读取重算 vs 增量汇总状态
+
+模拟一天内多次抓取（每次各平台部分标题更新、部分新增），在最后一个批次上对比：
+- 整天读取：read_all_today_titles_from_storage + count_word_frequency
+- 增量状态：load_daily_aggregation（只合并最新批次）+ count_word_frequency(aggregation=...)
+并校验两者统计结果完全一致。
+
+用法:
+    python -m benchmarks.bench_daily_aggregation [--platforms 10] [--crawls 48] [--per-crawl 50]
+"""
+
+import argparse
+import contextlib
+import io
+import random
+import shutil
+import tempfile
+import time
+
+from benchmarks.bench_keyword_matcher import CHARS, build_config
+from trendradar.core.aggregation import load_daily_aggregation
+from trendradar.core.analyzer import count_word_frequency
+from trendradar.core.data import read_all_today_titles_from_storage
+from trendradar.storage import StorageManager
+from trendradar.storage.base import NewsData, NewsItem
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="当日汇总基准")
+    parser.add_argument("--platforms", type=int, default=10)
+    parser.add_argument("--crawls", type=int, default=48)
+    parser.add_argument("--per-crawl", type=int, default=50, help="每个平台每次抓取的条目数")
+    parser.add_argument("--groups", type=int, default=100)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    word_groups, filter_words, global_filters = build_config(args.groups)
+    data_dir = tempfile.mkdtemp()
+    quiet = io.StringIO()
+
+    try:
+        storage = StorageManager(backend_type="local", data_dir=data_dir, timezone="Asia/Shanghai")
+        date = storage.get_backend()._format_date_folder()
+        platform_ids = [f"p{i}" for i in range(args.platforms)]
+        pools = {pid: [] for pid in platform_ids}
+
+        for crawl in range(args.crawls):
+            crawl_time = f"{crawl // 4:02d}-{crawl % 4 * 15:02d}"
+            items = {}
+            for pid in platform_ids:
+                pool = pools[pid]
+                # 约 70% 沿用已有标题，其余为新标题
+                keep = rng.sample(pool, min(len(pool), args.per_crawl * 7 // 10))
+                while len(keep) < args.per_crawl:
+                    title = "".join(rng.choice(CHARS) for _ in range(rng.randint(12, 30)))
+                    entry = (title, f"https://{pid}.example.com/{len(pool)}")
+                    pool.append(entry)
+                    keep.append(entry)
+                items[pid] = [
+                    NewsItem(title=title, source_id=pid, source_name=pid, rank=rank, url=url, crawl_time=crawl_time)
+                    for rank, (title, url) in enumerate(keep, 1)
+                ]
+            with contextlib.redirect_stdout(quiet):
+                storage.save_news_data(NewsData(date=date, crawl_time=crawl_time, items=items,
+                                                id_to_name={pid: pid for pid in platform_ids}, failed_ids=[]))
+                # 每个批次之后更新状态，模拟每次运行
+                if crawl < args.crawls - 1:
+                    load_daily_aggregation(storage, word_groups, filter_words, global_filters, platform_ids)
+
+        with contextlib.redirect_stdout(quiet):
+            start = time.perf_counter()
+            results, id_to_name, title_info = read_all_today_titles_from_storage(storage, platform_ids)
+            expected = count_word_frequency(results, word_groups, filter_words, id_to_name, title_info,
+                                            mode="daily", global_filters=global_filters, quiet=True)
+            full_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            aggregation = load_daily_aggregation(storage, word_groups, filter_words, global_filters, platform_ids)
+            actual = count_word_frequency({}, word_groups, filter_words, aggregation.id_to_name,
+                                          mode="daily", global_filters=global_filters, quiet=True,
+                                          aggregation=aggregation)
+            incremental_time = time.perf_counter() - start
+
+        assert actual == expected, "增量汇总与整天重算结果不一致"
+
+        print(f"平台 {args.platforms} 个，批次 {args.crawls} 个，当天标题 {expected[1]} 条")
+        print(f"整天读取重算: {full_time:.3f}s")
+        print(f"增量汇总状态: {incremental_time:.3f}s")
+        print(f"加速比: {full_time / incremental_time:.1f}x")
+        storage.cleanup()
+    finally:
+        shutil.rmtree(data_dir)
+
+
+if __name__ == "__main__":
+    main()
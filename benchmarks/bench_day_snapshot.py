@@ -0,0 +1,115 @@
+# coding=utf-8
+"""
+单日数据内存基准：NewsData + 嵌套字典 vs DaySnapshot 视图
+
+构造一天的热榜日库后，分别用 tracemalloc 统计：
+- 旧路径：get_today_all_data → results / title_info 两份嵌套字典
+- 新路径：get_today_snapshot → results_view / title_info_view
+的内存峰值与常驻大小，并校验两者内容一致。
+
+用法:
+    python -m benchmarks.bench_day_snapshot [--platforms 20] [--crawls 48] [--per-crawl 50]
+"""
+
+import argparse
+import contextlib
+import gc
+import io
+import random
+import shutil
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable, Tuple
+
+from benchmarks.bench_keyword_matcher import CHARS
+from trendradar.storage import StorageManager
+from trendradar.storage.base import NewsData, NewsItem
+
+
+def legacy_read(storage: StorageManager) -> Tuple[dict, dict, dict]:
+    """旧实现：NewsData 转为 results / title_info 两份嵌套字典"""
+    news_data = storage.get_today_all_data()
+    results: dict = {}
+    title_info: dict = {}
+    for source_id, news_list in news_data.items.items():
+        results[source_id] = {}
+        title_info[source_id] = {}
+        for item in news_list:
+            results[source_id][item.title] = {
+                "ranks": item.ranks, "url": item.url or "", "mobileUrl": item.mobile_url or "",
+            }
+            title_info[source_id][item.title] = {
+                "first_time": item.first_time, "last_time": item.last_time, "count": item.count,
+                "ranks": item.ranks, "url": item.url or "", "mobileUrl": item.mobile_url or "",
+            }
+    return results, dict(news_data.id_to_name), title_info
+
+
+def snapshot_read(storage: StorageManager) -> Tuple[Any, dict, Any]:
+    snapshot = storage.get_today_snapshot()
+    return snapshot.results_view(), snapshot.names_for(), snapshot.title_info_view()
+
+
+def measure(func: Callable[[], Any]) -> Tuple[Any, float, int, int]:
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, current, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="单日数据内存基准")
+    parser.add_argument("--platforms", type=int, default=20)
+    parser.add_argument("--crawls", type=int, default=48)
+    parser.add_argument("--per-crawl", type=int, default=50, help="每个平台每次抓取的条目数")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    data_dir = tempfile.mkdtemp()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            storage = StorageManager(backend_type="local", data_dir=data_dir, timezone="Asia/Shanghai")
+            date = storage.get_backend()._format_date_folder()
+            platform_ids = [f"p{i}" for i in range(args.platforms)]
+            pools = {pid: [] for pid in platform_ids}
+            for crawl in range(args.crawls):
+                crawl_time = f"{crawl // 4:02d}-{crawl % 4 * 15:02d}"
+                items = {}
+                for pid in platform_ids:
+                    pool = pools[pid]
+                    keep = rng.sample(pool, min(len(pool), args.per_crawl * 7 // 10))
+                    while len(keep) < args.per_crawl:
+                        title = "".join(rng.choice(CHARS) for _ in range(rng.randint(12, 30)))
+                        pool.append((title, f"https://{pid}.example.com/{len(pool)}"))
+                        keep.append(pool[-1])
+                    items[pid] = [
+                        NewsItem(title=t, source_id=pid, source_name=pid, rank=r, url=u, crawl_time=crawl_time)
+                        for r, (t, u) in enumerate(keep, 1)
+                    ]
+                storage.save_news_data(NewsData(date=date, crawl_time=crawl_time, items=items,
+                                                id_to_name={pid: pid for pid in platform_ids}, failed_ids=[]))
+
+            legacy, legacy_time, legacy_size, legacy_peak = measure(lambda: legacy_read(storage))
+            views, snapshot_time, snapshot_size, snapshot_peak = measure(lambda: snapshot_read(storage))
+
+        for old, new in ((legacy[0], views[0]), (legacy[2], views[2])):
+            assert list(old) == list(new)
+            for source_id in old:
+                assert old[source_id] == dict(new[source_id].items()), "快照视图与嵌套字典内容不一致"
+
+        total = sum(len(titles) for titles in legacy[0].values())
+        print(f"平台 {args.platforms} 个，批次 {args.crawls} 个，当天标题 {total} 条")
+        print(f"嵌套字典: 常驻 {legacy_size / 1e6:.1f}MB，峰值 {legacy_peak / 1e6:.1f}MB，{legacy_time:.3f}s")
+        print(f"列式快照: 常驻 {snapshot_size / 1e6:.1f}MB，峰值 {snapshot_peak / 1e6:.1f}MB，{snapshot_time:.3f}s")
+        storage.cleanup()
+    finally:
+        shutil.rmtree(data_dir)
+
+
+if __name__ == "__main__":
+    main()
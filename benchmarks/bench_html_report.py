@@ -0,0 +1,91 @@
+# coding=utf-8
+"""
+HTML 报告写入基准：整页字符串 vs 流式片段
+
+用大报告分别按改造前的方式（render_html_content 拼出整页后写入，
+当日汇总再原样写入两份 index.html）和当前方式（iter_html_content 边渲染边写入，
+index.html 直接复制文件）生成报告，用 tracemalloc 统计峰值内存并校验文件一致。
+
+用法:
+    python -m benchmarks.bench_html_report [--titles 20000] [--repeat 3]
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Callable, Tuple
+
+from benchmarks.bench_splitter import build_report
+from trendradar.report import iter_html_content, render_html_content, write_html
+
+
+def write_whole_page(report, out_dir: str) -> None:
+    report_data, rss_items, rss_new_items = report
+    html_content = render_html_content(
+        report_data, 0, True, "daily", None,
+        get_time_func=lambda: datetime(2026, 1, 2, 10, 0),
+        rss_items=rss_items, rss_new_items=rss_new_items,
+    )
+    for name in ("当日汇总.html", "index.html", "index_output.html"):
+        with open(os.path.join(out_dir, name), "w", encoding="utf-8") as f:
+            f.write(html_content)
+
+
+def write_streaming(report, out_dir: str) -> None:
+    report_data, rss_items, rss_new_items = report
+    file_path = os.path.join(out_dir, "当日汇总.html")
+    with open(file_path, "w", encoding="utf-8") as f:
+        write_html(f, iter_html_content(
+            report_data, 0, True, "daily", None,
+            get_time_func=lambda: datetime(2026, 1, 2, 10, 0),
+            rss_items=rss_items, rss_new_items=rss_new_items,
+        ))
+    for name in ("index.html", "index_output.html"):
+        shutil.copyfile(file_path, os.path.join(out_dir, name))
+
+
+def measure(func: Callable[[], None], repeat: int) -> Tuple[float, int]:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="HTML 报告写入基准")
+    parser.add_argument("--titles", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    report = build_report(args.titles)
+    whole_dir = tempfile.mkdtemp()
+    stream_dir = tempfile.mkdtemp()
+    try:
+        whole_time, whole_peak = measure(lambda: write_whole_page(report, whole_dir), args.repeat)
+        stream_time, stream_peak = measure(lambda: write_streaming(report, stream_dir), args.repeat)
+
+        for name in ("当日汇总.html", "index.html", "index_output.html"):
+            with open(os.path.join(whole_dir, name), "rb") as a, open(os.path.join(stream_dir, name), "rb") as b:
+                assert a.read() == b.read(), f"{name} 内容不一致"
+
+        size = os.path.getsize(os.path.join(stream_dir, "当日汇总.html"))
+        print(f"标题 {args.titles} 条，页面 {size / 1e6:.1f}MB")
+        print(f"整页字符串: 峰值 {whole_peak / 1e6:.1f}MB，{whole_time:.3f}s")
+        print(f"流式片段:   峰值 {stream_peak / 1e6:.1f}MB，{stream_time:.3f}s")
+    finally:
+        shutil.rmtree(whole_dir)
+        shutil.rmtree(stream_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+# coding=utf-8
+"""
+关键词匹配基准：matches_word_groups vs KeywordMatcher
+
+在合成的词组与标题上对比逐词子串检查与 Aho-Corasick 单次扫描，
+并校验两者对每条标题的匹配结果完全一致。
+
+用法:
+    python -m benchmarks.bench_keyword_matcher [--groups 300] [--titles 20000]
+"""
+
+import argparse
+import random
+import time
+from typing import Dict, List, Tuple
+
+from trendradar.core.frequency import KeywordMatcher, matches_word_groups
+
+
+CHARS = "的一是在不了有和人这中大为上个国我以要他时来用们生到作地于出就分对成会可主发年动同工也能下过子说产种面而方后多定行学法所民得经"
+
+
+def build_config(groups: int, seed: int = 42) -> Tuple[List[Dict], List[str], List[str]]:
+    """构造词组配置：每组 1~4 个普通词，约 20% 的组带必须词"""
+    rng = random.Random(seed)
+
+    def word() -> str:
+        return "".join(rng.choice(CHARS) for _ in range(rng.randint(2, 4)))
+
+    word_groups = []
+    for _ in range(groups):
+        normal = [word() for _ in range(rng.randint(1, 4))]
+        required = [word()] if rng.random() < 0.2 else []
+        word_groups.append({
+            "required": required,
+            "normal": normal,
+            "group_key": " ".join(normal),
+            "max_count": 0,
+        })
+    filter_words = [word() for _ in range(20)]
+    global_filters = [word() for _ in range(10)]
+    return word_groups, filter_words, global_filters
+
+
+def build_titles(count: int, seed: int = 7) -> List[str]:
+    rng = random.Random(seed)
+    return ["".join(rng.choice(CHARS) for _ in range(rng.randint(12, 40))) for _ in range(count)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="关键词匹配基准")
+    parser.add_argument("--groups", type=int, default=300)
+    parser.add_argument("--titles", type=int, default=20000)
+    args = parser.parse_args()
+
+    word_groups, filter_words, global_filters = build_config(args.groups)
+    titles = build_titles(args.titles)
+
+    start = time.perf_counter()
+    expected = [matches_word_groups(t, word_groups, filter_words, global_filters) for t in titles]
+    baseline = time.perf_counter() - start
+
+    start = time.perf_counter()
+    matcher = KeywordMatcher(word_groups, filter_words, global_filters)
+    compile_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    actual = [matcher.matches(t) for t in titles]
+    compiled = time.perf_counter() - start
+
+    assert actual == expected, "KeywordMatcher 与 matches_word_groups 结果不一致"
+
+    print(f"词组 {args.groups} 个，标题 {args.titles} 条，匹配 {sum(actual)} 条")
+    print(f"matches_word_groups: {baseline:.3f}s")
+    print(f"KeywordMatcher:      {compiled:.3f}s（编译 {compile_time * 1000:.1f}ms）")
+    print(f"加速比: {baseline / compiled:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
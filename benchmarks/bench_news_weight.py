@@ -0,0 +1,90 @@
+# coding=utf-8
+"""
+新闻权重基准：逐条计算 vs 批量计算
+
+在合成的整天数据上对比排序键中逐条调用 calculate_news_weight 与
+calculate_news_weights 批量计算（纯 Python / NumPy），并校验权重逐位相同、
+排序结果完全一致。
+
+用法:
+    python -m benchmarks.bench_news_weight [--items 50000] [--repeat 3]
+"""
+
+import argparse
+import random
+import time
+from typing import Callable, List, Tuple
+
+from trendradar.core import analyzer
+from trendradar.core.analyzer import calculate_news_weight
+
+
+WEIGHT_CONFIG = {"RANK_WEIGHT": 0.6, "FREQUENCY_WEIGHT": 0.3, "HOTNESS_WEIGHT": 0.1}
+RANK_THRESHOLD = 5
+
+
+def build_items(count: int, seed: int = 42) -> Tuple[List[List[int]], List[int]]:
+    """构造排名列表（模拟一天内 1~48 次抓取）与出现次数"""
+    rng = random.Random(seed)
+    ranks_list = []
+    for _ in range(count):
+        base = rng.randint(1, 50)
+        ranks_list.append([max(1, base + rng.randint(-3, 3)) for _ in range(rng.randint(1, 48))])
+    counts = [len(ranks) for ranks in ranks_list]
+    return ranks_list, counts
+
+
+def sort_order(weights: List[float], ranks_list: List[List[int]], counts: List[int]) -> List[int]:
+    """与 count_word_frequency 相同的排序键"""
+    return sorted(
+        range(len(weights)),
+        key=lambda i: (-weights[i], min(ranks_list[i]), -counts[i]),
+    )
+
+
+def timed(func: Callable[[], List[float]], repeat: int) -> Tuple[float, List[float]]:
+    best, result = float("inf"), []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="新闻权重基准")
+    parser.add_argument("--items", type=int, default=50000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    ranks_list, counts = build_items(args.items)
+    factors = (WEIGHT_CONFIG["RANK_WEIGHT"], WEIGHT_CONFIG["FREQUENCY_WEIGHT"], WEIGHT_CONFIG["HOTNESS_WEIGHT"])
+
+    baseline_time, expected = timed(
+        lambda: [
+            calculate_news_weight({"ranks": ranks, "count": count}, RANK_THRESHOLD, WEIGHT_CONFIG)
+            for ranks, count in zip(ranks_list, counts)
+        ],
+        args.repeat,
+    )
+    expected_order = sort_order(expected, ranks_list, counts)
+    print(f"条目 {args.items} 条，平均每条 {sum(counts) / len(counts):.1f} 个排名")
+    print(f"逐条 calculate_news_weight: {baseline_time:.3f}s")
+
+    backends = [("纯 Python 批量", analyzer._calculate_news_weights_python)]
+    if analyzer.HAS_NUMPY:
+        backends.append(("NumPy 批量", analyzer._calculate_news_weights_numpy))
+    else:
+        print("NumPy 未安装，跳过 NumPy 实现")
+
+    for name, func in backends:
+        elapsed, weights = timed(
+            lambda: func(ranks_list, counts, RANK_THRESHOLD, *factors), args.repeat
+        )
+        assert weights == expected, f"{name} 权重与逐条计算不一致"
+        assert sort_order(weights, ranks_list, counts) == expected_order, f"{name} 排序结果不一致"
+        print(f"{name}: {elapsed:.3f}s（{baseline_time / elapsed:.1f}x，权重与排序一致）")
+
+
+if __name__ == "__main__":
+    main()
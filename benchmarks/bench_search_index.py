@@ -0,0 +1,159 @@
+# coding=utf-8
+"""
+跨日期关键词检索基准：逐天加载日库扫描 vs 检索索引
+
+用 LocalStorageBackend 写入一个月的热榜日库（保存时同步更新 search_index.db），
+然后按月范围检索关键词：
+- 旧路径：逐天 read_all_titles_for_date，加载全部标题后判断 `keyword.lower() in title.lower()`
+- 新路径：DataService.search_news_by_keyword（检索索引 + 只读取命中条目）
+两者都从冷缓存开始，统计耗时与 tracemalloc 峰值，并校验结果完全一致。
+
+用法:
+    python -m benchmarks.bench_search_index [--days 30] [--platforms 10] [--crawls 24] [--per-crawl 50]
+"""
+
+import argparse
+import contextlib
+import io
+import random
+import shutil
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+from benchmarks.bench_keyword_matcher import CHARS
+from mcp_server.services.cache_service import CacheService
+from mcp_server.services.data_service import DataService
+from mcp_server.services.parser_service import ParserService
+from mcp_server.utils.errors import DataNotFoundError
+from trendradar.storage.base import NewsData, NewsItem
+from trendradar.storage.local import LocalStorageBackend
+
+# 混入标题的英文词（大小写不同），用于校验大小写不敏感匹配
+ENGLISH_WORDS = ["AI", "OpenAI", "iPhone", "GPT-5", "Tesla"]
+KEYWORDS = ["openai", "iphone", "人工智", "AI"]
+START = datetime(2026, 1, 1)
+
+
+def build_month(root: Path, days: int, platforms: int, crawls: int, per_crawl: int, seed: int = 42) -> None:
+    """写入日库：每个平台每次抓取 per_crawl 条，约一半标题与上次抓取相同"""
+    rng = random.Random(seed)
+
+    def title() -> str:
+        text = "".join(rng.choice(CHARS) for _ in range(rng.randint(10, 30)))
+        if rng.random() < 0.05:
+            text += " " + rng.choice(ENGLISH_WORDS)
+        if rng.random() < 0.02:
+            text = "人工智能" + text
+        return text
+
+    backend = LocalStorageBackend(data_dir=str(root / "output"), enable_txt=False, enable_html=False)
+    with contextlib.redirect_stdout(io.StringIO()):
+        for day in range(days):
+            date = (START + timedelta(days=day)).strftime("%Y-%m-%d")
+            current = {f"p{i}": [title() for _ in range(per_crawl)] for i in range(platforms)}
+            for crawl in range(crawls):
+                crawl_time = f"{crawl // 2:02d}:{(crawl % 2) * 30:02d}"
+                items = {
+                    pid: [NewsItem(title=t, source_id=pid, source_name=pid, rank=rank,
+                                   url=f"https://example.com/{pid}/{day}/{hash(t)}", crawl_time=crawl_time)
+                          for rank, t in enumerate(titles, 1)]
+                    for pid, titles in current.items()
+                }
+                backend.save_news_data(NewsData(date=date, crawl_time=crawl_time, items=items,
+                                                id_to_name={pid: pid for pid in current}, failed_ids=[]))
+                for titles in current.values():
+                    for i in rng.sample(range(per_crawl), per_crawl // 2):
+                        titles[i] = title()
+        backend.cleanup()
+
+
+def legacy_search(parser: ParserService, keyword: str, start: datetime, end: datetime) -> List[Dict]:
+    """改造前的检索（对照组）：逐天加载全部标题后做子串判断"""
+    results = []
+    current_date = start
+    while current_date <= end:
+        try:
+            all_titles, id_to_name, _ = parser.read_all_titles_for_date(date=current_date)
+            for platform_id, titles in all_titles.items():
+                platform_name = id_to_name.get(platform_id, platform_id)
+                for title, info in titles.items():
+                    if keyword.lower() in title.lower():
+                        avg_rank = sum(info["ranks"]) / len(info["ranks"]) if info["ranks"] else 0
+                        results.append({
+                            "title": title,
+                            "platform": platform_id,
+                            "platform_name": platform_name,
+                            "ranks": info["ranks"],
+                            "count": len(info["ranks"]),
+                            "avg_rank": round(avg_rank, 2),
+                            "url": info.get("url", ""),
+                            "mobileUrl": info.get("mobileUrl", ""),
+                            "date": current_date.strftime("%Y-%m-%d")
+                        })
+        except DataNotFoundError:
+            pass
+        current_date += timedelta(days=1)
+    return results
+
+
+def measure(func: Callable[[], Any]) -> Tuple[Any, float, int]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="跨日期关键词检索基准")
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--platforms", type=int, default=10)
+    parser.add_argument("--crawls", type=int, default=24)
+    parser.add_argument("--per-crawl", type=int, default=50)
+    args = parser.parse_args()
+
+    root = Path(tempfile.mkdtemp())
+    try:
+        start = time.perf_counter()
+        build_month(root, args.days, args.platforms, args.crawls, args.per_crawl)
+        print(f"写入 {args.days} 天日库（含检索索引）: {time.perf_counter() - start:.1f}s")
+
+        end_date = START + timedelta(days=args.days - 1)
+
+        # 关闭连接时的 WAL checkpoint 改变了日库状态，读取方首次查询前按状态补齐索引
+        start = time.perf_counter()
+        ParserService(project_root=str(root)).search_titles("", START, end_date)
+        print(f"读取方补齐索引: {time.perf_counter() - start:.3f}s")
+
+        for keyword in KEYWORDS:
+            legacy_parser = ParserService(project_root=str(root))
+            legacy_parser.cache = CacheService(sweep_interval=0)
+            expected, legacy_time, legacy_peak = measure(
+                lambda: legacy_search(legacy_parser, keyword, START, end_date)
+            )
+
+            service = DataService(project_root=str(root))
+            service.parser.cache = CacheService(sweep_interval=0)
+            try:
+                actual, index_time, index_peak = measure(
+                    lambda: service.search_news_by_keyword(keyword, (START, end_date))["results"]
+                )
+            except DataNotFoundError:
+                actual, index_time, index_peak = [], 0.0, 0
+
+            assert actual == expected, f"'{keyword}' 检索结果不一致"
+            print(f"'{keyword}': 命中 {len(expected)} 条")
+            print(f"  逐天加载扫描: {legacy_time:.3f}s，峰值 {legacy_peak / 1e6:.1f}MB")
+            print(f"  检索索引:     {index_time:.3f}s，峰值 {index_peak / 1e6:.1f}MB")
+    finally:
+        shutil.rmtree(root)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+# coding=utf-8
+"""
+消息分批基准：字符串拼接 + 整体重编码 vs 片段列表 + 累计字节数
+
+构造包含热榜统计、新增热点、失败平台与 RSS 的大报告，对全部七种推送格式
+分别用改造前的分批策略（每追加一行都拼接字符串并把整个批次重新 UTF-8 编码
+比较大小）和当前线性实现生成批次，比较耗时并校验输出逐字节一致。
+
+用法:
+    python -m benchmarks.bench_splitter [--titles 2000] [--max-bytes 4000] [--repeat 3]
+"""
+
+import argparse
+import random
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from unittest.mock import patch
+
+from benchmarks.bench_keyword_matcher import CHARS
+from trendradar.notification.splitter import split_content_into_batches
+
+FORMATS = ["feishu", "dingtalk", "wework", "telegram", "ntfy", "bark", "slack"]
+SOURCES = ["知乎", "微博", "百度热搜", "今日头条", "Hacker News"]
+
+
+class LegacyBatchBuilder:
+    """改造前的分批策略（对照组）：字符串拼接，每次整体编码判断大小"""
+
+    def __init__(self, base_header: str, base_footer: str, max_bytes: int):
+        self.base_header = base_header
+        self.base_footer = base_footer
+        self.max_bytes = max_bytes
+        self.batches: List[str] = []
+        self.has_content = False
+        self.current = base_header
+
+    def _fits(self, fragment: str) -> bool:
+        return len((self.current + fragment).encode("utf-8")) + len(self.base_footer.encode("utf-8")) < self.max_bytes
+
+    def add(self, fragment: str, *restart_prefix: str) -> None:
+        if self._fits(fragment):
+            self.current += fragment
+        else:
+            if self.has_content:
+                self.batches.append(self.current + self.base_footer)
+            self.current = self.base_header + "".join(restart_prefix) + fragment
+        self.has_content = True
+
+    def add_if_fits(self, fragment: str) -> None:
+        if self._fits(fragment):
+            self.current += fragment
+
+    def append(self, fragment: str) -> None:
+        self.current += fragment
+
+    def finish(self) -> List[str]:
+        if self.has_content:
+            self.batches.append(self.current + self.base_footer)
+            self.has_content = False
+            self.current = self.base_header
+        return self.batches
+
+
+def build_report(titles: int, seed: int = 42) -> Tuple[Dict, List[Dict], List[Dict]]:
+    """构造 report_data 以及 RSS 统计/新增列表，热榜统计占约 80% 的标题"""
+    rng = random.Random(seed)
+    counter = 0
+
+    def title_data(keyword: str) -> Dict:
+        nonlocal counter
+        counter += 1
+        return {
+            "title": "".join(rng.choice(CHARS) for _ in range(rng.randint(12, 36))),
+            "source_name": rng.choice(SOURCES),
+            "time_display": rng.choice(["", "[08:00 ~ 12:30]", "10:15"]),
+            "count": rng.randint(1, 8),
+            "ranks": sorted(rng.sample(range(1, 51), rng.randint(1, 3))),
+            "rank_threshold": 5,
+            "url": f"https://example.com/news/{counter}",
+            "mobile_url": rng.choice(["", f"https://m.example.com/news/{counter}"]),
+            "is_new": rng.random() < 0.2,
+            "matched_keyword": keyword,
+        }
+
+    def groups(total: int, group_count: int) -> List[Dict]:
+        result = []
+        for i in range(group_count):
+            word = f"关键词{i}"
+            size = total // group_count + (1 if i < total % group_count else 0)
+            result.append({"word": word, "count": size, "titles": [title_data(word) for _ in range(size)]})
+        return result
+
+    stats_total = titles * 8 // 10
+    new_total = titles * 1 // 10
+    rss_total = titles - stats_total - new_total
+    new_titles = []
+    for i, source in enumerate(SOURCES):
+        size = new_total // len(SOURCES) + (1 if i < new_total % len(SOURCES) else 0)
+        new_titles.append({"source_id": f"s{i}", "source_name": source,
+                           "titles": [title_data("") for _ in range(size)]})
+    report_data = {
+        "stats": groups(stats_total, 40),
+        "new_titles": new_titles,
+        "failed_ids": ["toutiao", "douyin"],
+        "total_new_count": new_total,
+    }
+    return report_data, groups(rss_total - rss_total // 2, 5), groups(rss_total // 2, 5)
+
+
+def render_all(report: Tuple[Dict, List[Dict], List[Dict]], max_bytes: Optional[int]) -> Dict[str, List[str]]:
+    report_data, rss_items, rss_new_items = report
+    return {
+        fmt: split_content_into_batches(
+            report_data, fmt, max_bytes=max_bytes, mode="daily",
+            get_time_func=lambda: datetime(2026, 1, 2, 10, 0),
+            rss_items=rss_items, rss_new_items=rss_new_items,
+        )
+        for fmt in FORMATS
+    }
+
+
+def best_of(repeat: int, func) -> Tuple[Dict[str, List[str]], float]:
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="消息分批基准")
+    parser.add_argument("--titles", type=int, default=2000)
+    parser.add_argument("--max-bytes", type=int, default=None, help="默认按各格式的配置大小")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    report = build_report(args.titles)
+    with patch("trendradar.notification.splitter._BatchBuilder", LegacyBatchBuilder):
+        legacy, legacy_time = best_of(args.repeat, lambda: render_all(report, args.max_bytes))
+    linear, linear_time = best_of(args.repeat, lambda: render_all(report, args.max_bytes))
+
+    assert legacy == linear, "线性分批与原分批输出不一致"
+
+    print(f"标题 {args.titles} 条，格式 {len(FORMATS)} 种")
+    for fmt in FORMATS:
+        size = sum(len(batch.encode("utf-8")) for batch in linear[fmt])
+        print(f"  {fmt:<9} {len(linear[fmt]):>4} 批，{size / 1e3:.1f}KB")
+    print(f"拼接 + 整体编码: {legacy_time:.3f}s")
+    print(f"片段 + 累计字节: {linear_time:.3f}s")
+    print(f"加速比: {legacy_time / linear_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
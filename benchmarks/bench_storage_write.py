@@ -0,0 +1,123 @@
+# coding=utf-8
+"""
+存储写入基准：逐条写入 vs 批量写入
+
+在合成数据上对比 SQLiteBatchWriter 的两条写入路径，并校验两者的
+新增/更新/标题变更计数及写入结果完全一致。
+
+用法:
+    python -m benchmarks.bench_storage_write [--items 5000] [--crawls 3]
+"""
+
+import argparse
+import random
+import tempfile
+import time
+from typing import Dict, List, Tuple
+
+from trendradar.storage.base import NewsData, NewsItem
+from trendradar.storage.local import LocalStorageBackend
+
+
+DATE = "2026-01-01"
+NOW_STR = f"{DATE} 00:00:00"
+
+
+def build_crawls(total_items: int, crawls: int, platforms: int = 30, seed: int = 42) -> List[NewsData]:
+    """
+    构造多批次合成数据
+
+    第一批全部为新增；之后每批约 80% 为已有 URL（其中 5% 标题变化），
+    20% 为新 URL，另有少量空 URL 条目。
+    """
+    rng = random.Random(seed)
+    per_platform = max(1, total_items // platforms)
+    platform_ids = [f"platform-{i:02d}" for i in range(platforms)]
+    next_serial = {pid: per_platform for pid in platform_ids}
+
+    result = []
+    for crawl_index in range(crawls):
+        items: Dict[str, List[NewsItem]] = {}
+        for pid in platform_ids:
+            known = list(range(next_serial[pid]))
+            rng.shuffle(known)
+            news_list = []
+            for rank in range(1, per_platform + 1):
+                if crawl_index == 0:
+                    serial = rank - 1
+                elif rng.random() < 0.8:
+                    serial = known.pop()
+                else:
+                    serial = next_serial[pid]
+                    next_serial[pid] += 1
+
+                title = f"{pid} 新闻 {serial}"
+                if crawl_index and rng.random() < 0.05:
+                    title += f"（更新 {crawl_index}）"
+
+                url = "" if rng.random() < 0.01 else f"https://example.com/{pid}/{serial}"
+                news_list.append(NewsItem(title=title, source_id=pid, rank=rank, url=url))
+            items[pid] = news_list
+
+        result.append(NewsData(
+            date=DATE,
+            crawl_time=f"{8 + crawl_index:02d}-00",
+            items=items,
+            id_to_name={pid: pid for pid in platform_ids},
+        ))
+    return result
+
+
+def run_path(writer_name: str, crawls: List[NewsData]) -> Tuple[float, List[Tuple[int, int, int]], List]:
+    """在全新的临时库上运行指定写入路径，返回 (耗时, 每批计数, 写入结果)"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        backend = LocalStorageBackend(data_dir=temp_dir, enable_txt=False, enable_html=False)
+        conn = backend._get_connection(DATE)
+        writer = getattr(backend._writer, writer_name)
+
+        counts = []
+        start = time.perf_counter()
+        for data in crawls:
+            cursor = conn.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            counts.append(writer(cursor, data, NOW_STR))
+            conn.commit()
+        elapsed = time.perf_counter() - start
+
+        snapshot = [
+            list(conn.execute("SELECT id, title, url, rank, last_crawl_time, crawl_count FROM news_items ORDER BY id")),
+            list(conn.execute("SELECT news_item_id, rank, crawl_time FROM rank_history ORDER BY id")),
+            list(conn.execute("SELECT news_item_id, old_title, new_title FROM title_changes ORDER BY id")),
+        ]
+        snapshot = [[tuple(row) for row in rows] for rows in snapshot]
+        backend.cleanup()
+
+    return elapsed, counts, snapshot
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="存储写入基准：逐条 vs 批量")
+    parser.add_argument("--items", type=int, default=5000, help="每批条目数")
+    parser.add_argument("--crawls", type=int, default=3, help="抓取批次数")
+    args = parser.parse_args()
+
+    crawls = build_crawls(args.items, args.crawls)
+    total = sum(len(items) for data in crawls for items in data.items.values())
+    print(f"合成数据: {args.crawls} 批 × {total // args.crawls} 条")
+
+    rowwise_time, rowwise_counts, rowwise_rows = run_path("write_news_items_rowwise", crawls)
+    batched_time, batched_counts, batched_rows = run_path("write_news_items_batched", crawls)
+
+    print(f"{'路径':<8}{'耗时(秒)':>12}{'条/秒':>12}")
+    print(f"{'逐条':<8}{rowwise_time:>12.3f}{total / rowwise_time:>12.0f}")
+    print(f"{'批量':<8}{batched_time:>12.3f}{total / batched_time:>12.0f}")
+    print(f"加速比: {rowwise_time / batched_time:.1f}x")
+    print(f"每批计数 (新增, 更新, 标题变更): {batched_counts}")
+
+    if rowwise_counts != batched_counts or rowwise_rows != batched_rows:
+        raise SystemExit("❌ 批量路径与逐条路径结果不一致")
+    print("✅ 两条路径计数与写入结果一致")
+
+
+if __name__ == "__main__":
+    main()
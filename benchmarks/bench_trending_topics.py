@@ -0,0 +1,115 @@
+# coding=utf-8
+"""
+MCP 热点话题关注词统计基准：逐标题重新解析词文件 vs 缓存编译后单次扫描
+
+按改造前 DataService.get_trending_topics（keywords 模式）的做法，每条标题都重新读取、
+解析 frequency_words.txt 并逐词子串检查；当前做法由 ParserService 按文件修改时间
+缓存解析结果和编译后的 FrequencyWordCounter，对全部标题单次扫描计数。
+校验两者的词频（含 most_common 顺序）与命中标题数完全一致。
+
+用法:
+    python -m benchmarks.bench_trending_topics [--groups 300] [--titles 20000]
+"""
+
+import argparse
+import random
+import shutil
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from benchmarks.bench_keyword_matcher import build_config, build_titles
+from mcp_server.services.cache_service import CacheService
+from mcp_server.services.parser_service import ParserService
+
+# 大小写不同的英文关注词，用于校验区分大小写的统计语义
+MIXED_CASE_WORDS = ["AI", "ai", "OpenAI", "GPT", "gpt"]
+
+
+def write_words_file(path: Path, groups: int) -> None:
+    word_groups, filter_words, _ = build_config(groups)
+    lines = []
+    for i, group in enumerate(word_groups):
+        words = [f"{w}+" for w in group["required"]] + group["normal"]
+        if i < len(filter_words):
+            words.append(f"{filter_words[i]}!")
+        lines.append(",".join(words))
+    lines.append("|".join(MIXED_CASE_WORDS))
+    # 重复出现的词在旧统计中按出现次数计数
+    lines.append(word_groups[0]["normal"][0])
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def build_day(count: int, seed: int = 11) -> Dict[str, Dict[str, Dict]]:
+    rng = random.Random(seed)
+    titles = build_titles(count)
+    all_titles: Dict[str, Dict[str, Dict]] = {}
+    for i, title in enumerate(titles):
+        if rng.random() < 0.1:
+            title += " " + rng.choice(MIXED_CASE_WORDS + ["Ai", "openai"])
+        all_titles.setdefault(f"platform{i % 10}", {})[title] = {}
+    return all_titles
+
+
+def legacy_count(parser: ParserService, words_file: Path,
+                 all_titles: Dict[str, Dict[str, Dict]]) -> Tuple[Counter, Dict[str, List[str]]]:
+    """改造前的统计（对照组）：每条标题重新解析词文件"""
+    word_frequency = Counter()
+    keyword_to_news: Dict[str, List[str]] = {}
+    for titles in all_titles.values():
+        for title in titles.keys():
+            word_groups = parser._parse_frequency_file(words_file)
+            for group in word_groups:
+                for word in group.get("required", []) + group.get("normal", []):
+                    if word and word in title:
+                        word_frequency[word] += 1
+                        keyword_to_news.setdefault(word, []).append(title)
+    return word_frequency, keyword_to_news
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="MCP 热点话题关注词统计基准")
+    parser.add_argument("--groups", type=int, default=300)
+    parser.add_argument("--titles", type=int, default=20000)
+    args = parser.parse_args()
+
+    root = Path(tempfile.mkdtemp())
+    try:
+        words_file = root / "config" / "frequency_words.txt"
+        words_file.parent.mkdir(parents=True)
+        write_words_file(words_file, args.groups)
+        all_titles = build_day(args.titles)
+
+        service = ParserService(project_root=str(root))
+        service.cache = CacheService(sweep_interval=0)
+
+        start = time.perf_counter()
+        expected_freq, expected_news = legacy_count(service, words_file, all_titles)
+        legacy_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        service.get_frequency_counter()
+        compile_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        actual_freq, actual_news = service.get_frequency_counter().count(
+            title for titles in all_titles.values() for title in titles.keys()
+        )
+        count_time = time.perf_counter() - start
+
+        assert actual_freq.most_common() == expected_freq.most_common(), "词频统计不一致"
+        assert {w: len(set(t)) for w, t in expected_news.items()} == \
+            {w: len(t) for w, t in actual_news.items()}, "命中标题数不一致"
+
+        print(f"词组 {args.groups} 个，标题 {args.titles} 条，命中词 {len(actual_freq)} 个")
+        print(f"逐标题重新解析: {legacy_time:.3f}s")
+        print(f"缓存编译 + 单次扫描: {count_time:.3f}s（首次解析编译 {compile_time * 1000:.1f}ms）")
+        print(f"加速比: {legacy_time / count_time:.1f}x")
+    finally:
+        shutil.rmtree(root)
+
+
+if __name__ == "__main__":
+    main()
@@ -830,7 +830,7 @@ async def get_system_status() -> str:
     """
     获取系统运行状态和健康检查信息
 
-    返回系统版本、数据统计、缓存状态等信息
+    返回系统版本、数据统计、缓存状态（条目数、近似占用、命中/未命中/淘汰次数）等信息
 
     Returns:
         JSON格式的系统状态信息
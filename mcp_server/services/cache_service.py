@@ -1,56 +1,200 @@
 """
 缓存服务
 
-实现TTL缓存机制，提升数据访问性能。
+实现有界 TTL 缓存机制，提升数据访问性能。
+
+- 条目数与近似内存占用双重上限，超出时按 LRU 淘汰最久未访问的条目
+- 每个条目在写入时设置 TTL，过期条目由后台清理线程定期回收
+- 统计命中/未命中/淘汰/过期次数，通过 get_stats（及 get_system_status 工具）查看
 """
 
+import sys
+import threading
 import time
+from collections import OrderedDict
 from typing import Any, Optional
 from threading import Lock
 
 
+# 默认上限：条目数与近似内存占用
+DEFAULT_MAX_ENTRIES = 512
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+# 默认存活时间（秒）与后台清理间隔（秒）
+DEFAULT_TTL = 900
+DEFAULT_SWEEP_INTERVAL = 60
+# 永不过期（直到被 LRU 淘汰或删除），用于自带有效性校验的条目
+NO_EXPIRY = float("inf")
+
+# 估算内存占用时，超过该长度的容器只抽样测量后按比例推算
+_SIZE_SAMPLE = 64
+
+
+def estimate_size(value: Any, _seen: Optional[set] = None) -> int:
+    """
+    估算对象的近似内存占用（字节）
+
+    递归累加 sys.getsizeof，共享对象只计一次；普通对象沿 __dict__ 和各层 __slots__
+    递归（DaySnapshot、NewsItem 等使用 __slots__，没有 __dict__）；
+    大容器只测量前 _SIZE_SAMPLE 个元素并按长度推算，避免写入缓存时完整遍历大结果。
+
+    Args:
+        value: 待估算对象
+
+    Returns:
+        近似字节数
+    """
+    if _seen is None:
+        _seen = set()
+    obj_id = id(value)
+    if obj_id in _seen:
+        return 0
+    _seen.add(obj_id)
+
+    size = sys.getsizeof(value)
+    if isinstance(value, (str, bytes, bytearray, int, float, bool)) or value is None:
+        return size
+
+    if isinstance(value, dict):
+        items = value.items()
+        count = len(value)
+        sample = [estimate_size(k, _seen) + estimate_size(v, _seen)
+                  for _, (k, v) in zip(range(_SIZE_SAMPLE), items)]
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        count = len(value)
+        sample = [estimate_size(item, _seen) for _, item in zip(range(_SIZE_SAMPLE), value)]
+    else:
+        attrs = getattr(value, "__dict__", None)
+        if attrs is not None:
+            size += estimate_size(attrs, _seen)
+        for slot_value in _slot_values(value):
+            size += estimate_size(slot_value, _seen)
+        return size
+
+    if not sample:
+        return size
+    return size + sum(sample) * count // len(sample)
+
+
+def _slot_values(value: Any):
+    """遍历对象在各层 __slots__ 中已赋值的属性值"""
+    for cls in type(value).__mro__:
+        slots = cls.__dict__.get("__slots__", ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        for name in slots:
+            if name in ("__dict__", "__weakref__"):
+                continue
+            # 双下划线开头的私有槽位经过名称改写
+            if name.startswith("__") and not name.endswith("__"):
+                name = f"_{cls.__name__.lstrip('_')}{name}"
+            try:
+                yield getattr(value, name)
+            except AttributeError:
+                continue
+
+
+class _CacheEntry:
+    """缓存条目"""
+
+    __slots__ = ("value", "size", "created_at", "expires_at")
+
+    def __init__(self, value: Any, size: int, created_at: float, expires_at: float):
+        self.value = value
+        self.size = size
+        self.created_at = created_at
+        self.expires_at = expires_at
+
+
 class CacheService:
     """缓存服务类"""
 
-    def __init__(self):
-        """初始化缓存服务"""
-        self._cache = {}
-        self._timestamps = {}
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        default_ttl: int = DEFAULT_TTL,
+        sweep_interval: float = DEFAULT_SWEEP_INTERVAL,
+    ):
+        """
+        初始化缓存服务
+
+        Args:
+            max_entries: 最大条目数
+            max_bytes: 最大近似内存占用（字节）
+            default_ttl: 写入时未指定 TTL 时的默认存活时间（秒）
+            sweep_interval: 后台清理过期条目的间隔（秒），<= 0 表示不启动后台清理
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.sweep_interval = sweep_interval
+
+        self._cache: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self._total_bytes = 0
         self._lock = Lock()
 
-    def get(self, key: str, ttl: int = 900) -> Optional[Any]:
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+        self._sweeper: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+
+    def get(self, key: str) -> Optional[Any]:
         """
-        获取缓存数据
+        获取缓存数据（命中时刷新 LRU 顺序）
 
         Args:
             key: 缓存键
-            ttl: 存活时间（秒），默认15分钟
 
         Returns:
             缓存的值，如果不存在或已过期则返回None
         """
         with self._lock:
-            if key in self._cache:
-                # 检查是否过期
-                if time.time() - self._timestamps[key] < ttl:
-                    return self._cache[key]
-                else:
-                    # 已过期，删除缓存
-                    del self._cache[key]
-                    del self._timestamps[key]
+            entry = self._cache.get(key)
+            if entry is not None:
+                if time.time() < entry.expires_at:
+                    self._cache.move_to_end(key)
+                    self._hits += 1
+                    return entry.value
+                # 已过期，删除缓存
+                self._remove(key)
+                self._expirations += 1
+            self._misses += 1
         return None
 
-    def set(self, key: str, value: Any) -> None:
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
         """
         设置缓存数据
 
+        超出条目数或内存上限时淘汰最久未访问的条目；
+        单个值超过内存上限时不缓存。
+
         Args:
             key: 缓存键
             value: 缓存值
+            ttl: 存活时间（秒），默认使用 default_ttl；NO_EXPIRY 表示直到被淘汰
         """
+        size = estimate_size(value)
+        now = time.time()
+        expires_at = now + (self.default_ttl if ttl is None else ttl)
+
         with self._lock:
-            self._cache[key] = value
-            self._timestamps[key] = time.time()
+            if key in self._cache:
+                self._remove(key)
+            if size > self.max_bytes:
+                return
+
+            self._cache[key] = _CacheEntry(value, size, now, expires_at)
+            self._total_bytes += size
+
+            while len(self._cache) > self.max_entries or self._total_bytes > self.max_bytes:
+                oldest_key = next(iter(self._cache))
+                self._remove(oldest_key)
+                self._evictions += 1
+
+        self._ensure_sweeper()
 
     def delete(self, key: str) -> bool:
         """
@@ -64,37 +208,33 @@ class CacheService:
         """
         with self._lock:
             if key in self._cache:
-                del self._cache[key]
-                del self._timestamps[key]
+                self._remove(key)
                 return True
         return False
 
     def clear(self) -> None:
-        """清空所有缓存"""
+        """清空所有缓存（统计计数保留）"""
         with self._lock:
             self._cache.clear()
-            self._timestamps.clear()
+            self._total_bytes = 0
 
-    def cleanup_expired(self, ttl: int = 900) -> int:
+    def cleanup_expired(self) -> int:
         """
         清理过期缓存
 
-        Args:
-            ttl: 存活时间（秒）
-
         Returns:
             清理的条目数量
         """
         with self._lock:
             current_time = time.time()
             expired_keys = [
-                key for key, timestamp in self._timestamps.items()
-                if current_time - timestamp >= ttl
+                key for key, entry in self._cache.items()
+                if current_time >= entry.expires_at
             ]
 
             for key in expired_keys:
-                del self._cache[key]
-                del self._timestamps[key]
+                self._remove(key)
+            self._expirations += len(expired_keys)
 
             return len(expired_keys)
 
@@ -106,18 +246,53 @@ class CacheService:
             统计信息字典
         """
         with self._lock:
+            now = time.time()
+            created = [entry.created_at for entry in self._cache.values()]
+            lookups = self._hits + self._misses
             return {
                 "total_entries": len(self._cache),
-                "oldest_entry_age": (
-                    time.time() - min(self._timestamps.values())
-                    if self._timestamps else 0
-                ),
-                "newest_entry_age": (
-                    time.time() - max(self._timestamps.values())
-                    if self._timestamps else 0
-                )
+                "max_entries": self.max_entries,
+                "total_bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "oldest_entry_age": now - min(created) if created else 0,
+                "newest_entry_age": now - max(created) if created else 0,
             }
 
+    def stop_sweeper(self) -> None:
+        """停止后台清理线程"""
+        self._stop_event.set()
+        sweeper = self._sweeper
+        if sweeper is not None and sweeper is not threading.current_thread():
+            sweeper.join(timeout=1)
+        self._sweeper = None
+
+    def _remove(self, key: str) -> None:
+        """删除条目并扣减占用（调用方持有锁）"""
+        entry = self._cache.pop(key)
+        self._total_bytes -= entry.size
+
+    def _ensure_sweeper(self) -> None:
+        """首次写入时启动后台清理线程（守护线程，不阻止进程退出）"""
+        if self.sweep_interval <= 0 or self._sweeper is not None:
+            return
+        with self._lock:
+            if self._sweeper is not None:
+                return
+            self._stop_event.clear()
+            self._sweeper = threading.Thread(
+                target=self._sweep_loop, name="mcp-cache-sweeper", daemon=True
+            )
+            self._sweeper.start()
+
+    def _sweep_loop(self) -> None:
+        while not self._stop_event.wait(self.sweep_interval):
+            self.cleanup_expired()
+
 
 # 全局缓存实例
 _global_cache = None
@@ -65,7 +65,7 @@ class DataService:
         """
         # 尝试从缓存获取
         cache_key = f"latest_news:{','.join(platforms or [])}:{limit}:{include_url}"
-        cached = self.cache.get(cache_key, ttl=900)  # 15分钟缓存
+        cached = self.cache.get(cache_key)
         if cached:
             return cached
 
@@ -113,7 +113,7 @@ class DataService:
         result = news_list[:limit]
 
         # 缓存结果
-        self.cache.set(cache_key, result)
+        self.cache.set(cache_key, result, ttl=900)  # 15分钟缓存
 
         return result
 
@@ -150,7 +150,7 @@ class DataService:
         # 尝试从缓存获取
         date_str = target_date.strftime("%Y-%m-%d")
         cache_key = f"news_by_date:{date_str}:{','.join(platforms or [])}:{limit}:{include_url}"
-        cached = self.cache.get(cache_key, ttl=1800)  # 30分钟缓存
+        cached = self.cache.get(cache_key)
         if cached:
             return cached
 
@@ -193,7 +193,7 @@ class DataService:
         result = news_list[:limit]
 
         # 缓存结果(历史数据缓存更久)
-        self.cache.set(cache_key, result)
+        self.cache.set(cache_key, result, ttl=1800)  # 30分钟缓存
 
         return result
 
@@ -230,44 +230,26 @@ class DataService:
         results = []
         platform_distribution = Counter()
 
-        # 遍历日期范围
-        current_date = start_date
-        while current_date <= end_date:
-            try:
-                all_titles, id_to_name, _ = self.parser.read_all_titles_for_date(
-                    date=current_date,
-                    platform_ids=platforms
-                )
-
-                # 搜索包含关键词的标题
-                for platform_id, titles in all_titles.items():
-                    platform_name = id_to_name.get(platform_id, platform_id)
-
-                    for title, info in titles.items():
-                        if keyword.lower() in title.lower():
-                            # 计算平均排名
-                            avg_rank = sum(info["ranks"]) / len(info["ranks"]) if info["ranks"] else 0
-
-                            results.append({
-                                "title": title,
-                                "platform": platform_id,
-                                "platform_name": platform_name,
-                                "ranks": info["ranks"],
-                                "count": len(info["ranks"]),
-                                "avg_rank": round(avg_rank, 2),
-                                "url": info.get("url", ""),
-                                "mobileUrl": info.get("mobileUrl", ""),
-                                "date": current_date.strftime("%Y-%m-%d")
-                            })
-
-                            platform_distribution[platform_id] += 1
-
-            except DataNotFoundError:
-                # 该日期没有数据,继续下一天
-                pass
+        # 通过跨日期检索索引查找命中标题，只加载有命中的日期
+        for current_date, platform_id, platform_name, title, info in self.parser.iter_title_matches(
+            keyword, start_date, end_date, platforms
+        ):
+            # 计算平均排名
+            avg_rank = sum(info["ranks"]) / len(info["ranks"]) if info["ranks"] else 0
+
+            results.append({
+                "title": title,
+                "platform": platform_id,
+                "platform_name": platform_name,
+                "ranks": info["ranks"],
+                "count": len(info["ranks"]),
+                "avg_rank": round(avg_rank, 2),
+                "url": info.get("url", ""),
+                "mobileUrl": info.get("mobileUrl", ""),
+                "date": current_date.strftime("%Y-%m-%d")
+            })
 
-            # 下一天
-            current_date += timedelta(days=1)
+            platform_distribution[platform_id] += 1
 
         if not results:
             raise DataNotFoundError(
@@ -353,7 +335,7 @@ class DataService:
         """
         # 尝试从缓存获取
         cache_key = f"trending_topics:{top_n}:{mode}:{extract_mode}"
-        cached = self.cache.get(cache_key, ttl=1800)  # 30分钟缓存
+        cached = self.cache.get(cache_key)
         if cached:
             return cached
 
@@ -378,23 +360,17 @@ class DataService:
         word_frequency = Counter()
         keyword_to_news = {}
 
-        # 遍历要处理的标题
-        for platform_id, titles in titles_to_process.items():
-            for title in titles.keys():
-                if extract_mode == "keywords":
-                    # 基于预设关键词统计
-                    word_groups = self.parser.parse_frequency_words()
-                    for group in word_groups:
-                        all_words = group.get("required", []) + group.get("normal", [])
-                        for word in all_words:
-                            if word and word in title:
-                                word_frequency[word] += 1
-                                if word not in keyword_to_news:
-                                    keyword_to_news[word] = []
-                                keyword_to_news[word].append(title)
-
-                elif extract_mode == "auto_extract":
-                    # 自动提取关键词
+        if extract_mode == "keywords":
+            # 基于预设关键词统计：关注词文件按修改时间缓存并编译，单次扫描全部标题
+            counter = self.parser.get_frequency_counter()
+            word_frequency, keyword_to_news = counter.count(
+                title for titles in titles_to_process.values() for title in titles.keys()
+            )
+
+        elif extract_mode == "auto_extract":
+            # 自动提取关键词
+            for platform_id, titles in titles_to_process.items():
+                for title in titles.keys():
                     extracted_words = self._extract_words_from_title(title)
                     for word in extracted_words:
                         word_frequency[word] += 1
@@ -429,7 +405,7 @@ class DataService:
         }
 
         # 缓存结果
-        self.cache.set(cache_key, result)
+        self.cache.set(cache_key, result, ttl=1800)  # 30分钟缓存
 
         return result
 
@@ -462,7 +438,7 @@ class DataService:
         """
         # 尝试从缓存获取
         cache_key = f"config:{section}"
-        cached = self.cache.get(cache_key, ttl=3600)  # 1小时缓存
+        cached = self.cache.get(cache_key)
         if cached:
             return cached
 
@@ -536,7 +512,7 @@ class DataService:
             result = {}
 
         # 缓存结果
-        self.cache.set(cache_key, result)
+        self.cache.set(cache_key, result, ttl=3600)  # 1小时缓存
 
         return result
 
@@ -692,7 +668,7 @@ class DataService:
             DataNotFoundError: 数据不存在
         """
         cache_key = f"latest_rss:{','.join(feeds or [])}:{limit}:{include_summary}"
-        cached = self.cache.get(cache_key, ttl=900)
+        cached = self.cache.get(cache_key)
         if cached:
             return cached
 
@@ -738,7 +714,7 @@ class DataService:
         result = rss_list[:limit]
 
         # 缓存结果
-        self.cache.set(cache_key, result)
+        self.cache.set(cache_key, result, ttl=900)  # 15分钟缓存
 
         return result
 
@@ -764,7 +740,7 @@ class DataService:
             匹配的 RSS 条目列表
         """
         cache_key = f"search_rss:{keyword}:{','.join(feeds or [])}:{days}:{limit}:{include_summary}"
-        cached = self.cache.get(cache_key, ttl=900)
+        cached = self.cache.get(cache_key)
         if cached:
             return cached
 
@@ -813,7 +789,7 @@ class DataService:
         result = results[:limit]
 
         # 缓存结果
-        self.cache.set(cache_key, result)
+        self.cache.set(cache_key, result, ttl=900)  # 15分钟缓存
 
         return result
 
@@ -825,7 +801,7 @@ class DataService:
             RSS 源状态信息
         """
         cache_key = "rss_feeds_status"
-        cached = self.cache.get(cache_key, ttl=300)
+        cached = self.cache.get(cache_key)
         if cached:
             return cached
 
@@ -857,6 +833,6 @@ class DataService:
             "generated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         }
 
-        self.cache.set(cache_key, result)
+        self.cache.set(cache_key, result, ttl=300)  # 5分钟缓存
 
         return result
@@ -7,14 +7,84 @@ v2.0.0: 仅支持 SQLite 数据库，移除 TXT 文件支持
 
 import re
 import sqlite3
+from collections import Counter
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
-from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Set, Tuple, Optional
+from datetime import datetime, timedelta
 
 import yaml
 
+from trendradar.core.frequency import KeywordMatcher
+from trendradar.storage.search_index import SEARCH_INDEX_FILENAME, SearchIndex
+from trendradar.storage.snapshot import DaySnapshot, load_day_snapshot, load_title_entries
+from trendradar.storage.sqlite_profile import SQLiteProfile, db_signature
+
 from ..utils.errors import FileParseError, DataNotFoundError
-from .cache_service import get_cache
+from .cache_service import NO_EXPIRY, get_cache
+
+
+class FrequencyWordCounter:
+    """
+    编译后的关注词计数器
+
+    由 parse_frequency_words 的词组构建一次。每个标题先用 KeywordMatcher 单次扫描
+    得到候选词，再按原统计语义确认：区分大小写的子串匹配，
+    同一个词在多个词组中出现时按出现次数分别计数。
+    """
+
+    def __init__(self, word_groups: List[Dict]):
+        """
+        编译关注词
+
+        Args:
+            word_groups: parse_frequency_words 返回的词组列表
+        """
+        # 词 -> 在各词组 required/normal 中出现的次数（按配置顺序）
+        self._multiplicity: Dict[str, int] = {}
+        for group in word_groups:
+            for word in group.get("required", []) + group.get("normal", []):
+                if word:
+                    self._multiplicity[word] = self._multiplicity.get(word, 0) + 1
+        self._order = {word: index for index, word in enumerate(self._multiplicity)}
+
+        # 小写形式 -> 原词列表（自动机大小写不敏感，命中后再区分大小写确认）
+        self._by_lower: Dict[str, List[str]] = {}
+        for word in self._multiplicity:
+            self._by_lower.setdefault(word.lower(), []).append(word)
+
+        self._matcher = KeywordMatcher([{"required": [], "normal": list(self._multiplicity)}])
+
+    def count(self, titles: Iterable[str]) -> Tuple[Counter, Dict[str, Set[str]]]:
+        """
+        统计关注词在标题中的出现次数
+
+        Args:
+            titles: 标题序列
+
+        Returns:
+            (词频 Counter, {词: 命中标题集合}) 元组；词频的插入顺序与按配置顺序逐词匹配一致
+        """
+        word_frequency = Counter()
+        keyword_to_news: Dict[str, Set[str]] = {}
+        if not self._multiplicity:
+            return word_frequency, keyword_to_news
+
+        for title in titles:
+            hits = self._matcher.find_words(title)
+            if not hits:
+                continue
+            matched = [
+                word
+                for lower in hits
+                for word in self._by_lower.get(lower, ())
+                if word in title
+            ]
+            matched.sort(key=self._order.__getitem__)
+            for word in matched:
+                word_frequency[word] += self._multiplicity[word]
+                keyword_to_news.setdefault(word, set()).add(title)
+
+        return word_frequency, keyword_to_news
 
 
 class ParserService:
@@ -34,6 +104,8 @@ class ParserService:
             self.project_root = Path(project_root)
 
         self.cache = get_cache()
+        self._sqlite_profile: Optional[SQLiteProfile] = None
+        self._search_index: Optional[SearchIndex] = None
 
     @staticmethod
     def clean_title(title: str) -> str:
@@ -75,22 +147,62 @@ class ParserService:
             return db_path
         return None
 
+    @staticmethod
+    def _file_signature(path: Path) -> Optional[Tuple]:
+        """
+        获取文件签名 (路径, mtime, 大小)
+
+        Returns:
+            签名元组，文件不存在时返回 None
+        """
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        return (str(path), stat.st_mtime_ns, stat.st_size)
+
+    def _get_sqlite_profile(self) -> SQLiteProfile:
+        """
+        获取 SQLite 连接参数（读取 config.yaml 的 storage.sqlite，缺失时使用默认值）
+
+        Returns:
+            SQLiteProfile 实例
+        """
+        if self._sqlite_profile is None:
+            try:
+                storage_config = (self.parse_yaml_config() or {}).get("storage", {}) or {}
+                sqlite_config = storage_config.get("sqlite")
+            except FileParseError:
+                sqlite_config = None
+            self._sqlite_profile = SQLiteProfile.from_config(sqlite_config)
+        return self._sqlite_profile
+
+    def _connect_day_db(self, db_path: Path) -> sqlite3.Connection:
+        """
+        打开日库读连接
+
+        只读不迁移：schema 迁移由写入方（存储后端）和批量迁移命令负责，
+        读取的查询不依赖迁移新增的索引/表。
+        """
+        conn = self._get_sqlite_profile().connect(db_path, read_only=True)
+        conn.row_factory = sqlite3.Row
+        return conn
+
     def _read_from_sqlite(
         self,
         date: datetime = None,
-        platform_ids: Optional[List[str]] = None,
         db_type: str = "news"
-    ) -> Optional[Tuple[Dict, Dict, Dict]]:
+    ) -> Optional[Tuple[Any, Dict, Dict]]:
         """
-        从 SQLite 数据库读取数据
+        从 SQLite 数据库读取一整天的数据（所有平台/Feed，平台过滤在内存中进行）
 
         Args:
             date: 日期对象，默认为今天
-            platform_ids: 平台ID列表，None表示所有平台
             db_type: 数据库类型 ("news" 或 "rss")
 
         Returns:
-            (all_titles, id_to_name, all_timestamps) 元组，如果数据库不存在返回 None
+            (day_data, id_to_name, all_timestamps) 元组，如果数据库不存在返回 None。
+            热榜的 day_data 为 DaySnapshot，RSS 的 day_data 为 {feed_id: {标题: 字段字典}}
         """
         db_path = self._get_db_path(date, db_type)
         if db_path is None:
@@ -101,14 +213,13 @@ class ParserService:
         all_timestamps = {}
 
         try:
-            conn = sqlite3.connect(str(db_path))
-            conn.row_factory = sqlite3.Row
+            conn = self._connect_day_db(db_path)
             cursor = conn.cursor()
 
             if db_type == "news":
-                return self._read_news_from_sqlite(cursor, platform_ids, all_titles, id_to_name, all_timestamps)
+                return self._read_news_from_sqlite(cursor, id_to_name, all_timestamps)
             elif db_type == "rss":
-                return self._read_rss_from_sqlite(cursor, platform_ids, all_titles, id_to_name, all_timestamps)
+                return self._read_rss_from_sqlite(cursor, all_titles, id_to_name, all_timestamps)
 
         except Exception as e:
             print(f"Warning: 从 SQLite 读取数据失败: {e}")
@@ -120,12 +231,10 @@ class ParserService:
     def _read_news_from_sqlite(
         self,
         cursor,
-        platform_ids: Optional[List[str]],
-        all_titles: Dict,
         id_to_name: Dict,
         all_timestamps: Dict
-    ) -> Optional[Tuple[Dict, Dict, Dict]]:
-        """从热榜数据库读取数据"""
+    ) -> Optional[Tuple[DaySnapshot, Dict, Dict]]:
+        """从热榜数据库读取整天的列式快照"""
         # 检查表是否存在
         cursor.execute("""
             SELECT name FROM sqlite_master
@@ -134,70 +243,11 @@ class ParserService:
         if not cursor.fetchone():
             return None
 
-        # 构建查询
-        if platform_ids:
-            placeholders = ','.join(['?' for _ in platform_ids])
-            query = f"""
-                SELECT n.id, n.platform_id, p.name as platform_name, n.title,
-                       n.rank, n.url, n.mobile_url,
-                       n.first_crawl_time, n.last_crawl_time, n.crawl_count
-                FROM news_items n
-                LEFT JOIN platforms p ON n.platform_id = p.id
-                WHERE n.platform_id IN ({placeholders})
-            """
-            cursor.execute(query, platform_ids)
-        else:
-            cursor.execute("""
-                SELECT n.id, n.platform_id, p.name as platform_name, n.title,
-                       n.rank, n.url, n.mobile_url,
-                       n.first_crawl_time, n.last_crawl_time, n.crawl_count
-                FROM news_items n
-                LEFT JOIN platforms p ON n.platform_id = p.id
-            """)
-
-        rows = cursor.fetchall()
-
-        # 收集所有 news_item_id 用于查询历史排名
-        news_ids = [row['id'] for row in rows]
-        rank_history_map = {}
-
-        if news_ids:
-            placeholders = ",".join("?" * len(news_ids))
-            cursor.execute(f"""
-                SELECT news_item_id, rank FROM rank_history
-                WHERE news_item_id IN ({placeholders})
-                ORDER BY news_item_id, crawl_time
-            """, news_ids)
-
-            for rh_row in cursor.fetchall():
-                news_id = rh_row['news_item_id']
-                rank = rh_row['rank']
-                if news_id not in rank_history_map:
-                    rank_history_map[news_id] = []
-                rank_history_map[news_id].append(rank)
-
-        for row in rows:
-            news_id = row['id']
-            platform_id = row['platform_id']
-            platform_name = row['platform_name'] or platform_id
-            title = row['title']
-
-            if platform_id not in id_to_name:
-                id_to_name[platform_id] = platform_name
-
-            if platform_id not in all_titles:
-                all_titles[platform_id] = {}
-
-            ranks = rank_history_map.get(news_id, [row['rank']])
-
-            all_titles[platform_id][title] = {
-                "ranks": ranks,
-                "url": row['url'] or "",
-                "mobileUrl": row['mobile_url'] or "",
-                "first_time": row['first_crawl_time'] or "",
-                "last_time": row['last_crawl_time'] or "",
-                "count": row['crawl_count'] or 1,
-            }
+        # 直接读取列式快照，字段字典在访问时按需构建
+        snapshot = load_day_snapshot(cursor, "", None, dedupe=False)
+        if snapshot is None:
+            return None
+        id_to_name.update(snapshot.id_to_name)
 
         # 获取抓取时间作为 timestamps
         cursor.execute("""
@@ -213,15 +263,11 @@ class ParserService:
                 ts = datetime.now().timestamp()
             all_timestamps[f"{crawl_time}.db"] = ts
 
-        if not all_titles:
-            return None
-
-        return (all_titles, id_to_name, all_timestamps)
+        return (snapshot, id_to_name, all_timestamps)
 
     def _read_rss_from_sqlite(
         self,
         cursor,
-        feed_ids: Optional[List[str]],
         all_items: Dict,
         id_to_name: Dict,
         all_timestamps: Dict
@@ -235,28 +281,14 @@ class ParserService:
         if not cursor.fetchone():
             return None
 
-        # 构建查询
-        if feed_ids:
-            placeholders = ','.join(['?' for _ in feed_ids])
-            query = f"""
-                SELECT i.id, i.feed_id, f.name as feed_name, i.title,
-                       i.url, i.published_at, i.summary, i.author,
-                       i.first_crawl_time, i.last_crawl_time, i.crawl_count
-                FROM rss_items i
-                LEFT JOIN rss_feeds f ON i.feed_id = f.id
-                WHERE i.feed_id IN ({placeholders})
-                ORDER BY i.published_at DESC
-            """
-            cursor.execute(query, feed_ids)
-        else:
-            cursor.execute("""
-                SELECT i.id, i.feed_id, f.name as feed_name, i.title,
-                       i.url, i.published_at, i.summary, i.author,
-                       i.first_crawl_time, i.last_crawl_time, i.crawl_count
-                FROM rss_items i
-                LEFT JOIN rss_feeds f ON i.feed_id = f.id
-                ORDER BY i.published_at DESC
-            """)
+        cursor.execute("""
+            SELECT i.id, i.feed_id, f.name as feed_name, i.title,
+                   i.url, i.published_at, i.summary, i.author,
+                   i.first_crawl_time, i.last_crawl_time, i.crawl_count
+            FROM rss_items i
+            LEFT JOIN rss_feeds f ON i.feed_id = f.id
+            ORDER BY i.published_at DESC
+        """)
 
         rows = cursor.fetchall()
 
@@ -300,6 +332,58 @@ class ParserService:
 
         return (all_items, id_to_name, all_timestamps)
 
+    def _load_day(self, date: datetime = None, db_type: str = "news") -> Optional[Tuple[Any, Dict, Dict]]:
+        """
+        加载整天数据（每天每种数据库只缓存一份，不同的平台过滤共用）
+
+        缓存以日库文件签名校验有效性：历史日期文件不再变化，一直有效直到被淘汰；
+        当天的库在爬虫提交写入后签名即变化，下次读取立即重新加载。
+        """
+        cache_key = f"read_all:{db_type}:{self.get_date_folder_name(date)}"
+        db_path = self._get_db_path(date, db_type)
+        # 缓存为进程级共用，签名带上路径以区分不同项目目录下的同名日库
+        file_signature = db_signature(db_path) if db_path else None
+        signature = (str(db_path), file_signature) if file_signature else None
+
+        cached = self.cache.get(cache_key)
+        if cached and signature is not None and cached[0] == signature:
+            return cached[1]
+
+        day = self._read_from_sqlite(date, db_type)
+        if day and signature is not None:
+            self.cache.set(cache_key, (signature, day), ttl=NO_EXPIRY)
+        return day
+
+    @staticmethod
+    def _filter_day(
+        day: Tuple[Any, Dict, Dict],
+        platform_ids: Optional[List[str]],
+        db_type: str
+    ) -> Optional[Tuple[Dict, Dict, Dict]]:
+        """
+        在内存中按平台/Feed 过滤整天数据
+
+        热榜返回 DaySnapshot 的只读视图；RSS 返回浅拷贝的外层字典（条目字典共享）。
+
+        Returns:
+            (all_titles, id_to_name, all_timestamps) 元组，过滤后没有数据时返回 None
+        """
+        day_data, id_to_name, all_timestamps = day
+        if db_type == "news":
+            all_titles = day_data.title_info_view(platform_ids or None)
+            id_to_name = day_data.names_for(platform_ids or None)
+        else:
+            allowed = set(platform_ids) if platform_ids else None
+            all_titles = {
+                feed_id: items for feed_id, items in day_data.items()
+                if allowed is None or feed_id in allowed
+            }
+            id_to_name = {feed_id: id_to_name[feed_id] for feed_id in all_titles}
+
+        if not all_titles:
+            return None
+        return (all_titles, id_to_name, dict(all_timestamps))
+
     def read_all_titles_for_date(
         self,
         date: datetime = None,
@@ -307,7 +391,7 @@ class ParserService:
         db_type: str = "news"
     ) -> Tuple[Dict, Dict, Dict]:
         """
-        读取指定日期的所有数据（带缓存）
+        读取指定日期的所有数据（带缓存，按日库文件签名校验，平台过滤在内存中进行）
 
         Args:
             date: 日期对象，默认为今天
@@ -321,19 +405,9 @@ class ParserService:
             DataNotFoundError: 数据不存在
         """
         date_str = self.get_date_folder_name(date)
-        platform_key = ','.join(sorted(platform_ids)) if platform_ids else 'all'
-        cache_key = f"read_all:{db_type}:{date_str}:{platform_key}"
-
-        is_today = (date is None) or (date.date() == datetime.now().date())
-        ttl = 900 if is_today else 3600
-
-        cached = self.cache.get(cache_key, ttl=ttl)
-        if cached:
-            return cached
-
-        result = self._read_from_sqlite(date, platform_ids, db_type)
+        day = self._load_day(date, db_type)
+        result = self._filter_day(day, platform_ids, db_type) if day else None
         if result:
-            self.cache.set(cache_key, result)
             return result
 
         raise DataNotFoundError(
@@ -341,6 +415,164 @@ class ParserService:
             suggestion="请先运行爬虫或检查日期是否正确"
         )
 
+    def search_titles(
+        self,
+        keyword: str,
+        start_date: datetime,
+        end_date: datetime,
+        platform_ids: Optional[List[str]] = None
+    ) -> Dict[str, List[Tuple[str, str, int]]]:
+        """
+        通过跨日期检索索引查找包含关键词的热榜标题
+
+        匹配语义同 `keyword.lower() in title.lower()`；查询前按日库文件状态补齐索引，
+        不需要打开没有命中的日库。
+
+        Args:
+            keyword: 关键词
+            start_date: 开始日期
+            end_date: 结束日期（含）
+            platform_ids: 平台ID列表，None表示所有平台
+
+        Returns:
+            {日期字符串: [(platform_id, title, news_item_id), ...]}，
+            每天内的顺序与 read_all_titles_for_date 一致；
+            索引不可用时改为逐天扫描，news_item_id 为 None
+        """
+        days = {}
+        current_date = start_date
+        while current_date <= end_date:
+            days[self.get_date_folder_name(current_date)] = current_date
+            current_date += timedelta(days=1)
+        day_paths = {date_str: self._get_db_path(date, "news") for date_str, date in days.items()}
+        if not any(day_paths.values()):
+            return {}
+
+        try:
+            if self._search_index is None:
+                self._search_index = SearchIndex(
+                    self.project_root / "output" / "news" / SEARCH_INDEX_FILENAME,
+                    self._get_sqlite_profile()
+                )
+            self._search_index.refresh(day_paths)
+            return self._search_index.search(keyword, day_paths, platform_ids)
+        except sqlite3.Error as e:
+            # 索引只是派生数据，无法打开/创建/写入时（只读目录、磁盘已满、文件损坏等）
+            # 退回逐天扫描，下次查询再尝试重建
+            print(f"Warning: 检索索引不可用，改为逐天扫描: {e}")
+            self._close_search_index()
+            return self._scan_titles(keyword, days, platform_ids)
+
+    def _close_search_index(self) -> None:
+        """关闭并丢弃检索索引连接"""
+        if self._search_index is not None:
+            try:
+                self._search_index.close()
+            except sqlite3.Error:
+                pass
+            self._search_index = None
+
+    def _scan_titles(
+        self,
+        keyword: str,
+        days: Dict[str, datetime],
+        platform_ids: Optional[List[str]]
+    ) -> Dict[str, List[Tuple[str, str, None]]]:
+        """逐天读取整天数据查找包含关键词的标题（检索索引不可用时的回退路径）"""
+        needle = keyword.lower()
+        results = {}
+        for date_str, date in days.items():
+            try:
+                all_titles, _, _ = self.read_all_titles_for_date(date, platform_ids)
+            except DataNotFoundError:
+                continue
+            day_matches = [
+                (platform_id, title, None)
+                for platform_id, titles in all_titles.items()
+                for title in titles
+                if needle in title.lower()
+            ]
+            if day_matches:
+                results[date_str] = day_matches
+        return results
+
+    def iter_title_matches(
+        self,
+        keyword: str,
+        start_date: datetime,
+        end_date: datetime,
+        platform_ids: Optional[List[str]] = None
+    ) -> Iterator[Tuple[datetime, str, str, str, Dict]]:
+        """
+        按日期顺序逐条返回包含关键词的热榜标题及其字段
+
+        只从有命中的日库读取命中条目，结果与逐天读取后做
+        `keyword.lower() in title.lower()` 判断一致。
+
+        Args:
+            keyword: 关键词
+            start_date: 开始日期
+            end_date: 结束日期（含）
+            platform_ids: 平台ID列表，None表示所有平台
+
+        Yields:
+            (日期, platform_id, platform_name, title, 字段字典) 元组
+        """
+        matches = self.search_titles(keyword, start_date, end_date, platform_ids)
+
+        current_date = start_date
+        while current_date <= end_date:
+            day_matches = matches.get(self.get_date_folder_name(current_date))
+            db_path = self._get_db_path(current_date, "news") if day_matches else None
+            if db_path is not None and day_matches[0][2] is None:
+                # 逐天扫描的结果，字段直接取自已缓存的整天数据
+                all_titles, id_to_name, _ = self.read_all_titles_for_date(current_date, platform_ids)
+                for platform_id, title, _ in day_matches:
+                    yield (
+                        current_date,
+                        platform_id,
+                        id_to_name.get(platform_id, platform_id),
+                        title,
+                        all_titles[platform_id][title]
+                    )
+            elif db_path is not None:
+                entries, id_to_name = self._read_title_entries(db_path, [m[2] for m in day_matches])
+                for platform_id, title, item_id in day_matches:
+                    info = entries.get(item_id)
+                    # 索引补齐后日库又有变化时，以日库为准
+                    if info is None:
+                        continue
+                    yield (
+                        current_date,
+                        platform_id,
+                        id_to_name.get(platform_id, platform_id),
+                        title,
+                        info
+                    )
+
+            current_date += timedelta(days=1)
+
+    def _read_title_entries(self, db_path: Path, item_ids: List[int]) -> Tuple[Dict[int, Dict], Dict[str, str]]:
+        """
+        只读取日库中指定条目的字段字典与平台名称
+
+        Returns:
+            ({news_item_id: 字段字典}, {platform_id: 平台名称}) 元组，读取失败时返回空字典
+        """
+        try:
+            conn = self._connect_day_db(db_path)
+            try:
+                cursor = conn.cursor()
+                entries = load_title_entries(cursor, item_ids, dedupe=False)
+                cursor.execute("SELECT id, name FROM platforms")
+                id_to_name = {row[0]: row[1] or row[0] for row in cursor.fetchall()}
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            print(f"Warning: 从 SQLite 读取数据失败: {e}")
+            return {}, {}
+        return entries, id_to_name
+
     def parse_yaml_config(self, config_path: str = None) -> dict:
         """
         解析YAML配置文件
@@ -369,6 +601,35 @@ class ParserService:
         except Exception as e:
             raise FileParseError(str(config_path), str(e))
 
+    def _load_frequency_words(self, words_file: str = None) -> Tuple[List[Dict], FrequencyWordCounter]:
+        """
+        加载并编译关注词文件（按文件签名缓存，文件修改后下次调用立即重新解析）
+
+        Returns:
+            (词组列表, 编译后的计数器) 元组，缓存内共享，调用方不应修改
+
+        Raises:
+            FileParseError: 文件解析错误
+        """
+        if words_file is None:
+            words_file = self.project_root / "config" / "frequency_words.txt"
+        else:
+            words_file = Path(words_file)
+
+        signature = self._file_signature(words_file)
+        if signature is None:
+            return [], FrequencyWordCounter([])
+
+        cache_key = f"frequency_words:{words_file}"
+        cached = self.cache.get(cache_key)
+        if cached and cached[0] == signature:
+            return cached[1]
+
+        word_groups = self._parse_frequency_file(words_file)
+        compiled = (word_groups, FrequencyWordCounter(word_groups))
+        self.cache.set(cache_key, (signature, compiled), ttl=NO_EXPIRY)
+        return compiled
+
     def parse_frequency_words(self, words_file: str = None) -> List[Dict]:
         """
         解析关键词配置文件
@@ -382,14 +643,28 @@ class ParserService:
         Raises:
             FileParseError: 文件解析错误
         """
-        if words_file is None:
-            words_file = self.project_root / "config" / "frequency_words.txt"
-        else:
-            words_file = Path(words_file)
+        word_groups, _ = self._load_frequency_words(words_file)
+        return [{key: list(words) for key, words in group.items()} for group in word_groups]
 
-        if not words_file.exists():
-            return []
+    def get_frequency_counter(self, words_file: str = None) -> FrequencyWordCounter:
+        """
+        获取编译后的关注词计数器
+
+        Args:
+            words_file: 关键词文件路径，默认为 config/frequency_words.txt
 
+        Returns:
+            FrequencyWordCounter 实例
+
+        Raises:
+            FileParseError: 文件解析错误
+        """
+        _, counter = self._load_frequency_words(words_file)
+        return counter
+
+    @staticmethod
+    def _parse_frequency_file(words_file: Path) -> List[Dict]:
+        """解析关键词文件内容"""
         word_groups = []
 
         try:
@@ -7,9 +7,11 @@
 import re
 from collections import Counter, defaultdict
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Union
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 from difflib import SequenceMatcher
 
+from trendradar.core.analyzer import calculate_news_weights as _calculate_weights_batch
+
 from ..services.data_service import DataService
 from ..utils.validators import (
     validate_platforms,
@@ -22,13 +24,17 @@ from ..utils.validators import (
 from ..utils.errors import MCPError, InvalidParameterError, DataNotFoundError
 
 
+# 权重配置（排名 60% / 频次 30% / 热度 10%，与 config.yaml 默认值一致）
+WEIGHT_CONFIG = {
+    "RANK_WEIGHT": 0.6,
+    "FREQUENCY_WEIGHT": 0.3,
+    "HOTNESS_WEIGHT": 0.1,
+}
+
+
 def calculate_news_weight(news_data: Dict, rank_threshold: int = 5) -> float:
     """
-    计算新闻权重（用于排序）
-
-    - 排名权重 (60%)：新闻在榜单中的排名
-    - 频次权重 (30%)：新闻出现的次数
-    - 热度权重 (10%)：高排名出现的比例
+    计算单条新闻权重（用于排序，按 WEIGHT_CONFIG 计算，等价于单条调用 calculate_news_weights）
 
     Args:
         news_data: 新闻数据字典，包含 ranks 和 count 字段
@@ -37,41 +43,44 @@ def calculate_news_weight(news_data: Dict, rank_threshold: int = 5) -> float:
     Returns:
         权重分数（0-100之间的浮点数）
     """
-    ranks = news_data.get("ranks", [])
-    if not ranks:
-        return 0.0
+    return calculate_news_weights([news_data], rank_threshold)[0]
 
-    count = news_data.get("count", len(ranks))
 
-    # 权重配置（与 config.yaml 保持一致）
-    RANK_WEIGHT = 0.6
-    FREQUENCY_WEIGHT = 0.3
-    HOTNESS_WEIGHT = 0.1
+def calculate_news_weights(news_list: List[Dict], rank_threshold: int = 5) -> List[float]:
+    """
+    批量计算新闻权重
 
-    # 1. 排名权重：Σ(11 - min(rank, 10)) / 出现次数
-    rank_scores = []
-    for rank in ranks:
-        score = 11 - min(rank, 10)
-        rank_scores.append(score)
+    按 WEIGHT_CONFIG 整批一次计算（NumPy 可用时向量化），是 MCP 工具权重的唯一实现。
 
-    rank_weight = sum(rank_scores) / len(ranks) if ranks else 0
+    Args:
+        news_list: 新闻数据字典列表，包含 ranks 和 count 字段
+        rank_threshold: 高排名阈值，默认5
 
-    # 2. 频次权重：min(出现次数, 10) × 10
-    frequency_weight = min(count, 10) * 10
+    Returns:
+        与输入顺序一致的权重列表
+    """
+    ranks_list = [news.get("ranks") or [] for news in news_list]
+    # 排名为空的新闻权重恒为 0，出现次数不参与计算
+    counts = [
+        news.get("count", len(ranks)) if ranks else 0
+        for news, ranks in zip(news_list, ranks_list)
+    ]
+    return _calculate_weights_batch(ranks_list, counts, rank_threshold, WEIGHT_CONFIG)
 
-    # 3. 热度加成：高排名次数 / 总出现次数 × 100
-    high_rank_count = sum(1 for rank in ranks if rank <= rank_threshold)
-    hotness_ratio = high_rank_count / len(ranks) if ranks else 0
-    hotness_weight = hotness_ratio * 100
 
-    # 综合权重
-    total_weight = (
-        rank_weight * RANK_WEIGHT
-        + frequency_weight * FREQUENCY_WEIGHT
-        + hotness_weight * HOTNESS_WEIGHT
-    )
+def sort_news_by_weight(news_list: List[Dict], rank_threshold: int = 5) -> None:
+    """
+    按权重降序原地排序（权重相同时保持原顺序）
 
-    return total_weight
+    等价于 news_list.sort(key=calculate_news_weight, reverse=True)，但权重批量计算。
+
+    Args:
+        news_list: 新闻数据字典列表
+        rank_threshold: 高排名阈值，默认5
+    """
+    weights = calculate_news_weights(news_list, rank_threshold)
+    order = sorted(range(len(news_list)), key=weights.__getitem__, reverse=True)
+    news_list[:] = [news_list[i] for i in order]
 
 
 class AnalyticsTools:
@@ -306,38 +315,20 @@ class AnalyticsTools:
                 end_date = datetime.now()
                 start_date = end_date - timedelta(days=6)
 
-            # 收集趋势数据
+            # 收集趋势数据（跨日期检索索引直接给出每天的命中标题，无需加载日库）
+            matches = self.data_service.parser.search_titles(topic, start_date, end_date)
             trend_data = []
             current_date = start_date
 
             while current_date <= end_date:
-                try:
-                    all_titles, _, _ = self.data_service.parser.read_all_titles_for_date(
-                        date=current_date
-                    )
-
-                    # 统计该时间点的话题出现次数
-                    count = 0
-                    matched_titles = []
-
-                    for _, titles in all_titles.items():
-                        for title in titles.keys():
-                            if topic.lower() in title.lower():
-                                count += 1
-                                matched_titles.append(title)
+                date_str = current_date.strftime("%Y-%m-%d")
+                matched_titles = [match[1] for match in matches.get(date_str, [])]
 
-                    trend_data.append({
-                        "date": current_date.strftime("%Y-%m-%d"),
-                        "count": count,
-                        "sample_titles": matched_titles[:3]  # 只保留前3个样本
-                    })
-
-                except DataNotFoundError:
-                    trend_data.append({
-                        "date": current_date.strftime("%Y-%m-%d"),
-                        "count": 0,
-                        "sample_titles": []
-                    })
+                trend_data.append({
+                    "date": date_str,
+                    "count": len(matched_titles),
+                    "sample_titles": matched_titles[:3]  # 只保留前3个样本
+                })
 
                 # 按天增加时间
                 current_date += timedelta(days=1)
@@ -755,10 +746,7 @@ class AnalyticsTools:
 
             # 按权重排序（如果启用）
             if sort_by_weight:
-                deduplicated_news.sort(
-                    key=lambda x: calculate_news_weight(x),
-                    reverse=True
-                )
+                sort_news_by_weight(deduplicated_news)
 
             # 限制返回数量
             selected_news = deduplicated_news[:limit]
@@ -1110,10 +1098,7 @@ class AnalyticsTools:
 
             # 按权重排序（如果启用）
             if sort_by_weight:
-                related_news.sort(
-                    key=lambda x: calculate_news_weight(x),
-                    reverse=True
-                )
+                sort_news_by_weight(related_news)
             else:
                 # 按排名排序
                 related_news.sort(key=lambda x: x["rank"])
@@ -2059,8 +2044,6 @@ class AnalyticsTools:
                                 news_item["url"] = info.get("url", "")
                                 news_item["mobileUrl"] = info.get("mobileUrl", "")
 
-                            # 计算权重
-                            news_item["weight"] = calculate_news_weight(news_item)
                             all_news.append(news_item)
 
                 except DataNotFoundError:
@@ -2068,6 +2051,10 @@ class AnalyticsTools:
 
                 current_date += timedelta(days=1)
 
+            # 批量计算权重
+            for news_item, weight in zip(all_news, calculate_news_weights(all_news)):
+                news_item["weight"] = weight
+
             if not all_news:
                 return {
                     "success": True,
@@ -2344,18 +2331,13 @@ class AnalyticsTools:
                 return None
         return None
 
-    def _collect_period_data(
+    def _iter_period_titles(
         self,
-        date_range: tuple,
-        platforms: Optional[List[str]],
-        topic: Optional[str]
-    ) -> Dict:
-        """收集指定时期的新闻数据"""
-        start_date, end_date = date_range
-        all_news = []
-        all_keywords = Counter()
-        platform_stats = Counter()
-
+        start_date: datetime,
+        end_date: datetime,
+        platforms: Optional[List[str]]
+    ) -> Iterator[Tuple[datetime, str, str, str, Dict]]:
+        """逐天读取并返回 (日期, platform_id, platform_name, title, 字段字典)"""
         current_date = start_date
         while current_date <= end_date:
             try:
@@ -2366,35 +2348,56 @@ class AnalyticsTools:
 
                 for platform_id, titles in all_titles.items():
                     platform_name = id_to_name.get(platform_id, platform_id)
-
                     for title, info in titles.items():
-                        # 如果指定了话题，过滤不相关的新闻
-                        if topic and topic.lower() not in title.lower():
-                            continue
-
-                        news_item = {
-                            "title": title,
-                            "platform": platform_id,
-                            "platform_name": platform_name,
-                            "date": current_date.strftime("%Y-%m-%d"),
-                            "ranks": info.get("ranks", []),
-                            "rank": info["ranks"][0] if info["ranks"] else 999
-                        }
-                        news_item["weight"] = calculate_news_weight(news_item)
-                        all_news.append(news_item)
-
-                        # 统计平台
-                        platform_stats[platform_name] += 1
-
-                        # 提取关键词
-                        keywords = self._extract_keywords(title)
-                        all_keywords.update(keywords)
+                        yield current_date, platform_id, platform_name, title, info
 
             except DataNotFoundError:
                 pass
 
             current_date += timedelta(days=1)
 
+    def _collect_period_data(
+        self,
+        date_range: tuple,
+        platforms: Optional[List[str]],
+        topic: Optional[str]
+    ) -> Dict:
+        """收集指定时期的新闻数据"""
+        start_date, end_date = date_range
+        all_news = []
+        all_keywords = Counter()
+        platform_stats = Counter()
+
+        # 指定话题时通过跨日期检索索引只加载有命中的日期
+        if topic:
+            period_titles = self.data_service.parser.iter_title_matches(
+                topic, start_date, end_date, platforms
+            )
+        else:
+            period_titles = self._iter_period_titles(start_date, end_date, platforms)
+
+        for current_date, platform_id, platform_name, title, info in period_titles:
+            news_item = {
+                "title": title,
+                "platform": platform_id,
+                "platform_name": platform_name,
+                "date": current_date.strftime("%Y-%m-%d"),
+                "ranks": info.get("ranks", []),
+                "rank": info["ranks"][0] if info["ranks"] else 999
+            }
+            all_news.append(news_item)
+
+            # 统计平台
+            platform_stats[platform_name] += 1
+
+            # 提取关键词
+            keywords = self._extract_keywords(title)
+            all_keywords.update(keywords)
+
+        # 批量计算权重
+        for news_item, weight in zip(all_news, calculate_news_weights(all_news)):
+            news_item["weight"] = weight
+
         return {
             "news": all_news,
             "news_count": len(all_news),
@@ -126,37 +126,39 @@ class SearchTools:
                 start_date = end_date = latest
 
             # 收集所有匹配的新闻
-            all_matches = []
-            current_date = start_date
-
-            while current_date <= end_date:
-                try:
-                    all_titles, id_to_name, timestamps = self.data_service.parser.read_all_titles_for_date(
-                        date=current_date,
-                        platform_ids=platforms
-                    )
+            if search_mode == "keyword":
+                # 关键词模式走跨日期检索索引，只加载有命中的日期
+                all_matches = self._search_by_keyword_mode(
+                    query, start_date, end_date, platforms, include_url
+                )
+            else:
+                all_matches = []
+                current_date = start_date
 
-                    # 根据搜索模式执行不同的搜索逻辑
-                    if search_mode == "keyword":
-                        matches = self._search_by_keyword_mode(
-                            query, all_titles, id_to_name, current_date, include_url
-                        )
-                    elif search_mode == "fuzzy":
-                        matches = self._search_by_fuzzy_mode(
-                            query, all_titles, id_to_name, current_date, threshold, include_url
-                        )
-                    else:  # entity
-                        matches = self._search_by_entity_mode(
-                            query, all_titles, id_to_name, current_date, include_url
+                while current_date <= end_date:
+                    try:
+                        all_titles, id_to_name, timestamps = self.data_service.parser.read_all_titles_for_date(
+                            date=current_date,
+                            platform_ids=platforms
                         )
 
-                    all_matches.extend(matches)
+                        # 根据搜索模式执行不同的搜索逻辑
+                        if search_mode == "fuzzy":
+                            matches = self._search_by_fuzzy_mode(
+                                query, all_titles, id_to_name, current_date, threshold, include_url
+                            )
+                        else:  # entity
+                            matches = self._search_by_entity_mode(
+                                query, all_titles, id_to_name, current_date, include_url
+                            )
 
-                except DataNotFoundError:
-                    # 该日期没有数据，继续下一天
-                    pass
+                        all_matches.extend(matches)
 
-                current_date += timedelta(days=1)
+                    except DataNotFoundError:
+                        # 该日期没有数据，继续下一天
+                        pass
+
+                    current_date += timedelta(days=1)
 
             if not all_matches:
                 # 获取可用日期范围用于错误提示
@@ -192,8 +194,8 @@ class SearchTools:
             if sort_by == "relevance":
                 all_matches.sort(key=lambda x: x.get("similarity_score", 1.0), reverse=True)
             elif sort_by == "weight":
-                from .analytics import calculate_news_weight
-                all_matches.sort(key=lambda x: calculate_news_weight(x), reverse=True)
+                from .analytics import sort_news_by_weight
+                sort_news_by_weight(all_matches)
             elif sort_by == "date":
                 all_matches.sort(key=lambda x: x.get("date", ""), reverse=True)
 
@@ -262,9 +264,9 @@ class SearchTools:
     def _search_by_keyword_mode(
         self,
         query: str,
-        all_titles: Dict,
-        id_to_name: Dict,
-        current_date: datetime,
+        start_date: datetime,
+        end_date: datetime,
+        platforms: Optional[List[str]],
         include_url: bool
     ) -> List[Dict]:
         """
@@ -272,39 +274,34 @@ class SearchTools:
 
         Args:
             query: 搜索关键词
-            all_titles: 所有标题字典
-            id_to_name: 平台ID到名称映射
-            current_date: 当前日期
+            start_date: 开始日期
+            end_date: 结束日期
+            platforms: 平台过滤列表
 
         Returns:
             匹配的新闻列表
         """
         matches = []
-        query_lower = query.lower()
-
-        for platform_id, titles in all_titles.items():
-            platform_name = id_to_name.get(platform_id, platform_id)
 
-            for title, info in titles.items():
-                # 精确包含判断
-                if query_lower in title.lower():
-                    news_item = {
-                        "title": title,
-                        "platform": platform_id,
-                        "platform_name": platform_name,
-                        "date": current_date.strftime("%Y-%m-%d"),
-                        "similarity_score": 1.0,  # 精确匹配，相似度为1
-                        "ranks": info.get("ranks", []),
-                        "count": len(info.get("ranks", [])),
-                        "rank": info["ranks"][0] if info["ranks"] else 999
-                    }
+        for current_date, platform_id, platform_name, title, info in \
+                self.data_service.parser.iter_title_matches(query, start_date, end_date, platforms):
+            news_item = {
+                "title": title,
+                "platform": platform_id,
+                "platform_name": platform_name,
+                "date": current_date.strftime("%Y-%m-%d"),
+                "similarity_score": 1.0,  # 精确匹配，相似度为1
+                "ranks": info.get("ranks", []),
+                "count": len(info.get("ranks", [])),
+                "rank": info["ranks"][0] if info["ranks"] else 999
+            }
 
-                    # 条件性添加 URL 字段
-                    if include_url:
-                        news_item["url"] = info.get("url", "")
-                        news_item["mobileUrl"] = info.get("mobileUrl", "")
+            # 条件性添加 URL 字段
+            if include_url:
+                news_item["url"] = info.get("url", "")
+                news_item["mobileUrl"] = info.get("mobileUrl", "")
 
-                    matches.append(news_item)
+            matches.append(news_item)
 
         return matches
 
@@ -86,6 +86,7 @@ class StorageSyncTools:
 
         try:
             from trendradar.storage.remote import RemoteStorageBackend
+            from trendradar.storage.sqlite_profile import SQLiteProfile
 
             remote_config = self._get_remote_config()
             config = self._load_config()
@@ -98,6 +99,9 @@ class StorageSyncTools:
                 endpoint_url=remote_config["endpoint_url"],
                 region=remote_config.get("region", ""),
                 timezone=timezone,
+                sqlite_profile=SQLiteProfile.from_config(
+                    self._get_storage_config().get("sqlite")
+                ),
             )
             return self._remote_backend
         except ImportError:
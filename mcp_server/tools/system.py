@@ -91,6 +91,7 @@ class SystemManagementTools:
             import yaml
             from trendradar.crawler.fetcher import DataFetcher
             from trendradar.storage.local import LocalStorageBackend
+            from trendradar.storage.sqlite_profile import SQLiteProfile
             from trendradar.storage.base import convert_crawl_results_to_news_data
             from trendradar.utils.time import get_configured_time, format_date_folder, format_time_filename
             from ..services.cache_service import get_cache
@@ -146,14 +147,21 @@ class SystemManagementTools:
             if crawler_config.get("use_proxy"):
                 proxy_url = crawler_config.get("default_proxy")
             
-            fetcher = DataFetcher(proxy_url=proxy_url)
+            fetcher = DataFetcher(
+                proxy_url=proxy_url,
+                max_workers=crawler_config.get("max_workers", 1),
+                pool_size=crawler_config.get("pool_size", 10),
+            )
             request_interval = crawler_config.get("request_interval", 100)
 
             # 执行爬取
-            results, id_to_name, failed_ids = fetcher.crawl_websites(
-                ids_list=ids,
-                request_interval=request_interval
-            )
+            try:
+                results, id_to_name, failed_ids = fetcher.crawl_websites(
+                    ids_list=ids,
+                    request_interval=request_interval
+                )
+            finally:
+                fetcher.close()
 
             # 获取当前时间（统一使用 trendradar 的时间工具）
             # 从配置中读取时区，默认为 Asia/Shanghai
@@ -176,7 +184,10 @@ class SystemManagementTools:
                 data_dir=str(self.project_root / "output"),
                 enable_txt=True,
                 enable_html=True,
-                timezone=timezone
+                timezone=timezone,
+                sqlite_profile=SQLiteProfile.from_config(
+                    config_data.get("storage", {}).get("sqlite")
+                ),
             )
 
             # 尝试持久化数据
@@ -0,0 +1,124 @@
+# coding=utf-8
+"""
+测试共用夹具
+"""
+
+import hashlib
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+
+class _FakeS3Error(Exception):
+    """模拟 botocore ClientError（带 response 错误码）"""
+
+    def __init__(self, code: str):
+        super().__init__(code)
+        self.response = {"Error": {"Code": code}}
+
+
+class _FakeBody:
+    def __init__(self, data: bytes):
+        self._data = data
+
+    def iter_chunks(self, chunk_size: int = 1024):
+        for start in range(0, len(self._data), chunk_size):
+            yield self._data[start:start + chunk_size]
+
+
+class FakeS3:
+    """内存中的 S3 兼容客户端，记录 put_object 调用"""
+
+    def __init__(self):
+        self.objects = {}
+        self.puts = []
+
+    def head_object(self, Bucket, Key):
+        if Key not in self.objects:
+            raise _FakeS3Error("404")
+        return {"ETag": '"%s"' % hashlib.md5(self.objects[Key]).hexdigest()}
+
+    def get_object(self, Bucket, Key):
+        if Key not in self.objects:
+            raise _FakeS3Error("NoSuchKey")
+        data = self.objects[Key]
+        return {"Body": _FakeBody(data), "ETag": '"%s"' % hashlib.md5(data).hexdigest()}
+
+    def put_object(self, Bucket, Key, Body, **kwargs):
+        self.objects[Key] = bytes(Body)
+        self.puts.append(Key)
+        return {"ETag": '"%s"' % hashlib.md5(Body).hexdigest()}
+
+
+def _save_news(storage, crawl_time, items, date=None, id_to_name=None):
+    """
+    保存一次热榜抓取并断言成功
+
+    Args:
+        storage: 存储管理器或存储后端
+        crawl_time: 抓取时间
+        items: {platform_id: [标题 或 (标题, URL), ...]}，每个平台内排名按顺序从 1 递增
+        date: 日期，默认为 Asia/Shanghai 时区的今天（与存储默认时区一致）
+        id_to_name: 平台名称映射，默认平台名即平台 ID
+
+    Returns:
+        保存的 NewsData
+    """
+    from trendradar.storage.base import NewsData, NewsItem
+    from trendradar.utils.time import format_date_folder
+
+    if id_to_name is None:
+        id_to_name = {platform_id: platform_id for platform_id in items}
+    news_items = {}
+    for platform_id, entries in items.items():
+        news_items[platform_id] = []
+        for rank, entry in enumerate(entries, 1):
+            title, url = (entry, "") if isinstance(entry, str) else entry
+            news_items[platform_id].append(NewsItem(
+                title=title, source_id=platform_id, source_name=id_to_name.get(platform_id, platform_id),
+                rank=rank, url=url, crawl_time=crawl_time,
+            ))
+    data = NewsData(
+        date=date or format_date_folder(None, "Asia/Shanghai"), crawl_time=crawl_time,
+        items=news_items, id_to_name=id_to_name, failed_ids=[],
+    )
+    assert storage.save_news_data(data)
+    return data
+
+
+@pytest.fixture
+def save_news():
+    """保存一次热榜抓取的辅助函数（参数见 _save_news）"""
+    return _save_news
+
+
+@pytest.fixture
+def remote_backend(tmp_path):
+    """
+    使用内存 S3 的 RemoteStorageBackend 工厂（不需要安装 boto3）
+
+    每次调用创建一个新的后端实例（模拟一次运行），共用同一个 FakeS3，
+    可通过 backend.s3_client 查看上传记录。
+    """
+    from trendradar.storage import remote
+
+    s3 = FakeS3()
+    backends = []
+
+    def factory():
+        with patch.object(remote, "HAS_BOTO3", True), \
+                patch.object(remote, "boto3", MagicMock(client=MagicMock(return_value=s3))), \
+                patch.object(remote, "BotoConfig", MagicMock()):
+            backend = remote.RemoteStorageBackend(
+                bucket_name="bucket",
+                access_key_id="key",
+                secret_access_key="secret",
+                endpoint_url="https://s3.example.com",
+                temp_dir=str(tmp_path / f"run{len(backends)}"),
+            )
+        backends.append(backend)
+        return backend
+
+    yield factory
+    for backend in backends:
+        backend.cleanup()
@@ -0,0 +1,203 @@
+# coding=utf-8
+"""
+测试当日汇总增量状态 (trendradar/core/aggregation.py)
+"""
+
+import sqlite3
+from unittest.mock import patch
+
+import pytest
+
+from trendradar.core.aggregation import (
+    DailyAggregation,
+    aggregation_key,
+    load_daily_aggregation,
+)
+from trendradar.core.analyzer import count_word_frequency
+from trendradar.core.frequency import KeywordMatcher
+from trendradar.core.data import read_all_today_titles_from_storage
+from trendradar.storage import StorageManager
+from trendradar.utils.time import format_date_folder
+
+
+WORD_GROUPS = [
+    {"required": [], "normal": ["AI"], "group_key": "AI", "max_count": 0},
+    {"required": [], "normal": ["芯片"], "group_key": "芯片", "max_count": 1},
+]
+FILTER_WORDS = ["广告"]
+
+
+@pytest.fixture
+def storage(tmp_path):
+    manager = StorageManager(backend_type="local", data_dir=str(tmp_path), timezone="Asia/Shanghai")
+    yield manager
+    manager.cleanup()
+
+
+def _full_stats(storage, word_groups=WORD_GROUPS, platform_ids=None):
+    results, id_to_name, title_info = read_all_today_titles_from_storage(storage, platform_ids)
+    return count_word_frequency(
+        results, word_groups, FILTER_WORDS, id_to_name, title_info,
+        mode="daily", quiet=True,
+    )
+
+
+def _incremental_stats(aggregation, word_groups=WORD_GROUPS):
+    return count_word_frequency(
+        {}, word_groups, FILTER_WORDS, aggregation.id_to_name,
+        mode="daily", quiet=True, aggregation=aggregation,
+    )
+
+
+class TestDailyAggregation:
+    """增量汇总状态"""
+
+    def test_incremental_matches_full_recompute(self, storage, save_news):
+        crawls = [
+            ("08-00", {"a": [("AI 大模型", "http://a/1"), ("芯片 新品", "http://a/2")],
+                       "b": [("AI 广告", "http://b/1"), "天气"]}),
+            ("09-00", {"a": [("芯片 新品", "http://a/2")],
+                       "b": [("AI 芯片", "http://b/2"), "天气"], "c": ["AI 汽车"]}),
+            ("10-00", {"a": [("AI 大模型", "http://a/1")],
+                       "c": ["AI 汽车", ("芯片 出口", "http://c/1")]}),
+        ]
+        with patch.object(
+            storage, "get_news_by_last_crawl", wraps=storage.get_news_by_last_crawl
+        ) as delta_spy:
+            for crawl_time, entries in crawls:
+                save_news(storage, crawl_time, entries)
+                aggregation = load_daily_aggregation(storage, WORD_GROUPS, FILTER_WORDS, quiet=True)
+
+                assert aggregation.crawl_times == storage.get_crawl_times()
+                assert _incremental_stats(aggregation) == _full_stats(storage)
+
+        # 首个批次整天构建，之后每个批次只读取增量
+        assert delta_spy.call_count == len(crawls) - 1
+
+    def test_state_reused_without_new_crawl(self, storage, save_news):
+        save_news(storage, "08-00", {"a": [("AI 大模型", "http://a/1")]})
+        load_daily_aggregation(storage, WORD_GROUPS, FILTER_WORDS, quiet=True)
+
+        with patch.object(storage, "get_today_all_data") as full_read, \
+                patch.object(storage, "get_news_by_last_crawl") as delta_read:
+            aggregation = load_daily_aggregation(storage, WORD_GROUPS, FILTER_WORDS, quiet=True)
+
+        full_read.assert_not_called()
+        delta_read.assert_not_called()
+        assert aggregation.total_titles == 1
+
+    def test_config_change_rebuilds(self, storage, save_news):
+        save_news(storage, "08-00", {"a": [("AI 大模型", "http://a/1"), ("汽车", "http://a/2")]})
+        load_daily_aggregation(storage, WORD_GROUPS, FILTER_WORDS, quiet=True)
+        save_news(storage, "09-00", {"a": [("汽车", "http://a/2")]})
+
+        new_groups = WORD_GROUPS + [{"required": [], "normal": ["汽车"], "group_key": "汽车", "max_count": 0}]
+        with patch.object(storage, "get_news_by_last_crawl") as delta_read:
+            aggregation = load_daily_aggregation(storage, new_groups, FILTER_WORDS, quiet=True)
+
+        delta_read.assert_not_called()
+        assert _incremental_stats(aggregation, new_groups) == _full_stats(storage, new_groups)
+
+        # 每个日库只保留当前配置的状态
+        db_path = storage.get_backend()._get_db_path()
+        with sqlite3.connect(str(db_path)) as conn:
+            keys = [row[0] for row in conn.execute("SELECT state_key FROM aggregation_state")]
+        assert keys == [aggregation.key]
+
+    def test_title_change_falls_back_to_full_rebuild(self, storage, save_news):
+        save_news(storage, "08-00", {"a": [("AI 旧标题", "http://a/1")]})
+        load_daily_aggregation(storage, WORD_GROUPS, FILTER_WORDS, quiet=True)
+        save_news(storage, "09-00", {"a": [("AI 新标题", "http://a/1")]})
+
+        with patch.object(storage, "get_today_all_data", wraps=storage.get_today_all_data) as full_read:
+            aggregation = load_daily_aggregation(storage, WORD_GROUPS, FILTER_WORDS, quiet=True)
+
+        full_read.assert_called_once()
+        assert list(aggregation.titles["a"]) == ["AI 新标题"]
+        assert _incremental_stats(aggregation) == _full_stats(storage)
+
+    def test_refreshed_title_with_older_row_keeps_position(self, storage, save_news):
+        """测试同一标题有多行（URL 变化）时，刷新最后一行不移动标题位置（与整天读取一致）"""
+        crawls = [
+            ("08-00", {"a": [("AI x", "http://a/u1"), ("AI y", "http://a/u3")]}),
+            ("09-00", {"a": [("AI y", "http://a/u3"), ("AI x", "http://a/u2")]}),
+            ("10-00", {"a": [("AI x", "http://a/u2")]}),
+        ]
+        for crawl_time, items in crawls:
+            save_news(storage, crawl_time, items)
+            with patch.object(storage, "get_today_all_data", wraps=storage.get_today_all_data) as full_read:
+                aggregation = load_daily_aggregation(storage, WORD_GROUPS, FILTER_WORDS, quiet=True)
+            assert _incremental_stats(aggregation) == _full_stats(storage)
+
+        # 最后一个批次走增量合并
+        full_read.assert_not_called()
+        assert list(aggregation.titles["a"]) == ["AI x", "AI y"]
+        assert aggregation.titles["a"]["AI x"][1] == "http://a/u2"
+
+    def test_platform_filter(self, storage, save_news):
+        save_news(storage, "08-00", {"a": [("AI 一", "http://a/1")], "b": [("AI 二", "http://b/1")]})
+        save_news(storage, "09-00", {"b": [("AI 三", "http://b/2")]})
+
+        aggregation = load_daily_aggregation(storage, WORD_GROUPS, FILTER_WORDS, platform_ids=["a"], quiet=True)
+
+        assert set(aggregation.titles) == {"a"}
+        assert _incremental_stats(aggregation) == _full_stats(storage, platform_ids=["a"])
+
+    def test_no_data_returns_none(self, storage):
+        assert load_daily_aggregation(storage, WORD_GROUPS, FILTER_WORDS, quiet=True) is None
+
+    def test_key_ignores_display_only_config(self):
+        limited = [dict(group, max_count=5) for group in WORD_GROUPS]
+        assert aggregation_key(WORD_GROUPS, FILTER_WORDS) == aggregation_key(limited, FILTER_WORDS)
+        assert aggregation_key(WORD_GROUPS, FILTER_WORDS) != aggregation_key(WORD_GROUPS[::-1], FILTER_WORDS)
+        assert aggregation_key(WORD_GROUPS, FILTER_WORDS, platform_ids=["a"]) != aggregation_key(
+            WORD_GROUPS, FILTER_WORDS
+        )
+
+    def test_round_trip_and_version_check(self, storage, save_news):
+        save_news(storage, "08-00", {"a": [("AI 一", "http://a/1"), "天气"]})
+        aggregation = DailyAggregation("k", ["08-00"], {"a": "A"})
+        aggregation.merge(
+            storage.get_news_by_last_crawl("08-00"), KeywordMatcher(WORD_GROUPS, FILTER_WORDS), {}
+        )
+        assert storage.save_aggregation_state("k", aggregation.to_dict(), aggregation.dirty_rows, replace=True)
+
+        restored = DailyAggregation.from_dict(storage.load_aggregation_state("k"), "k")
+        assert restored.titles == aggregation.titles and list(restored.titles["a"]) == ["AI 一"]
+        assert restored.total_titles == 2 and restored.next_position == 2
+        assert restored.crawl_times == ["08-00"]
+        assert DailyAggregation.from_dict(storage.load_aggregation_state("k"), "other") is None
+        assert DailyAggregation.from_dict(dict(aggregation.to_dict(), titles={}, version=0), "k") is None
+
+    def test_merge_writes_only_batch_rows(self, storage, save_news):
+        save_news(storage, "08-00", {"a": [(f"AI {i}", f"http://a/{i}") for i in range(50)]})
+        load_daily_aggregation(storage, WORD_GROUPS, FILTER_WORDS, quiet=True)
+        save_news(storage, "09-00", {"a": [("AI 3", "http://a/3"), ("AI 新", "http://a/new")]})
+
+        with patch.object(storage, "save_aggregation_state", wraps=storage.save_aggregation_state) as save:
+            aggregation = load_daily_aggregation(storage, WORD_GROUPS, FILTER_WORDS, quiet=True)
+
+        _, _, rows = save.call_args.args
+        assert not save.call_args.kwargs.get("replace")
+        assert [row[1] for row in rows] == ["AI 3", "AI 新"]
+        assert aggregation.total_titles == 51
+        assert _incremental_stats(aggregation) == _full_stats(storage)
+
+    def test_remote_state_shares_crawl_upload(self, remote_backend, save_news):
+        """测试远程后端的汇总状态与热榜数据共用一次上传，下次运行增量合并"""
+        crawls = [
+            ("08-00", {"a": [("AI 一", "http://a/1"), ("芯片 二", "http://a/2")]}),
+            ("09-00", {"a": [("AI 一", "http://a/1"), ("AI 三", "http://a/3")]}),
+        ]
+        for run, (crawl_time, entries) in enumerate(crawls):
+            backend = remote_backend()
+            with patch.object(backend, "get_today_all_data", wraps=backend.get_today_all_data) as full_read:
+                with backend.deferred_sync():
+                    save_news(backend, crawl_time, entries)
+                    aggregation = load_daily_aggregation(backend, WORD_GROUPS, FILTER_WORDS, quiet=True)
+                    assert backend.s3_client.puts == ["news/%s.db" % format_date_folder(None, "Asia/Shanghai")] * run
+
+            assert len(backend.s3_client.puts) == run + 1
+            assert full_read.call_count == (1 if run == 0 else 0)
+        # 有 URL 的条目更新后移动到末尾（与整天读取顺序一致）
+        assert list(aggregation.titles["a"]) == ["芯片 二", "AI 一", "AI 三"]
@@ -8,6 +8,7 @@ from typing import Dict, Any, List, Callable
 
 from trendradar.core.analyzer import (
     calculate_news_weight,
+    calculate_news_weights,
     format_time_display,
     count_word_frequency,
     count_rss_frequency,
@@ -131,6 +132,64 @@ class TestCalculateNewsWeight:
         assert weight == 42.6
 
 
+class TestCalculateNewsWeights:
+    """calculate_news_weights 批量计算测试类"""
+
+    WEIGHT_CONFIG = {"RANK_WEIGHT": 0.37, "FREQUENCY_WEIGHT": 0.21, "HOTNESS_WEIGHT": 0.42}
+
+    @staticmethod
+    def _columns(size: int, seed: int = 5):
+        import random
+
+        rng = random.Random(seed)
+        ranks_list = [[rng.randint(1, 60) for _ in range(rng.randint(0, 8))] for _ in range(size)]
+        counts = [rng.randint(0, 20) for _ in range(size)]
+        return ranks_list, counts
+
+    def _expected(self, ranks_list, counts, rank_threshold):
+        return [
+            calculate_news_weight({"ranks": ranks, "count": count}, rank_threshold, self.WEIGHT_CONFIG)
+            for ranks, count in zip(ranks_list, counts)
+        ]
+
+    @pytest.mark.parametrize("size", [0, 5, 1000])
+    def test_matches_per_item_weights(self, size):
+        """测试批量结果与逐条计算逐位一致（小批量走纯 Python，大批量走 NumPy）"""
+        ranks_list, counts = self._columns(size)
+        assert calculate_news_weights(ranks_list, counts, 7, self.WEIGHT_CONFIG) == self._expected(
+            ranks_list, counts, 7
+        )
+
+    def test_python_fallback(self, monkeypatch):
+        """测试 NumPy 不可用时的纯 Python 实现"""
+        import trendradar.core.analyzer as analyzer
+
+        monkeypatch.setattr(analyzer, "HAS_NUMPY", False)
+        ranks_list, counts = self._columns(500)
+        assert calculate_news_weights(ranks_list, counts, 3, self.WEIGHT_CONFIG) == self._expected(
+            ranks_list, counts, 3
+        )
+
+    def test_numpy_backend(self):
+        """测试 NumPy 实现（含全部为空排名的批次）"""
+        pytest.importorskip("numpy")
+        from trendradar.core.analyzer import _calculate_news_weights_numpy
+
+        ranks_list, counts = self._columns(300)
+        assert _calculate_news_weights_numpy(
+            ranks_list, counts, 5, 0.37, 0.21, 0.42
+        ) == self._expected(ranks_list, counts, 5)
+        assert _calculate_news_weights_numpy([[], []], [3, 4], 5, 0.37, 0.21, 0.42) == [0.0, 0.0]
+
+    def test_counts_default_to_rank_count(self):
+        """测试未提供出现次数时使用排名列表长度"""
+        ranks_list = [[1, 2, 3], [5], []]
+        expected = [
+            calculate_news_weight({"ranks": ranks}, 3, self.WEIGHT_CONFIG) for ranks in ranks_list
+        ]
+        assert calculate_news_weights(ranks_list, None, 3, self.WEIGHT_CONFIG) == expected
+
+
 class TestFormatTimeDisplay:
     """format_time_display 函数测试类"""
 
@@ -400,6 +459,86 @@ class TestCountWordFrequency:
         assert ai_stat["count"] == 2  # 统计数仍然是2
         assert len(ai_stat["titles"]) == 1  # 但只显示1条
 
+    def _large_results(self, sources: int = 5, per_source: int = 60):
+        """构造包含大量权重相同条目的数据，用于校验排序与截断"""
+        import random
+
+        rng = random.Random(3)
+        results, title_info = {}, {}
+        for s in range(sources):
+            source_id = f"src{s}"
+            results[source_id], title_info[source_id] = {}, {}
+            for i in range(per_source):
+                title = f"{'AI' if i % 2 else 'Python'} 新闻 {s}-{i}"
+                ranks = [rng.randint(1, 15) for _ in range(rng.randint(1, 3))]
+                results[source_id][title] = {"ranks": ranks, "url": f"u{s}-{i}", "mobileUrl": ""}
+                title_info[source_id][title] = {
+                    "first_time": "08-00",
+                    "last_time": f"{8 + i % 3:02d}-00",
+                    "count": rng.randint(1, 12),
+                    "ranks": ranks,
+                    "url": f"u{s}-{i}",
+                    "mobileUrl": "",
+                }
+        return results, title_info
+
+    def test_count_frequency_top_k_matches_full_sort(self):
+        """测试有界堆截断结果与完整排序后截断一致"""
+        results, title_info = self._large_results()
+        word_groups = [
+            {"required": [], "normal": ["AI"], "group_key": "AI", "max_count": 7},
+            {"required": [], "normal": ["Python"], "group_key": "Python", "max_count": 0},
+        ]
+        kwargs = dict(
+            results=results, filter_words=[], id_to_name={}, title_info=title_info, quiet=True
+        )
+
+        full, total = count_word_frequency(
+            word_groups=[dict(g, max_count=0) for g in word_groups], **kwargs
+        )
+        limited, limited_total = count_word_frequency(
+            word_groups=word_groups, max_news_per_keyword=11, **kwargs
+        )
+
+        assert total == limited_total == 300
+        full_by_word = {stat["word"]: stat for stat in full}
+        expected_limits = {"AI": 7, "Python": 11}
+        for stat in limited:
+            expected = full_by_word[stat["word"]]
+            assert stat["count"] == expected["count"] == 150
+            assert stat["titles"] == expected["titles"][: expected_limits[stat["word"]]]
+
+        # 完整列表按 (权重降序, 最高排名, 出现次数降序) 有序
+        for stat in full:
+            keys = [
+                (-calculate_news_weight(t, 3, {}), min(t["ranks"]), -t["count"])
+                for t in stat["titles"]
+            ]
+            assert keys == sorted(keys)
+
+    def test_count_frequency_display_fields_built_after_truncation(self):
+        """测试只为截断后保留的标题构建展示字段"""
+        results, title_info = self._large_results()
+        calls = []
+
+        def convert(value):
+            calls.append(value)
+            return value.replace("-", ":")
+
+        stats, _ = count_word_frequency(
+            results=results,
+            word_groups=[{"required": [], "normal": ["AI"], "group_key": "AI", "max_count": 5}],
+            filter_words=[],
+            id_to_name={},
+            title_info=title_info,
+            convert_time_func=convert,
+            quiet=True,
+        )
+
+        assert len(stats[0]["titles"]) == 5
+        assert len(calls) == 2 * 5
+        assert "08:00" in stats[0]["titles"][0]["time_display"]
+
     def test_count_frequency_sort_by_position(self, sample_results):
         """测试按配置位置排序"""
         word_groups = [
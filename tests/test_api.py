@@ -11,6 +11,7 @@ from datetime import datetime
 from unittest.mock import Mock, patch, MagicMock
 
 from trendradar.core.api import TrendRadarAPI
+from trendradar.storage.snapshot import DaySnapshot
 
 
 class TestTrendRadarAPI:
@@ -321,6 +322,16 @@ app:
         api = TrendRadarAPI(config_path=str(config_path), work_dir=temp_dir)
         assert api.timezone == "America/New_York"
 
+    def test_context_manager_closes_fetcher(self, temp_dir):
+        """测试 with 语句退出时关闭爬虫连接池"""
+        from trendradar.crawler import DataFetcher
+
+        with patch.object(DataFetcher, "close") as close:
+            with TrendRadarAPI(work_dir=temp_dir) as api:
+                assert api.fetcher is not None
+                close.assert_not_called()
+            close.assert_called_once()
+
     def test_filter_by_keywords_default_match_type(self, api):
         """测试关键词过滤 - 默认匹配类型"""
         news_data = [
@@ -501,7 +512,7 @@ class TestTrendRadarAPIAdvanced:
             }
         )
 
-        api.storage.get_today_all_data = Mock(return_value=mock_data)
+        api.storage.get_today_snapshot = Mock(return_value=DaySnapshot.from_news_data(mock_data))
 
         # 添加关键词
         api.keywords = [
@@ -642,7 +653,7 @@ class TestTrendRadarAPICoverageEdgeCases:
             }
         )
 
-        api.storage.get_today_all_data = Mock(return_value=mock_data)
+        api.storage.get_today_snapshot = Mock(return_value=DaySnapshot.from_news_data(mock_data))
 
         # Mock convert_news_data_to_results and count_word_frequency
         with patch('trendradar.storage.convert_news_data_to_results') as mock_convert:
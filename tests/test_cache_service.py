@@ -0,0 +1,269 @@
+# coding=utf-8
+"""
+MCP 缓存服务单元测试 (mcp_server/services/cache_service.py, parser_service.py)
+"""
+
+import os
+import sqlite3
+import time
+import tracemalloc
+from collections import Counter
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from mcp_server.services.cache_service import CacheService, estimate_size
+from mcp_server.services.parser_service import FrequencyWordCounter, ParserService
+from mcp_server.utils.errors import DataNotFoundError
+from trendradar.storage.base import RSSData, RSSItem
+from trendradar.storage.local import LocalStorageBackend
+
+
+class TestCacheService:
+    """有界缓存测试"""
+
+    def test_lru_eviction_by_entries(self):
+        """测试超出条目上限时淘汰最久未访问的条目"""
+        cache = CacheService(max_entries=2, sweep_interval=0)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.get("a") == 1  # a 变为最近访问
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1 and cache.get("c") == 3
+        stats = cache.get_stats()
+        assert stats["evictions"] == 1
+        assert stats["hits"] == 3 and stats["misses"] == 1
+        assert stats["hit_rate"] == 0.75
+
+    def test_eviction_by_bytes(self):
+        """测试按近似内存占用淘汰，超过上限的单个值不缓存"""
+        value = "x" * 1000
+        size = estimate_size(value)
+        cache = CacheService(max_bytes=size * 2 + 10, sweep_interval=0)
+        for key in ("a", "b", "c"):
+            cache.set(key, value + key)
+
+        assert cache.get("a") is None
+        assert cache.get_stats()["total_bytes"] <= size * 2 + 10
+        cache.set("big", "x" * 10000)
+        assert cache.get("big") is None
+
+        cache.clear()
+        assert cache.get_stats()["total_bytes"] == 0
+
+    def test_ttl_set_per_entry(self):
+        """测试 TTL 在写入时按条目设置"""
+        cache = CacheService(default_ttl=100, sweep_interval=0)
+        with patch("mcp_server.services.cache_service.time.time", return_value=1000.0):
+            cache.set("short", 1, ttl=10)
+            cache.set("long", 2)
+        with patch("mcp_server.services.cache_service.time.time", return_value=1050.0):
+            assert cache.get("short") is None
+            assert cache.get("long") == 2
+            assert cache.cleanup_expired() == 0
+        with patch("mcp_server.services.cache_service.time.time", return_value=1100.0):
+            assert cache.cleanup_expired() == 1
+        assert cache.get_stats()["expirations"] == 2
+
+    def test_background_sweeper(self):
+        """测试后台线程回收未再访问的过期条目"""
+        cache = CacheService(sweep_interval=0.02)
+        try:
+            cache.set("a", [1, 2, 3], ttl=0.01)
+            deadline = time.monotonic() + 2
+            while cache.get_stats()["total_entries"] and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert cache.get_stats()["total_entries"] == 0
+            assert cache.get_stats()["total_bytes"] == 0
+        finally:
+            cache.stop_sweeper()
+
+    def test_estimate_size_scales_with_content(self):
+        """测试大容器抽样估算与内容规模同量级"""
+        small = {f"t{i}": {"ranks": [i], "url": f"https://e.com/{i}"} for i in range(10)}
+        large = {f"t{i}": {"ranks": [i], "url": f"https://e.com/{i}"} for i in range(1000)}
+        assert 50 < estimate_size(large) / estimate_size(small) < 200
+
+
+class TestParserDayCache:
+    """ParserService 日库缓存测试"""
+
+    def test_cache_invalidated_by_db_commit(self, tmp_path, save_news):
+        """测试日库未变化时复用缓存，爬虫写入后立即重新读取"""
+        backend = LocalStorageBackend(data_dir=str(tmp_path / "output"), enable_txt=False, enable_html=False)
+        save_news(backend, "10:00", {"zhihu": ["标题A"]}, date="2026-01-02")
+
+        parser = ParserService(project_root=str(tmp_path))
+        parser.cache = CacheService(sweep_interval=0)
+        day = datetime(2026, 1, 2)
+
+        with patch.object(parser, "_read_from_sqlite", wraps=parser._read_from_sqlite) as reader:
+            first = parser.read_all_titles_for_date(day)
+            again = parser.read_all_titles_for_date(day)
+            assert reader.call_count == 1
+            assert dict(again[0]["zhihu"]) == dict(first[0]["zhihu"])
+            assert set(first[0]["zhihu"]) == {"标题A"}
+
+            save_news(backend, "10:30", {"zhihu": ["标题A", "标题B"]}, date="2026-01-02")
+            second = parser.read_all_titles_for_date(day)
+            assert reader.call_count == 2
+            assert set(second[0]["zhihu"]) == {"标题A", "标题B"}
+        backend.cleanup()
+
+    def test_filters_share_one_day_load(self, tmp_path, save_news):
+        """测试不同平台/Feed 过滤共用一次整天读取，过滤结果为整天数据的子集"""
+        backend = LocalStorageBackend(data_dir=str(tmp_path / "output"), enable_txt=False, enable_html=False)
+        save_news(backend, "10:00", {pid: ["标题A", "标题B"] for pid in ("zhihu", "weibo")},
+                  date="2026-01-02")
+        backend.save_rss_data(RSSData(
+            date="2026-01-02", crawl_time="10:00",
+            items={fid: [RSSItem(title=f"{fid} 文章", feed_id=fid, feed_name=fid.upper(), crawl_time="10:00")]
+                   for fid in ("hn", "v2ex")},
+            id_to_name={"hn": "HN", "v2ex": "V2EX"},
+        ))
+
+        parser = ParserService(project_root=str(tmp_path))
+        parser.cache = CacheService(sweep_interval=0)
+        day = datetime(2026, 1, 2)
+
+        with patch.object(parser, "_read_from_sqlite", wraps=parser._read_from_sqlite) as reader:
+            full, names, _ = parser.read_all_titles_for_date(day)
+            zhihu, zhihu_names, _ = parser.read_all_titles_for_date(day, ["zhihu"])
+            weibo, weibo_names, _ = parser.read_all_titles_for_date(day, ["weibo", "missing"])
+            with pytest.raises(DataNotFoundError):
+                parser.read_all_titles_for_date(day, ["missing"])
+            rss_full, _, _ = parser.read_all_titles_for_date(day, db_type="rss")
+            hn, hn_names, _ = parser.read_all_titles_for_date(day, ["hn"], db_type="rss")
+
+        assert reader.call_count == 2
+        assert set(full) == {"zhihu", "weibo"} and names == {"zhihu": "zhihu", "weibo": "weibo"}
+        assert list(zhihu) == ["zhihu"] and zhihu_names == {"zhihu": "zhihu"}
+        assert list(weibo) == ["weibo"] and weibo_names == {"weibo": "weibo"}
+        assert dict(zhihu["zhihu"]) == dict(full["zhihu"])
+        assert set(rss_full) == {"hn", "v2ex"}
+        assert hn == {"hn": rss_full["hn"]} and list(hn_names) == ["hn"]
+        backend.cleanup()
+
+    def test_cached_day_size_counts_slotted_snapshot(self, tmp_path, save_news):
+        """测试缓存的整天快照（__slots__ 对象）按实际内容估算占用"""
+        backend = LocalStorageBackend(data_dir=str(tmp_path / "output"), enable_txt=False, enable_html=False)
+        titles = [f"第{i}条热榜标题" * 3 for i in range(2000)]
+        save_news(backend, "10:00", {pid: titles for pid in ("zhihu", "weibo")}, date="2026-01-02")
+        backend.cleanup()
+
+        parser = ParserService(project_root=str(tmp_path))
+        parser.cache = CacheService(sweep_interval=0)
+        tracemalloc.start()
+        try:
+            day = parser._read_from_sqlite(datetime(2026, 1, 2))
+            actual, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        del day
+
+        parser.read_all_titles_for_date(datetime(2026, 1, 2))
+        total_bytes = parser.cache.get_stats()["total_bytes"]
+        assert actual / 4 < total_bytes < actual * 4
+
+    def test_title_matches_use_index_without_day_loads(self, tmp_path, save_news):
+        """测试关键词检索只读取命中条目，结果与逐天读取后过滤一致"""
+        backend = LocalStorageBackend(data_dir=str(tmp_path / "output"), enable_txt=False, enable_html=False)
+        save_news(backend, "10:00", {pid: ["OpenAI 发布", "天气", "openai 融资"] for pid in ("zhihu", "weibo")},
+                  date="2026-01-02")
+        save_news(backend, "10:30", {pid: ["OpenAI 发布", "路况"] for pid in ("zhihu", "weibo")},
+                  date="2026-01-02")
+        backend.cleanup()
+
+        parser = ParserService(project_root=str(tmp_path))
+        parser.cache = CacheService(sweep_interval=0)
+        start, end = datetime(2026, 1, 1), datetime(2026, 1, 3)
+
+        with patch.object(parser, "_read_from_sqlite", wraps=parser._read_from_sqlite) as reader:
+            matches = list(parser.iter_title_matches("OPENAI", start, end, ["zhihu"]))
+            assert reader.call_count == 0
+
+        all_titles, id_to_name, _ = parser.read_all_titles_for_date(datetime(2026, 1, 2), ["zhihu"])
+        expected = [
+            (datetime(2026, 1, 2), pid, id_to_name[pid], title, info)
+            for pid, titles in all_titles.items()
+            for title, info in titles.items()
+            if "openai" in title.lower()
+        ]
+        assert matches == expected and len(matches) == 2
+        assert list(parser.search_titles("路况", start, end)) == ["2026-01-02"]
+
+    def test_title_matches_fall_back_when_index_fails(self, tmp_path, save_news):
+        """测试检索索引无法打开时退回逐天扫描，结果与索引路径一致"""
+        backend = LocalStorageBackend(data_dir=str(tmp_path / "output"), enable_txt=False, enable_html=False)
+        save_news(backend, "10:00", {pid: ["OpenAI 发布", "天气", "openai 融资"] for pid in ("zhihu", "weibo")},
+                  date="2026-01-02")
+        backend.cleanup()
+
+        parser = ParserService(project_root=str(tmp_path))
+        parser.cache = CacheService(sweep_interval=0)
+        start, end = datetime(2026, 1, 1), datetime(2026, 1, 3)
+        indexed = list(parser.iter_title_matches("OPENAI", start, end))
+        indexed_titles = parser.search_titles("openai", start, end, ["weibo"])
+        parser._close_search_index()
+
+        with patch("mcp_server.services.parser_service.SearchIndex",
+                   side_effect=sqlite3.OperationalError("unable to open database file")):
+            assert list(parser.iter_title_matches("OPENAI", start, end)) == indexed
+            scanned = parser.search_titles("openai", start, end, ["weibo"])
+        assert len(indexed) == 4
+        assert scanned == {
+            date: [(pid, title, None) for pid, title, _ in matches]
+            for date, matches in indexed_titles.items()
+        }
+
+
+class TestFrequencyWords:
+    """ParserService 关注词缓存与计数器测试"""
+
+    def test_parsed_once_until_file_changes(self, tmp_path):
+        """测试词文件未变化时复用解析结果，修改后重新解析"""
+        words_file = tmp_path / "config" / "frequency_words.txt"
+        words_file.parent.mkdir()
+        words_file.write_text("华为,苹果\n", encoding="utf-8")
+
+        parser = ParserService(project_root=str(tmp_path))
+        parser.cache = CacheService(sweep_interval=0)
+
+        with patch.object(ParserService, "_parse_frequency_file",
+                          wraps=ParserService._parse_frequency_file) as parse:
+            groups = parser.parse_frequency_words()
+            groups[0]["normal"].append("被修改")
+            assert parser.parse_frequency_words() == [
+                {"required": [], "normal": ["华为", "苹果"], "filter_words": []}
+            ]
+            parser.get_frequency_counter()
+            assert parse.call_count == 1
+
+            words_file.write_text("华为,苹果\n小米+\n", encoding="utf-8")
+            stat = words_file.stat()
+            os.utime(words_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            assert len(parser.parse_frequency_words()) == 2
+            assert parse.call_count == 2
+
+    def test_missing_file(self, tmp_path):
+        """测试词文件不存在时返回空词组"""
+        parser = ParserService(project_root=str(tmp_path))
+        assert parser.parse_frequency_words() == []
+        assert parser.get_frequency_counter().count(["华为发布会"]) == (Counter(), {})
+
+    def test_counter_matches_substring_semantics(self):
+        """测试计数与逐词子串检查一致：区分大小写，重复词按次数计数，顺序按配置"""
+        word_groups = [
+            {"required": ["发布"], "normal": ["华为", "AI"], "filter_words": []},
+            {"required": [], "normal": ["ai", "华为"], "filter_words": ["广告"]},
+        ]
+        titles = ["AI 大会召开", "华为发布新机", "ai 芯片 华为", "无关标题", "Ai 助手"]
+
+        frequency, news = FrequencyWordCounter(word_groups).count(titles)
+
+        assert list(frequency.items()) == [("AI", 1), ("发布", 1), ("华为", 4), ("ai", 1)]
+        assert news == {"AI": {"AI 大会召开"}, "华为": {"华为发布新机", "ai 芯片 华为"},
+                        "发布": {"华为发布新机"}, "ai": {"ai 芯片 华为"}}
@@ -5,6 +5,7 @@ TrendRadar AppContext 单元测试
 
 import os
 import tempfile
+from datetime import datetime
 from pathlib import Path
 from unittest.mock import MagicMock, Mock, patch
 
@@ -226,10 +227,10 @@ class TestAppContextStorageOperations:
         # 只调用一次
         mock_get_storage_manager.assert_called_once()
 
-    def test_get_output_path(self):
+    def test_get_output_path(self, monkeypatch):
         """测试获取输出路径"""
         with tempfile.TemporaryDirectory() as tmpdir:
-            os.chdir(tmpdir)
+            monkeypatch.chdir(tmpdir)
             ctx = AppContext({"TIMEZONE": "Asia/Shanghai"})
 
             with patch.object(ctx, "format_date", return_value="2025-01-02"):
@@ -309,19 +310,28 @@ class TestAppContextFrequencyWords:
         assert global_filters == []
         mock_load.assert_called_once_with("test.txt")
 
-    @patch("trendradar.context.matches_word_groups")
-    def test_matches_word_groups(self, mock_matches):
-        """测试匹配词组"""
-        mock_matches.return_value = True
+    def test_matches_word_groups(self):
+        """测试匹配词组（通过编译后的匹配器）"""
+        ctx = AppContext({})
+        word_groups = [{"group_key": "AI", "normal": ["AI"], "required": []}]
+        filter_words = ["广告"]
+
+        assert ctx.matches_word_groups("AI新闻", word_groups, filter_words) is True
+        assert ctx.matches_word_groups("AI广告", word_groups, filter_words) is False
+        assert ctx.matches_word_groups("体育新闻", word_groups, filter_words) is False
 
+    def test_keyword_matcher_compiled_once(self):
+        """测试同一份词组配置只编译一次"""
         ctx = AppContext({})
-        word_groups = [{"words": ["AI"]}]
-        filter_words = []
-        title = "AI新闻"
+        word_groups = [{"group_key": "AI", "normal": ["AI"], "required": []}]
+        filter_words, global_filters = [], []
+
+        matcher = ctx.get_keyword_matcher(word_groups, filter_words, global_filters)
+        assert ctx.get_keyword_matcher(word_groups, filter_words, global_filters) is matcher
 
-        result = ctx.matches_word_groups(title, word_groups, filter_words)
-        assert result is True
-        mock_matches.assert_called_once()
+        # 重新加载的配置（新对象）会重新编译
+        reloaded = [dict(group) for group in word_groups]
+        assert ctx.get_keyword_matcher(reloaded, filter_words, global_filters) is not matcher
 
 
 class TestAppContextStatistics:
@@ -391,6 +401,57 @@ class TestAppContextReportGeneration:
         assert html == "<html>content</html>"
         mock_render.assert_called_once()
 
+    def test_generate_html_streams_page(self, tmp_path, monkeypatch):
+        """测试 HTML 报告流式写入，内容与整页渲染一致，index.html 为同一内容"""
+        monkeypatch.chdir(tmp_path)
+        ctx = AppContext({"RANK_THRESHOLD": 5, "DISPLAY_MODE": "keyword"})
+        stats = [{
+            "word": "AI",
+            "count": 1,
+            "titles": [{"title": "AI <新闻>", "source_name": "知乎", "ranks": [1], "rank_threshold": 5, "count": 2,
+                        "url": "https://a?x=1&y=2", "time_display": "", "is_new": True}],
+        }]
+        rss_items = [{"title": "订阅", "feed_id": "hn", "feed_name": "HN", "url": "", "published_at": "2026-01-02"}]
+
+        with patch.object(ctx, "format_date", return_value="2025-01-02"), \
+                patch.object(ctx, "format_time", return_value="12-34"):
+            file_path = ctx.generate_html(stats, 10, failed_ids=["weibo"], is_daily_summary=True, rss_items=rss_items)
+            report_data = ctx.prepare_report(stats, failed_ids=["weibo"])
+            expected = ctx.render_html(report_data, 10, is_daily_summary=True, rss_items=rss_items)
+
+        assert Path(file_path).read_text(encoding="utf-8") == expected
+        assert "AI &lt;新闻&gt;" in expected and "HN" in expected
+        assert (tmp_path / "index.html").read_text(encoding="utf-8") == expected
+        assert (tmp_path / "output" / "index.html").read_text(encoding="utf-8") == expected
+
+    def test_generate_html_skips_unchanged_summary(self, tmp_path, monkeypatch):
+        """测试当日汇总内容未变化时（仅生成时间不同）不覆盖页面、不重复复制 index.html"""
+        monkeypatch.chdir(tmp_path)
+        ctx = AppContext({"RANK_THRESHOLD": 5})
+        stats = [{
+            "word": "AI",
+            "count": 1,
+            "titles": [{"title": "AI 新闻", "source_name": "知乎", "ranks": [1], "rank_threshold": 5,
+                        "count": 1, "time_display": ""}],
+        }]
+
+        def generate(minute, data):
+            with patch.object(ctx, "format_date", return_value="2025-01-02"), \
+                    patch.object(ctx, "get_time", return_value=datetime(2025, 1, 2, 10, minute)):
+                return Path(ctx.generate_html(data, 10, is_daily_summary=True))
+
+        first = generate(0, stats)
+        (tmp_path / "index.html").write_text("已发布", encoding="utf-8")
+
+        assert generate(30, stats) == first
+        assert "01-02 10:00" in first.read_text(encoding="utf-8")
+        assert (tmp_path / "index.html").read_text(encoding="utf-8") == "已发布"
+
+        stats[0]["titles"][0]["title"] = "AI 新闻更新"
+        generate(45, stats)
+        assert "01-02 10:45" in first.read_text(encoding="utf-8")
+        assert (tmp_path / "index.html").read_text(encoding="utf-8") == first.read_text(encoding="utf-8")
+
 
 class TestAppContextNotificationRendering:
     """AppContext 通知内容渲染测试类"""
@@ -8,7 +8,7 @@ from unittest.mock import Mock, patch, MagicMock
 import pytest
 import requests
 
-from trendradar.crawler.fetcher import DataFetcher
+from trendradar.crawler.fetcher import DataFetcher, HostRateLimiter
 
 
 class TestDataFetcher:
@@ -42,7 +42,7 @@ class TestDataFetcher:
         assert fetcher.proxy_url == proxy_url
         assert fetcher.api_url == custom_url
 
-    @patch('trendradar.crawler.fetcher.requests.get')
+    @patch('trendradar.crawler.fetcher.requests.Session.get')
     def test_fetch_data_success(self, mock_get):
         """测试成功获取数据"""
         # Mock 响应
@@ -59,7 +59,7 @@ class TestDataFetcher:
         assert alias == "test_id"
         mock_get.assert_called_once()
 
-    @patch('trendradar.crawler.fetcher.requests.get')
+    @patch('trendradar.crawler.fetcher.requests.Session.get')
     def test_fetch_data_with_tuple(self, mock_get):
         """测试使用元组形式的 ID"""
         mock_response = Mock()
@@ -74,7 +74,7 @@ class TestDataFetcher:
         assert id_value == "test_id"
         assert alias == "custom_alias"
 
-    @patch('trendradar.crawler.fetcher.requests.get')
+    @patch('trendradar.crawler.fetcher.requests.Session.get')
     def test_fetch_data_cache_status(self, mock_get):
         """测试缓存状态响应"""
         mock_response = Mock()
@@ -88,7 +88,7 @@ class TestDataFetcher:
         assert data is not None
         assert id_value == "test_id"
 
-    @patch('trendradar.crawler.fetcher.requests.get')
+    @patch('trendradar.crawler.fetcher.requests.Session.get')
     def test_fetch_data_with_proxy(self, mock_get):
         """测试使用代理获取数据"""
         mock_response = Mock()
@@ -100,13 +100,12 @@ class TestDataFetcher:
         fetcher = DataFetcher(proxy_url=proxy_url)
         fetcher.fetch_data("test_id")
 
-        # 验证代理设置被传递
-        call_args = mock_get.call_args
-        assert 'proxies' in call_args.kwargs
-        assert call_args.kwargs['proxies']['http'] == proxy_url
-        assert call_args.kwargs['proxies']['https'] == proxy_url
+        # 验证代理设置在会话上（复用连接池）
+        mock_get.assert_called_once()
+        assert fetcher.session.proxies['http'] == proxy_url
+        assert fetcher.session.proxies['https'] == proxy_url
 
-    @patch('trendradar.crawler.fetcher.requests.get')
+    @patch('trendradar.crawler.fetcher.requests.Session.get')
     def test_fetch_data_invalid_status(self, mock_get):
         """测试无效状态响应"""
         mock_response = Mock()
@@ -121,7 +120,7 @@ class TestDataFetcher:
         assert data is None
         assert id_value == "test_id"
 
-    @patch('trendradar.crawler.fetcher.requests.get')
+    @patch('trendradar.crawler.fetcher.requests.Session.get')
     @patch('trendradar.crawler.fetcher.time.sleep')
     def test_fetch_data_retry_on_failure(self, mock_sleep, mock_get):
         """测试失败重试机制"""
@@ -146,7 +145,7 @@ class TestDataFetcher:
         assert mock_get.call_count == 3
         assert mock_sleep.call_count == 2
 
-    @patch('trendradar.crawler.fetcher.requests.get')
+    @patch('trendradar.crawler.fetcher.requests.Session.get')
     def test_fetch_data_max_retries_exceeded(self, mock_get):
         """测试超过最大重试次数"""
         mock_response = Mock()
@@ -160,7 +159,7 @@ class TestDataFetcher:
         # 初始请求 + 1次重试 = 2次
         assert mock_get.call_count == 2
 
-    @patch('trendradar.crawler.fetcher.requests.get')
+    @patch('trendradar.crawler.fetcher.requests.Session.get')
     def test_crawl_websites_single_id(self, mock_get):
         """测试爬取单个网站"""
         mock_response = Mock()
@@ -184,7 +183,7 @@ class TestDataFetcher:
         assert id_to_name["test_id"] == "test_id"
         assert len(failed_ids) == 0
 
-    @patch('trendradar.crawler.fetcher.requests.get')
+    @patch('trendradar.crawler.fetcher.requests.Session.get')
     def test_crawl_websites_multiple_ids(self, mock_get):
         """测试爬取多个网站"""
         def create_response(title_prefix):
@@ -215,7 +214,7 @@ class TestDataFetcher:
         assert "source2" in results
         assert len(failed_ids) == 0
 
-    @patch('trendradar.crawler.fetcher.requests.get')
+    @patch('trendradar.crawler.fetcher.requests.Session.get')
     def test_crawl_websites_with_tuples(self, mock_get):
         """测试使用元组形式的 ID 列表"""
         mock_response = Mock()
@@ -235,7 +234,7 @@ class TestDataFetcher:
         assert id_to_name["id1"] == "Source One"
         assert id_to_name["id2"] == "Source Two"
 
-    @patch('trendradar.crawler.fetcher.requests.get')
+    @patch('trendradar.crawler.fetcher.requests.Session.get')
     def test_crawl_websites_with_failure(self, mock_get):
         """测试部分网站失败的情况"""
         mock_success = Mock()
@@ -261,7 +260,7 @@ class TestDataFetcher:
         assert "fail_id" in failed_ids
         assert len(failed_ids) == 1
 
-    @patch('trendradar.crawler.fetcher.requests.get')
+    @patch('trendradar.crawler.fetcher.requests.Session.get')
     def test_crawl_websites_skip_invalid_titles(self, mock_get):
         """测试跳过无效标题"""
         mock_response = Mock()
@@ -285,7 +284,7 @@ class TestDataFetcher:
         assert "Valid Title" in results["test_id"]
         assert "Another Valid" in results["test_id"]
 
-    @patch('trendradar.crawler.fetcher.requests.get')
+    @patch('trendradar.crawler.fetcher.requests.Session.get')
     def test_crawl_websites_duplicate_titles(self, mock_get):
         """测试重复标题的处理"""
         mock_response = Mock()
@@ -308,7 +307,7 @@ class TestDataFetcher:
         assert len(results["test_id"]["Duplicate Title"]["ranks"]) == 2
         assert results["test_id"]["Duplicate Title"]["ranks"] == [1, 2]
 
-    @patch('trendradar.crawler.fetcher.requests.get')
+    @patch('trendradar.crawler.fetcher.requests.Session.get')
     def test_crawl_websites_invalid_json(self, mock_get):
         """测试无效 JSON 响应"""
         mock_response = Mock()
@@ -322,7 +321,7 @@ class TestDataFetcher:
         assert "test_id" not in results
         assert "test_id" in failed_ids
 
-    @patch('trendradar.crawler.fetcher.requests.get')
+    @patch('trendradar.crawler.fetcher.requests.Session.get')
     @patch('trendradar.crawler.fetcher.time.sleep')
     def test_crawl_websites_request_interval(self, mock_sleep, mock_get):
         """测试请求间隔"""
@@ -357,7 +356,7 @@ class TestDataFetcher:
 class TestDataFetcherEdgeCases:
     """DataFetcher 边界情况测试"""
 
-    @patch('trendradar.crawler.fetcher.requests.get')
+    @patch('trendradar.crawler.fetcher.requests.Session.get')
     def test_empty_items_list(self, mock_get):
         """测试空 items 列表"""
         mock_response = Mock()
@@ -374,7 +373,7 @@ class TestDataFetcherEdgeCases:
         assert "test_id" in results
         assert len(results["test_id"]) == 0
 
-    @patch('trendradar.crawler.fetcher.requests.get')
+    @patch('trendradar.crawler.fetcher.requests.Session.get')
     def test_items_with_missing_url(self, mock_get):
         """测试缺少 URL 字段的项目"""
         mock_response = Mock()
@@ -394,7 +393,7 @@ class TestDataFetcherEdgeCases:
         assert results["test_id"]["Test"]["url"] == ""
         assert results["test_id"]["Test"]["mobileUrl"] == ""
 
-    @patch('trendradar.crawler.fetcher.requests.get')
+    @patch('trendradar.crawler.fetcher.requests.Session.get')
     def test_crawl_empty_ids_list(self, mock_get):
         """测试空 ID 列表"""
         fetcher = DataFetcher()
@@ -405,7 +404,7 @@ class TestDataFetcherEdgeCases:
         assert len(failed_ids) == 0
         mock_get.assert_not_called()
 
-    @patch('trendradar.crawler.fetcher.requests.get')
+    @patch('trendradar.crawler.fetcher.requests.Session.get')
     def test_fetch_data_unknown_status(self, mock_get):
         """测试未知状态"""
         mock_response = Mock()
@@ -418,3 +417,144 @@ class TestDataFetcherEdgeCases:
 
         assert data is None
         assert id_value == "test_id"
+
+
+class TestConcurrentCrawl:
+    """并发抓取模式测试"""
+
+    @staticmethod
+    def _response_for(url):
+        """根据请求 URL 构造对应平台的响应"""
+        platform_id = url.split("id=")[1].split("&")[0]
+        if platform_id.startswith("fail"):
+            response = Mock()
+            response.raise_for_status.side_effect = requests.RequestException("Network error")
+            return response
+        return Mock(
+            text=json.dumps({
+                "status": "success",
+                "items": [{"title": f"{platform_id} News", "url": f"http://example.com/{platform_id}"}],
+            }),
+            raise_for_status=Mock(),
+        )
+
+    def test_init_max_workers(self):
+        """测试并发数初始化"""
+        assert DataFetcher().max_workers == 1
+        assert DataFetcher(max_workers=8).max_workers == 8
+        assert DataFetcher(max_workers=0).max_workers == 1
+
+    @patch('trendradar.crawler.fetcher.time.sleep')
+    @patch('trendradar.crawler.fetcher.requests.Session.get')
+    def test_concurrent_results_match_sequential(self, mock_get, mock_sleep):
+        """测试并发模式与顺序模式返回相同结果"""
+        mock_get.side_effect = lambda url, **kwargs: self._response_for(url)
+        ids = [("id1", "One"), "id2", ("fail1", "Fail"), "id3"]
+
+        sequential = DataFetcher().crawl_websites(ids, request_interval=0)
+        concurrent = DataFetcher(max_workers=4).crawl_websites(
+            ids, request_interval=0, max_workers=None
+        )
+
+        assert concurrent == sequential
+        results, id_to_name, failed_ids = concurrent
+        assert list(results.keys()) == ["id1", "id2", "id3"]
+        assert id_to_name == {"id1": "One", "id2": "id2", "fail1": "Fail", "id3": "id3"}
+        assert failed_ids == ["fail1"]
+
+    @patch('trendradar.crawler.fetcher.requests.Session.get')
+    def test_concurrent_override_per_call(self, mock_get):
+        """测试调用时指定并发数"""
+        mock_get.side_effect = lambda url, **kwargs: self._response_for(url)
+
+        fetcher = DataFetcher()
+        results, _, failed_ids = fetcher.crawl_websites(
+            ["id1", "id2", "id3"], request_interval=0, max_workers=3
+        )
+
+        assert list(results.keys()) == ["id1", "id2", "id3"]
+        assert failed_ids == []
+        assert mock_get.call_count == 3
+
+
+class TestHostRateLimiter:
+    """按主机限速器测试"""
+
+    @patch('trendradar.crawler.fetcher.time.sleep')
+    def test_first_request_not_delayed(self, mock_sleep):
+        """测试首次请求不等待"""
+        limiter = HostRateLimiter(1000)
+        limiter.wait("https://a.example.com/api")
+        mock_sleep.assert_not_called()
+
+    @patch('trendradar.crawler.fetcher.time.sleep')
+    def test_same_host_is_spaced(self, mock_sleep):
+        """测试同一主机的请求被限速"""
+        limiter = HostRateLimiter(1000)
+        limiter.wait("https://a.example.com/api?id=1")
+        limiter.wait("https://a.example.com/api?id=2")
+
+        assert mock_sleep.call_count == 1
+        delay = mock_sleep.call_args[0][0]
+        assert 0.9 < delay <= 1.02
+
+    @patch('trendradar.crawler.fetcher.time.sleep')
+    def test_different_hosts_independent(self, mock_sleep):
+        """测试不同主机互不影响"""
+        limiter = HostRateLimiter(1000)
+        limiter.wait("https://a.example.com/api")
+        limiter.wait("https://b.example.com/api")
+        mock_sleep.assert_not_called()
+
+    @patch('trendradar.crawler.fetcher.time.sleep')
+    def test_zero_interval_disabled(self, mock_sleep):
+        """测试间隔为 0 时不限速"""
+        limiter = HostRateLimiter(0)
+        for _ in range(3):
+            limiter.wait("https://a.example.com/api")
+        mock_sleep.assert_not_called()
+
+
+class TestSessionPool:
+    """连接池会话测试"""
+
+    def test_session_created_with_headers(self):
+        """测试会话携带默认请求头"""
+        fetcher = DataFetcher()
+        for key, value in DataFetcher.DEFAULT_HEADERS.items():
+            assert fetcher.session.headers[key] == value
+        assert not fetcher.session.proxies
+
+    def test_pool_size_covers_workers(self):
+        """测试连接池大小不小于并发数"""
+        assert DataFetcher(pool_size=4).pool_size == 4
+        assert DataFetcher(max_workers=8, pool_size=4).pool_size == 8
+
+    def test_adapter_mounted_for_both_schemes(self):
+        """测试 http/https 共用同一连接池适配器"""
+        fetcher = DataFetcher()
+        assert fetcher.session.get_adapter("https://a.example.com") is fetcher._adapter
+        assert fetcher.session.get_adapter("http://a.example.com") is fetcher._adapter
+
+    @patch('trendradar.crawler.fetcher.requests.Session.get')
+    def test_connection_stats_counts_requests(self, mock_get):
+        """测试请求计数"""
+        mock_get.return_value = Mock(
+            text='{"status": "success", "items": []}',
+            raise_for_status=Mock(),
+        )
+
+        fetcher = DataFetcher()
+        fetcher.crawl_websites(["id1", "id2"], request_interval=0)
+
+        stats = fetcher.get_connection_stats()
+        assert stats["requests"] == 2
+        assert stats["connections"] == 0  # 请求被 mock，未真正建立连接
+        assert stats["reused"] == 2
+
+    def test_close_session(self):
+        """测试关闭会话"""
+        fetcher = DataFetcher()
+        with patch.object(fetcher.session, "close") as mock_close:
+            fetcher.close()
+        mock_close.assert_called_once()
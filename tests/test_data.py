@@ -22,6 +22,14 @@ from trendradar.core.data import (
     is_first_crawl_today,
 )
 from trendradar.storage.base import NewsData, NewsItem
+from trendradar.storage.snapshot import DaySnapshot
+
+
+def _snapshot(news_data) -> DaySnapshot:
+    """存储后端 get_today_snapshot 的返回值（由 NewsData 构建）"""
+    return DaySnapshot.from_news_data(
+        NewsData(date="", crawl_time="", items=news_data.items, id_to_name=getattr(news_data, "id_to_name", {}))
+    )
 
 
 class TestSaveTitlesToFile:
@@ -194,7 +202,7 @@ class TestReadAllTodayTitlesFromStorage:
             ]
         }
         mock_news_data.id_to_name = {"baidu": "百度热榜"}
-        mock_storage.get_today_all_data.return_value = mock_news_data
+        mock_storage.get_today_snapshot.return_value = _snapshot(mock_news_data)
 
         results, id_to_name, title_info = read_all_today_titles_from_storage(mock_storage)
 
@@ -213,7 +221,7 @@ class TestReadAllTodayTitlesFromStorage:
             "weibo": [NewsItem(source_id="test", title="标题2", rank=1, crawl_time="2026-01-02 10:00:00")],
         }
         mock_news_data.id_to_name = {"baidu": "百度", "weibo": "微博"}
-        mock_storage.get_today_all_data.return_value = mock_news_data
+        mock_storage.get_today_snapshot.return_value = _snapshot(mock_news_data)
 
         results, id_to_name, title_info = read_all_today_titles_from_storage(
             mock_storage, current_platform_ids=["baidu"]
@@ -225,7 +233,7 @@ class TestReadAllTodayTitlesFromStorage:
     def test_read_empty_data(self):
         """测试空数据"""
         mock_storage = Mock()
-        mock_storage.get_today_all_data.return_value = None
+        mock_storage.get_today_snapshot.return_value = None
 
         results, id_to_name, title_info = read_all_today_titles_from_storage(mock_storage)
 
@@ -238,7 +246,7 @@ class TestReadAllTodayTitlesFromStorage:
         mock_storage = Mock()
         mock_news_data = Mock(spec=NewsData)
         mock_news_data.items = {}
-        mock_storage.get_today_all_data.return_value = mock_news_data
+        mock_storage.get_today_snapshot.return_value = _snapshot(mock_news_data)
 
         results, id_to_name, title_info = read_all_today_titles_from_storage(mock_storage)
 
@@ -265,7 +273,7 @@ class TestReadAllTodayTitlesFromStorage:
 
         mock_news_data.items = {"baidu": [item]}
         mock_news_data.id_to_name = {"baidu": "百度"}
-        mock_storage.get_today_all_data.return_value = mock_news_data
+        mock_storage.get_today_snapshot.return_value = _snapshot(mock_news_data)
 
         results, id_to_name, title_info = read_all_today_titles_from_storage(mock_storage)
 
@@ -277,7 +285,7 @@ class TestReadAllTodayTitlesFromStorage:
     def test_read_with_exception(self):
         """测试异常处理"""
         mock_storage = Mock()
-        mock_storage.get_today_all_data.side_effect = Exception("Database error")
+        mock_storage.get_today_snapshot.side_effect = Exception("Database error")
 
         results, id_to_name, title_info = read_all_today_titles_from_storage(mock_storage)
 
@@ -293,7 +301,7 @@ class TestReadAllTodayTitlesFromStorage:
             "unknown_id": [NewsItem(source_id="test", title="标题", rank=1, crawl_time="2026-01-02 10:00:00")]
         }
         mock_news_data.id_to_name = {}
-        mock_storage.get_today_all_data.return_value = mock_news_data
+        mock_storage.get_today_snapshot.return_value = _snapshot(mock_news_data)
 
         results, id_to_name, title_info = read_all_today_titles_from_storage(mock_storage)
 
@@ -315,7 +323,7 @@ class TestReadAllTodayTitles:
             ]
         }
         mock_news_data.id_to_name = {"baidu": "百度"}
-        mock_storage.get_today_all_data.return_value = mock_news_data
+        mock_storage.get_today_snapshot.return_value = _snapshot(mock_news_data)
 
         results, id_to_name, title_info = read_all_today_titles(mock_storage, quiet=False)
 
@@ -325,7 +333,7 @@ class TestReadAllTodayTitles:
     def test_read_with_no_data_logging(self, capsys):
         """测试无数据时的日志"""
         mock_storage = Mock()
-        mock_storage.get_today_all_data.return_value = None
+        mock_storage.get_today_snapshot.return_value = None
 
         results, id_to_name, title_info = read_all_today_titles(mock_storage, quiet=False)
 
@@ -340,7 +348,7 @@ class TestReadAllTodayTitles:
             "baidu": [NewsItem(source_id="test", title="标题", rank=1, crawl_time="2026-01-02 10:00:00")]
         }
         mock_news_data.id_to_name = {"baidu": "百度"}
-        mock_storage.get_today_all_data.return_value = mock_news_data
+        mock_storage.get_today_snapshot.return_value = _snapshot(mock_news_data)
 
         results, id_to_name, title_info = read_all_today_titles(mock_storage, quiet=True)
 
@@ -348,6 +356,20 @@ class TestReadAllTodayTitles:
         assert "已从存储后端读取" not in captured.out
 
 
+def _historical_titles_from(all_data):
+    """用整天数据模拟存储后端的 get_historical_titles"""
+    def get_historical_titles(before_time, date=None, platform_ids=None):
+        historical_titles = {}
+        for source_id, news_list in all_data.items.items():
+            if platform_ids is not None and source_id not in platform_ids:
+                continue
+            titles = {item.title for item in news_list if item.first_time < before_time}
+            if titles:
+                historical_titles[source_id] = titles
+        return historical_titles
+    return get_historical_titles
+
+
 class TestDetectLatestNewTitlesFromStorage:
     """测试 detect_latest_new_titles_from_storage 函数"""
 
@@ -392,7 +414,7 @@ class TestDetectLatestNewTitlesFromStorage:
         mock_all.items["baidu"][1].first_time = "2026-01-02 12:00:00"  # Same as latest, so it's new
 
         mock_storage.get_latest_crawl_data.return_value = mock_latest
-        mock_storage.get_today_all_data.return_value = mock_all
+        mock_storage.get_historical_titles.side_effect = _historical_titles_from(mock_all)
 
         new_titles = detect_latest_new_titles_from_storage(mock_storage)
 
@@ -417,7 +439,7 @@ class TestDetectLatestNewTitlesFromStorage:
         mock_all.items = {"baidu": [item]}
 
         mock_storage.get_latest_crawl_data.return_value = mock_latest
-        mock_storage.get_today_all_data.return_value = mock_all
+        mock_storage.get_historical_titles.side_effect = _historical_titles_from(mock_all)
 
         new_titles = detect_latest_new_titles_from_storage(mock_storage)
 
@@ -441,7 +463,7 @@ class TestDetectLatestNewTitlesFromStorage:
         mock_all.items = {"baidu": [item]}
 
         mock_storage.get_latest_crawl_data.return_value = mock_latest
-        mock_storage.get_today_all_data.return_value = mock_all
+        mock_storage.get_historical_titles.side_effect = _historical_titles_from(mock_all)
 
         new_titles = detect_latest_new_titles_from_storage(mock_storage)
 
@@ -471,7 +493,7 @@ class TestDetectLatestNewTitlesFromStorage:
         mock_all.items = {"baidu": [baidu_old, baidu_item], "weibo": [weibo_item]}
 
         mock_storage.get_latest_crawl_data.return_value = mock_latest
-        mock_storage.get_today_all_data.return_value = mock_all
+        mock_storage.get_historical_titles.side_effect = _historical_titles_from(mock_all)
 
         new_titles = detect_latest_new_titles_from_storage(
             mock_storage, current_platform_ids=["baidu"]
@@ -498,7 +520,7 @@ class TestDetectLatestNewTitlesFromStorage:
         mock_latest.items = {"baidu": [NewsItem(source_id="test", title="标题", rank=1, crawl_time="2026-01-02 12:00:00")]}
 
         mock_storage.get_latest_crawl_data.return_value = mock_latest
-        mock_storage.get_today_all_data.return_value = None
+        mock_storage.get_historical_titles.return_value = None
 
         new_titles = detect_latest_new_titles_from_storage(mock_storage)
 
@@ -540,7 +562,7 @@ class TestDetectLatestNewTitles:
         mock_all.items = {"baidu": [historical, new1, new2]}
 
         mock_storage.get_latest_crawl_data.return_value = mock_latest
-        mock_storage.get_today_all_data.return_value = mock_all
+        mock_storage.get_historical_titles.side_effect = _historical_titles_from(mock_all)
 
         new_titles = detect_latest_new_titles(mock_storage, quiet=False)
 
@@ -8,7 +8,7 @@ import tempfile
 import os
 from pathlib import Path
 
-from trendradar.core.frequency import load_frequency_words, matches_word_groups
+from trendradar.core.frequency import KeywordMatcher, load_frequency_words, matches_word_groups
 
 
 class TestLoadFrequencyWords:
@@ -408,3 +408,80 @@ class TestMatchesWordGroups:
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
+
+
+class TestKeywordMatcher:
+    """KeywordMatcher 测试类"""
+
+    def test_overlapping_words(self):
+        """测试重叠、互为前后缀的词均能命中"""
+        matcher = KeywordMatcher([
+            {"group_key": "he", "normal": ["he"], "required": []},
+            {"group_key": "she", "normal": ["she"], "required": []},
+            {"group_key": "hers", "normal": ["hers"], "required": []},
+        ])
+
+        assert matcher.find_words("USHERS") == {"he", "she", "hers"}
+        assert matcher.find_words("ahishers") == {"he", "she", "hers"}
+        assert matcher.match_group("usher") == 0
+        assert matcher.find_words("无关标题") == set()
+
+    def test_first_matching_group_in_config_order(self):
+        """测试返回配置顺序中首个满足必须词/普通词规则的词组"""
+        word_groups = [
+            {"group_key": "深度学习", "normal": ["深度学习"], "required": ["人工智能"]},
+            {"group_key": "AI", "normal": ["ai", "人工智能"], "required": []},
+            {"group_key": "芯片", "normal": [], "required": ["芯片", "美国"]},
+        ]
+        matcher = KeywordMatcher(word_groups, ["广告"], ["震惊"])
+
+        assert matcher.match_group("人工智能推动深度学习") == 0
+        assert matcher.match_group("深度学习与 AI") == 1
+        assert matcher.match_group("美国芯片出口管制") == 2
+        assert matcher.match_group("芯片产能提升") is None
+        assert matcher.match_group("AI 广告") is None
+        assert matcher.match_group("震惊！AI 新进展") is None
+
+    def test_equivalent_to_matches_word_groups(self):
+        """测试随机词组与标题上与 matches_word_groups 结果一致"""
+        import random
+
+        rng = random.Random(7)
+        alphabet = "abcAB人工智能芯片"
+
+        def rand_word():
+            return "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 3)))
+
+        for _ in range(30):
+            word_groups = []
+            for i in range(rng.randint(0, 6)):
+                word_groups.append({
+                    "group_key": str(i),
+                    "required": [rand_word() for _ in range(rng.randint(0, 2))],
+                    "normal": [rand_word() for _ in range(rng.randint(0, 3))],
+                })
+            filter_words = [rand_word() for _ in range(rng.randint(0, 2))]
+            global_filters = [rand_word() for _ in range(rng.randint(0, 1))]
+            matcher = KeywordMatcher(word_groups, filter_words, global_filters)
+
+            for _ in range(50):
+                title = "".join(rng.choice(alphabet + " ") for _ in range(rng.randint(0, 12)))
+                expected = matches_word_groups(title, word_groups, filter_words, global_filters)
+                assert matcher.matches(title) is expected, (title, word_groups)
+
+    def test_edge_cases(self):
+        """测试空标题、非字符串标题、空词组与大小写"""
+        matcher = KeywordMatcher([{"group_key": "AI", "normal": ["Ai"], "required": []}])
+        assert matcher.matches("ai 技术") is True
+        assert matcher.matches("AI 技术") is True
+        assert matcher.matches("") is False
+        assert matcher.matches("   ") is False
+        assert matcher.matches(None) is False
+
+        number_matcher = KeywordMatcher([{"group_key": "n", "normal": ["123"], "required": []}])
+        assert number_matcher.matches(123) is True
+
+        empty = KeywordMatcher([], [], ["广告"])
+        assert empty.matches("任意标题") is True
+        assert empty.matches("广告标题") is False
+        assert empty.match_group("任意标题") is None
@@ -159,6 +159,7 @@ class TestLoadCrawlerConfig:
             "advanced": {
                 "crawler": {
                     "request_interval": 200,
+                    "max_workers": 4,
                     "use_proxy": True,
                     "default_proxy": "http://proxy",
                     "enabled": False
@@ -167,6 +168,7 @@ class TestLoadCrawlerConfig:
         }
         result = _load_crawler_config(config_data)
         assert result["REQUEST_INTERVAL"] == 200
+        assert result["MAX_WORKERS"] == 4
         assert result["USE_PROXY"] is True
         assert result["DEFAULT_PROXY"] == "http://proxy"
         assert result["ENABLE_CRAWLER"] is False
@@ -176,6 +178,8 @@ class TestLoadCrawlerConfig:
         config_data = {}
         result = _load_crawler_config(config_data)
         assert result["REQUEST_INTERVAL"] == 100
+        assert result["MAX_WORKERS"] == 1
+        assert result["POOL_SIZE"] == 10
         assert result["USE_PROXY"] is False
         assert result["DEFAULT_PROXY"] == ""
         assert result["ENABLE_CRAWLER"] is True
@@ -382,6 +386,8 @@ class TestLoadRSSConfig:
         assert result["ENABLED"] is False
         assert result["REQUEST_INTERVAL"] == 2000
         assert result["TIMEOUT"] == 15
+        assert result["MAX_WORKERS"] == 1
+        assert result["CONDITIONAL_GET"] is True
         assert result["USE_PROXY"] is False
         assert result["PROXY_URL"] == ""
         assert result["FEEDS"] == []
@@ -448,6 +454,11 @@ class TestLoadStorageConfig:
                 "pull": {
                     "enabled": True,
                     "days": 14
+                },
+                "sqlite": {
+                    "journal_mode": "delete",
+                    "synchronous": "full",
+                    "busy_timeout": 1000
                 }
             }
         }
@@ -466,6 +477,10 @@ class TestLoadStorageConfig:
         assert result["REMOTE"]["RETENTION_DAYS"] == 90
         assert result["PULL"]["ENABLED"] is True
         assert result["PULL"]["DAYS"] == 14
+        assert result["SQLITE"]["JOURNAL_MODE"] == "delete"
+        assert result["SQLITE"]["SYNCHRONOUS"] == "full"
+        assert result["SQLITE"]["BUSY_TIMEOUT"] == 1000
+        assert result["SQLITE"]["MMAP_SIZE"] == 268435456
 
     def test_load_storage_config_defaults(self) -> None:
         """测试默认值"""
@@ -485,6 +500,9 @@ class TestLoadStorageConfig:
         assert result["REMOTE"]["RETENTION_DAYS"] == 0
         assert result["PULL"]["ENABLED"] is False
         assert result["PULL"]["DAYS"] == 7
+        assert result["SQLITE"]["JOURNAL_MODE"] == "wal"
+        assert result["SQLITE"]["SYNCHRONOUS"] == "normal"
+        assert result["SQLITE"]["TEMP_STORE"] == "memory"
 
 
 class TestLoadWebhookConfig:
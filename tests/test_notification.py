@@ -0,0 +1,338 @@
+# coding=utf-8
+"""
+通知模块单元测试 (trendradar/notification)
+"""
+
+import hashlib
+import random
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Tuple
+from unittest.mock import Mock, patch
+
+import pytest
+
+from trendradar.notification import BatchRateLimiter, NotificationDispatcher
+from trendradar.notification.splitter import split_content_into_batches
+
+
+REPORT_DATA = {
+    "stats": [{"word": "AI", "count": 1, "titles": [{"title": "AI 新闻", "source_name": "知乎"}]}],
+    "new_titles": [],
+    "failed_ids": [],
+    "total_new_count": 0,
+}
+
+
+def _fake_sender(**kwargs):
+    """模拟发送函数：只调用分批函数，并修改返回的列表"""
+    batches = kwargs["split_content_func"](
+        kwargs["report_data"], "bark", kwargs["update_info"],
+        max_bytes=kwargs["batch_size"] - 100, mode=kwargs["mode"],
+    )
+    batches.append("被调用方修改")
+    return True
+
+
+class TestNotificationDispatcherRenderCache:
+    """调度器渲染缓存测试"""
+
+    def _dispatcher(self, config, split_func):
+        return NotificationDispatcher(
+            config=config,
+            get_time_func=lambda: datetime(2026, 1, 2, 10, 0),
+            split_content_func=split_func,
+        )
+
+    def test_accounts_share_one_render(self):
+        """测试多账号、相同限制只渲染一次，且缓存结果不被调用方修改"""
+        split_func = Mock(return_value=["批次1", "批次2"])
+        dispatcher = self._dispatcher({"BARK_URL": "https://a;https://b;https://c"}, split_func)
+        seen = []
+
+        def sender(**kwargs):
+            seen.append(kwargs["split_content_func"](
+                kwargs["report_data"], "bark", None, max_bytes=kwargs["batch_size"], mode="daily",
+            ))
+            seen[-1].append("被调用方修改")
+            return True
+
+        with patch("trendradar.notification.dispatcher.send_to_bark", side_effect=sender):
+            results = dispatcher.dispatch_all(REPORT_DATA, "当日汇总")
+
+        assert results == {"bark": True}
+        assert split_func.call_count == 1
+        assert seen == [["批次1", "批次2", "被调用方修改"]] * 3
+
+    def test_different_limits_render_separately(self):
+        """测试不同格式/大小分别渲染，缓存在两次调度之间清空"""
+        split_func = Mock(return_value=["批次"])
+        dispatcher = self._dispatcher(
+            {"BARK_URL": "https://a;https://b", "SLACK_WEBHOOK_URL": "https://s", "SLACK_BATCH_SIZE": 3000},
+            split_func,
+        )
+
+        with patch("trendradar.notification.dispatcher.send_to_bark", side_effect=_fake_sender), \
+                patch("trendradar.notification.dispatcher.send_to_slack", side_effect=_fake_sender):
+            dispatcher.dispatch_all(REPORT_DATA, "当日汇总")
+            assert split_func.call_count == 2
+            dispatcher.dispatch_all(REPORT_DATA, "当日汇总")
+
+        assert split_func.call_count == 4
+        assert dispatcher._render_cache == {}
+
+    def test_render_lock_is_per_key(self):
+        """测试不同键并行渲染，相同键等待首次渲染结果"""
+        slack_started = threading.Event()
+        slack_release = threading.Event()
+        calls = []
+
+        def split_func(report_data, format_type, update_info, **kwargs):
+            calls.append(format_type)
+            if format_type == "slack":
+                slack_started.set()
+                slack_release.wait(2)
+            return [format_type]
+
+        dispatcher = self._dispatcher({}, split_func)
+        results = []
+        slow = [threading.Thread(
+            target=lambda: results.append(dispatcher._split_content_cached(REPORT_DATA, "slack"))
+        ) for _ in range(2)]
+        for thread in slow:
+            thread.start()
+        assert slack_started.wait(2)
+
+        # slack 渲染未完成时 bark 不被阻塞
+        start = time.monotonic()
+        assert dispatcher._split_content_cached(REPORT_DATA, "bark") == ["bark"]
+        assert time.monotonic() - start < 1
+
+        slack_release.set()
+        for thread in slow:
+            thread.join()
+        assert results == [["slack"], ["slack"]]
+        assert sorted(calls) == ["bark", "slack"]
+
+
+class TestConcurrentDelivery:
+    """并发推送测试"""
+
+    def test_slow_channel_does_not_block_others(self):
+        """测试慢渠道不阻塞其他渠道，结果映射与顺序模式一致"""
+        release = threading.Event()
+        finished = []
+
+        def slow_telegram(**kwargs):
+            release.wait(2)
+            finished.append("telegram")
+            return True
+
+        def fast_bark(**kwargs):
+            finished.append(kwargs["account_label"])
+            if len(finished) == 2:
+                release.set()
+            return kwargs["account_label"] == "账号2"
+
+        config = {
+            "NOTIFICATION_MAX_WORKERS": 4,
+            "TELEGRAM_BOT_TOKEN": "token",
+            "TELEGRAM_CHAT_ID": "chat",
+            "BARK_URL": "https://a;https://b",
+            "SLACK_WEBHOOK_URL": "https://s",
+        }
+        dispatcher = NotificationDispatcher(config, datetime.now, Mock(return_value=["批次"]))
+
+        with patch("trendradar.notification.dispatcher.send_to_telegram", side_effect=slow_telegram), \
+                patch("trendradar.notification.dispatcher.send_to_bark", side_effect=fast_bark), \
+                patch("trendradar.notification.dispatcher.send_to_slack", side_effect=RuntimeError("boom")):
+            start = time.monotonic()
+            results = dispatcher.dispatch_all(REPORT_DATA, "当日汇总")
+
+        assert time.monotonic() - start < 1.5
+        assert finished[-1] == "telegram"
+        assert list(results.items()) == [("telegram", True), ("bark", True), ("slack", False)]
+
+    def test_channel_limiter_shared_by_accounts(self):
+        """测试同一渠道的账号共用限速器，不同渠道各自独立"""
+        limiters = {}
+
+        def sender(**kwargs):
+            limiters.setdefault(kwargs["bark_url"] if "bark_url" in kwargs else "slack", kwargs["rate_limiter"])
+            return True
+
+        config = {
+            "NOTIFICATION_MAX_WORKERS": 2,
+            "BATCH_SEND_INTERVAL": 0.5,
+            "BARK_URL": "https://a;https://b",
+            "SLACK_WEBHOOK_URL": "https://s",
+        }
+        dispatcher = NotificationDispatcher(config, datetime.now, Mock(return_value=["批次"]))
+        with patch("trendradar.notification.dispatcher.send_to_bark", side_effect=sender), \
+                patch("trendradar.notification.dispatcher.send_to_slack", side_effect=sender):
+            dispatcher.dispatch_all(REPORT_DATA, "当日汇总")
+
+        assert limiters["https://a"] is limiters["https://b"]
+        assert limiters["slack"] is not limiters["https://a"]
+        assert limiters["slack"].interval == 0.5
+
+    def test_sequential_mode_keeps_sender_sleep(self):
+        """测试顺序模式不传限速器（沿用发送函数内的批次间隔）"""
+        sender = Mock(return_value=True)
+        dispatcher = NotificationDispatcher({"BARK_URL": "https://a"}, datetime.now, Mock())
+        with patch("trendradar.notification.dispatcher.send_to_bark", sender):
+            assert dispatcher.dispatch_all(REPORT_DATA, "当日汇总") == {"bark": True}
+        assert sender.call_args.kwargs["rate_limiter"] is None
+
+
+class TestBatchRateLimiter:
+    """批次限速器测试"""
+
+    def test_spacing(self):
+        """测试相邻批次至少间隔 interval 秒，首个批次不等待"""
+        limiter = BatchRateLimiter(0.05)
+        start = time.monotonic()
+        stamps = []
+        for _ in range(3):
+            limiter.wait()
+            stamps.append(time.monotonic() - start)
+
+        assert stamps[0] < 0.045
+        assert stamps[1] >= 0.05
+        assert stamps[2] >= 0.1
+
+
+FORMATS = ["feishu", "dingtalk", "wework", "telegram", "ntfy", "bark", "slack"]
+SOURCES = ["知乎", "微博", "百度热搜", "今日头条", "Hacker News"]
+CHARS = "的一是在不了有和人这中大为上个国我以要他时来用们生到作地于出就分对成会可主发年动同工也能下过子说产种面而方后多定行学法所民得经"
+
+
+class LegacyBatchBuilder:
+    """改造前的分批策略（对照组）：字符串拼接，每次整体编码判断大小"""
+
+    def __init__(self, base_header: str, base_footer: str, max_bytes: int):
+        self.base_header = base_header
+        self.base_footer = base_footer
+        self.max_bytes = max_bytes
+        self.batches: List[str] = []
+        self.has_content = False
+        self.current = base_header
+
+    def _fits(self, fragment: str) -> bool:
+        return len((self.current + fragment).encode("utf-8")) + len(self.base_footer.encode("utf-8")) < self.max_bytes
+
+    def add(self, fragment: str, *restart_prefix: str) -> None:
+        if self._fits(fragment):
+            self.current += fragment
+        else:
+            if self.has_content:
+                self.batches.append(self.current + self.base_footer)
+            self.current = self.base_header + "".join(restart_prefix) + fragment
+        self.has_content = True
+
+    def add_if_fits(self, fragment: str) -> None:
+        if self._fits(fragment):
+            self.current += fragment
+
+    def append(self, fragment: str) -> None:
+        self.current += fragment
+
+    def finish(self) -> List[str]:
+        if self.has_content:
+            self.batches.append(self.current + self.base_footer)
+            self.has_content = False
+            self.current = self.base_header
+        return self.batches
+
+
+def build_report(titles: int, seed: int = 42) -> Tuple[Dict, List[Dict], List[Dict]]:
+    """构造 report_data 以及 RSS 统计/新增列表，热榜统计占约 80% 的标题"""
+    rng = random.Random(seed)
+    counter = 0
+
+    def title_data(keyword: str) -> Dict:
+        nonlocal counter
+        counter += 1
+        return {
+            "title": "".join(rng.choice(CHARS) for _ in range(rng.randint(12, 36))),
+            "source_name": rng.choice(SOURCES),
+            "time_display": rng.choice(["", "[08:00 ~ 12:30]", "10:15"]),
+            "count": rng.randint(1, 8),
+            "ranks": sorted(rng.sample(range(1, 51), rng.randint(1, 3))),
+            "rank_threshold": 5,
+            "url": f"https://example.com/news/{counter}",
+            "mobile_url": rng.choice(["", f"https://m.example.com/news/{counter}"]),
+            "is_new": rng.random() < 0.2,
+            "matched_keyword": keyword,
+        }
+
+    def groups(total: int, group_count: int) -> List[Dict]:
+        result = []
+        for i in range(group_count):
+            word = f"关键词{i}"
+            size = total // group_count + (1 if i < total % group_count else 0)
+            result.append({"word": word, "count": size, "titles": [title_data(word) for _ in range(size)]})
+        return result
+
+    stats_total = titles * 8 // 10
+    new_total = titles * 1 // 10
+    rss_total = titles - stats_total - new_total
+    new_titles = []
+    for i, source in enumerate(SOURCES):
+        size = new_total // len(SOURCES) + (1 if i < new_total % len(SOURCES) else 0)
+        new_titles.append({"source_id": f"s{i}", "source_name": source,
+                           "titles": [title_data("") for _ in range(size)]})
+    report_data = {
+        "stats": groups(stats_total, 40),
+        "new_titles": new_titles,
+        "failed_ids": ["toutiao", "douyin"],
+        "total_new_count": new_total,
+    }
+    return report_data, groups(rss_total - rss_total // 2, 5), groups(rss_total // 2, 5)
+
+
+# 改造前实现对 build_report(300, seed=7)、max_bytes=1200 的输出摘要（批次数, sha256 前缀）
+SPLIT_DIGESTS = {
+    "feishu": (75, "1e2feac5ca310e65"),
+    "dingtalk": (50, "b9c50036dddaf9a5"),
+    "wework": (47, "1abfe922d4997037"),
+    "telegram": (56, "50ba2aec7a7a50f3"),
+    "ntfy": (46, "826c83e30a148add"),
+    "bark": (46, "8379dd0788333e07"),
+    "slack": (47, "def7c2cd1b6b4b6b"),
+}
+
+
+def _split(report, format_type, **kwargs):
+    report_data, rss_items, rss_new_items = report
+    return split_content_into_batches(
+        report_data, format_type, mode="daily",
+        get_time_func=lambda: datetime(2026, 1, 2, 10, 0),
+        rss_items=rss_items, rss_new_items=rss_new_items, **kwargs,
+    )
+
+
+class TestSplitContentIntoBatches:
+    """消息分批回归测试"""
+
+    @pytest.mark.parametrize("format_type", FORMATS)
+    def test_output_unchanged(self, format_type):
+        """测试各格式输出与改造前逐字节一致"""
+        batches = _split(build_report(300, seed=7), format_type, max_bytes=1200)
+        digest = hashlib.sha256("\x00".join(batches).encode("utf-8")).hexdigest()[:16]
+        assert (len(batches), digest) == SPLIT_DIGESTS[format_type]
+        assert all(len(batch.encode("utf-8")) < 1200 for batch in batches)
+
+    @pytest.mark.parametrize("format_type", FORMATS)
+    @pytest.mark.parametrize("options", [
+        {},
+        {"max_bytes": 2500, "reverse_content_order": True},
+        {"max_bytes": 600, "display_mode": "platform", "update_info": {"remote_version": "9.0", "current_version": "1.0"}},
+    ])
+    def test_matches_concatenating_builder(self, format_type, options):
+        """测试 2000 条标题的大报告与逐行拼接、整体编码的分批方式结果一致"""
+        report = build_report(2000)
+        with patch("trendradar.notification.splitter._BatchBuilder", LegacyBatchBuilder):
+            expected = _split(report, format_type, **options)
+        assert _split(report, format_type, **options) == expected
@@ -9,6 +9,7 @@ from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime, timedelta
 from requests.exceptions import Timeout, RequestException
 
+from trendradar.crawler.rss.cache import FeedCacheEntry, FeedValidatorCache
 from trendradar.crawler.rss.fetcher import RSSFetcher, RSSFeedConfig
 from trendradar.crawler.rss.parser import RSSParser, ParsedRSSItem
 from trendradar.storage.base import RSSItem, RSSData
@@ -758,3 +759,164 @@ def sample_rss_content():
             </item>
         </channel>
     </rss>'''
+
+
+class TestFeedValidatorCache:
+    """RSS 源校验缓存测试"""
+
+    def test_set_and_get(self, tmp_path):
+        """测试写入与读取"""
+        cache = FeedValidatorCache(tmp_path / "rss" / "feed_cache.db")
+        cache.set("feed1", FeedCacheEntry(
+            url="https://example.com/feed",
+            etag='"abc"',
+            last_modified="Wed, 01 Jan 2025 00:00:00 GMT",
+            content_hash="hash1",
+            items=[ParsedRSSItem(title="标题", url="https://example.com/1", summary="摘要")],
+        ))
+
+        entry = cache.get("feed1", "https://example.com/feed")
+        assert entry is not None
+        assert entry.etag == '"abc"'
+        assert entry.last_modified == "Wed, 01 Jan 2025 00:00:00 GMT"
+        assert entry.content_hash == "hash1"
+        assert entry.items == [ParsedRSSItem(title="标题", url="https://example.com/1", summary="摘要")]
+        cache.close()
+
+    def test_persisted_across_instances(self, tmp_path):
+        """测试缓存持久化"""
+        db_path = tmp_path / "feed_cache.db"
+        cache = FeedValidatorCache(db_path)
+        cache.set("feed1", FeedCacheEntry(url="https://example.com/feed", etag="e1"))
+        cache.close()
+
+        reopened = FeedValidatorCache(db_path)
+        assert reopened.get("feed1", "https://example.com/feed").etag == "e1"
+        reopened.close()
+
+    def test_url_change_invalidates(self, tmp_path):
+        """测试 URL 变化时缓存失效"""
+        cache = FeedValidatorCache(tmp_path / "feed_cache.db")
+        cache.set("feed1", FeedCacheEntry(url="https://example.com/old", etag="e1"))
+
+        assert cache.get("feed1", "https://example.com/new") is None
+        assert cache.get("missing", "https://example.com/old") is None
+        cache.close()
+
+
+class TestRSSFetcherConditionalGet:
+    """RSS 条件请求测试"""
+
+    FEED_XML = b"<rss>content</rss>"
+
+    def _make_fetcher(self, tmp_path):
+        feeds = [RSSFeedConfig(id="test", name="Test Feed", url="https://example.com/feed")]
+        fetcher = RSSFetcher(feeds=feeds, cache_path=tmp_path / "feed_cache.db")
+        return fetcher, feeds[0]
+
+    def _response(self, status_code=200, content=FEED_XML, headers=None):
+        response = Mock()
+        response.status_code = status_code
+        response.content = content
+        response.text = content.decode("utf-8")
+        response.headers = headers or {}
+        response.raise_for_status = Mock()
+        return response
+
+    @patch('trendradar.crawler.rss.fetcher.requests.Session.get')
+    def test_first_fetch_stores_validators(self, mock_get, tmp_path):
+        """测试首次抓取写入校验信息"""
+        fetcher, feed = self._make_fetcher(tmp_path)
+        mock_get.return_value = self._response(headers={"ETag": '"v1"', "Last-Modified": "LM1"})
+
+        with patch.object(fetcher.parser, 'parse', return_value=[
+            ParsedRSSItem(title="Article", url="https://example.com/a")
+        ]):
+            items, error = fetcher.fetch_feed(feed)
+
+        assert error is None
+        assert len(items) == 1
+        assert mock_get.call_args.kwargs["headers"] == {}
+        entry = fetcher.cache.get("test", feed.url)
+        assert entry.etag == '"v1"'
+        assert entry.last_modified == "LM1"
+        fetcher.close()
+
+    @patch('trendradar.crawler.rss.fetcher.requests.Session.get')
+    def test_not_modified_reuses_cached_items(self, mock_get, tmp_path):
+        """测试 304 时复用缓存条目且不解析"""
+        fetcher, feed = self._make_fetcher(tmp_path)
+        fetcher.cache.set("test", FeedCacheEntry(
+            url=feed.url, etag='"v1"', last_modified="LM1", content_hash="h",
+            items=[ParsedRSSItem(title="Cached", url="https://example.com/c")],
+        ))
+        mock_get.return_value = self._response(status_code=304, content=b"")
+
+        with patch.object(fetcher.parser, 'parse') as mock_parse:
+            items, error = fetcher.fetch_feed(feed)
+
+        mock_parse.assert_not_called()
+        assert error is None
+        assert [item.title for item in items] == ["Cached"]
+        assert mock_get.call_args.kwargs["headers"] == {
+            "If-None-Match": '"v1"',
+            "If-Modified-Since": "LM1",
+        }
+        fetcher.close()
+
+    @patch('trendradar.crawler.rss.fetcher.requests.Session.get')
+    def test_unchanged_hash_skips_parsing(self, mock_get, tmp_path):
+        """测试内容哈希未变化时跳过解析"""
+        fetcher, feed = self._make_fetcher(tmp_path)
+        mock_get.return_value = self._response()
+
+        with patch.object(fetcher.parser, 'parse', return_value=[
+            ParsedRSSItem(title="Article", url="https://example.com/a")
+        ]) as mock_parse:
+            first, _ = fetcher.fetch_feed(feed)
+            second, _ = fetcher.fetch_feed(feed)
+
+        assert mock_parse.call_count == 1
+        assert [item.title for item in second] == [item.title for item in first]
+        fetcher.close()
+
+
+class TestRSSFetcherConcurrent:
+    """RSS 并发抓取测试"""
+
+    @patch('trendradar.crawler.rss.fetcher.RSSFetcher.fetch_feed')
+    def test_concurrent_keeps_feed_order(self, mock_fetch_feed):
+        """测试并发模式下结果顺序与配置顺序一致"""
+        feeds = [
+            RSSFeedConfig(id=f"feed{i}", name=f"Feed {i}", url=f"https://host{i}.example.com/rss")
+            for i in range(4)
+        ]
+        fetcher = RSSFetcher(feeds=feeds, max_workers=4)
+
+        def fake_fetch(feed, rate_limiter=None):
+            if feed.id == "feed2":
+                return [], "Connection failed"
+            return [RSSItem(title=feed.name, feed_id=feed.id, url=feed.url,
+                            crawl_time="12:00", first_time="12:00", last_time="12:00", count=1)], None
+
+        mock_fetch_feed.side_effect = fake_fetch
+
+        result = fetcher.fetch_all()
+
+        assert list(result.items.keys()) == ["feed0", "feed1", "feed3"]
+        assert result.failed_ids == ["feed2"]
+        assert list(result.id_to_name.keys()) == ["feed0", "feed1", "feed2", "feed3"]
+        assert mock_fetch_feed.call_count == 4
+
+    def test_from_config_concurrency_and_cache(self, tmp_path):
+        """测试从配置启用并发和校验缓存"""
+        config = {
+            "max_workers": 3,
+            "cache_path": str(tmp_path / "feed_cache.db"),
+            "feeds": [{"id": "test", "name": "Test", "url": "https://example.com/feed"}],
+        }
+        fetcher = RSSFetcher.from_config(config)
+        assert fetcher.max_workers == 3
+        assert fetcher.cache is not None
+        fetcher.close()
+        assert fetcher.cache is None
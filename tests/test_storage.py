@@ -4,9 +4,11 @@ TrendRadar Storage Manager 单元测试
 """
 
 import pytest
+import sqlite3
 import tempfile
 import shutil
 import os
+import sys
 from pathlib import Path
 from datetime import datetime
 from typing import Any
@@ -560,6 +562,14 @@ class TestStorageManagerAdvanced:
         assert isinstance(filepath, str)
         assert filepath.endswith("test_report.html")
 
+    def test_save_html_report_streaming(self, storage):
+        """测试 HTML 报告可按片段流式写入"""
+        fragments = (f"<p>第{i}段</p>" for i in range(3))
+
+        filepath = storage.save_html_report(fragments, "stream.html")
+        with open(filepath, encoding="utf-8") as f:
+            assert f.read() == "<p>第0段</p><p>第1段</p><p>第2段</p>"
+
     def test_is_first_crawl_today(self, storage):
         """测试检查是否首次爬取"""
         # 第一次应该是 True
@@ -727,5 +737,867 @@ class TestStorageManagerSingleton:
         assert manager1 is not manager2
 
 
+class TestSQLiteBatchWriter:
+    """SQLite 批量写入器测试（批量路径与逐条路径结果一致）"""
+
+    TABLES = {
+        "news_items": "SELECT id, title, platform_id, rank, url, mobile_url, "
+                      "first_crawl_time, last_crawl_time, crawl_count FROM news_items ORDER BY id",
+        "rank_history": "SELECT news_item_id, rank, crawl_time FROM rank_history ORDER BY id",
+        "title_changes": "SELECT news_item_id, old_title, new_title FROM title_changes ORDER BY id",
+    }
+
+    @staticmethod
+    def _crawls():
+        """构造多批次数据：新增、更新、标题变更、空 URL、同批次重复 URL、URL 标准化"""
+        def item(title, url, rank, source_id="zhihu"):
+            return NewsItem(title=title, source_id=source_id, url=url, rank=rank)
+
+        return [
+            NewsData(date="2026-01-02", crawl_time="10-00", items={
+                "zhihu": [
+                    item("A", "http://example.com/a", 1),
+                    item("B", "http://example.com/b", 2),
+                    item("无链接", "", 3),
+                    item("A 重复", "http://example.com/a", 4),
+                ],
+                "weibo": [
+                    item("热搜", "https://s.weibo.com/weibo?q=x&band_rank=1", 1, "weibo"),
+                ],
+            }),
+            NewsData(date="2026-01-02", crawl_time="11-00", items={
+                "zhihu": [
+                    item("A 新标题", "http://example.com/a", 2),
+                    item("C", "http://example.com/c", 1),
+                    item("无链接", "", 5),
+                ],
+                "weibo": [
+                    item("热搜", "https://s.weibo.com/weibo?q=x&band_rank=7", 3, "weibo"),
+                ],
+            }),
+        ]
+
+    def _run(self, temp_dir, writer_name):
+        from trendradar.storage.local import LocalStorageBackend
+
+        backend = LocalStorageBackend(data_dir=temp_dir, enable_txt=False, enable_html=False)
+        counts = []
+        for data in self._crawls():
+            conn = backend._get_connection(data.date)
+            cursor = conn.cursor()
+            counts.append(getattr(backend._writer, writer_name)(cursor, data, "2026-01-02 00:00:00"))
+            conn.commit()
+
+        conn = backend._get_connection("2026-01-02")
+        tables = {name: [tuple(row) for row in conn.execute(sql)] for name, sql in self.TABLES.items()}
+        backend.cleanup()
+        return counts, tables
+
+    def test_batched_matches_rowwise(self, tmp_path):
+        """测试批量路径与逐条路径的计数和写入结果一致"""
+        rowwise = self._run(str(tmp_path / "rowwise"), "write_news_items_rowwise")
+        batched = self._run(str(tmp_path / "batched"), "write_news_items_batched")
+
+        assert batched == rowwise
+        counts, tables = batched
+        assert counts == [(4, 1, 1), (2, 2, 1)]
+        assert len(tables["rank_history"]) == 9
+
+    def test_save_news_data_uses_batched_path(self, tmp_path):
+        """测试 save_news_data 走批量路径"""
+        from trendradar.storage.local import LocalStorageBackend
+
+        backend = LocalStorageBackend(data_dir=str(tmp_path), enable_txt=False, enable_html=False)
+        with patch.object(
+            backend._writer, "write_news_items_rowwise", wraps=backend._writer.write_news_items_rowwise
+        ) as rowwise:
+            for data in self._crawls():
+                assert backend.save_news_data(data)
+        rowwise.assert_not_called()
+
+        latest = backend.get_latest_crawl_data("2026-01-02")
+        assert sorted(item.title for items in latest.items.values() for item in items) == [
+            "A 新标题", "C", "无链接", "热搜",
+        ]
+        backend.cleanup()
+
+    def test_batched_failure_falls_back_to_rowwise(self, tmp_path):
+        """测试批量写入失败时回退逐条写入，单条失败不影响其他条目"""
+        from trendradar.storage.local import LocalStorageBackend
+
+        backend = LocalStorageBackend(data_dir=str(tmp_path), enable_txt=False, enable_html=False)
+        data = NewsData(date="2026-01-02", crawl_time="10-00", items={
+            "zhihu": [
+                NewsItem(title="正常", source_id="zhihu", url="http://example.com/ok", rank=1),
+                NewsItem(title="缺少排名", source_id="zhihu", url="http://example.com/bad", rank=None),
+            ],
+        })
+
+        assert backend.save_news_data(data)
+
+        conn = backend._get_connection("2026-01-02")
+        titles = [row[0] for row in conn.execute("SELECT title FROM news_items")]
+        assert titles == ["正常"]
+        backend.cleanup()
+
+
+    @staticmethod
+    def _rss_crawls():
+        """构造 RSS 多批次数据：新增、更新、同批次重复 URL"""
+        from trendradar.storage.base import RSSItem
+
+        def item(title, url, feed_id="hn"):
+            return RSSItem(title=title, feed_id=feed_id, url=url, published_at="2026-01-02T08:00:00")
+
+        return [
+            RSSData(date="2026-01-02", crawl_time="10-00", items={
+                "hn": [item("A", "http://example.com/a"), item("B", "http://example.com/b"),
+                       item("A 重复", "http://example.com/a")],
+                "lobsters": [item("L", "http://example.com/l", "lobsters")],
+            }, id_to_name={"hn": "Hacker News", "lobsters": "Lobsters"}, failed_ids=["v2ex"]),
+            RSSData(date="2026-01-02", crawl_time="11-00", items={
+                "hn": [item("A 新标题", "http://example.com/a"), item("C", "http://example.com/c")],
+            }, id_to_name={"hn": "Hacker News"}),
+        ]
+
+    def test_rss_batched_matches_rowwise(self, tmp_path):
+        """测试 RSS 批量路径与逐条路径的计数和写入结果一致"""
+        from trendradar.storage.local import LocalStorageBackend
+
+        sql = ("SELECT id, title, feed_id, url, first_crawl_time, last_crawl_time, crawl_count "
+               "FROM rss_items ORDER BY id")
+        results = []
+        for writer_name in ("write_rss_items_rowwise", "write_rss_items_batched"):
+            backend = LocalStorageBackend(data_dir=str(tmp_path / writer_name),
+                                          enable_txt=False, enable_html=False)
+            counts = []
+            for data in self._rss_crawls():
+                conn = backend._get_connection(data.date, db_type="rss")
+                counts.append(getattr(backend._writer, writer_name)(
+                    conn.cursor(), data, "2026-01-02 00:00:00"))
+                conn.commit()
+            conn = backend._get_connection("2026-01-02", db_type="rss")
+            results.append((counts, [tuple(row) for row in conn.execute(sql)]))
+            backend.cleanup()
+
+        assert results[0] == results[1]
+        counts, rows = results[1]
+        assert counts == [(3, 1), (1, 1)]
+        assert [row[1] for row in rows] == ["A 新标题", "B", "L", "C"]
+
+    def test_save_rss_data_single_transaction(self, tmp_path):
+        """测试 save_rss_data 在单事务内写入条目、抓取记录与状态"""
+        from trendradar.storage.local import LocalStorageBackend
+
+        backend = LocalStorageBackend(data_dir=str(tmp_path), enable_txt=False, enable_html=False)
+        with patch.object(
+            backend._writer, "write_rss_items_rowwise", wraps=backend._writer.write_rss_items_rowwise
+        ) as rowwise:
+            for data in self._rss_crawls():
+                assert backend.save_rss_data(data)
+        rowwise.assert_not_called()
+
+        conn = backend._get_connection("2026-01-02", db_type="rss")
+        assert not conn.in_transaction
+        statuses = sorted(tuple(row) for row in conn.execute(
+            "SELECT feed_id, status FROM rss_crawl_status"))
+        assert statuses == [("hn", "success"), ("hn", "success"),
+                            ("lobsters", "success"), ("v2ex", "failed")]
+        assert conn.execute("SELECT name FROM rss_feeds WHERE id = 'v2ex'").fetchone()[0] == "v2ex"
+        backend.cleanup()
+
+    def test_save_news_data_rolls_back_on_error(self, tmp_path):
+        """测试写入抓取记录出错时整体回滚，不留下部分条目"""
+        from trendradar.storage.local import LocalStorageBackend
+        from trendradar.storage import sqlite_writer
+
+        backend = LocalStorageBackend(data_dir=str(tmp_path), enable_txt=False, enable_html=False)
+        with patch.object(sqlite_writer, "INSERT_CRAWL_RECORD_SQL", "INSERT INTO missing_table VALUES (?, ?, ?)"):
+            assert not backend.save_news_data(self._crawls()[0])
+
+        conn = backend._get_connection("2026-01-02")
+        assert not conn.in_transaction
+        assert conn.execute("SELECT COUNT(*) FROM news_items").fetchone()[0] == 0
+        backend.cleanup()
+
+
+class TestHistoricalTitles:
+    """新增标题检测的索引查询测试"""
+
+    def test_matches_full_day_scan(self, tmp_path, save_news):
+        """测试索引查询与整天数据扫描结果一致（含 URL 变化产生的重复标题）"""
+        from trendradar.storage.base import StorageBackend
+        from trendradar.storage.local import LocalStorageBackend
+
+        backend = LocalStorageBackend(data_dir=str(tmp_path), enable_txt=False, enable_html=False)
+        assert backend.get_historical_titles("10-00", "2026-01-02") is None
+        # 没有日库时不创建空库
+        assert not backend._get_db_path("2026-01-02").exists()
+
+        save_news(backend, "10-00", {"zhihu": [("A", "http://a"), ("B", "http://b")],
+                                  "weibo": [("W", "http://w")]}, date="2026-01-02")
+        save_news(backend, "11-00", {"zhihu": [("A", "http://a2"), ("C", "http://c")]}, date="2026-01-02")
+
+        for before_time in ("10-00", "11-00", "12-00"):
+            for platform_ids in (None, ["zhihu"], []):
+                indexed = backend.get_historical_titles(before_time, "2026-01-02", platform_ids)
+                scanned = StorageBackend.get_historical_titles(
+                    backend, before_time, "2026-01-02", platform_ids)
+                assert indexed == scanned
+
+        assert backend.get_historical_titles("11-00", "2026-01-02") == {
+            "zhihu": {"A", "B"}, "weibo": {"W"},
+        }
+        backend.cleanup()
+
+    def test_detect_new_titles_does_not_load_full_day(self, tmp_path, save_news):
+        """测试 detect_new_titles 不再调用 get_today_all_data"""
+        from trendradar.storage.local import LocalStorageBackend
+
+        backend = LocalStorageBackend(data_dir=str(tmp_path), enable_txt=False, enable_html=False)
+        save_news(backend, "10-00", {"zhihu": [("A", "http://a")]}, date="2026-01-02")
+        current = save_news(backend, "11-00", {"zhihu": [("A", "http://a"), ("B", "http://b")]},
+                            date="2026-01-02")
+
+        with patch.object(backend, "get_today_all_data") as full_load:
+            new_titles = backend.detect_new_titles(current)
+        full_load.assert_not_called()
+        assert list(new_titles["zhihu"]) == ["B"]
+        backend.cleanup()
+
+    def test_query_uses_covering_index(self, tmp_path):
+        """测试历史标题查询走覆盖索引"""
+        from trendradar.storage.local import LocalStorageBackend
+
+        backend = LocalStorageBackend(data_dir=str(tmp_path), enable_txt=False, enable_html=False)
+        conn = backend._get_connection("2026-01-02")
+        plan = " ".join(row[-1] for row in conn.execute(
+            "EXPLAIN QUERY PLAN SELECT DISTINCT platform_id, title FROM news_items "
+            "WHERE first_crawl_time < ? AND platform_id IN (?)", ("11-00", "zhihu")))
+        assert "COVERING INDEX idx_news_platform_first_time" in plan
+        backend.cleanup()
+
+
+class TestRankHistoryLoader:
+    """排名历史流式加载测试"""
+
+    @pytest.fixture
+    def conn(self):
+        import sqlite3
+
+        conn = sqlite3.connect(":memory:")
+        schema = Path(__file__).parent.parent / "trendradar" / "storage" / "schema.sql"
+        conn.executescript(schema.read_text(encoding="utf-8"))
+        conn.executemany(
+            "INSERT INTO news_items (id, title, platform_id, rank, url, first_crawl_time, last_crawl_time) "
+            "VALUES (?, ?, ?, ?, '', ?, ?)",
+            [(1, "A", "zhihu", 1, "10-00", "12-00"), (2, "B", "weibo", 3, "10-00", "11-00"),
+             (3, "C", "zhihu", 2, "12-00", "12-00")],
+        )
+        conn.executemany(
+            "INSERT INTO rank_history (news_item_id, rank, crawl_time) VALUES (?, ?, ?)",
+            [(2, 3, "11-00"), (1, 2, "11-00"), (1, 1, "10-00"), (3, 2, "12-00"),
+             (1, 1, "12-00"), (2, 5, "10-00")],
+        )
+        yield conn
+        conn.close()
+
+    def test_ordered_by_crawl_time_and_deduped(self, conn):
+        """测试按抓取时间排序，去重保留首次出现顺序"""
+        from trendradar.storage.rank_history import load_rank_history
+
+        assert load_rank_history(conn.cursor()) == {1: [1, 2], 2: [5, 3], 3: [2]}
+        assert load_rank_history(conn.cursor(), dedupe=False) == {1: [1, 2, 1], 2: [5, 3], 3: [2]}
+
+    def test_item_filter(self, conn):
+        """测试通过 news_items 条件过滤（不使用 IN 列表）"""
+        from trendradar.storage.rank_history import load_rank_history
+
+        latest = load_rank_history(conn.cursor(), "n.last_crawl_time = ?", ("12-00",))
+        assert latest == {1: [1, 2], 3: [2]}
+        by_platform = load_rank_history(conn.cursor(), "n.platform_id IN (?)", ["weibo"])
+        assert by_platform == {2: [5, 3]}
+
+    def test_full_scan_uses_composite_index(self, conn):
+        """测试全天读取按复合索引顺序扫描，无需排序"""
+        plan = " ".join(row[-1] for row in conn.execute(
+            "EXPLAIN QUERY PLAN SELECT news_item_id, rank FROM rank_history "
+            "ORDER BY news_item_id, crawl_time"))
+        assert "idx_rank_history_item_time" in plan
+        assert "TEMP B-TREE" not in plan
+
+    def test_get_today_all_data_beyond_variable_limit(self, tmp_path):
+        """测试条目数超过 SQLite 变量上限时整天读取仍然正常"""
+        from trendradar.storage.local import LocalStorageBackend
+
+        backend = LocalStorageBackend(data_dir=str(tmp_path), enable_txt=False, enable_html=False)
+        conn = backend._get_connection("2026-01-02")
+        total = 33000
+        conn.executemany(
+            "INSERT INTO news_items (id, title, platform_id, rank, url, first_crawl_time, last_crawl_time) "
+            "VALUES (?, ?, 'zhihu', 1, '', '10-00', '10-00')",
+            [(i, f"T{i}") for i in range(1, total + 1)],
+        )
+        conn.executemany(
+            "INSERT INTO rank_history (news_item_id, rank, crawl_time) VALUES (?, ?, '10-00')",
+            [(i, i % 50 + 1) for i in range(1, total + 1)],
+        )
+        conn.commit()
+
+        data = backend.get_today_all_data("2026-01-02")
+        assert data is not None
+        assert data.get_total_count() == total
+        assert data.items["zhihu"][0].ranks == [2]
+        backend.cleanup()
+
+class TestDaySnapshot:
+    """单日列式快照测试"""
+
+    @staticmethod
+    def _news_data():
+        items = {
+            "zhihu": [
+                NewsItem(title="A", source_id="zhihu", rank=1, url="u1", crawl_time="10-00",
+                         ranks=[1, 2], first_time="09-00", last_time="10-00", count=2),
+                NewsItem(title="B", source_id="zhihu", rank=3, url="", crawl_time="10-00"),
+                NewsItem(title="A", source_id="zhihu", rank=4, url="u1", crawl_time="11-00",
+                         ranks=[4], first_time="11-00", last_time="11-00", count=1),
+            ],
+            "weibo": [NewsItem(title="C", source_id="weibo", rank=2, url="u3", mobile_url="m3",
+                               crawl_time="10-00", ranks=[2])],
+        }
+        return NewsData(date="2026-01-02", crawl_time="11-00", items=items,
+                        id_to_name={"zhihu": "知乎", "weibo": "微博"}, failed_ids=["baidu"])
+
+    def test_views_match_nested_dicts(self):
+        """测试视图内容与旧的嵌套字典转换一致（重复标题保留首次位置、取最后的值）"""
+        from trendradar.storage.snapshot import DaySnapshot
+
+        data = self._news_data()
+        expected = {}
+        for source_id, news_list in data.items.items():
+            expected[source_id] = {}
+            for item in news_list:
+                expected[source_id][item.title] = {
+                    "first_time": item.first_time, "last_time": item.last_time, "count": item.count,
+                    "ranks": item.ranks, "url": item.url or "", "mobileUrl": item.mobile_url or "",
+                }
+
+        snapshot = DaySnapshot.from_news_data(data)
+        view = snapshot.title_info_view()
+        assert list(view) == list(expected)
+        assert {pid: dict(view[pid].items()) for pid in view} == expected
+        assert list(view["zhihu"]) == ["A", "B"]
+        assert snapshot.results_view()["zhihu"]["A"] == {"ranks": [4], "url": "u1", "mobileUrl": ""}
+        assert snapshot.title_count() == 3
+
+    def test_platform_filter_and_fresh_entries(self):
+        """测试平台过滤，且视图返回的字典可安全修改"""
+        from trendradar.storage.snapshot import DaySnapshot
+
+        snapshot = DaySnapshot.from_news_data(self._news_data())
+        view = snapshot.results_view(["weibo", "baidu"])
+        assert list(view) == ["weibo"]
+        assert "zhihu" not in view
+        assert snapshot.names_for(["weibo"]) == {"weibo": "微博"}
+
+        entry = view["weibo"]["C"]
+        entry["ranks"].append(99)
+        entry["url"] = "changed"
+        assert view["weibo"]["C"] == {"ranks": [2], "url": "u3", "mobileUrl": "m3"}
+
+    def test_round_trip(self):
+        """测试转换回 NewsData"""
+        from trendradar.storage.snapshot import DaySnapshot
+
+        restored = DaySnapshot.from_news_data(self._news_data()).to_news_data()
+        assert restored.crawl_time == "11-00"
+        assert restored.failed_ids == ["baidu"]
+        # 每一行对应一个 NewsItem，重复标题的行也保留
+        assert [item.title for item in restored.items["zhihu"]] == ["A", "B", "A"]
+        assert restored.items["zhihu"][2].ranks == [4]
+        assert restored.items["weibo"][0].mobile_url == "m3"
+
+    def test_local_backend_snapshot_matches_all_data(self, tmp_path):
+        """测试本地后端直接加载的快照与 get_today_all_data 一致"""
+        from trendradar.storage.local import LocalStorageBackend
+        from trendradar.storage.snapshot import DaySnapshot
+
+        backend = LocalStorageBackend(data_dir=str(tmp_path), enable_txt=False, enable_html=False)
+        for crawl_time, titles in (("10-00", ["A", "B"]), ("11-00", ["B", "C"])):
+            items = {"zhihu": [NewsItem(title=t, source_id="zhihu", rank=r, url=f"u{t}", crawl_time=crawl_time)
+                               for r, t in enumerate(titles, 1)]}
+            backend.save_news_data(NewsData(date="2026-01-02", crawl_time=crawl_time, items=items,
+                                            id_to_name={"zhihu": "知乎"}, failed_ids=[]))
+
+        snapshot = backend.get_today_snapshot("2026-01-02")
+        expected = DaySnapshot.from_news_data(backend.get_today_all_data("2026-01-02"))
+        assert snapshot.crawl_time == "11-00"
+        assert snapshot.names_for() == {"zhihu": "知乎"}
+        assert dict(snapshot.title_info_view()["zhihu"].items()) == dict(expected.title_info_view()["zhihu"].items())
+        assert backend.get_today_snapshot("2026-01-03") is None
+        backend.cleanup()
+
+
+class TestMigrations:
+    """日库 schema 迁移测试"""
+
+    LEGACY_SCHEMA = """
+        CREATE TABLE news_items (id INTEGER PRIMARY KEY AUTOINCREMENT, title TEXT NOT NULL,
+            platform_id TEXT NOT NULL, rank INTEGER NOT NULL, url TEXT DEFAULT '',
+            mobile_url TEXT DEFAULT '', first_crawl_time TEXT NOT NULL,
+            last_crawl_time TEXT NOT NULL, crawl_count INTEGER DEFAULT 1);
+        CREATE TABLE rank_history (id INTEGER PRIMARY KEY AUTOINCREMENT, news_item_id INTEGER NOT NULL,
+            rank INTEGER NOT NULL, crawl_time TEXT NOT NULL);
+        CREATE INDEX idx_rank_history_news ON rank_history(news_item_id);
+    """
+
+    @staticmethod
+    def _indexes(conn):
+        return {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+
+    def _legacy_db(self, path):
+        import sqlite3
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(path))
+        conn.executescript(self.LEGACY_SCHEMA)
+        conn.commit()
+        return conn
+
+    def test_fresh_database_stamped_latest(self, tmp_path):
+        """测试新建日库直接标记为最新版本"""
+        from trendradar.storage.local import LocalStorageBackend
+        from trendradar.storage.migrations import get_schema_version, latest_version
+
+        backend = LocalStorageBackend(data_dir=str(tmp_path), enable_txt=False, enable_html=False)
+        conn = backend._get_connection("2026-01-02")
+        assert get_schema_version(conn) == latest_version("news") >= 2
+        assert "idx_rank_history_news" not in self._indexes(conn)
+        rss_conn = backend._get_connection("2026-01-02", db_type="rss")
+        assert get_schema_version(rss_conn) == latest_version("rss")
+        backend.cleanup()
+
+    def test_legacy_database_migrated_on_open(self, tmp_path):
+        """测试打开旧日库时惰性执行迁移"""
+        from trendradar.storage.local import LocalStorageBackend
+        from trendradar.storage.migrations import get_schema_version, latest_version
+
+        self._legacy_db(tmp_path / "news" / "2026-01-02.db").close()
+
+        backend = LocalStorageBackend(data_dir=str(tmp_path), enable_txt=False, enable_html=False)
+        conn = backend._get_connection("2026-01-02")
+        assert get_schema_version(conn) == latest_version("news")
+        indexes = self._indexes(conn)
+        assert "idx_rank_history_news" not in indexes
+        assert {"idx_rank_history_item_time", "idx_news_platform_first_time"} <= indexes
+        backend.cleanup()
+
+    def test_failed_migration_rolls_back(self, tmp_path):
+        """测试迁移失败时回滚，版本号停留在最后一个成功的迁移"""
+        from trendradar.storage import migrations
+        from trendradar.storage.migrations import Migration, get_schema_version, migrate
+
+        conn = self._legacy_db(tmp_path / "legacy.db")
+        broken = [
+            Migration(1, "ok", ("CREATE INDEX IF NOT EXISTS idx_a ON news_items(title)",)),
+            Migration(2, "broken", ("CREATE INDEX idx_b ON news_items(title)", "SELECT * FROM missing")),
+        ]
+        with patch.dict(migrations.MIGRATIONS, {"news": broken}):
+            with pytest.raises(sqlite3.OperationalError):
+                migrate(conn, "news")
+            assert get_schema_version(conn) == 1
+            assert "idx_b" not in self._indexes(conn)
+            assert not conn.in_transaction
+        conn.close()
+
+    def test_newer_schema_version_is_left_alone(self, tmp_path):
+        """测试数据库版本高于程序支持版本时不做迁移"""
+        from trendradar.storage.migrations import get_schema_version, migrate
+
+        conn = self._legacy_db(tmp_path / "future.db")
+        conn.execute("PRAGMA user_version = 99")
+        assert migrate(conn, "news") == 0
+        assert get_schema_version(conn) == 99
+        assert "idx_rank_history_news" in self._indexes(conn)
+        conn.close()
+
+    def test_migrate_all_day_files(self, tmp_path):
+        """测试批量迁移所有日库（跳过非日库文件）"""
+        from trendradar.storage.migrations import get_schema_version, migrate_all_day_files
+        from trendradar.storage.sqlite_profile import SQLiteProfile
+
+        for name in ("2026-01-01.db", "2026-01-02.db"):
+            self._legacy_db(tmp_path / "news" / name).close()
+        self._legacy_db(tmp_path / "rss" / "feed_cache.db").close()
+
+        profile = SQLiteProfile(busy_timeout=1234)
+        with patch.object(profile, "connect", wraps=profile.connect) as connect:
+            assert migrate_all_day_files(str(tmp_path), sqlite_profile=profile) == {
+                "total": 2, "migrated": 2, "failed": 0,
+            }
+        assert connect.call_count == 2
+        assert migrate_all_day_files(str(tmp_path)) == {"total": 2, "migrated": 0, "failed": 0}
+
+        conn = sqlite3.connect(str(tmp_path / "rss" / "feed_cache.db"))
+        assert get_schema_version(conn) == 0
+        conn.close()
+
+    def test_cli_uses_config_sqlite_profile(self, tmp_path):
+        """测试批量迁移命令按 --config 中的 storage.sqlite 建立连接"""
+        from trendradar.storage import migrations
+
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text("storage:\n  sqlite:\n    busy_timeout: 1234\n", encoding="utf-8")
+        stats = {"total": 0, "migrated": 0, "failed": 0}
+        argv = ["migrations", "--data-dir", str(tmp_path), "--config", str(config_path)]
+        with patch.object(sys, "argv", argv), \
+                patch.object(migrations, "migrate_all_day_files", return_value=stats) as migrate_all:
+            migrations.main()
+        assert migrate_all.call_args.args[2].busy_timeout == 1234
+
+        argv[-1] = str(tmp_path / "missing.yaml")
+        with patch.object(sys, "argv", argv), \
+                patch.object(migrations, "migrate_all_day_files", return_value=stats) as migrate_all:
+            migrations.main()
+        assert migrate_all.call_args.args[2].busy_timeout == 5000
+
+    def test_reader_does_not_migrate(self, tmp_path, save_news):
+        """测试 MCP 读取旧日库时不执行迁移（迁移只由写入方和批量命令负责）"""
+        from mcp_server.services.parser_service import ParserService
+        from trendradar.storage.local import LocalStorageBackend
+        from trendradar.storage.migrations import get_schema_version
+
+        backend = LocalStorageBackend(data_dir=str(tmp_path / "output"), enable_txt=False, enable_html=False)
+        save_news(backend, "10:00", {"zhihu": ["旧标题"]}, date="2026-01-02")
+        backend.cleanup()
+        db_path = tmp_path / "output" / "news" / "2026-01-02.db"
+        conn = sqlite3.connect(str(db_path))
+        conn.execute("DROP INDEX idx_news_platform_first_time")
+        conn.execute("PRAGMA user_version = 0")
+        conn.close()
+
+        parser = ParserService(project_root=str(tmp_path))
+        all_titles, _, _ = parser.read_all_titles_for_date(datetime(2026, 1, 2))
+        assert list(all_titles["zhihu"]) == ["旧标题"]
+
+        conn = sqlite3.connect(str(db_path))
+        assert get_schema_version(conn) == 0
+        assert "idx_news_platform_first_time" not in self._indexes(conn)
+        conn.close()
+
+
+class TestSQLiteProfile:
+    """SQLite 连接参数测试"""
+
+    def test_from_config_accepts_loader_and_yaml_keys(self):
+        """测试同时支持 loader 大写键与 config.yaml 小写键"""
+        from trendradar.storage.sqlite_profile import SQLiteProfile
+
+        upper = SQLiteProfile.from_config({"JOURNAL_MODE": "DELETE", "BUSY_TIMEOUT": "2000"})
+        lower = SQLiteProfile.from_config({"journal_mode": "delete", "busy_timeout": 2000})
+        assert upper == lower
+        assert upper.journal_mode == "delete"
+        assert upper.busy_timeout == 2000
+        assert upper.synchronous == "normal"
+
+    def test_from_config_invalid_values_fall_back(self, capsys):
+        """测试非法值回退默认值（防止拼接进 PRAGMA）"""
+        from trendradar.storage.sqlite_profile import SQLiteProfile
+
+        profile = SQLiteProfile.from_config({
+            "journal_mode": "wal; DROP TABLE news_items",
+            "cache_size": "big",
+        })
+        assert profile == SQLiteProfile()
+        assert "无效" in capsys.readouterr().out
+
+    def test_local_backend_applies_profile(self, tmp_path):
+        """测试本地存储连接应用 WAL 等参数"""
+        from trendradar.storage.local import LocalStorageBackend
+        from trendradar.storage.sqlite_profile import SQLiteProfile
+
+        backend = LocalStorageBackend(
+            data_dir=str(tmp_path), enable_txt=False, enable_html=False,
+            sqlite_profile=SQLiteProfile(synchronous="full", busy_timeout=1234),
+        )
+        conn = backend._get_connection("2026-01-02")
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 2
+        assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 1234
+        assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2
+        backend.cleanup()
+
+    def test_reader_does_not_block_writer(self, tmp_path):
+        """测试 WAL 模式下读事务进行中，写入者仍可提交"""
+        from trendradar.storage.local import LocalStorageBackend
+        from trendradar.storage.sqlite_profile import SQLiteProfile
+
+        backend = LocalStorageBackend(data_dir=str(tmp_path), enable_txt=False, enable_html=False)
+        data = NewsData(date="2026-01-02", crawl_time="10-00", items={
+            "zhihu": [NewsItem(title="A", source_id="zhihu", url="http://example.com/a", rank=1)],
+        })
+        assert backend.save_news_data(data)
+
+        reader = SQLiteProfile(busy_timeout=0).connect(
+            backend._get_db_path("2026-01-02"), read_only=True
+        )
+        reader.execute("BEGIN")
+        assert reader.execute("SELECT COUNT(*) FROM news_items").fetchone()[0] == 1
+
+        data.crawl_time = "11-00"
+        data.items["zhihu"].append(
+            NewsItem(title="B", source_id="zhihu", url="http://example.com/b", rank=2)
+        )
+        assert backend.save_news_data(data)
+
+        # 读事务仍看到快照，提交后看到新数据
+        assert reader.execute("SELECT COUNT(*) FROM news_items").fetchone()[0] == 1
+        reader.execute("COMMIT")
+        assert reader.execute("SELECT COUNT(*) FROM news_items").fetchone()[0] == 2
+        reader.close()
+        backend.cleanup()
+
+    def test_cleanup_old_data_removes_wal_files(self, tmp_path):
+        """测试清理过期数据时一并删除 -wal / -shm 文件"""
+        from trendradar.storage.local import LocalStorageBackend
+
+        backend = LocalStorageBackend(data_dir=str(tmp_path), enable_txt=False, enable_html=False)
+        db_dir = tmp_path / "news"
+        db_dir.mkdir()
+        for name in ("2020-01-01.db", "2020-01-01.db-wal", "2020-01-01.db-shm"):
+            (db_dir / name).write_bytes(b"")
+
+        assert backend.cleanup_old_data(retention_days=1) == 1
+        assert list(db_dir.iterdir()) == []
+
+
+class TestContentManifest:
+    """内容摘要清单测试"""
+
+    @staticmethod
+    def _page(generated_at: str, body: str) -> str:
+        return (
+            '<span class="info-label">生成时间</span>\n'
+            f'                        <span class="info-value">{generated_at}</span>{body}'
+        )
+
+    def test_record_and_reload(self, tmp_path):
+        """测试清单落盘后可重新加载，损坏的清单视为空"""
+        from trendradar.storage.manifest import ContentManifest, content_digests
+
+        digests = content_digests(b"abc")
+        manifest = ContentManifest(tmp_path / "m.json")
+        manifest.record("news/2026-01-02.db", digests["sha256"], 3, etag=digests["md5"])
+
+        reloaded = ContentManifest(tmp_path / "m.json")
+        assert reloaded.is_unchanged("news/2026-01-02.db", digests["sha256"])
+        assert not reloaded.is_unchanged("news/2026-01-02.db", content_digests(b"abd")["sha256"])
+        assert reloaded.get("news/2026-01-02.db")["etag"] == "900150983cd24fb0d6963f7d28e17f72"
+
+        (tmp_path / "m.json").write_text("{broken", encoding="utf-8")
+        assert ContentManifest(tmp_path / "m.json").get("news/2026-01-02.db") is None
+
+    def test_local_html_skips_unchanged_page(self, tmp_path):
+        """测试仅生成时间不同的页面不覆盖原文件，内容变化时重新写入"""
+        from trendradar.storage.local import LocalStorageBackend
+
+        backend = LocalStorageBackend(data_dir=str(tmp_path), enable_txt=False, enable_html=True)
+        path = backend.save_html_report(iter([self._page("01-02 10:00", "<p>A</p>")]), "当日汇总.html")
+        os.utime(path, (0, 0))
+
+        assert backend.save_html_report(self._page("01-02 10:30", "<p>A</p>"), "当日汇总.html") == path
+        assert os.path.getmtime(path) == 0
+        assert "10:00" in Path(path).read_text(encoding="utf-8")
+        assert not Path(path + ".tmp").exists()
+
+        backend.save_html_report(self._page("01-02 11:00", "<p>B</p>"), "当日汇总.html")
+        assert Path(path).read_text(encoding="utf-8") == self._page("01-02 11:00", "<p>B</p>")
+
+        # 文件被删除后即使摘要一致也重新写入
+        os.remove(path)
+        backend.save_html_report(self._page("01-02 11:30", "<p>B</p>"), "当日汇总.html")
+        assert "11:30" in Path(path).read_text(encoding="utf-8")
+        backend.cleanup()
+
+    def test_remote_upload_skips_unchanged_and_verifies_by_etag(self, remote_backend):
+        """测试远程 SQLite 内容未变化时跳过上传，上传后用 ETag 校验而不发 HEAD 请求"""
+        import hashlib
+
+        backend = remote_backend()
+        backend.s3_client = MagicMock()
+        backend.s3_client.put_object.side_effect = lambda **kwargs: {
+            "ETag": '"%s"' % hashlib.md5(kwargs["Body"]).hexdigest()
+        }
+
+        db_path = backend._get_local_db_path("2026-01-02")
+        db_path.write_bytes(b"v1")
+
+        assert backend._upload_sqlite("2026-01-02") is True
+        assert backend._upload_sqlite("2026-01-02") is True
+        assert backend.s3_client.put_object.call_count == 1
+        backend.s3_client.head_object.assert_not_called()
+
+        db_path.write_bytes(b"v2")
+        assert backend._upload_sqlite("2026-01-02") is True
+        assert backend.s3_client.put_object.call_count == 2
+
+        # ETag 不是 MD5 时回退到 HEAD 检查
+        backend.s3_client.put_object.side_effect = lambda **kwargs: {"ETag": '"kms-etag"'}
+        db_path.write_bytes(b"v3")
+        assert backend._upload_sqlite("2026-01-02") is True
+        backend.s3_client.head_object.assert_called_once()
+        assert backend._get_manifest("2026-01-02").get("news/2026-01-02.db")["etag"] == "kms-etag"
+
+    def test_remote_crawl_with_unchanged_items_still_uploads(self, remote_backend):
+        """测试真实远程流程：下载 → 保存内容未变的抓取 → 上传；只跳过同一运行内的重复上传"""
+        items = [("AI 新闻", "https://a/1"), ("天气", "https://a/2")]
+
+        def crawl(backend, crawl_time):
+            news = {"a": [NewsItem(title=t, source_id="a", source_name="A", rank=i, url=u, crawl_time=crawl_time)
+                          for i, (t, u) in enumerate(items, 1)]}
+            assert backend.save_news_data(NewsData(date="2026-01-02", crawl_time=crawl_time, items=news,
+                                                   id_to_name={"a": "A"}, failed_ids=[]))
+
+        first = remote_backend()
+        crawl(first, "10:00")
+        assert first.s3_client.puts == ["news/2026-01-02.db"]
+
+        # 新一次运行：条目完全相同，但 crawl_records 与 last_crawl_time 已变化，必须上传
+        second = remote_backend()
+        crawl(second, "10:30")
+        assert len(second.s3_client.puts) == 2
+        assert second.get_crawl_times("2026-01-02") == ["10:00", "10:30"]
+
+        # 同一运行内没有新写入时再次上传：字节与上次上传一致，跳过
+        assert second._upload_sqlite("2026-01-02") is True
+        assert len(second.s3_client.puts) == 2
+
+    def test_deferred_sync_reports_failed_upload(self, remote_backend, save_news):
+        """测试 deferred_sync 退出时上传失败会反映在 SyncResult 中（上下文内保存只代表写入本地）"""
+        backend = remote_backend()
+        with patch.object(backend.s3_client, "put_object", side_effect=RuntimeError("network down")):
+            with backend.deferred_sync() as sync:
+                save_news(backend, "10:00", {"a": ["AI 新闻"]}, date="2026-01-02")
+                assert sync.ok and backend.s3_client.puts == []
+
+        assert not sync.ok
+        assert sync.failed == ["news/2026-01-02.db"]
+
+        with backend.deferred_sync() as sync:
+            save_news(backend, "10:30", {"a": ["AI 新闻"]}, date="2026-01-02")
+        assert sync.ok and backend.s3_client.puts == ["news/2026-01-02.db"]
+
+
+class TestSearchIndex:
+    """跨日期标题检索索引测试"""
+
+    def test_local_save_updates_index(self, tmp_path, save_news):
+        """测试本地保存后增量更新索引：大小写不敏感子串匹配，标题变更后旧标题不再命中"""
+        from trendradar.storage.local import LocalStorageBackend
+        from trendradar.storage.search_index import SEARCH_INDEX_FILENAME
+        from trendradar.storage.sqlite_profile import db_signature
+
+        backend = LocalStorageBackend(data_dir=str(tmp_path), enable_txt=False, enable_html=False)
+        save_news(backend, "10:00", {"zhihu": [("OpenAI 发布新模型", "a"), ("天气预报", "b")]},
+                  date="2026-01-01")
+        save_news(backend, "10:00", {"zhihu": [("openai 融资", "c")]}, date="2026-01-02")
+
+        index = backend._get_search_index()
+        assert index.index_path == tmp_path / "news" / SEARCH_INDEX_FILENAME
+        assert index.get_state("2026-01-02") == db_signature(tmp_path / "news" / "2026-01-02.db")
+
+        result = index.search("OPENAI", ["2026-01-01", "2026-01-02"])
+        assert {date: [m[:2] for m in matches] for date, matches in result.items()} == {
+            "2026-01-01": [("zhihu", "OpenAI 发布新模型")],
+            "2026-01-02": [("zhihu", "openai 融资")],
+        }
+        # 两个字符的关键词走扫描路径
+        assert [m[1] for m in index.search("预报", ["2026-01-01"])["2026-01-01"]] == ["天气预报"]
+
+        # 同一 URL 标题变更
+        save_news(backend, "10:30", {"zhihu": [("OpenAI 发布新模型 GPT", "a"), ("天气预报", "b")]},
+                  date="2026-01-01")
+        result = index.search("openai", ["2026-01-01"])
+        assert [m[1] for m in result["2026-01-01"]] == ["OpenAI 发布新模型 GPT"]
+        assert index.search("新模型", ["2026-01-01"], platform_ids=["weibo"]) == {}
+        backend.cleanup()
+
+    def test_save_syncs_only_crawl_rows(self, tmp_path, save_news):
+        """测试保存后只读取本批次的行同步索引，结果与整天比对重建一致"""
+        from trendradar.storage.local import LocalStorageBackend
+        from trendradar.storage.search_index import SearchIndex
+
+        backend = LocalStorageBackend(data_dir=str(tmp_path / "output"), enable_txt=False, enable_html=False)
+        save_news(backend, "10:00", {"zhihu": [("OpenAI 一", "a"), ("天气", "b"), "无链接"]}, date="2026-01-01")
+        save_news(backend, "10:30", {"zhihu": [("OpenAI 一 改", "a"), "无链接", ("新条目", "c")]},
+                  date="2026-01-01")
+
+        statements = []
+        conn = backend._get_connection("2026-01-01")
+        conn.set_trace_callback(statements.append)
+        save_news(backend, "11:00", {"zhihu": [("新条目", "c"), ("再新", "d")]}, date="2026-01-01")
+        conn.set_trace_callback(None)
+        title_reads = [sql for sql in statements if "FROM news_items" in sql and "platform_id, title" in sql]
+        assert title_reads and all("WHERE" in sql for sql in title_reads)
+
+        def indexed(index):
+            return sorted(index._conn.execute(
+                "SELECT platform_id, title, last_crawl_time, item_id FROM titles WHERE date = '2026-01-01'"
+            ))
+
+        rebuilt = SearchIndex(tmp_path / "rebuilt.db")
+        rebuilt.refresh({"2026-01-01": backend._get_db_path("2026-01-01")})
+        assert indexed(backend._get_search_index()) == indexed(rebuilt)
+        assert backend._get_search_index().search("openai", ["2026-01-01"])["2026-01-01"][0][1] == "OpenAI 一 改"
+        rebuilt.close()
+
+        # 索引落后于上一批次时退回整天比对
+        index = backend._get_search_index()
+        index._conn.execute("UPDATE indexed_days SET crawl_time = '09:00'")
+        index._conn.commit()
+        with patch.object(index, "index_day", wraps=index.index_day) as full_sync:
+            save_news(backend, "11:30", {"zhihu": [("再新", "d")]}, date="2026-01-01")
+        full_sync.assert_called_once()
+        backend.cleanup()
+
+    def test_scan_fallback_matches_fts(self, tmp_path, save_news):
+        """测试无 FTS5 时的扫描路径与 trigram 查询结果一致"""
+        from trendradar.storage.local import LocalStorageBackend
+
+        backend = LocalStorageBackend(data_dir=str(tmp_path), enable_txt=False, enable_html=False)
+        titles = [(f"标题{i} {'AI 芯片' if i % 3 == 0 else '其他'}", str(i)) for i in range(30)]
+        save_news(backend, "10:00", {"zhihu": titles}, date="2026-01-01")
+
+        index = backend._get_search_index()
+        assert index.has_fts
+        with_fts = index.search("ai 芯", ["2026-01-01"])
+        index.has_fts = False
+        assert index.search("ai 芯", ["2026-01-01"]) == with_fts
+        assert len(with_fts["2026-01-01"]) == 10
+        backend.cleanup()
+
+    def test_refresh_follows_day_files(self, tmp_path, save_news):
+        """测试 refresh 按日库状态补齐：未索引的日库被同步，已删除的日库条目被移除"""
+        from trendradar.storage.local import LocalStorageBackend
+        from trendradar.storage.search_index import SearchIndex
+
+        backend = LocalStorageBackend(data_dir=str(tmp_path / "output"), enable_txt=False, enable_html=False)
+        save_news(backend, "10:00", {"zhihu": [("特斯拉降价", "a")]}, date="2026-01-01")
+        backend.cleanup()
+
+        db_path = tmp_path / "output" / "news" / "2026-01-01.db"
+        index = SearchIndex(tmp_path / "index.db")
+        assert index.refresh({"2026-01-01": db_path}) == 1
+        assert index.refresh({"2026-01-01": db_path}) == 0
+        assert "2026-01-01" in index.search("特斯拉", ["2026-01-01"])
+
+        db_path.unlink()
+        index.refresh({"2026-01-01": None})
+        assert index.search("特斯拉", ["2026-01-01"]) == {}
+        assert index.get_state("2026-01-01") is None
+        index.close()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -117,6 +117,31 @@ class TestNewsItem:
         assert restored.rank == original.rank
         assert restored.url == original.url
 
+    def test_compact_storage(self):
+        """测试紧凑存储：无 __dict__，排名压缩存储，读取时返回列表副本"""
+        item = NewsItem(title="标题", source_id="".join(["zhi", "hu"]), ranks=[3, 1, 2])
+
+        assert not hasattr(item, "__dict__")
+        assert item._ranks.typecode == "H"
+        assert item.ranks == [3, 1, 2]
+        assert item.source_id is NewsItem(title="其他", source_id="zhihu").source_id
+
+        item.ranks.append(9)
+        assert item.ranks == [3, 1, 2]
+        item.ranks = [5]
+        assert item.ranks == [5]
+
+        # 超出 unsigned short 范围时退回宽类型
+        assert NewsItem(title="t", source_id="s", ranks=[70000, -1]).ranks == [70000, -1]
+
+    def test_equality_and_repr(self):
+        """测试相等比较与 repr 保持 dataclass 语义"""
+        item = NewsItem(title="标题", source_id="zhihu", ranks=[1, 2])
+
+        assert item == NewsItem(title="标题", source_id="zhihu", ranks=[1, 2])
+        assert item != NewsItem(title="标题", source_id="zhihu", ranks=[1])
+        assert "ranks=[1, 2]" in repr(item)
+
 
 class TestRSSItem:
     """RSSItem 数据模型测试"""
@@ -203,6 +228,15 @@ class TestRSSItem:
         assert item.count == 1
 
 
+    def test_slots(self):
+        """测试 __slots__ 且重复字段驻留"""
+        item = RSSItem(title="文章", feed_id="".join(["hacker", "-news"]), author="".join(["作", "者"]))
+
+        assert not hasattr(item, "__dict__")
+        assert item.feed_id is RSSItem(title="其他", feed_id="hacker-news").feed_id
+        assert item.author is RSSItem(title="其他", feed_id="x", author="作者").author
+
+
 class TestRSSData:
     """RSSData 数据模型测试"""
 
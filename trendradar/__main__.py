@@ -15,10 +15,10 @@ import requests
 
 from trendradar.context import AppContext
 from trendradar import __version__
-from trendradar.core import load_config
+from trendradar.core import DailyAggregation, load_config
 from trendradar.core.analyzer import convert_keyword_stats_to_platform_stats
 from trendradar.crawler import DataFetcher
-from trendradar.storage import convert_crawl_results_to_news_data
+from trendradar.storage import DaySnapshot, convert_crawl_results_to_news_data
 from trendradar.utils.time import is_within_days
 
 
@@ -120,7 +120,11 @@ class NewsAnalyzer:
         self.update_info = None
         self.proxy_url = None
         self._setup_proxy()
-        self.data_fetcher = DataFetcher(self.proxy_url)
+        self.data_fetcher = DataFetcher(
+            self.proxy_url,
+            max_workers=self.ctx.config.get("MAX_WORKERS", 1),
+            pool_size=self.ctx.config.get("POOL_SIZE", 10),
+        )
 
         # 初始化存储管理器（使用 AppContext）
         self._init_storage_manager()
@@ -237,28 +241,48 @@ class NewsAnalyzer:
     def _load_analysis_data(
         self,
         quiet: bool = False,
-    ) -> Optional[Tuple[Dict, Dict, Dict, Dict, List, List, List]]:
-        """统一的数据加载和预处理，使用当前监控平台列表过滤历史数据"""
+        daily_summary: bool = False,
+    ) -> Optional[Tuple[Dict, Dict, Dict, Dict, List, List, List, Optional[DailyAggregation]]]:
+        """
+        统一的数据加载和预处理，使用当前监控平台列表过滤历史数据
+
+        daily_summary=True 时优先使用当日汇总状态（只合并最新批次），此时返回的
+        all_results / title_info 为空，统计由最后一项 aggregation 提供；
+        存储后端不支持时回退整天读取。
+        """
         try:
             # 获取当前配置的监控平台ID列表
             current_platform_ids = self.ctx.platform_ids
             if not quiet:
                 print(f"当前监控平台: {current_platform_ids}")
 
-            all_results, id_to_name, title_info = self.ctx.read_today_titles(
-                current_platform_ids, quiet=quiet
-            )
+            word_groups, filter_words, global_filters = self.ctx.load_frequency_words()
+
+            aggregation = None
+            if daily_summary:
+                aggregation = self.ctx.load_daily_aggregation(
+                    word_groups, filter_words, global_filters, current_platform_ids, quiet=quiet
+                )
 
-            if not all_results:
+            if aggregation is not None:
+                all_results: Dict = {}
+                title_info: Dict = {}
+                id_to_name = dict(aggregation.id_to_name)
+                total_titles = aggregation.total_titles
+            else:
+                all_results, id_to_name, title_info = self.ctx.read_today_titles(
+                    current_platform_ids, quiet=quiet
+                )
+                total_titles = sum(len(titles) for titles in all_results.values())
+
+            if not total_titles:
                 print("没有找到当天的数据")
                 return None
 
-            total_titles = sum(len(titles) for titles in all_results.values())
             if not quiet:
                 print(f"读取到 {total_titles} 个标题（已按当前监控平台过滤）")
 
             new_titles = self.ctx.detect_new_titles(current_platform_ids, quiet=quiet)
-            word_groups, filter_words, global_filters = self.ctx.load_frequency_words()
 
             return (
                 all_results,
@@ -268,30 +292,15 @@ class NewsAnalyzer:
                 word_groups,
                 filter_words,
                 global_filters,
+                aggregation,
             )
         except Exception as e:
             print(f"数据加载失败: {e}")
             return None
 
     def _prepare_current_title_info(self, results: Dict, time_info: str) -> Dict:
-        """从当前抓取结果构建标题信息"""
-        title_info: Dict[str, Dict[str, Dict[str, Any]]] = {}
-        for source_id, titles_data in results.items():
-            title_info[source_id] = {}
-            for title, title_data in titles_data.items():
-                ranks = title_data.get("ranks", [])
-                url = title_data.get("url", "")
-                mobile_url = title_data.get("mobileUrl", "")
-
-                title_info[source_id][title] = {
-                    "first_time": time_info,
-                    "last_time": time_info,
-                    "count": 1,
-                    "ranks": ranks,
-                    "url": url,
-                    "mobileUrl": mobile_url,
-                }
-        return title_info
+        """从当前抓取结果构建标题信息（列式快照上的只读视图，不复制嵌套字典）"""
+        return cast(Dict, DaySnapshot.from_results(results, crawl_time=time_info).title_info_view())
 
     def _run_analysis_pipeline(
         self,
@@ -308,6 +317,7 @@ class NewsAnalyzer:
         quiet: bool = False,
         rss_items: Optional[List[Dict]] = None,
         rss_new_items: Optional[List[Dict]] = None,
+        aggregation: Optional[DailyAggregation] = None,
     ) -> Tuple[List[Dict], Optional[str]]:
         """统一的分析流水线：数据处理 → 统计计算 → HTML生成"""
 
@@ -322,6 +332,7 @@ class NewsAnalyzer:
             mode=mode,
             global_filters=global_filters,
             quiet=quiet,
+            aggregation=aggregation,
         )
 
         # 如果是 platform 模式，转换数据结构
@@ -487,13 +498,16 @@ class NewsAnalyzer:
         print(f"生成{summary_type}报告...")
 
         # 加载分析数据
-        analysis_data = self._load_analysis_data()
+        analysis_data = self._load_analysis_data(
+            daily_summary=mode_strategy["summary_mode"] == "daily"
+        )
         if not analysis_data:
             return None
 
-        all_results, id_to_name, title_info, new_titles, word_groups, filter_words, global_filters = (
-            analysis_data
-        )
+        (
+            all_results, id_to_name, title_info, new_titles,
+            word_groups, filter_words, global_filters, aggregation,
+        ) = analysis_data
 
         # 运行分析流水线
         stats, html_file = self._run_analysis_pipeline(
@@ -508,6 +522,7 @@ class NewsAnalyzer:
             global_filters=global_filters,
             rss_items=rss_items,
             rss_new_items=rss_new_items,
+            aggregation=aggregation,
         )
 
         if html_file:
@@ -539,13 +554,14 @@ class NewsAnalyzer:
         print(f"生成{summary_type}HTML...")
 
         # 加载分析数据（静默模式，避免重复输出日志）
-        analysis_data = self._load_analysis_data(quiet=True)
+        analysis_data = self._load_analysis_data(quiet=True, daily_summary=mode == "daily")
         if not analysis_data:
             return None
 
-        all_results, id_to_name, title_info, new_titles, word_groups, filter_words, global_filters = (
-            analysis_data
-        )
+        (
+            all_results, id_to_name, title_info, new_titles,
+            word_groups, filter_words, global_filters, aggregation,
+        ) = analysis_data
 
         # 运行分析流水线（静默模式，避免重复输出日志）
         _, html_file = self._run_analysis_pipeline(
@@ -561,6 +577,7 @@ class NewsAnalyzer:
             quiet=True,
             rss_items=rss_items,
             rss_new_items=rss_new_items,
+            aggregation=aggregation,
         )
 
         if html_file:
@@ -614,9 +631,16 @@ class NewsAnalyzer:
             results, id_to_name, failed_ids, crawl_time, crawl_date
         )
 
-        # 保存到存储后端（SQLite）
-        if self.storage_manager.save_news_data(news_data):
+        # 保存到存储后端（SQLite），并在同一次远程同步中推进当日汇总状态
+        with self.storage_manager.deferred_sync() as sync:
+            saved = self.storage_manager.save_news_data(news_data)
+            if saved:
+                self._update_daily_aggregation()
+        # 远程后端退出上下文时才真正上传，以同步结果为准
+        if saved and sync.ok:
             print(f"数据已保存到存储后端: {self.storage_manager.backend_name}")
+        elif saved:
+            print(f"数据同步到存储后端失败: {self.storage_manager.backend_name} ({', '.join(sync.failed)})")
 
         # 保存 TXT 快照（如果启用）
         txt_file = self.storage_manager.save_txt_snapshot(news_data)
@@ -630,6 +654,24 @@ class NewsAnalyzer:
 
         return results, id_to_name, failed_ids
 
+    def _update_daily_aggregation(self) -> None:
+        """
+        保存后立即合并最新批次到当日汇总状态（仅生成当日汇总的模式）
+
+        状态写入与热榜数据位于同一日库，远程后端在 deferred_sync 内只上传一次；
+        之后生成汇总时状态已是最新，无需再次写入。
+        """
+        mode_strategy = self._get_mode_strategy()
+        if not (mode_strategy["should_generate_summary"] and mode_strategy["summary_mode"] == "daily"):
+            return
+        try:
+            word_groups, filter_words, global_filters = self.ctx.load_frequency_words()
+            self.ctx.load_daily_aggregation(
+                word_groups, filter_words, global_filters, self.ctx.platform_ids
+            )
+        except Exception as e:
+            print(f"更新当日汇总状态失败: {e}")
+
     def _crawl_rss_data(self) -> Tuple[Optional[List[Dict]], Optional[List[Dict]]]:
         """
         执行 RSS 数据抓取
@@ -649,7 +691,7 @@ class NewsAnalyzer:
             return None, None
 
         try:
-            from trendradar.crawler.rss import RSSFetcher, RSSFeedConfig
+            from trendradar.crawler.rss import RSSFetcher, RSSFeedConfig, FEED_CACHE_FILENAME
 
             # 构建 RSS 源配置
             feeds = []
@@ -695,6 +737,13 @@ class NewsAnalyzer:
             freshness_enabled = freshness_config.get("ENABLED", True)
             default_max_age_days = freshness_config.get("MAX_AGE_DAYS", 3)
 
+            # 条件请求校验缓存与 RSS 日库存放在同一目录
+            cache_path = None
+            if rss_config.get("CONDITIONAL_GET", True):
+                storage_config = self.ctx.config.get("STORAGE", {})
+                data_dir = storage_config.get("LOCAL", {}).get("DATA_DIR", "output")
+                cache_path = Path(data_dir) / "rss" / FEED_CACHE_FILENAME
+
             fetcher = RSSFetcher(
                 feeds=feeds,
                 request_interval=rss_config.get("REQUEST_INTERVAL", 2000),
@@ -704,10 +753,15 @@ class NewsAnalyzer:
                 timezone=timezone,
                 freshness_enabled=freshness_enabled,
                 default_max_age_days=default_max_age_days,
+                max_workers=rss_config.get("MAX_WORKERS", 1),
+                cache_path=cache_path,
             )
 
             # 抓取数据
-            rss_data = fetcher.fetch_all()
+            try:
+                rss_data = fetcher.fetch_all()
+            finally:
+                fetcher.close()
 
             # 保存到存储后端
             if self.storage_manager.save_rss_data(rss_data):
@@ -758,6 +812,12 @@ class NewsAnalyzer:
         except FileNotFoundError:
             word_groups, filter_words, global_filters = [], [], []
 
+        # 各次统计共用同一个编译后的匹配器
+        matcher = (
+            self.ctx.get_keyword_matcher(word_groups, filter_words, global_filters)
+            if word_groups else None
+        )
+
         timezone = self.ctx.timezone
         max_news_per_keyword = self.ctx.config.get("MAX_NEWS_PER_KEYWORD", 0)
         sort_by_position_first = self.ctx.config.get("SORT_BY_POSITION_FIRST", False)
@@ -791,6 +851,7 @@ class NewsAnalyzer:
                 timezone=timezone,
                 rank_threshold=self.rank_threshold,
                 quiet=False,
+                matcher=matcher,
             )
             if not rss_stats:
                 print("[RSS] 增量模式：关键词匹配后没有内容")
@@ -815,6 +876,7 @@ class NewsAnalyzer:
                 timezone=timezone,
                 rank_threshold=self.rank_threshold,
                 quiet=False,
+                matcher=matcher,
             )
             if not rss_stats:
                 print("[RSS] 当前榜单模式：关键词匹配后没有内容")
@@ -833,6 +895,7 @@ class NewsAnalyzer:
                     timezone=timezone,
                     rank_threshold=self.rank_threshold,
                     quiet=True,
+                    matcher=matcher,
                 )
 
         else:
@@ -854,6 +917,7 @@ class NewsAnalyzer:
                 timezone=timezone,
                 rank_threshold=self.rank_threshold,
                 quiet=False,
+                matcher=matcher,
             )
             if not rss_stats:
                 print("[RSS] 当日汇总模式：关键词匹配后没有内容")
@@ -872,6 +936,7 @@ class NewsAnalyzer:
                     timezone=timezone,
                     rank_threshold=self.rank_threshold,
                     quiet=True,
+                    matcher=matcher,
                 )
 
         return rss_stats, rss_new_stats
@@ -933,12 +998,10 @@ class NewsAnalyzer:
         try:
             word_groups, filter_words, global_filters = self.ctx.load_frequency_words()
             if word_groups or filter_words or global_filters:
-                from trendradar.core.frequency import matches_word_groups
-                filtered_items = []
-                for item in rss_items:
-                    title = item.get("title", "")
-                    if matches_word_groups(title, word_groups, filter_words, global_filters):
-                        filtered_items.append(item)
+                matcher = self.ctx.get_keyword_matcher(word_groups, filter_words, global_filters)
+                filtered_items = [
+                    item for item in rss_items if matcher.matches(item.get("title", ""))
+                ]
 
                 original_count = len(rss_items)
                 rss_items = filtered_items
@@ -961,10 +1024,11 @@ class NewsAnalyzer:
     def _generate_rss_html_report(self, rss_items: list, feeds_info: dict) -> Optional[str]:
         """生成 RSS HTML 报告"""
         try:
-            from trendradar.report.rss_html import render_rss_html_content
+            from trendradar.report.helpers import write_html
+            from trendradar.report.rss_html import iter_rss_html_content
             from pathlib import Path
 
-            html_content = render_rss_html_content(
+            html_content = iter_rss_html_content(
                 rss_items=rss_items,
                 total_count=len(rss_items),
                 feeds_info=feeds_info,
@@ -979,7 +1043,7 @@ class NewsAnalyzer:
 
             file_path = output_dir / f"rss_{time_filename}.html"
             with open(file_path, "w", encoding="utf-8") as f:
-                f.write(html_content)
+                write_html(f, html_content)
 
             print(f"[RSS] HTML 报告已生成: {file_path}")
             return str(file_path)
@@ -1016,6 +1080,7 @@ class NewsAnalyzer:
                     _,
                     _,
                     _,
+                    _,
                 ) = analysis_data
 
                 print(
@@ -1148,7 +1213,8 @@ class NewsAnalyzer:
             print(f"分析流程执行出错: {e}")
             raise
         finally:
-            # 清理资源（包括过期数据清理和数据库连接关闭）
+            # 清理资源（包括过期数据清理、数据库连接和 HTTP 连接池关闭）
+            self.data_fetcher.close()
             self.ctx.cleanup()
 
 
@@ -7,7 +7,7 @@
 
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Tuple, cast
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, cast
 
 from trendradar.core.analyzer import WeightConfig
 
@@ -19,18 +19,21 @@ from trendradar.utils.time import (
     convert_time_for_display,
 )
 from trendradar.core import (
+    DailyAggregation,
+    KeywordMatcher,
     load_frequency_words,
-    matches_word_groups,
     save_titles_to_file,
     read_all_today_titles,
     detect_latest_new_titles,
     is_first_crawl_today,
+    load_daily_aggregation,
     count_word_frequency,
 )
 from trendradar.report import (
     clean_title,
     prepare_report_data,
     generate_html_report,
+    iter_html_content,
     render_html_content,
 )
 from trendradar.notification import (
@@ -74,6 +77,8 @@ class AppContext:
         """
         self.config = config
         self._storage_manager: Optional[StorageManager] = None
+        # (词组配置, 编译结果)：同一份 load_frequency_words 输出只编译一次
+        self._keyword_matcher: Optional[Tuple[Tuple, KeywordMatcher]] = None
 
     # === 配置访问 ===
 
@@ -172,6 +177,7 @@ class AppContext:
                 pull_enabled=pull_config.get("ENABLED", False),
                 pull_days=pull_config.get("DAYS", 7),
                 timezone=self.timezone,
+                sqlite_config=storage_config.get("SQLITE"),
             )
         return self._storage_manager
 
@@ -200,6 +206,25 @@ class AppContext:
         """检测最新批次的新增标题"""
         return detect_latest_new_titles(self.get_storage_manager(), platform_ids, quiet=quiet)
 
+    def load_daily_aggregation(
+        self,
+        word_groups: List[Dict],
+        filter_words: List[str],
+        global_filters: Optional[List[str]] = None,
+        platform_ids: Optional[List[str]] = None,
+        quiet: bool = False,
+    ) -> Optional[DailyAggregation]:
+        """加载当日汇总状态（增量合并最新批次，配置变化时整天重算）"""
+        return load_daily_aggregation(
+            self.get_storage_manager(),
+            word_groups,
+            filter_words,
+            global_filters,
+            platform_ids,
+            matcher=self.get_keyword_matcher(word_groups, filter_words, global_filters) if word_groups else None,
+            quiet=quiet,
+        )
+
     def is_first_crawl(self) -> bool:
         """检测是否是当天第一次爬取"""
         return bool(self.get_storage_manager().is_first_crawl_today())
@@ -212,6 +237,26 @@ class AppContext:
         """加载频率词配置"""
         return load_frequency_words(frequency_file)
 
+    def get_keyword_matcher(
+        self,
+        word_groups: List[Dict],
+        filter_words: List[str],
+        global_filters: Optional[List[str]] = None,
+    ) -> KeywordMatcher:
+        """
+        获取编译后的关键词匹配器
+
+        按词组配置对象缓存：对同一份 load_frequency_words 输出反复调用时只编译一次。
+        """
+        sources = (word_groups, filter_words, global_filters)
+        cached = self._keyword_matcher
+        if cached is not None and all(a is b for a, b in zip(cached[0], sources)):
+            return cached[1]
+
+        matcher = KeywordMatcher(word_groups, filter_words, global_filters)
+        self._keyword_matcher = (sources, matcher)
+        return matcher
+
     def matches_word_groups(
         self,
         title: str,
@@ -220,7 +265,7 @@ class AppContext:
         global_filters: Optional[List[str]] = None,
     ) -> bool:
         """检查标题是否匹配词组规则"""
-        return matches_word_groups(title, word_groups, filter_words, global_filters)
+        return self.get_keyword_matcher(word_groups, filter_words, global_filters).matches(title)
 
     # === 统计分析 ===
 
@@ -235,8 +280,9 @@ class AppContext:
         mode: str = "daily",
         global_filters: Optional[List[str]] = None,
         quiet: bool = False,
+        aggregation: Optional[DailyAggregation] = None,
     ) -> Tuple[List[Dict], int]:
-        """统计词频"""
+        """统计词频（daily 模式可传入当日汇总状态，跳过整天重新匹配）"""
         return count_word_frequency(
             results=results,
             word_groups=word_groups,
@@ -253,6 +299,8 @@ class AppContext:
             is_first_crawl_func=self.is_first_crawl,
             convert_time_func=self.convert_time_display,
             quiet=quiet,
+            matcher=self.get_keyword_matcher(word_groups, filter_words, global_filters) if word_groups else None,
+            aggregation=aggregation,
         )
 
     # === 报告生成 ===
@@ -305,7 +353,7 @@ class AppContext:
             date_folder=self.format_date(),
             time_filename=self.format_time(),
             render_html_func=lambda report_data, total_titles, is_daily_summary=False, mode="daily", update_info=None:
-                self.render_html(report_data, total_titles, is_daily_summary, mode, update_info, rss_items, rss_new_items),
+                self.iter_html(report_data, total_titles, is_daily_summary, mode, update_info, rss_items, rss_new_items),
             matches_word_groups_func=self.matches_word_groups,
             load_frequency_words_func=self.load_frequency_words,
             enable_index_copy=True,
@@ -335,6 +383,30 @@ class AppContext:
             display_mode=self.display_mode,
         )
 
+    def iter_html(
+        self,
+        report_data: Dict,
+        total_titles: int,
+        is_daily_summary: bool = False,
+        mode: str = "daily",
+        update_info: Optional[Dict] = None,
+        rss_items: Optional[List[Dict]] = None,
+        rss_new_items: Optional[List[Dict]] = None,
+    ) -> Iterator[str]:
+        """逐段渲染HTML内容（供写文件时流式输出，参数同 render_html）"""
+        return iter_html_content(
+            report_data=report_data,
+            total_titles=total_titles,
+            is_daily_summary=is_daily_summary,
+            mode=mode,
+            update_info=update_info,
+            reverse_content_order=self.config.get("REVERSE_CONTENT_ORDER", False),
+            get_time_func=self.get_time,
+            rss_items=rss_items,
+            rss_new_items=rss_new_items,
+            display_mode=self.display_mode,
+        )
+
     # === 通知内容渲染 ===
 
     def render_feishu(
@@ -420,6 +492,7 @@ class AppContext:
             config=self.config,
             get_time_func=self.get_time,
             split_content_func=self.split_content,
+            display_mode=self.display_mode,
         )
 
     def create_push_manager(self) -> PushRecordManager:
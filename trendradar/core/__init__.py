@@ -10,7 +10,7 @@ from trendradar.core.config import (
     get_account_at_index,
 )
 from trendradar.core.loader import load_config
-from trendradar.core.frequency import load_frequency_words, matches_word_groups
+from trendradar.core.frequency import KeywordMatcher, load_frequency_words, matches_word_groups
 from trendradar.core.data import (
     save_titles_to_file,
     read_all_today_titles_from_storage,
@@ -19,8 +19,10 @@ from trendradar.core.data import (
     detect_latest_new_titles,
     is_first_crawl_today,
 )
+from trendradar.core.aggregation import DailyAggregation, load_daily_aggregation
 from trendradar.core.analyzer import (
     calculate_news_weight,
+    calculate_news_weights,
     format_time_display,
     count_word_frequency,
     count_rss_frequency,
@@ -34,6 +36,7 @@ __all__ = [
     "load_config",
     "load_frequency_words",
     "matches_word_groups",
+    "KeywordMatcher",
     # 数据处理
     "save_titles_to_file",
     "read_all_today_titles_from_storage",
@@ -41,8 +44,11 @@ __all__ = [
     "detect_latest_new_titles_from_storage",
     "detect_latest_new_titles",
     "is_first_crawl_today",
+    "DailyAggregation",
+    "load_daily_aggregation",
     # 统计分析
     "calculate_news_weight",
+    "calculate_news_weights",
     "format_time_display",
     "count_word_frequency",
     "count_rss_frequency",
@@ -0,0 +1,393 @@
+# coding=utf-8
+"""
+当日汇总增量状态
+
+daily 模式每次运行都要读取整天数据、逐条匹配频率词，耗时随当天累计条目线性增长。
+这里把"每个标题匹配到哪个词组 + 统计信息"持久化到日库（aggregation_titles 表逐标题
+一行，aggregation_state 表保存水位等元数据）：
+
+- 状态以抓取时间列表为水位：已处理 crawl_times[:-1] 时，只需读取最新批次更新过的
+  条目（last_crawl_time = 最新批次）合并；冲突检测按标题/URL 索引只查询相关行，
+  写回只 upsert 本批次变化的行，耗时与本批次条目数成正比
+- 内存中只加载匹配到词组的标题（报告输出需要），未匹配的标题只计数
+- 状态键为频率词 / 过滤词 / 全局过滤词 / 监控平台的哈希，配置变化后自动整天重算
+- 遇到无法增量合并的情况（同一 URL 标题变化、同名标题对应不同条目等）回退整天重算
+
+合并结果与 read_all_today_titles + count_word_frequency 的整天计算一致，
+由 count_word_frequency(aggregation=...) 消费。
+"""
+
+import hashlib
+import json
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from trendradar.core.frequency import KeywordMatcher
+
+
+# 状态格式版本（格式变化时递增，旧状态自动失效）
+AGGREGATION_STATE_VERSION = 3
+
+# 未配置频率词时使用的虚拟词组（与 count_word_frequency 一致）
+ALL_NEWS_GROUP_KEY = "全部新闻"
+
+# 条目字段下标：[group_index, url, mobile_url, first_time, last_time, count, ranks]
+# 未匹配任何词组的标题只记录 [-1, url]（仍计入总标题数，并用于冲突检测，不加载到内存）
+_GROUP, _URL, _MOBILE_URL, _FIRST_TIME, _LAST_TIME, _COUNT, _RANKS = range(7)
+
+
+def effective_word_groups(
+    word_groups: List[Dict],
+    filter_words: List[str],
+) -> Tuple[List[Dict], List[str]]:
+    """未配置频率词时替换为"全部新闻"虚拟词组并清空过滤词（与 count_word_frequency 一致）"""
+    if word_groups:
+        return word_groups, filter_words
+    return [{"required": [], "normal": [], "group_key": ALL_NEWS_GROUP_KEY}], []
+
+
+def aggregation_key(
+    word_groups: List[Dict],
+    filter_words: List[str],
+    global_filters: Optional[List[str]] = None,
+    platform_ids: Optional[List[str]] = None,
+) -> str:
+    """
+    计算汇总状态键
+
+    只包含影响匹配结果的配置（词组的必须词/普通词及顺序、过滤词、全局过滤词、
+    监控平台）；max_count 等展示配置在输出阶段应用，不影响状态。
+
+    Args:
+        word_groups: 词组配置
+        filter_words: 过滤词
+        global_filters: 全局过滤词
+        platform_ids: 监控平台 ID 列表（None 表示不过滤）
+
+    Returns:
+        16 位十六进制哈希
+    """
+    payload = {
+        "version": AGGREGATION_STATE_VERSION,
+        "groups": [[list(g.get("required", [])), list(g.get("normal", []))] for g in word_groups],
+        "filter_words": list(filter_words or []),
+        "global_filters": list(global_filters or []),
+        "platforms": sorted(platform_ids) if platform_ids is not None else None,
+    }
+    encoded = json.dumps(payload, ensure_ascii=False, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()[:16]
+
+
+class DailyAggregation:
+    """
+    当日汇总状态
+
+    titles 为匹配到词组的标题 {source_id: {title: entry}}，同一平台内标题顺序与整天读取
+    （按 last_crawl_time、id 排序，重复标题保留首次位置、取最后一条的值）一致；
+    持久化时每个标题带一个位置序号和 news_items 行数，next_position 为下一个可用序号。
+    build / merge 之后，dirty_rows 为需要写回存储的行 [(source_id, title, position, row_count, entry)]。
+    """
+
+    def __init__(
+        self,
+        key: str,
+        crawl_times: Optional[List[str]] = None,
+        id_to_name: Optional[Dict[str, str]] = None,
+        titles: Optional[Dict[str, Dict[str, List[Any]]]] = None,
+        total_titles: int = 0,
+        next_position: int = 0,
+    ):
+        self.key = key
+        self.crawl_times: List[str] = list(crawl_times or [])
+        self.id_to_name: Dict[str, str] = dict(id_to_name or {})
+        self.titles: Dict[str, Dict[str, List[Any]]] = titles if titles is not None else {}
+        self.total_titles = total_titles
+        self.next_position = next_position
+        self.dirty_rows: List[Tuple[str, str, int, int, List[Any]]] = []
+
+    @staticmethod
+    def _make_entry(item: Any, matcher: KeywordMatcher) -> List[Any]:
+        group_index = matcher.match_group(item.title)
+        if group_index is None:
+            return [-1, item.url or ""]
+        # 字段取值与 read_all_today_titles_from_storage 一致
+        return [
+            group_index,
+            item.url or "",
+            item.mobile_url or "",
+            getattr(item, "first_time", item.crawl_time),
+            getattr(item, "last_time", item.crawl_time),
+            getattr(item, "count", 1),
+            list(getattr(item, "ranks", [item.rank])),
+        ]
+
+    def _set_entry(
+        self,
+        source_id: str,
+        title: str,
+        position: int,
+        row_count: int,
+        entry: List[Any],
+        move: bool,
+    ) -> None:
+        """记录一行变化，匹配到词组的标题同步更新内存中的 titles"""
+        self.dirty_rows.append((source_id, title, position, row_count, entry))
+        if entry[_GROUP] < 0:
+            return
+        source_titles = self.titles.setdefault(source_id, {})
+        if move:
+            source_titles.pop(title, None)
+        source_titles[title] = entry
+
+    @classmethod
+    def build(
+        cls,
+        key: str,
+        news_data: Any,
+        matcher: KeywordMatcher,
+        platform_ids: Optional[List[str]] = None,
+    ) -> "DailyAggregation":
+        """
+        从整天数据构建状态
+
+        Args:
+            key: 状态键
+            news_data: get_today_all_data 返回的 NewsData
+            matcher: 关键词匹配器
+            platform_ids: 监控平台 ID 列表（None 表示不过滤）
+
+        Returns:
+            DailyAggregation 实例（dirty_rows 为全部标题行）
+        """
+        aggregation = cls(key)
+        for source_id, news_list in news_data.items.items():
+            if platform_ids is not None and source_id not in platform_ids:
+                continue
+            aggregation.id_to_name[source_id] = news_data.id_to_name.get(source_id, source_id)
+            positions: Dict[str, int] = {}
+            row_counts: Dict[str, int] = {}
+            for item in news_list:
+                # 重复标题保留首次出现的位置、取最后一条的值
+                position = positions.get(item.title)
+                if position is None:
+                    position = positions[item.title] = aggregation.next_position
+                    aggregation.next_position += 1
+                row_counts[item.title] = row_counts.get(item.title, 0) + 1
+                aggregation._set_entry(
+                    source_id, item.title, position, row_counts[item.title],
+                    cls._make_entry(item, matcher), False,
+                )
+            aggregation.total_titles += len(positions)
+
+        # 重复标题只保留最后写入的一行
+        latest = {(row[0], row[1]): row for row in aggregation.dirty_rows}
+        aggregation.dirty_rows = list(latest.values())
+        return aggregation
+
+    @staticmethod
+    def lookup_keys(
+        news_data: Any,
+        platform_ids: Optional[List[str]] = None,
+    ) -> Dict[str, Tuple[List[str], List[str]]]:
+        """
+        批次中需要从存储查询的标题与 URL（供 merge 的冲突检测）
+
+        Returns:
+            {source_id: (标题列表, URL 列表)}
+        """
+        return {
+            source_id: ([item.title for item in news_list], [item.url for item in news_list if item.url])
+            for source_id, news_list in news_data.items.items()
+            if platform_ids is None or source_id in platform_ids
+        }
+
+    def merge(
+        self,
+        news_data: Any,
+        matcher: KeywordMatcher,
+        known: Dict[str, List[Tuple[str, int, int, str, int]]],
+        platform_ids: Optional[List[str]] = None,
+    ) -> bool:
+        """
+        合并某次抓取更新过的条目（get_news_by_last_crawl 的结果）
+
+        先整体校验再写入：返回 False 时状态保持不变，调用方应回退整天重算。
+
+        Args:
+            news_data: 批次数据（同一平台内按 id 排序）
+            matcher: 关键词匹配器
+            known: 存储中与本批次相关的已有行（find_aggregation_titles 的结果，
+                   {source_id: [(title, position, group_index, url, row_count)]}，按位置排序）
+            platform_ids: 监控平台 ID 列表（None 表示不过滤）
+
+        Returns:
+            是否合并成功
+        """
+        pending: List[Tuple[str, Any, Optional[Tuple[str, int, int, str, int]]]] = []
+
+        for source_id, news_list in news_data.items.items():
+            if platform_ids is not None and source_id not in platform_ids:
+                continue
+            rows = known.get(source_id, [])
+            existing = {row[0]: row for row in rows}
+            # 位置靠后的行覆盖靠前的行，与整天读取时的字典顺序一致
+            url_owner = {row[3]: row[0] for row in rows if row[3]}
+            seen = set()
+
+            for item in news_list:
+                title = item.title
+                url = item.url or ""
+                # 同一批次同名标题对应多个条目：整天读取时取哪条取决于全局顺序，不做增量
+                if title in seen:
+                    return False
+                seen.add(title)
+
+                row = existing.get(title)
+                if row is not None and row[3] != url:
+                    return False
+
+                # 同一 URL 的标题发生变化：旧标题需要从结果中移除，回退重算
+                if url:
+                    owner = url_owner.get(url)
+                    if owner is not None and owner != title:
+                        return False
+
+                pending.append((source_id, item, row))
+
+        self.dirty_rows = []
+        for source_id, item, row in pending:
+            self.id_to_name[source_id] = news_data.id_to_name.get(source_id, source_id)
+            if row is None:
+                self.total_titles += 1
+                position, row_count, move = self.next_position, 1, False
+                self.next_position += 1
+            elif not item.url:
+                # 无 URL 的条目每次抓取新增一行，标题保留首次出现的位置
+                position, row_count, move = row[1], row[4] + 1, False
+            elif row[4] > 1:
+                # 标题还有其他更早的行（状态中的 URL 来自排在最后的一行，刷新的正是这一行），
+                # 整天读取时标题位置由最早的行决定，保持不变
+                position, row_count, move = row[1], row[4], False
+            else:
+                # 只有这一行：last_crawl_time 更新后在整天读取中移动到末尾
+                position, row_count, move = self.next_position, 1, True
+                self.next_position += 1
+            self._set_entry(source_id, item.title, position, row_count, self._make_entry(item, matcher), move)
+
+        return True
+
+    def iter_matched(self) -> Iterator[Tuple[str, str, List[Any]]]:
+        """
+        按平台 ID 排序遍历匹配到词组的标题
+
+        Yields:
+            (source_id, title, entry)
+        """
+        for source_id in sorted(self.titles):
+            for title, entry in self.titles[source_id].items():
+                if entry[_GROUP] >= 0:
+                    yield source_id, title, entry
+
+    def to_dict(self) -> Dict[str, Any]:
+        """转换为可 JSON 序列化的元数据字典（标题行单独存储）"""
+        return {
+            "version": AGGREGATION_STATE_VERSION,
+            "key": self.key,
+            "crawl_times": self.crawl_times,
+            "id_to_name": self.id_to_name,
+            "total_titles": self.total_titles,
+            "next_position": self.next_position,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]], key: str) -> Optional["DailyAggregation"]:
+        """
+        从字典恢复
+
+        Args:
+            data: load_aggregation_state 的结果（to_dict 的元数据 + "titles" 匹配标题）
+            key: 期望的状态键
+
+        Returns:
+            DailyAggregation 实例；版本或状态键不一致时返回 None
+        """
+        if not data or data.get("version") != AGGREGATION_STATE_VERSION or data.get("key") != key:
+            return None
+        titles = data.get("titles")
+        if not isinstance(titles, dict):
+            return None
+        return cls(
+            key,
+            data.get("crawl_times"),
+            data.get("id_to_name"),
+            titles,
+            int(data.get("total_titles") or 0),
+            int(data.get("next_position") or 0),
+        )
+
+
+def load_daily_aggregation(
+    storage_manager: Any,
+    word_groups: List[Dict],
+    filter_words: List[str],
+    global_filters: Optional[List[str]] = None,
+    platform_ids: Optional[List[str]] = None,
+    matcher: Optional[KeywordMatcher] = None,
+    quiet: bool = False,
+) -> Optional[DailyAggregation]:
+    """
+    加载当日汇总状态（按需增量合并或整天重算，并写回存储）
+
+    Args:
+        storage_manager: 存储管理器
+        word_groups: 词组配置（为空时使用"全部新闻"虚拟词组）
+        filter_words: 过滤词
+        global_filters: 全局过滤词
+        platform_ids: 监控平台 ID 列表（None 表示不过滤）
+        matcher: 预编译的关键词匹配器（需由同一份有效词组配置构建）
+        quiet: 是否静默模式
+
+    Returns:
+        DailyAggregation；存储后端不支持或当天没有数据时返回 None
+    """
+    crawl_times = storage_manager.get_crawl_times()
+    if not crawl_times:
+        return None
+
+    word_groups, filter_words = effective_word_groups(word_groups, filter_words)
+    key = aggregation_key(word_groups, filter_words, global_filters, platform_ids)
+    if matcher is None:
+        matcher = KeywordMatcher(word_groups, filter_words, global_filters)
+
+    aggregation = DailyAggregation.from_dict(storage_manager.load_aggregation_state(key), key)
+
+    if aggregation is not None and aggregation.crawl_times == crawl_times:
+        if not quiet:
+            print(f"[存储] 当日汇总状态已是最新（{len(crawl_times)} 个批次）")
+        return aggregation
+
+    if aggregation is not None and aggregation.crawl_times == crawl_times[:-1]:
+        delta = storage_manager.get_news_by_last_crawl(crawl_times[-1])
+        known = None
+        if delta is not None:
+            known = storage_manager.find_aggregation_titles(
+                key, DailyAggregation.lookup_keys(delta, platform_ids)
+            )
+        if known is not None and aggregation.merge(delta, matcher, known, platform_ids):
+            aggregation.crawl_times = list(crawl_times)
+            if not quiet:
+                print(f"[存储] 当日汇总增量合并 {delta.get_total_count()} 条（批次 {crawl_times[-1]}）")
+            storage_manager.save_aggregation_state(key, aggregation.to_dict(), aggregation.dirty_rows)
+            return aggregation
+        if not quiet:
+            print("[存储] 当日汇总无法增量合并，整天重算")
+
+    all_data = storage_manager.get_today_all_data()
+    if not all_data or not all_data.items:
+        return None
+
+    aggregation = DailyAggregation.build(key, all_data, matcher, platform_ids)
+    aggregation.crawl_times = list(crawl_times)
+    if not quiet:
+        print(f"[存储] 当日汇总已整天重算（{aggregation.total_titles} 条标题）")
+    storage_manager.save_aggregation_state(key, aggregation.to_dict(), aggregation.dirty_rows, replace=True)
+    return aggregation
@@ -4,13 +4,28 @@
 
 提供新闻统计和分析功能：
 - calculate_news_weight: 计算新闻权重
+- calculate_news_weights: 批量计算新闻权重（NumPy 可用时向量化）
 - format_time_display: 格式化时间显示
 - count_word_frequency: 统计词频
 """
 
-from typing import Dict, List, Tuple, Optional, Callable, Any, TypedDict, cast
+import heapq
+from itertools import chain
+from typing import Dict, List, Tuple, Optional, Callable, Any, Sequence, TypedDict, cast
 
-from trendradar.core.frequency import matches_word_groups
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+    np = None
+
+from trendradar.core.aggregation import DailyAggregation
+from trendradar.core.frequency import KeywordMatcher
+
+
+# 批量较小时 NumPy 的数组构建开销大于收益，直接使用纯 Python 实现
+NUMPY_MIN_BATCH = 64
 
 
 class TitleData(TypedDict, total=False):
@@ -85,6 +100,112 @@ def calculate_news_weight(
     return float(total_weight)
 
 
+def calculate_news_weights(
+    ranks_list: Sequence[Sequence[int]],
+    counts: Optional[Sequence[int]],
+    rank_threshold: int,
+    weight_config: WeightConfig,
+) -> List[float]:
+    """
+    批量计算新闻权重
+
+    输入为列式数据（第 i 条新闻的排名列表与出现次数），一次算出整组/整天的权重，
+    结果与逐条调用 calculate_news_weight 逐位相同。NumPy 可用且批量足够大时向量化
+    计算，否则使用纯 Python 实现。
+
+    Args:
+        ranks_list: 每条新闻的排名列表
+        counts: 每条新闻的出现次数（为 None 时使用排名列表长度）
+        rank_threshold: 排名阈值
+        weight_config: 权重配置 {RANK_WEIGHT, FREQUENCY_WEIGHT, HOTNESS_WEIGHT}
+
+    Returns:
+        List[float]: 与输入顺序一致的权重列表
+    """
+    if counts is None:
+        counts = [len(ranks) for ranks in ranks_list]
+
+    rank_factor = weight_config.get("RANK_WEIGHT", 0.4)
+    frequency_factor = weight_config.get("FREQUENCY_WEIGHT", 0.3)
+    hotness_factor = weight_config.get("HOTNESS_WEIGHT", 0.3)
+
+    if HAS_NUMPY and len(ranks_list) >= NUMPY_MIN_BATCH:
+        return _calculate_news_weights_numpy(
+            ranks_list, counts, rank_threshold, rank_factor, frequency_factor, hotness_factor
+        )
+    return _calculate_news_weights_python(
+        ranks_list, counts, rank_threshold, rank_factor, frequency_factor, hotness_factor
+    )
+
+
+def _calculate_news_weights_python(
+    ranks_list: Sequence[Sequence[int]],
+    counts: Sequence[int],
+    rank_threshold: int,
+    rank_factor: float,
+    frequency_factor: float,
+    hotness_factor: float,
+) -> List[float]:
+    """批量计算权重（纯 Python 实现，运算顺序与 calculate_news_weight 一致）"""
+    weights = []
+    for ranks, count in zip(ranks_list, counts):
+        n = len(ranks)
+        if not n:
+            weights.append(0.0)
+            continue
+        rank_weight = sum(11 - min(rank, 10) for rank in ranks) / n
+        frequency_weight = min(count, 10) * 10
+        hotness_weight = sum(1 for rank in ranks if rank <= rank_threshold) / n * 100
+        weights.append(float(
+            rank_weight * rank_factor
+            + frequency_weight * frequency_factor
+            + hotness_weight * hotness_factor
+        ))
+    return weights
+
+
+def _calculate_news_weights_numpy(
+    ranks_list: Sequence[Sequence[int]],
+    counts: Sequence[int],
+    rank_threshold: int,
+    rank_factor: float,
+    frequency_factor: float,
+    hotness_factor: float,
+) -> List[float]:
+    """
+    批量计算权重（NumPy 实现）
+
+    所有排名拼接为一个扁平数组，按每条新闻的起始偏移用 reduceat 分段求和。
+    各步运算与纯 Python 实现相同（整数求和后做一次除法），结果逐位一致。
+    """
+    size = len(ranks_list)
+    lengths = np.fromiter((len(ranks) for ranks in ranks_list), dtype=np.int64, count=size)
+    flat = np.fromiter(chain.from_iterable(ranks_list), dtype=np.int64, count=int(lengths.sum()))
+    counts_array = np.fromiter(counts, dtype=np.int64, count=size)
+
+    weights = np.zeros(size, dtype=np.float64)
+    non_empty = lengths > 0
+    if not non_empty.any():
+        return weights.tolist()
+
+    # 空排名列表不占扁平数组位置，只需对非空条目的起始偏移做分段求和
+    starts = (np.cumsum(lengths) - lengths)[non_empty]
+    n = lengths[non_empty]
+    rank_sums = np.add.reduceat(11 - np.minimum(flat, 10), starts)
+    high_counts = np.add.reduceat((flat <= rank_threshold).astype(np.int64), starts)
+
+    rank_weight = rank_sums / n
+    frequency_weight = np.minimum(counts_array[non_empty], 10) * 10
+    hotness_weight = high_counts / n * 100
+
+    weights[non_empty] = (
+        rank_weight * rank_factor
+        + frequency_weight * frequency_factor
+        + hotness_weight * hotness_factor
+    )
+    return weights.tolist()
+
+
 def format_time_display(
     first_time: str,
     last_time: str,
@@ -112,6 +233,48 @@ def format_time_display(
         return f"[{first_display} ~ {last_display}]"
 
 
+class _GroupTitles:
+    """
+    单个词组的匹配标题集合
+
+    count 记录全部匹配数；标题只保留可能展示的部分：设置了显示上限时用大小为
+    limit 的有界堆保留排序最靠前的条目，避免对整组排序后再截断。
+    """
+
+    __slots__ = ("limit", "count", "_entries")
+
+    def __init__(self, limit: int = 0):
+        self.limit = limit
+        self.count = 0
+        self._entries: List[Tuple[Tuple, Tuple]] = []
+
+    def add(self, sort_key: Tuple, entry: Tuple) -> None:
+        """
+        加入一条匹配标题
+
+        Args:
+            sort_key: 排序键（越小越靠前，末位为唯一的顺序号）
+            entry: 延迟构建展示字段所需的原始数据
+        """
+        self.count += 1
+        if self.limit <= 0:
+            self._entries.append((sort_key, entry))
+            return
+
+        # 堆中存放取反后的键：堆顶即当前保留条目中排序最靠后的一条
+        heap_key = tuple(-value for value in sort_key)
+        if len(self._entries) < self.limit:
+            heapq.heappush(self._entries, (heap_key, entry))
+        elif heap_key > self._entries[0][0]:
+            heapq.heapreplace(self._entries, (heap_key, entry))
+
+    def sorted_entries(self) -> List[Tuple]:
+        """按排序键返回保留的条目"""
+        if self.limit <= 0:
+            return [entry for _, entry in sorted(self._entries, key=lambda item: item[0])]
+        return [entry for _, entry in sorted(self._entries, key=lambda item: item[0], reverse=True)]
+
+
 def count_word_frequency(
     results: Dict[str, Dict[str, Any]],
     word_groups: List[Dict[str, Any]],
@@ -128,6 +291,8 @@ def count_word_frequency(
     is_first_crawl_func: Optional[Callable[[], bool]] = None,
     convert_time_func: Optional[Callable[[str], str]] = None,
     quiet: bool = False,
+    matcher: Optional[KeywordMatcher] = None,
+    aggregation: Optional[DailyAggregation] = None,
 ) -> Tuple[List[Dict[str, Any]], int]:
     """
     统计词频，支持必须词、频率词、过滤词、全局过滤词，并标记新增标题
@@ -148,6 +313,9 @@ def count_word_frequency(
         is_first_crawl_func: 检测是否是当天第一次爬取的函数
         convert_time_func: 时间格式转换函数
         quiet: 是否静默模式（不打印日志）
+        matcher: 预编译的关键词匹配器（可选，需由同一份词组配置构建；为空时内部编译）
+        aggregation: 当日汇总状态（可选，仅 daily 模式；提供时忽略 results/title_info，
+                     直接使用状态中已匹配的标题，需由同一份词组配置构建）
 
     Returns:
         Tuple[List[Dict], int]: (统计结果列表, 总标题数)
@@ -173,6 +341,13 @@ def count_word_frequency(
         print("频率词配置为空，将显示所有新闻")
         word_groups = [{"required": [], "normal": [], "group_key": "全部新闻"}]
         filter_words = []  # 清空过滤词，显示所有新闻
+        matcher = None
+
+    if mode != "daily":
+        aggregation = None
+
+    if matcher is None and aggregation is None:
+        matcher = KeywordMatcher(word_groups, filter_words, global_filters)
 
     is_first_today = is_first_crawl_func()
 
@@ -224,7 +399,10 @@ def count_word_frequency(
         # 当日汇总模式：处理所有新闻
         results_to_process = results
         all_news_are_new = False
-        total_input_news = sum(len(titles) for titles in results.values())
+        if aggregation is not None:
+            total_input_news = aggregation.total_titles
+        else:
+            total_input_news = sum(len(titles) for titles in results.values())
         filter_status = (
             "全部显示"
             if len(word_groups) == 1 and word_groups[0]["group_key"] == "全部新闻"
@@ -232,9 +410,7 @@ def count_word_frequency(
         )
         print(f"当日汇总模式：处理 {total_input_news} 条新闻，模式：{filter_status}")
 
-    word_stats: Dict[str, Dict[str, Any]] = {}
     total_titles = 0
-    processed_titles: Dict[str, Dict[str, Any]] = {}
     matched_new_count = 0
 
     if title_info is None:
@@ -242,26 +418,55 @@ def count_word_frequency(
     if new_titles is None:
         new_titles = {}
 
+    # 创建 group_key 到位置和最大数量的映射
+    group_key_to_position = {
+        group["group_key"]: idx for idx, group in enumerate(word_groups)
+    }
+    group_key_to_max_count = {
+        group["group_key"]: group.get("max_count", 0) for group in word_groups
+    }
+
+    # 每个词组只保留可能展示的候选（有显示上限时为有界堆）
+    word_stats: Dict[str, _GroupTitles] = {}
     for group in word_groups:
         group_key = group["group_key"]
-        word_stats[group_key] = {"count": 0, "titles": {}}
+        # 应用最大显示数量限制（优先级：单独配置 > 全局配置）
+        group_max_count = group_key_to_max_count.get(group_key, 0) or max_news_per_keyword
+        word_stats[group_key] = _GroupTitles(group_max_count)
+
+    # 匹配标题的列式数据（按处理顺序）
+    matched_groups: List[str] = []
+    matched_ranks: List[List[int]] = []
+    matched_counts: List[int] = []
+    matched_entries: List[Tuple] = []
+
+    if aggregation is not None:
+        # 当日汇总状态中已记录每个标题匹配的词组，无需重新读取与匹配整天数据
+        total_titles = aggregation.total_titles
+        results_to_process = {}
+        for source_id, title, entry in aggregation.iter_matched():
+            group_index, url, mobile_url, first_time, last_time, count_info, ranks = entry
+            if not ranks:
+                ranks = [99]
+            new_titles_for_source = new_titles.get(source_id)
+            is_new = bool(new_titles_for_source) and title in new_titles_for_source
+
+            matched_groups.append(word_groups[group_index]["group_key"])
+            matched_ranks.append(ranks)
+            matched_counts.append(count_info)
+            matched_entries.append(
+                (source_id, title, first_time, last_time, count_info, ranks, url, mobile_url, is_new)
+            )
 
     for source_id, titles_data in results_to_process.items():
         total_titles += len(titles_data)
-
-        if source_id not in processed_titles:
-            processed_titles[source_id] = {}
+        source_title_info = title_info.get(source_id) if title_info else None
+        new_titles_for_source = new_titles.get(source_id) if new_titles else None
 
         for title, title_data in titles_data.items():
-            if title in processed_titles.get(source_id, {}):
-                continue
-
-            # 使用统一的匹配逻辑
-            matches_frequency_words = matches_word_groups(
-                title, word_groups, filter_words, global_filters
-            )
-
-            if not matches_frequency_words:
+            # 单次扫描标题，直接得到首个匹配的词组（同时完成过滤词检查）
+            group_index = matcher.match_group(title)
+            if group_index is None:
                 continue
 
             # 如果是增量模式或 current 模式第一次，统计匹配的新增新闻数量
@@ -270,119 +475,55 @@ def count_word_frequency(
             ):
                 matched_new_count += 1
 
-            source_ranks = title_data.get("ranks", [])
             source_url = title_data.get("url", "")
             source_mobile_url = title_data.get("mobileUrl", "")
 
-            # 找到匹配的词组（防御性转换确保类型安全）
-            title_lower = str(title).lower() if not isinstance(title, str) else title.lower()
-            for group in word_groups:
-                required_words = group["required"]
-                normal_words = group["normal"]
-
-                # 如果是"全部新闻"模式，所有标题都匹配第一个（唯一的）词组
-                if len(word_groups) == 1 and word_groups[0]["group_key"] == "全部新闻":
-                    group_key = group["group_key"]
-                    word_stats[group_key]["count"] += 1
-                    if source_id not in word_stats[group_key]["titles"]:
-                        word_stats[group_key]["titles"][source_id] = []
-                else:
-                    # 原有的匹配逻辑
-                    if required_words:
-                        all_required_present = all(
-                            req_word.lower() in title_lower
-                            for req_word in required_words
-                        )
-                        if not all_required_present:
-                            continue
-
-                    if normal_words:
-                        any_normal_present = any(
-                            normal_word.lower() in title_lower
-                            for normal_word in normal_words
-                        )
-                        if not any_normal_present:
-                            continue
-
-                    group_key = group["group_key"]
-                    word_stats[group_key]["count"] += 1
-                    if source_id not in word_stats[group_key]["titles"]:
-                        word_stats[group_key]["titles"][source_id] = []
-
-                first_time = ""
-                last_time = ""
-                count_info = 1
-                ranks = source_ranks if source_ranks else []
-                url = source_url
-                mobile_url = source_mobile_url
-
-                # 对于 current 模式，从历史统计信息中获取完整数据
-                if (
-                    mode == "current"
-                    and title_info
-                    and source_id in title_info
-                    and title in title_info[source_id]
-                ):
-                    info = title_info[source_id][title]
-                    first_time = info.get("first_time", "")
-                    last_time = info.get("last_time", "")
-                    count_info = info.get("count", 1)
-                    if "ranks" in info and info["ranks"]:
-                        ranks = info["ranks"]
-                    url = info.get("url", source_url)
-                    mobile_url = info.get("mobileUrl", source_mobile_url)
-                elif (
-                    title_info
-                    and source_id in title_info
-                    and title in title_info[source_id]
-                ):
-                    info = title_info[source_id][title]
-                    first_time = info.get("first_time", "")
-                    last_time = info.get("last_time", "")
-                    count_info = info.get("count", 1)
-                    if "ranks" in info and info["ranks"]:
-                        ranks = info["ranks"]
-                    url = info.get("url", source_url)
-                    mobile_url = info.get("mobileUrl", source_mobile_url)
-
-                if not ranks:
-                    ranks = [99]
-
-                time_display = format_time_display(first_time, last_time, convert_time_func)
-
-                source_name = id_to_name.get(source_id, source_id)
-
-                # 判断是否为新增
+            first_time = ""
+            last_time = ""
+            count_info = 1
+            ranks = title_data.get("ranks", []) or []
+            url = source_url
+            mobile_url = source_mobile_url
+
+            # 从历史统计信息中获取完整数据（current 模式下统计信息来自全部历史）
+            if source_title_info and title in source_title_info:
+                info = source_title_info[title]
+                first_time = info.get("first_time", "")
+                last_time = info.get("last_time", "")
+                count_info = info.get("count", 1)
+                if "ranks" in info and info["ranks"]:
+                    ranks = info["ranks"]
+                url = info.get("url", source_url)
+                mobile_url = info.get("mobileUrl", source_mobile_url)
+
+            if not ranks:
+                ranks = [99]
+
+            # 判断是否为新增
+            if all_news_are_new:
+                # 增量模式下所有处理的新闻都是新增，或者当天第一次的所有新闻都是新增
+                is_new = True
+            elif new_titles_for_source:
+                # 检查是否在新增列表中
+                is_new = title in new_titles_for_source
+            else:
                 is_new = False
-                if all_news_are_new:
-                    # 增量模式下所有处理的新闻都是新增，或者当天第一次的所有新闻都是新增
-                    is_new = True
-                elif new_titles and source_id in new_titles:
-                    # 检查是否在新增列表中
-                    new_titles_for_source = new_titles[source_id]
-                    is_new = title in new_titles_for_source
-
-                word_stats[group_key]["titles"][source_id].append(
-                    {
-                        "title": title,
-                        "source_name": source_name,
-                        "first_time": first_time,
-                        "last_time": last_time,
-                        "time_display": time_display,
-                        "count": count_info,
-                        "ranks": ranks,
-                        "rank_threshold": rank_threshold,
-                        "url": url,
-                        "mobileUrl": mobile_url,
-                        "is_new": is_new,
-                    }
-                )
 
-                if source_id not in processed_titles:
-                    processed_titles[source_id] = {}
-                processed_titles[source_id][title] = True
+            # 展示字段（时间格式化、来源名称等）延迟到截断之后再构建
+            matched_groups.append(word_groups[group_index]["group_key"])
+            matched_ranks.append(ranks)
+            matched_counts.append(count_info)
+            matched_entries.append(
+                (source_id, title, first_time, last_time, count_info, ranks, url, mobile_url, is_new)
+            )
 
-                break
+    # 一次性批量计算全部匹配标题的权重，再分配到各词组
+    # 排序键：权重降序、最高排名升序、出现次数降序；末位顺序号保证权重完全相同时保持处理顺序
+    weights = calculate_news_weights(matched_ranks, matched_counts, rank_threshold, weight_config)
+    for sequence, (group_key, weight, ranks, count_info, entry) in enumerate(
+        zip(matched_groups, weights, matched_ranks, matched_counts, matched_entries)
+    ):
+        word_stats[group_key].add((-weight, min(ranks), -count_info, sequence), entry)
 
     # 最后统一打印汇总信息
     if mode == "incremental":
@@ -428,7 +569,7 @@ def count_word_frequency(
                     f"当前榜单模式：当天第一次爬取，{total_input_news} 条当前榜单新闻中有 {matched_new_count} 条{filter_status}"
                 )
         else:
-            matched_count = sum(stat["count"] for stat in word_stats.values())
+            matched_count = sum(data.count for data in word_stats.values())
             filter_status = (
                 "全部显示"
                 if len(word_groups) == 1 and word_groups[0]["group_key"] == "全部新闻"
@@ -440,46 +581,33 @@ def count_word_frequency(
                 )
 
     stats = []
-    # 创建 group_key 到位置和最大数量的映射
-    group_key_to_position = {
-        group["group_key"]: idx for idx, group in enumerate(word_groups)
-    }
-    group_key_to_max_count = {
-        group["group_key"]: group.get("max_count", 0) for group in word_groups
-    }
-
     for group_key, data in word_stats.items():
-        all_titles = []
-        for source_id, title_list in data["titles"].items():
-            all_titles.extend(title_list)
-
-        # 按权重排序
-        sorted_titles = sorted(
-            all_titles,
-            key=lambda x: (
-                -calculate_news_weight(x, rank_threshold, weight_config),
-                min(x["ranks"]) if x["ranks"] else 999,
-                -x["count"],
-            ),
-        )
-
-        # 应用最大显示数量限制（优先级：单独配置 > 全局配置）
-        group_max_count = group_key_to_max_count.get(group_key, 0)
-        if group_max_count == 0:
-            # 使用全局配置
-            group_max_count = max_news_per_keyword
-
-        if group_max_count > 0:
-            sorted_titles = sorted_titles[:group_max_count]
+        sorted_titles = []
+        for source_id, title, first_time, last_time, count_info, ranks, url, mobile_url, is_new in data.sorted_entries():
+            sorted_titles.append(
+                {
+                    "title": title,
+                    "source_name": id_to_name.get(source_id, source_id),
+                    "first_time": first_time,
+                    "last_time": last_time,
+                    "time_display": format_time_display(first_time, last_time, convert_time_func),
+                    "count": count_info,
+                    "ranks": ranks,
+                    "rank_threshold": rank_threshold,
+                    "url": url,
+                    "mobileUrl": mobile_url,
+                    "is_new": is_new,
+                }
+            )
 
         stats.append(
             {
                 "word": group_key,
-                "count": data["count"],
+                "count": data.count,
                 "position": group_key_to_position.get(group_key, 999),
                 "titles": sorted_titles,
                 "percentage": (
-                    round(data["count"] / total_titles * 100, 2)
+                    round(data.count / total_titles * 100, 2)
                     if total_titles > 0
                     else 0
                 ),
@@ -514,6 +642,7 @@ def count_rss_frequency(
     timezone: str = "Asia/Shanghai",
     rank_threshold: int = 5,
     quiet: bool = False,
+    matcher: Optional[KeywordMatcher] = None,
 ) -> Tuple[List[Dict[str, Any]], int]:
     """
     按关键词分组统计 RSS 条目（与热榜统计格式一致）
@@ -533,6 +662,7 @@ def count_rss_frequency(
         sort_by_position_first: 是否优先按配置位置排序
         timezone: 时区名称（用于时间格式化）
         quiet: 是否静默模式
+        matcher: 预编译的关键词匹配器（可选，需由同一份词组配置构建；为空时内部编译）
 
     Returns:
         Tuple[List[Dict], int]: (统计结果列表, 总条目数)
@@ -570,6 +700,10 @@ def count_rss_frequency(
             print("[RSS] 频率词配置为空，将显示所有 RSS 条目")
         word_groups = [{"required": [], "normal": [], "group_key": "全部 RSS"}]
         filter_words = []
+        matcher = None
+
+    if matcher is None:
+        matcher = KeywordMatcher(word_groups, filter_words, global_filters)
 
     # 创建新增条目的 URL 集合，用于快速查找
     new_urls = set()
@@ -606,67 +740,36 @@ def count_rss_frequency(
         if url:
             processed_urls.add(url)
 
-        # 使用统一的匹配逻辑
-        if not matches_word_groups(title, word_groups, filter_words, global_filters):
+        # 单次扫描标题，直接得到首个匹配的词组（一个条目只计入第一个词组）
+        group_index = matcher.match_group(title)
+        if group_index is None:
             continue
 
-        # 找到匹配的词组
-        title_lower = title.lower()
-        for group in word_groups:
-            required_words = group["required"]
-            normal_words = group["normal"]
-            group_key = group["group_key"]
-
-            # "全部 RSS" 模式：所有条目都匹配
-            if len(word_groups) == 1 and word_groups[0]["group_key"] == "全部 RSS":
-                matched = True
-            else:
-                # 检查必须词
-                if required_words:
-                    all_required_present = all(
-                        req_word.lower() in title_lower
-                        for req_word in required_words
-                    )
-                    if not all_required_present:
-                        continue
-
-                # 检查普通词
-                if normal_words:
-                    any_normal_present = any(
-                        normal_word.lower() in title_lower
-                        for normal_word in normal_words
-                    )
-                    if not any_normal_present:
-                        continue
-
-                matched = True
-
-            if matched:
-                word_stats[group_key]["count"] += 1
-
-                # 格式化时间显示
-                published_at = item.get("published_at", "")
-                time_display = format_iso_time_friendly(published_at, timezone, include_date=True) if published_at else ""
-
-                # 判断是否为新增
-                is_new = url in new_urls if url else False
-
-                # 获取排名（基于发布时间顺序）
-                rank = url_to_rank.get(url, 99) if url else 99
-
-                title_data = {
-                    "title": title,
-                    "source_name": item.get("feed_name", item.get("feed_id", "RSS")),
-                    "time_display": time_display,
-                    "count": 1,  # RSS 条目通常只出现一次
-                    "ranks": [rank],
-                    "rank_threshold": rank_threshold,
-                    "url": url,
-                    "mobile_url": "",
-                    "is_new": is_new,
-                }
-                word_stats[group_key]["titles"].append(title_data)
-                break  # 一个条目只匹配第一个词组
+        group_key = word_groups[group_index]["group_key"]
+        word_stats[group_key]["count"] += 1
+
+        # 格式化时间显示
+        published_at = item.get("published_at", "")
+        time_display = format_iso_time_friendly(published_at, timezone, include_date=True) if published_at else ""
+
+        # 判断是否为新增
+        is_new = url in new_urls if url else False
+
+        # 获取排名（基于发布时间顺序）
+        rank = url_to_rank.get(url, 99) if url else 99
+
+        title_data = {
+            "title": title,
+            "source_name": item.get("feed_name", item.get("feed_id", "RSS")),
+            "time_display": time_display,
+            "count": 1,  # RSS 条目通常只出现一次
+            "ranks": [rank],
+            "rank_threshold": rank_threshold,
+            "url": url,
+            "mobile_url": "",
+            "is_new": is_new,
+        }
+        word_stats[group_key]["titles"].append(title_data)
 
     # 构建统计结果
     stats = []
@@ -758,16 +861,24 @@ def convert_keyword_stats_to_platform_stats(
                 unique_titles.append(title_data)
         platform_map[source_name] = unique_titles
 
-    # 3. 按权重排序每个平台内的新闻
+    # 3. 按权重排序每个平台内的新闻（整个平台的权重批量计算）
     for source_name, titles in platform_map.items():
-        platform_map[source_name] = sorted(
-            titles,
-            key=lambda x: (
-                -calculate_news_weight(x, rank_threshold, cast(WeightConfig, weight_config)),
-                min(x["ranks"]) if x["ranks"] else 999,
-                -cast(int, x["count"]),
+        ranks_list = [x.get("ranks") or [] for x in titles]
+        weights = calculate_news_weights(
+            ranks_list,
+            [x.get("count", len(ranks)) if ranks else 0 for x, ranks in zip(titles, ranks_list)],
+            rank_threshold,
+            cast(WeightConfig, weight_config),
+        )
+        order = sorted(
+            range(len(titles)),
+            key=lambda i: (
+                -weights[i],
+                min(titles[i]["ranks"]) if titles[i]["ranks"] else 999,
+                -cast(int, titles[i]["count"]),
             ),
         )
+        platform_map[source_name] = [titles[i] for i in order]
 
     # 4. 构建平台统计结果
     platform_stats = []
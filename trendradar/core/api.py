@@ -74,6 +74,8 @@ class TrendRadarAPI:
                 {"id": "baidu", "name": "百度热搜"},
             ],
             "REQUEST_INTERVAL": 1000,
+            "MAX_WORKERS": 1,
+            "POOL_SIZE": 10,
             "TIMEZONE": "Asia/Shanghai",
             "REPORT_MODE": "daily",
             "RANK_THRESHOLD": 5,
@@ -128,7 +130,11 @@ class TrendRadarAPI:
 
         # 初始化爬虫
         proxy_url = self.config.get("DEFAULT_PROXY", "") if self.config.get("USE_PROXY") else None
-        self.fetcher = DataFetcher(proxy_url=proxy_url)
+        self.fetcher = DataFetcher(
+            proxy_url=proxy_url,
+            max_workers=self.config.get("MAX_WORKERS", 1),
+            pool_size=self.config.get("POOL_SIZE", 10),
+        )
 
         # 初始化存储
         storage_config = self.config.get("STORAGE", {})
@@ -142,6 +148,16 @@ class TrendRadarAPI:
         # 时区
         self.timezone = self.config.get("TIMEZONE", "Asia/Shanghai")
 
+    def close(self) -> None:
+        """关闭爬虫会话，释放 HTTP 连接池"""
+        self.fetcher.close()
+
+    def __enter__(self) -> "TrendRadarAPI":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
     def fetch_news(
         self,
         platforms: Optional[List[str]] = None,
@@ -206,41 +222,20 @@ class TrendRadarAPI:
             分析结果统计
         """
         from .analyzer import count_word_frequency
-        from ..storage import convert_news_data_to_results
-
-        # 获取数据
-        from ..storage.base import NewsData
 
-        news_data_obj: Optional[NewsData] = None
-        if not news_data:
-            # 从存储读取最新数据
-            date_str = datetime.now().strftime("%Y-%m-%d")
-            data = self.storage.get_today_all_data(date_str)
-            if not data or not data.items:
-                return {"error": "没有可用的新闻数据"}
-            news_data_obj = data
-        # 如果 news_data 参数提供了，暂时不支持（需要从字典转换为 NewsData）
-        # 这里为了简化，只使用存储中的数据
-
-        if not news_data_obj:
+        if news_data:
+            # 暂不支持从字典数据进行分析，只使用存储中的数据
             return {"error": "暂不支持从字典数据进行分析"}
 
-        # 转换格式
-        results, id_to_name = convert_news_data_to_results(news_data_obj)
-
-        # 构建标题信息
-        title_info: Dict[str, Dict[str, Dict[str, Any]]] = {}
-        for source_id, titles_data in results.items():
-            title_info[source_id] = {}
-            for title, data in titles_data.items():
-                title_info[source_id][title] = {
-                    "first_time": data.get("time", ""),
-                    "last_time": data.get("time", ""),
-                    "count": 1,
-                    "ranks": data.get("ranks", []),
-                    "url": data.get("url", ""),
-                    "mobileUrl": data.get("mobileUrl", ""),
-                }
+        # 从存储读取当天数据的列式快照
+        date_str = datetime.now().strftime("%Y-%m-%d")
+        snapshot = self.storage.get_today_snapshot(date_str)
+        if not snapshot or not len(snapshot):
+            return {"error": "没有可用的新闻数据"}
+
+        results = snapshot.results_view()
+        title_info = snapshot.title_info_view()
+        id_to_name = snapshot.names_for()
 
         # 获取关键词 - 转换为新格式
         word_groups = []
@@ -288,7 +283,7 @@ class TrendRadarAPI:
         Returns:
             过滤后的新闻列表
         """
-        from .frequency import matches_word_groups
+        from .frequency import KeywordMatcher
 
         # 构建符合新格式的 word_groups
         if match_type == "all":
@@ -296,13 +291,8 @@ class TrendRadarAPI:
         else:  # any
             word_groups = [{"required": [], "normal": keywords, "group_key": " ".join(keywords), "max_count": 0}]
 
-        filtered = []
-        for news in news_data:
-            title = news.get("title", "")
-            if matches_word_groups(title, word_groups, [], []):
-                filtered.append(news)
-
-        return filtered
+        matcher = KeywordMatcher(word_groups)
+        return [news for news in news_data if matcher.matches(news.get("title", ""))]
 
     def get_hot_topics(
         self,
@@ -95,54 +95,21 @@ def read_all_today_titles_from_storage(
         current_platform_ids: 当前监控的平台 ID 列表（用于过滤）
 
     Returns:
-        Tuple[Dict, Dict, Dict]: (all_results, id_to_name, title_info)
+        Tuple[Dict, Dict, Dict]: (all_results, id_to_name, title_info)，
+        all_results / title_info 为 DaySnapshot 的只读视图（结构与嵌套字典相同）
     """
     try:
-        news_data = storage_manager.get_today_all_data()
+        snapshot = storage_manager.get_today_snapshot()
 
-        if not news_data or not news_data.items:
+        if not snapshot or not len(snapshot):
             return {}, {}, {}
 
-        all_results: dict[str, dict[str, dict]] = {}
-        final_id_to_name: dict[str, str] = {}
-        title_info: dict[str, dict[str, dict]] = {}
-
-        for source_id, news_list in news_data.items.items():
-            # 按平台过滤
-            if current_platform_ids is not None and source_id not in current_platform_ids:
-                continue
-
-            # 获取来源名称
-            source_name = news_data.id_to_name.get(source_id, source_id)
-            final_id_to_name[source_id] = source_name
-
-            if source_id not in all_results:
-                all_results[source_id] = {}
-                title_info[source_id] = {}
-
-            for item in news_list:
-                title = item.title
-                ranks = getattr(item, 'ranks', [item.rank])
-                first_time = getattr(item, 'first_time', item.crawl_time)
-                last_time = getattr(item, 'last_time', item.crawl_time)
-                count = getattr(item, 'count', 1)
-
-                all_results[source_id][title] = {
-                    "ranks": ranks,
-                    "url": item.url or "",
-                    "mobileUrl": item.mobile_url or "",
-                }
-
-                title_info[source_id][title] = {
-                    "first_time": first_time,
-                    "last_time": last_time,
-                    "count": count,
-                    "ranks": ranks,
-                    "url": item.url or "",
-                    "mobileUrl": item.mobile_url or "",
-                }
-
-        return all_results, final_id_to_name, title_info
+        # 返回列式快照上的只读视图，不再复制出 results / title_info 两份嵌套字典
+        return (
+            snapshot.results_view(current_platform_ids),
+            snapshot.names_for(current_platform_ids),
+            snapshot.title_info_view(current_platform_ids),
+        )
 
     except Exception as e:
         print(f"[存储] 从存储后端读取数据失败: {e}")
@@ -199,12 +166,6 @@ def detect_latest_new_titles_from_storage(
         if not latest_data or not latest_data.items:
             return {}
 
-        # 获取所有历史数据
-        all_data = storage_manager.get_today_all_data()
-        if not all_data or not all_data.items:
-            # 没有历史数据（第一次抓取），不应该有"新增"标题
-            return {}
-
         # 获取最新批次时间
         latest_time = latest_data.crawl_time
 
@@ -224,22 +185,14 @@ def detect_latest_new_titles_from_storage(
         # 步骤2：收集历史标题
         # 关键逻辑：一个标题只要其 first_crawl_time < latest_time，就是历史标题
         # 这样即使同一标题有多条记录（URL 不同），只要任何一条是历史的，该标题就算历史
-        historical_titles: dict[str, set[str]] = {}
-        for source_id, news_list in all_data.items.items():
-            if current_platform_ids is not None and source_id not in current_platform_ids:
-                continue
-
-            historical_titles[source_id] = set()
-            for item in news_list:
-                first_time = getattr(item, 'first_time', item.crawl_time)
-                # 如果该记录的首次出现时间早于最新批次，则该标题是历史标题
-                if first_time < latest_time:
-                    historical_titles[source_id].add(item.title)
+        # 只查询 (platform_id, title)，不加载整天数据
+        historical_titles = storage_manager.get_historical_titles(
+            latest_time, platform_ids=current_platform_ids
+        )
 
         # 检查是否是当天第一次抓取（没有任何历史标题）
-        # 如果所有平台的历史标题集合都为空，说明只有一个抓取批次，不应该有"新增"标题
-        has_historical_data = any(len(titles) > 0 for titles in historical_titles.values())
-        if not has_historical_data:
+        # 没有数据（None）或所有平台的历史标题集合都为空，说明只有一个抓取批次，不应该有"新增"标题
+        if not historical_titles:
             return {}
 
         # 步骤3：找出新增标题 = 最新批次标题 - 历史标题
@@ -8,11 +8,13 @@
 - 过滤词（!前缀）
 - 全局过滤词（[GLOBAL_FILTER] 区域）
 - 最大显示数量（@前缀）
+
+以及编译后的关键词匹配器 KeywordMatcher（Aho-Corasick 多模式匹配）。
 """
 
 import os
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, FrozenSet, List, Tuple, Optional, Set
 
 
 def load_frequency_words(
@@ -192,3 +194,203 @@ def matches_word_groups(
         return True
 
     return False
+
+
+class KeywordMatcher:
+    """
+    编译后的关键词匹配器
+
+    由 load_frequency_words 的输出构建一次，之后对每个标题：
+    - 用 Aho-Corasick 自动机单次扫描（小写后）标题，得到命中的全部词
+    - 基于命中集合判断全局过滤词、过滤词、必须词、普通词规则
+
+    匹配语义与 matches_word_groups 完全一致（大小写不敏感的子串匹配），
+    但开销与词组数量基本无关，适合几百个词组 × 上万条标题的场景。
+
+    使用示例:
+        word_groups, filter_words, global_filters = load_frequency_words()
+        matcher = KeywordMatcher(word_groups, filter_words, global_filters)
+        matcher.matches(title)        # 等价于 matches_word_groups(...)
+        matcher.match_group(title)    # 首个匹配词组的下标
+    """
+
+    def __init__(
+        self,
+        word_groups: List[Dict],
+        filter_words: Optional[List[str]] = None,
+        global_filters: Optional[List[str]] = None,
+    ):
+        """
+        编译词组规则
+
+        Args:
+            word_groups: 词组列表（需包含 required / normal 字段）
+            filter_words: 过滤词列表
+            global_filters: 全局过滤词列表
+        """
+        self.word_groups = word_groups
+
+        # 自动机：goto[state] 为 {字符: 下一状态}，outputs[state] 为该状态命中的词 ID
+        self._goto: List[Dict[str, int]] = [{}]
+        self._outputs: List[Tuple[int, ...]] = [()]
+        self._words: List[str] = []
+        self._word_ids: Dict[str, int] = {}
+        # 空字符串是任何标题的子串，单独记录而不进入自动机
+        self._always_hit: Set[int] = set()
+
+        self._global_ids = self._add_words(global_filters or [])
+        self._filter_ids = self._add_words(filter_words or [])
+
+        self._required: List[FrozenSet[int]] = []
+        self._normal: List[FrozenSet[int]] = []
+        self._word_groups_index: Dict[int, List[int]] = {}
+        self._unconditional_groups: List[int] = []
+
+        for index, group in enumerate(word_groups):
+            required = self._add_words(group.get("required", []))
+            normal = self._add_words(group.get("normal", []))
+            self._required.append(required)
+            self._normal.append(normal)
+            if not required and not normal:
+                self._unconditional_groups.append(index)
+            for word_id in required | normal:
+                self._word_groups_index.setdefault(word_id, []).append(index)
+
+        self._build_failure_links()
+
+    def _add_words(self, words: List[str]) -> FrozenSet[int]:
+        """将词加入自动机，返回词 ID 集合"""
+        ids = set()
+        for word in words:
+            text = word.lower()
+            word_id = self._word_ids.get(text)
+            if word_id is None:
+                word_id = len(self._words)
+                self._words.append(text)
+                self._word_ids[text] = word_id
+                if not text:
+                    self._always_hit.add(word_id)
+                else:
+                    state = 0
+                    for char in text:
+                        next_state = self._goto[state].get(char)
+                        if next_state is None:
+                            next_state = len(self._goto)
+                            self._goto[state][char] = next_state
+                            self._goto.append({})
+                            self._outputs.append(())
+                        state = next_state
+                    self._outputs[state] += (word_id,)
+            ids.add(word_id)
+        return frozenset(ids)
+
+    def _build_failure_links(self) -> None:
+        """广度优先构建失败指针，并把失败链上的输出合并到各状态"""
+        self._fail = [0] * len(self._goto)
+        queue = list(self._goto[0].values())
+        head = 0
+        while head < len(queue):
+            state = queue[head]
+            head += 1
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                if self._outputs[self._fail[next_state]]:
+                    self._outputs[next_state] += self._outputs[self._fail[next_state]]
+
+    def _scan(self, title: object) -> Optional[Set[int]]:
+        """
+        扫描标题，返回命中的词 ID 集合
+
+        Returns:
+            命中集合；标题为空时返回 None
+        """
+        # 防御性类型检查：确保 title 是有效字符串
+        if not isinstance(title, str):
+            title = str(title) if title is not None else ""
+        if not title.strip():
+            return None
+
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        hits = set(self._always_hit)
+        state = 0
+        for char in title.lower():
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if outputs[state]:
+                hits.update(outputs[state])
+        return hits
+
+    def _first_group(self, hits: Set[int]) -> Optional[int]:
+        """按配置顺序返回首个满足必须词/普通词规则的词组下标"""
+        candidates = set(self._unconditional_groups)
+        for word_id in hits:
+            groups = self._word_groups_index.get(word_id)
+            if groups:
+                candidates.update(groups)
+
+        for index in sorted(candidates):
+            required = self._required[index]
+            if required and not required <= hits:
+                continue
+            normal = self._normal[index]
+            if normal and normal.isdisjoint(hits):
+                continue
+            return index
+        return None
+
+    def find_words(self, title: object) -> Set[str]:
+        """
+        返回标题中出现的全部已编译词（小写形式）
+
+        Args:
+            title: 标题文本
+
+        Returns:
+            命中词集合
+        """
+        hits = self._scan(title)
+        return {self._words[word_id] for word_id in hits} if hits else set()
+
+    def matches(self, title: object) -> bool:
+        """
+        检查标题是否匹配词组规则（语义同 matches_word_groups）
+
+        Args:
+            title: 标题文本
+
+        Returns:
+            是否匹配
+        """
+        hits = self._scan(title)
+        if hits is None:
+            return False
+        if not hits.isdisjoint(self._global_ids):
+            return False
+        if not self.word_groups:
+            return True
+        if not hits.isdisjoint(self._filter_ids):
+            return False
+        return self._first_group(hits) is not None
+
+    def match_group(self, title: object) -> Optional[int]:
+        """
+        返回标题匹配的首个词组下标
+
+        Args:
+            title: 标题文本
+
+        Returns:
+            词组下标；标题为空、被（全局）过滤词排除、未配置词组或无词组匹配时返回 None
+        """
+        hits = self._scan(title)
+        if hits is None or not self.word_groups:
+            return None
+        if not hits.isdisjoint(self._global_ids) or not hits.isdisjoint(self._filter_ids):
+            return None
+        return self._first_group(hits)
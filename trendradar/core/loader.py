@@ -56,6 +56,8 @@ def _load_crawler_config(config_data: Dict) -> Dict:
     enable_crawler_env = _get_env_bool("ENABLE_CRAWLER")
     return {
         "REQUEST_INTERVAL": crawler_config.get("request_interval", 100),
+        "MAX_WORKERS": _get_env_int("CRAWLER_MAX_WORKERS") or crawler_config.get("max_workers", 1),
+        "POOL_SIZE": crawler_config.get("pool_size", 10),
         "USE_PROXY": crawler_config.get("use_proxy", False),
         "DEFAULT_PROXY": crawler_config.get("default_proxy", ""),
         "ENABLE_CRAWLER": enable_crawler_env if enable_crawler_env is not None else crawler_config.get("enabled", True),
@@ -100,6 +102,7 @@ def _load_notification_config(config_data: Dict) -> Dict:
         "BATCH_SEND_INTERVAL": advanced.get("batch_send_interval", 1.0),
         "FEISHU_MESSAGE_SEPARATOR": advanced.get("feishu_message_separator", "---"),
         "MAX_ACCOUNTS_PER_CHANNEL": _get_env_int("MAX_ACCOUNTS_PER_CHANNEL") or advanced.get("max_accounts_per_channel", 3),
+        "NOTIFICATION_MAX_WORKERS": _get_env_int("NOTIFICATION_MAX_WORKERS") or advanced.get("notification_max_workers", 1),
     }
 
 
@@ -161,6 +164,8 @@ def _load_rss_config(config_data: Dict) -> Dict:
         "ENABLED": rss.get("enabled", False),
         "REQUEST_INTERVAL": advanced_rss.get("request_interval", 2000),
         "TIMEOUT": advanced_rss.get("timeout", 15),
+        "MAX_WORKERS": advanced_rss.get("max_workers", 1),
+        "CONDITIONAL_GET": advanced_rss.get("conditional_get", True),
         "USE_PROXY": advanced_rss.get("use_proxy", False),
         "PROXY_URL": rss_proxy_url,
         "FEEDS": rss.get("feeds", []),
@@ -181,6 +186,7 @@ def _load_storage_config(config_data: Dict) -> Dict:
     local = storage.get("local", {})
     remote = storage.get("remote", {})
     pull = storage.get("pull", {})
+    sqlite = storage.get("sqlite", {})
 
     txt_enabled_env = _get_env_bool("STORAGE_TXT_ENABLED")
     html_enabled_env = _get_env_bool("STORAGE_HTML_ENABLED")
@@ -209,6 +215,14 @@ def _load_storage_config(config_data: Dict) -> Dict:
             "ENABLED": pull_enabled_env if pull_enabled_env is not None else pull.get("enabled", False),
             "DAYS": _get_env_int("PULL_DAYS") or pull.get("days", 7),
         },
+        "SQLITE": {
+            "JOURNAL_MODE": sqlite.get("journal_mode", "wal"),
+            "SYNCHRONOUS": sqlite.get("synchronous", "normal"),
+            "MMAP_SIZE": sqlite.get("mmap_size", 268435456),
+            "CACHE_SIZE": sqlite.get("cache_size", -16000),
+            "TEMP_STORE": sqlite.get("temp_store", "memory"),
+            "BUSY_TIMEOUT": sqlite.get("busy_timeout", 5000),
+        },
     }
 
 
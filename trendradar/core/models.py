@@ -3,12 +3,13 @@
 TrendRadar 数据模型
 """
 
+import sys
 from dataclasses import dataclass, field
 from typing import List, Dict, Optional
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class NewsConfig:
     """新闻配置"""
     platforms: List[Dict[str, str]] = field(default_factory=list)
@@ -34,7 +35,7 @@ class NewsConfig:
     retention_days: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class NewsItem:
     """单条新闻"""
     title: str
@@ -46,6 +47,13 @@ class NewsItem:
     time: str = ""
     date: str = ""
 
+    def __post_init__(self) -> None:
+        # 平台名称/ID 与时间日期在大量条目间重复，驻留后共享同一对象
+        self.platform = sys.intern(self.platform)
+        self.platform_id = sys.intern(self.platform_id)
+        self.time = sys.intern(self.time)
+        self.date = sys.intern(self.date)
+
     def to_dict(self) -> Dict:
         """转换为字典"""
         return {
@@ -60,7 +68,7 @@ class NewsItem:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class NewsData:
     """新闻数据集合"""
     date: str
@@ -80,7 +88,7 @@ class NewsData:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class TopicStat:
     """话题统计"""
     keywords: List[str]
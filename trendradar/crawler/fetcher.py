@@ -7,14 +7,65 @@
 - 批量平台数据爬取
 - 自动重试机制
 - 代理支持
+- 并发抓取（按主机限速）
+- 连接池复用（keep-alive）
 """
 
 import json
 import random
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Tuple, Optional, Union
+from urllib.parse import urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
+
+
+class HostRateLimiter:
+    """
+    按主机的请求限速器（线程安全）
+
+    同一主机的相邻两次请求至少间隔 interval 毫秒（带随机波动），
+    不同主机之间互不影响。并发模式下用于替代全局 sleep。
+    """
+
+    def __init__(self, interval_ms: int = 100):
+        """
+        初始化限速器
+
+        Args:
+            interval_ms: 同一主机的请求间隔（毫秒）
+        """
+        self.interval_ms = interval_ms
+        self._next_slot: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def _next_interval(self) -> float:
+        """计算下一次间隔（秒），与顺序模式的波动规则一致"""
+        actual_interval = self.interval_ms + random.randint(-10, 20)
+        return max(50, actual_interval) / 1000
+
+    def wait(self, url: str) -> None:
+        """
+        等待直到允许向 url 所在主机发起请求
+
+        Args:
+            url: 即将请求的 URL
+        """
+        if self.interval_ms <= 0:
+            return
+
+        host = urlparse(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self._next_interval()
+
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
 
 
 class DataFetcher:
@@ -36,6 +87,8 @@ class DataFetcher:
         self,
         proxy_url: Optional[str] = None,
         api_url: Optional[str] = None,
+        max_workers: int = 1,
+        pool_size: int = 10,
     ):
         """
         初始化数据获取器
@@ -43,9 +96,67 @@ class DataFetcher:
         Args:
             proxy_url: 代理服务器 URL（可选）
             api_url: API 基础 URL（可选，默认使用 DEFAULT_API_URL）
+            max_workers: 最大并发请求数（1=顺序抓取）
+            pool_size: 每个主机的连接池大小（不小于 max_workers）
         """
         self.proxy_url = proxy_url
         self.api_url = api_url or self.DEFAULT_API_URL
+        self.max_workers = max(1, int(max_workers or 1))
+        self.pool_size = max(self.max_workers, int(pool_size or 1))
+
+        self._request_count = 0
+        self._stats_lock = threading.Lock()
+        self._adapter = HTTPAdapter(
+            pool_connections=self.pool_size,
+            pool_maxsize=self.pool_size,
+        )
+        self.session = self._create_session()
+
+    def _create_session(self) -> requests.Session:
+        """创建带连接池的请求会话（所有平台和重试共用，保持 keep-alive）"""
+        session = requests.Session()
+        session.headers.update(self.DEFAULT_HEADERS)
+        session.mount("http://", self._adapter)
+        session.mount("https://", self._adapter)
+
+        # 代理连接同样由适配器按代理地址池化复用
+        if self.proxy_url:
+            session.proxies = {
+                "http": self.proxy_url,
+                "https": self.proxy_url,
+            }
+
+        return session
+
+    def get_connection_stats(self) -> Dict[str, int]:
+        """
+        获取连接复用统计
+
+        Returns:
+            {"requests": 请求数, "connections": 新建连接数, "reused": 复用连接的请求数}
+        """
+        managers = [self._adapter.poolmanager]
+        managers.extend(self._adapter.proxy_manager.values())
+
+        connections = 0
+        for manager in managers:
+            for key in manager.pools.keys():
+                pool = manager.pools.get(key)
+                if pool is not None:
+                    connections += pool.num_connections
+
+        with self._stats_lock:
+            request_count = self._request_count
+
+        return {
+            "requests": request_count,
+            "connections": connections,
+            "reused": max(0, request_count - connections),
+        }
+
+    def close(self) -> None:
+        """关闭会话，释放连接池"""
+        self.session.close()
 
     def fetch_data(
         self,
@@ -53,6 +164,7 @@ class DataFetcher:
         max_retries: int = 2,
         min_retry_wait: int = 3,
         max_retry_wait: int = 5,
+        rate_limiter: Optional[HostRateLimiter] = None,
     ) -> Tuple[Optional[str], str, str]:
         """
         获取指定ID数据，支持重试
@@ -62,6 +174,7 @@ class DataFetcher:
             max_retries: 最大重试次数
             min_retry_wait: 最小重试等待时间（秒）
             max_retry_wait: 最大重试等待时间（秒）
+            rate_limiter: 按主机限速器（可选，并发模式下使用，重试同样受限速）
 
         Returns:
             (响应文本, 平台ID, 别名) 元组，失败时响应文本为 None
@@ -74,19 +187,14 @@ class DataFetcher:
 
         url = f"{self.api_url}?id={id_value}&latest"
 
-        proxies = None
-        if self.proxy_url:
-            proxies = {"http": self.proxy_url, "https": self.proxy_url}
-
         retries = 0
         while retries <= max_retries:
             try:
-                response = requests.get(
-                    url,
-                    proxies=proxies,
-                    headers=self.DEFAULT_HEADERS,
-                    timeout=10,
-                )
+                if rate_limiter:
+                    rate_limiter.wait(url)
+                with self._stats_lock:
+                    self._request_count += 1
+                response = self.session.get(url, timeout=10)
                 response.raise_for_status()
 
                 data_text = response.text
@@ -114,24 +222,96 @@ class DataFetcher:
 
         return None, id_value, alias
 
+    def _print_connection_stats(self) -> None:
+        """输出连接复用统计"""
+        stats = self.get_connection_stats()
+        if stats["requests"]:
+            print(
+                f"连接复用: {stats['requests']} 次请求, "
+                f"新建 {stats['connections']} 个连接, 复用 {stats['reused']} 次"
+            )
+
+    def _parse_response(self, id_value: str, response: str) -> Dict[str, Dict[str, Any]]:
+        """
+        解析单个平台的响应文本
+
+        Args:
+            id_value: 平台ID
+            response: 响应文本（JSON）
+
+        Returns:
+            {标题: {"ranks": [...], "url": ..., "mobileUrl": ...}} 字典
+        """
+        data = json.loads(response)
+        titles: Dict[str, Dict[str, Any]] = {}
+
+        for index, item in enumerate(data.get("items", []), 1):
+            title = item.get("title")
+            # 跳过无效标题（None、float、空字符串）
+            if title is None or isinstance(title, float) or not str(title).strip():
+                continue
+            title = str(title).strip()
+            url = item.get("url", "")
+            mobile_url = item.get("mobileUrl", "")
+
+            if title in titles:
+                titles[title]["ranks"].append(index)
+            else:
+                titles[title] = {
+                    "ranks": [index],
+                    "url": url,
+                    "mobileUrl": mobile_url,
+                }
+        return titles
+
+    def _collect_result(
+        self,
+        id_value: str,
+        response: Optional[str],
+        results: Dict[str, Dict[str, Dict[str, Any]]],
+        failed_ids: List[str],
+    ) -> None:
+        """将单个平台的响应写入结果字典或失败列表"""
+        if not response:
+            failed_ids.append(id_value)
+            return
+
+        try:
+            results[id_value] = self._parse_response(id_value, response)
+        except json.JSONDecodeError:
+            print(f"解析 {id_value} 响应失败")
+            failed_ids.append(id_value)
+        except Exception as e:
+            print(f"处理 {id_value} 数据出错: {e}")
+            failed_ids.append(id_value)
+
     def crawl_websites(
         self,
         ids_list: List[Union[str, Tuple[str, str]]],
         request_interval: int = 100,
+        max_workers: Optional[int] = None,
     ) -> Tuple[Dict, Dict, List]:
         """
         爬取多个网站数据
 
+        max_workers > 1 时启用并发模式：请求在线程池中并发执行，
+        同一主机的请求按 request_interval 限速，结果仍按 ids_list 顺序汇总。
+
         Args:
             ids_list: 平台ID列表，每个元素可以是字符串或 (平台ID, 别名) 元组
             request_interval: 请求间隔（毫秒）
+            max_workers: 最大并发请求数（可选，默认使用初始化时的配置）
 
         Returns:
             (结果字典, ID到名称的映射, 失败ID列表) 元组
         """
         results: Dict[str, Dict[str, Dict[str, Any]]] = {}
         id_to_name = {}
-        failed_ids = []
+        failed_ids: List[str] = []
+
+        workers = self.max_workers if max_workers is None else max(1, max_workers)
+        if workers > 1 and len(ids_list) > 1:
+            return self._crawl_concurrently(ids_list, request_interval, workers)
 
         for i, id_info in enumerate(ids_list):
             if isinstance(id_info, tuple):
@@ -142,37 +322,7 @@ class DataFetcher:
 
             id_to_name[id_value] = name
             response, _, _ = self.fetch_data(id_info)
-
-            if response:
-                try:
-                    data = json.loads(response)
-                    results[id_value] = {}
-
-                    for index, item in enumerate(data.get("items", []), 1):
-                        title = item.get("title")
-                        # 跳过无效标题（None、float、空字符串）
-                        if title is None or isinstance(title, float) or not str(title).strip():
-                            continue
-                        title = str(title).strip()
-                        url = item.get("url", "")
-                        mobile_url = item.get("mobileUrl", "")
-
-                        if title in results[id_value]:
-                            results[id_value][title]["ranks"].append(index)
-                        else:
-                            results[id_value][title] = {
-                                "ranks": [index],
-                                "url": url,
-                                "mobileUrl": mobile_url,
-                            }
-                except json.JSONDecodeError:
-                    print(f"解析 {id_value} 响应失败")
-                    failed_ids.append(id_value)
-                except Exception as e:
-                    print(f"处理 {id_value} 数据出错: {e}")
-                    failed_ids.append(id_value)
-            else:
-                failed_ids.append(id_value)
+            self._collect_result(id_value, response, results, failed_ids)
 
             # 请求间隔（除了最后一个）
             if i < len(ids_list) - 1:
@@ -181,4 +331,56 @@ class DataFetcher:
                 time.sleep(actual_interval / 1000)
 
         print(f"成功: {list(results.keys())}, 失败: {failed_ids}")
+        self._print_connection_stats()
+        return results, id_to_name, failed_ids
+
+    def _crawl_concurrently(
+        self,
+        ids_list: List[Union[str, Tuple[str, str]]],
+        request_interval: int,
+        max_workers: int,
+    ) -> Tuple[Dict, Dict, List]:
+        """
+        并发爬取多个网站数据
+
+        Args:
+            ids_list: 平台ID列表
+            request_interval: 同一主机的请求间隔（毫秒）
+            max_workers: 最大并发请求数
+
+        Returns:
+            (结果字典, ID到名称的映射, 失败ID列表) 元组
+        """
+        results: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        id_to_name = {}
+        failed_ids: List[str] = []
+
+        rate_limiter = HostRateLimiter(request_interval)
+        workers = min(max_workers, len(ids_list))
+        print(f"并发抓取模式：{workers} 个并发请求")
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(self.fetch_data, id_info, rate_limiter=rate_limiter)
+                for id_info in ids_list
+            ]
+
+            # 按输入顺序汇总，保证结果顺序与顺序模式一致
+            for id_info, future in zip(ids_list, futures):
+                if isinstance(id_info, tuple):
+                    id_value, name = id_info
+                else:
+                    id_value = id_info
+                    name = id_value
+
+                id_to_name[id_value] = name
+                try:
+                    response, _, _ = future.result()
+                except Exception as e:
+                    print(f"请求 {id_value} 失败: {e}")
+                    response = None
+                self._collect_result(id_value, response, results, failed_ids)
+
+        print(f"成功: {list(results.keys())}, 失败: {failed_ids}")
+        self._print_connection_stats()
         return results, id_to_name, failed_ids
@@ -7,5 +7,6 @@ RSS 抓取模块
 
 from .parser import RSSParser
 from .fetcher import RSSFetcher, RSSFeedConfig
+from .cache import FeedValidatorCache, FEED_CACHE_FILENAME
 
-__all__ = ["RSSParser", "RSSFetcher", "RSSFeedConfig"]
+__all__ = ["RSSParser", "RSSFetcher", "RSSFeedConfig", "FeedValidatorCache", "FEED_CACHE_FILENAME"]
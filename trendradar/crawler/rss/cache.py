@@ -0,0 +1,137 @@
+# coding=utf-8
+"""
+RSS 源校验缓存
+
+为每个 RSS 源持久化 ETag / Last-Modified / 内容哈希以及上次解析结果，
+用于条件请求（If-None-Match / If-Modified-Since）：
+- 服务端返回 304 时直接复用上次解析结果
+- 内容哈希未变化时跳过解析
+
+缓存文件与 RSS 日库存放在同一目录：output/rss/feed_cache.db
+"""
+
+import json
+import sqlite3
+import threading
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import List, Optional, Union
+
+from .parser import ParsedRSSItem
+
+
+# 缓存文件名（不符合 YYYY-MM-DD.db 格式，不会被当作日库处理或清理）
+FEED_CACHE_FILENAME = "feed_cache.db"
+
+
+@dataclass
+class FeedCacheEntry:
+    """单个 RSS 源的校验缓存条目"""
+    url: str                                  # 缓存对应的 RSS URL（URL 变化时缓存失效）
+    etag: str = ""                            # 响应头 ETag
+    last_modified: str = ""                   # 响应头 Last-Modified
+    content_hash: str = ""                    # 响应内容 SHA-256
+    items: List[ParsedRSSItem] = field(default_factory=list)  # 上次解析结果
+
+
+class FeedValidatorCache:
+    """
+    RSS 源校验缓存（SQLite 持久化，线程安全）
+
+    并发抓取时多个线程共享同一连接，读写通过锁串行化。
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS feed_validators (
+            feed_id TEXT PRIMARY KEY,
+            url TEXT NOT NULL,
+            etag TEXT DEFAULT '',
+            last_modified TEXT DEFAULT '',
+            content_hash TEXT DEFAULT '',
+            items TEXT DEFAULT '[]',
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """
+
+    def __init__(self, db_path: Union[str, Path]):
+        """
+        初始化缓存
+
+        Args:
+            db_path: 缓存数据库路径
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute(self.SCHEMA)
+        self._conn.commit()
+
+    def get(self, feed_id: str, url: str) -> Optional[FeedCacheEntry]:
+        """
+        获取缓存条目
+
+        Args:
+            feed_id: RSS 源 ID
+            url: 当前配置的 RSS URL
+
+        Returns:
+            缓存条目；不存在或 URL 已变化时返回 None
+        """
+        with self._lock:
+            row = self._conn.execute(
+                """
+                SELECT url, etag, last_modified, content_hash, items
+                FROM feed_validators WHERE feed_id = ?
+                """,
+                (feed_id,),
+            ).fetchone()
+
+        if not row or row[0] != url:
+            return None
+
+        try:
+            items = [ParsedRSSItem(**item) for item in json.loads(row[4] or "[]")]
+        except (ValueError, TypeError):
+            return None
+
+        return FeedCacheEntry(
+            url=row[0],
+            etag=row[1] or "",
+            last_modified=row[2] or "",
+            content_hash=row[3] or "",
+            items=items,
+        )
+
+    def set(self, feed_id: str, entry: FeedCacheEntry) -> None:
+        """
+        写入缓存条目
+
+        Args:
+            feed_id: RSS 源 ID
+            entry: 缓存条目
+        """
+        items_json = json.dumps([asdict(item) for item in entry.items], ensure_ascii=False)
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO feed_validators
+                (feed_id, url, etag, last_modified, content_hash, items, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+                ON CONFLICT(feed_id) DO UPDATE SET
+                    url = excluded.url,
+                    etag = excluded.etag,
+                    last_modified = excluded.last_modified,
+                    content_hash = excluded.content_hash,
+                    items = excluded.items,
+                    updated_at = excluded.updated_at
+                """,
+                (feed_id, entry.url, entry.etag, entry.last_modified,
+                 entry.content_hash, items_json),
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        """关闭数据库连接"""
+        with self._lock:
+            self._conn.close()
@@ -2,18 +2,25 @@
 """
 RSS 抓取器
 
-负责从配置的 RSS 源抓取数据并转换为标准格式
+负责从配置的 RSS 源抓取数据并转换为标准格式，支持：
+- 并发抓取（按主机限速）
+- 条件请求（ETag / Last-Modified），未变化的源跳过解析
 """
 
+import hashlib
 import time
 import random
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Dict, Optional, Tuple, Callable
+from pathlib import Path
+from typing import List, Dict, Optional, Tuple, Callable, Union
 
 import requests
 
+from .cache import FeedCacheEntry, FeedValidatorCache
 from .parser import RSSParser, ParsedRSSItem
+from trendradar.crawler.fetcher import HostRateLimiter
 from trendradar.storage.base import RSSItem, RSSData
 from trendradar.utils.time import get_configured_time, is_within_days, DEFAULT_TIMEZONE
 
@@ -42,19 +49,23 @@ class RSSFetcher:
         timezone: str = DEFAULT_TIMEZONE,
         freshness_enabled: bool = True,
         default_max_age_days: int = 3,
+        max_workers: int = 1,
+        cache_path: Optional[Union[str, Path]] = None,
     ):
         """
         初始化抓取器
 
         Args:
             feeds: RSS 源配置列表
-            request_interval: 请求间隔（毫秒）
+            request_interval: 请求间隔（毫秒），并发模式下为同一主机的最小请求间隔
             timeout: 请求超时（秒）
             use_proxy: 是否使用代理
             proxy_url: 代理 URL
             timezone: 时区配置（如 'Asia/Shanghai'）
             freshness_enabled: 是否启用新鲜度过滤
             default_max_age_days: 默认最大文章年龄（天）
+            max_workers: 最大并发抓取数（1=顺序抓取）
+            cache_path: 校验缓存数据库路径（可选，设置后启用条件请求）
         """
         self.feeds = [f for f in feeds if f.enabled]
         self.request_interval = request_interval
@@ -64,9 +75,13 @@ class RSSFetcher:
         self.timezone = timezone
         self.freshness_enabled = freshness_enabled
         self.default_max_age_days = default_max_age_days
+        self.max_workers = max(1, int(max_workers or 1))
 
         self.parser = RSSParser()
         self.session = self._create_session()
+        self.cache: Optional[FeedValidatorCache] = None
+        if cache_path:
+            self.cache = FeedValidatorCache(cache_path)
 
     def _create_session(self) -> requests.Session:
         """创建请求会话"""
@@ -127,22 +142,81 @@ class RSSFetcher:
         filtered_count = len(items) - len(filtered)
         return filtered, filtered_count
 
-    def fetch_feed(self, feed: RSSFeedConfig) -> Tuple[List[RSSItem], Optional[str]]:
+    def _fetch_parsed_items(
+        self,
+        feed: RSSFeedConfig,
+        rate_limiter: Optional[HostRateLimiter] = None,
+    ) -> List[ParsedRSSItem]:
         """
-        抓取单个 RSS 源
+        请求并解析单个 RSS 源
+
+        启用校验缓存时发送条件请求：返回 304 或内容哈希未变化时，
+        直接复用上次的解析结果，并更新缓存中的校验信息。
 
         Args:
             feed: RSS 源配置
+            rate_limiter: 按主机限速器（可选，并发模式下使用）
 
         Returns:
-            (条目列表, 错误信息) 元组
+            解析后的条目列表
         """
-        try:
+        if rate_limiter:
+            rate_limiter.wait(feed.url)
+
+        if not self.cache:
             response = self.session.get(feed.url, timeout=self.timeout)
             response.raise_for_status()
+            return self.parser.parse(response.text, feed.url)
+
+        cached = self.cache.get(feed.id, feed.url)
+        headers = {}
+        if cached and cached.etag:
+            headers["If-None-Match"] = cached.etag
+        if cached and cached.last_modified:
+            headers["If-Modified-Since"] = cached.last_modified
 
+        response = self.session.get(feed.url, timeout=self.timeout, headers=headers)
+
+        if response.status_code == 304 and cached:
+            print(f"[RSS] {feed.name}: 内容未变化（304），复用缓存")
+            return cached.items
+
+        response.raise_for_status()
+
+        content_hash = hashlib.sha256(response.content).hexdigest()
+        if cached and cached.content_hash == content_hash:
+            print(f"[RSS] {feed.name}: 内容未变化，跳过解析")
+            parsed_items = cached.items
+        else:
             parsed_items = self.parser.parse(response.text, feed.url)
 
+        self.cache.set(feed.id, FeedCacheEntry(
+            url=feed.url,
+            etag=response.headers.get("ETag", ""),
+            last_modified=response.headers.get("Last-Modified", ""),
+            content_hash=content_hash,
+            items=parsed_items,
+        ))
+        return parsed_items
+
+    def fetch_feed(
+        self,
+        feed: RSSFeedConfig,
+        rate_limiter: Optional[HostRateLimiter] = None,
+    ) -> Tuple[List[RSSItem], Optional[str]]:
+        """
+        抓取单个 RSS 源
+
+        Args:
+            feed: RSS 源配置
+            rate_limiter: 按主机限速器（可选，并发模式下使用）
+
+        Returns:
+            (条目列表, 错误信息) 元组
+        """
+        try:
+            parsed_items = self._fetch_parsed_items(feed, rate_limiter)
+
             # 限制条目数量（0=不限制）
             if feed.max_items > 0:
                 parsed_items = parsed_items[:feed.max_items]
@@ -211,15 +285,20 @@ class RSSFetcher:
 
         print(f"[RSS] 开始抓取 {len(self.feeds)} 个 RSS 源...")
 
-        for i, feed in enumerate(self.feeds):
-            # 请求间隔（带随机波动）
-            if i > 0:
-                interval = self.request_interval / 1000
-                jitter = random.uniform(-0.2, 0.2) * interval
-                time.sleep(interval + jitter)
+        if self.max_workers > 1 and len(self.feeds) > 1:
+            fetched = self._fetch_concurrently()
+        else:
+            fetched = []
+            for i, feed in enumerate(self.feeds):
+                # 请求间隔（带随机波动）
+                if i > 0:
+                    interval = self.request_interval / 1000
+                    jitter = random.uniform(-0.2, 0.2) * interval
+                    time.sleep(interval + jitter)
 
-            items, error = self.fetch_feed(feed)
+                fetched.append(self.fetch_feed(feed))
 
+        for feed, (items, error) in zip(self.feeds, fetched):
             id_to_name[feed.id] = feed.name
 
             if error:
@@ -238,6 +317,33 @@ class RSSFetcher:
             failed_ids=failed_ids,
         )
 
+    def _fetch_concurrently(self) -> List[Tuple[List[RSSItem], Optional[str]]]:
+        """
+        并发抓取所有 RSS 源
+
+        同一主机的请求按 request_interval 限速，不同主机并行。
+
+        Returns:
+            与 self.feeds 顺序一致的 (条目列表, 错误信息) 列表
+        """
+        rate_limiter = HostRateLimiter(self.request_interval)
+        workers = min(self.max_workers, len(self.feeds))
+        print(f"[RSS] 并发抓取模式：{workers} 个并发请求")
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(self.fetch_feed, feed, rate_limiter)
+                for feed in self.feeds
+            ]
+            return [future.result() for future in futures]
+
+    def close(self) -> None:
+        """释放资源（关闭会话和校验缓存）"""
+        self.session.close()
+        if self.cache:
+            self.cache.close()
+            self.cache = None
+
     @classmethod
     def from_config(cls, config: Dict) -> "RSSFetcher":
         """
@@ -248,6 +354,8 @@ class RSSFetcher:
                 {
                     "enabled": true,
                     "request_interval": 2000,
+                    "max_workers": 4,
+                    "cache_path": "output/rss/feed_cache.db",
                     "freshness_filter": {
                         "enabled": true,
                         "max_age_days": 3
@@ -302,4 +410,6 @@ class RSSFetcher:
             timezone=config.get("timezone", DEFAULT_TIMEZONE),
             freshness_enabled=freshness_enabled,
             default_max_age_days=default_max_age_days,
+            max_workers=config.get("max_workers", 1),
+            cache_path=config.get("cache_path"),
         )
@@ -21,9 +21,9 @@ except ImportError:
     feedparser = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedRSSItem:
-    """解析后的 RSS 条目"""
+    """解析后的 RSS 条目（__slots__，会随 HTTP 缓存常驻内存）"""
     title: str
     url: str
     published_at: Optional[str] = None
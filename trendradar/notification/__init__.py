@@ -27,6 +27,7 @@ from trendradar.notification.batch import (
     get_max_batch_header_size,
     truncate_to_bytes,
     add_batch_headers,
+    BatchRateLimiter,
 )
 from trendradar.notification.renderer import (
     render_feishu_content,
@@ -60,6 +61,7 @@ __all__ = [
     "get_max_batch_header_size",
     "truncate_to_bytes",
     "add_batch_headers",
+    "BatchRateLimiter",
     # 内容渲染
     "render_feishu_content",
     "render_dingtalk_content",
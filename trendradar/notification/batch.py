@@ -5,7 +5,9 @@
 提供消息分批发送的辅助函数
 """
 
-from typing import List
+import threading
+import time
+from typing import List, Optional
 
 
 def get_batch_header(format_type: str, batch_num: int, total_batches: int) -> str:
@@ -113,3 +115,34 @@ def add_batch_headers(
         result.append(header + content)
 
     return result
+
+
+class BatchRateLimiter:
+    """
+    渠道级批次限速器
+
+    同一渠道（跨账号共享）相邻两次批次发送至少间隔 interval 秒，
+    不同渠道各自持有限速器、互不阻塞。并发发送模式下用于替代批次间的 sleep。
+    """
+
+    def __init__(self, interval: float):
+        """
+        初始化限速器
+
+        Args:
+            interval: 同一渠道相邻批次的发送间隔（秒）
+        """
+        self.interval = max(0.0, float(interval or 0))
+        self._next_slot: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        """等待直到允许发送下一批次（按调用顺序依次占用发送时间槽）"""
+        with self._lock:
+            now = time.monotonic()
+            slot = now if self._next_slot is None else max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
@@ -10,7 +10,10 @@
     results = dispatcher.dispatch_all(report_data, report_type, ...)
 """
 
-from typing import Any, Callable, Dict, List, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from trendradar.core.config import (
     get_account_at_index,
@@ -19,6 +22,7 @@ from trendradar.core.config import (
     validate_paired_configs,
 )
 
+from .batch import BatchRateLimiter
 from .senders import (
     send_to_bark,
     send_to_dingtalk,
@@ -49,6 +53,7 @@ class NotificationDispatcher:
         config: Dict[str, Any],
         get_time_func: Callable,
         split_content_func: Callable,
+        display_mode: str = "keyword",
     ):
         """
         初始化通知调度器
@@ -57,11 +62,20 @@ class NotificationDispatcher:
             config: 完整的配置字典，包含所有通知渠道的配置
             get_time_func: 获取当前时间的函数
             split_content_func: 内容分批函数
+            display_mode: 显示模式（split_content_func 使用的模式，作为渲染缓存键的一部分）
         """
         self.config = config
         self.get_time_func = get_time_func
         self.split_content_func = split_content_func
+        self.display_mode = display_mode
         self.max_accounts = config.get("MAX_ACCOUNTS_PER_CHANNEL", 3)
+        # 并发推送数（1=按渠道、账号顺序发送，>1=渠道和账号并发发送）
+        self.max_workers = max(1, int(config.get("NOTIFICATION_MAX_WORKERS", 1) or 1))
+        # 单次 dispatch_all 内的渲染缓存：(format_type, max_bytes, mode, display_mode) -> 分批结果
+        self._render_cache: Dict[Tuple[str, Optional[int], str, str], List[str]] = {}
+        # 每个渲染键一把锁，只有相同键的线程互相等待；_render_lock 只保护锁表本身
+        self._render_key_locks: Dict[Tuple[str, Optional[int], str, str], threading.Lock] = {}
+        self._render_lock = threading.Lock()
 
     def dispatch_all(
         self,
@@ -77,6 +91,9 @@ class NotificationDispatcher:
         """
         分发通知到所有已配置的渠道（支持热榜+RSS合并推送）
 
+        配置 NOTIFICATION_MAX_WORKERS > 1 时各渠道、各账号并发发送，
+        同一渠道的批次间隔由渠道限速器保证。
+
         Args:
             report_data: 报告数据（由 prepare_report_data 生成）
             report_type: 报告类型（如 "当日汇总"、"实时增量"）
@@ -90,49 +107,62 @@ class NotificationDispatcher:
         Returns:
             Dict[str, bool]: 每个渠道的发送结果，key 为渠道名，value 为是否成功
         """
-        results = {}
+        # 同一份报告在各账号、各渠道间只按不同的格式/大小渲染一次
+        self._render_cache.clear()
+        self._render_key_locks.clear()
+        try:
+            return self._dispatch_all(
+                report_data, report_type, update_info, proxy_url, mode,
+                html_file_path, rss_items, rss_new_items,
+            )
+        finally:
+            self._render_cache.clear()
+            self._render_key_locks.clear()
+
+    def _dispatch_all(
+        self,
+        report_data: Dict,
+        report_type: str,
+        update_info: Optional[Dict],
+        proxy_url: Optional[str],
+        mode: str,
+        html_file_path: Optional[str],
+        rss_items: Optional[List[Dict]],
+        rss_new_items: Optional[List[Dict]],
+    ) -> Dict[str, bool]:
+        """收集各渠道的账号发送任务并投递（dispatch_all 的实现）"""
+        channels: Dict[str, List[Callable[[], bool]]] = {}
+        batch_interval = self.config.get("BATCH_SEND_INTERVAL", 1.0)
+        args = (report_data, report_type, update_info, proxy_url, mode, rss_items, rss_new_items)
 
         # 飞书
         if self.config.get("FEISHU_WEBHOOK_URL"):
-            results["feishu"] = self._send_feishu(
-                report_data, report_type, update_info, proxy_url, mode, rss_items, rss_new_items
-            )
+            channels["feishu"] = self._feishu_jobs(*args, self._channel_limiter(batch_interval))
 
         # 钉钉
         if self.config.get("DINGTALK_WEBHOOK_URL"):
-            results["dingtalk"] = self._send_dingtalk(
-                report_data, report_type, update_info, proxy_url, mode, rss_items, rss_new_items
-            )
+            channels["dingtalk"] = self._dingtalk_jobs(*args, self._channel_limiter(batch_interval))
 
         # 企业微信
         if self.config.get("WEWORK_WEBHOOK_URL"):
-            results["wework"] = self._send_wework(
-                report_data, report_type, update_info, proxy_url, mode, rss_items, rss_new_items
-            )
+            channels["wework"] = self._wework_jobs(*args, self._channel_limiter(batch_interval))
 
         # Telegram（需要配对验证）
         if self.config.get("TELEGRAM_BOT_TOKEN") and self.config.get("TELEGRAM_CHAT_ID"):
-            results["telegram"] = self._send_telegram(
-                report_data, report_type, update_info, proxy_url, mode, rss_items, rss_new_items
-            )
+            channels["telegram"] = self._telegram_jobs(*args, self._channel_limiter(batch_interval))
 
-        # ntfy（需要配对验证）
+        # ntfy（需要配对验证；公共服务器建议 2-3 秒，自托管可以更短）
         if self.config.get("NTFY_SERVER_URL") and self.config.get("NTFY_TOPIC"):
-            results["ntfy"] = self._send_ntfy(
-                report_data, report_type, update_info, proxy_url, mode, rss_items, rss_new_items
-            )
+            ntfy_interval = 2 if "ntfy.sh" in self.config["NTFY_SERVER_URL"] else 1
+            channels["ntfy"] = self._ntfy_jobs(*args, self._channel_limiter(ntfy_interval))
 
         # Bark
         if self.config.get("BARK_URL"):
-            results["bark"] = self._send_bark(
-                report_data, report_type, update_info, proxy_url, mode, rss_items, rss_new_items
-            )
+            channels["bark"] = self._bark_jobs(*args, self._channel_limiter(batch_interval))
 
         # Slack
         if self.config.get("SLACK_WEBHOOK_URL"):
-            results["slack"] = self._send_slack(
-                report_data, report_type, update_info, proxy_url, mode, rss_items, rss_new_items
-            )
+            channels["slack"] = self._slack_jobs(*args, self._channel_limiter(batch_interval))
 
         # 邮件（保持原有逻辑，已支持多收件人）
         if (
@@ -140,19 +170,95 @@ class NotificationDispatcher:
             and self.config.get("EMAIL_PASSWORD")
             and self.config.get("EMAIL_TO")
         ):
-            results["email"] = self._send_email(report_type, html_file_path)
+            channels["email"] = [partial(self._send_email, report_type, html_file_path)]
 
-        return results
+        return self._deliver(channels)
+
+    def _channel_limiter(self, interval: float) -> Optional[BatchRateLimiter]:
+        """并发模式下为渠道创建批次限速器（顺序模式沿用发送函数内的批次间 sleep）"""
+        return BatchRateLimiter(interval) if self.max_workers > 1 else None
+
+    def _deliver(self, channels: Dict[str, List[Callable[[], bool]]]) -> Dict[str, bool]:
+        """
+        执行各渠道的账号发送任务
+
+        顺序模式（max_workers=1）按渠道、账号依次执行；并发模式下所有账号任务
+        提交到线程池，同一渠道的批次间隔由渠道限速器保证，慢渠道不阻塞其他渠道。
+
+        Args:
+            channels: {渠道名: [账号发送任务]}
+
+        Returns:
+            Dict[str, bool]: 每个渠道的发送结果（任一账号成功即为 True）
+        """
+        outcomes: Dict[str, List[bool]] = {channel: [] for channel in channels}
+        jobs = [(channel, job) for channel, channel_jobs in channels.items() for job in channel_jobs]
+
+        if self.max_workers <= 1 or len(jobs) <= 1:
+            for channel, job in jobs:
+                outcomes[channel].append(job())
+        else:
+            workers = min(self.max_workers, len(jobs))
+            print(f"并发推送模式：{workers} 个并发任务，{len(channels)} 个渠道")
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [(channel, executor.submit(job)) for channel, job in jobs]
+                # 按渠道顺序汇总，保证结果顺序与顺序模式一致
+                for channel, future in futures:
+                    try:
+                        outcomes[channel].append(future.result())
+                    except Exception as e:
+                        print(f"❌ {channel} 推送出错：{e}")
+                        outcomes[channel].append(False)
+
+        return {channel: any(results) for channel, results in outcomes.items()}
+
+    def _split_content_cached(
+        self,
+        report_data: Dict,
+        format_type: str,
+        update_info: Optional[Dict] = None,
+        max_bytes: Optional[int] = None,
+        mode: str = "daily",
+        rss_items: Optional[List[Dict]] = None,
+        rss_new_items: Optional[List[Dict]] = None,
+    ) -> List[str]:
+        """
+        带渲染缓存的内容分批（签名与 split_content_func 一致）
+
+        dispatch_all 期间报告数据、更新信息和 RSS 条目不变，分批结果只取决于
+        (format_type, max_bytes, mode, display_mode)，相同键的账号/渠道复用同一次渲染。
 
-    def _send_to_multi_accounts(
+        Returns:
+            分批后的消息内容列表（副本，调用方可自由修改）
+        """
+        key = (format_type, max_bytes, mode, self.display_mode)
+        # 并发推送时各账号线程共用缓存：按键加锁，同一键只渲染一次，不同键并行渲染
+        with self._render_lock:
+            key_lock = self._render_key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            batches = self._render_cache.get(key)
+            if batches is None:
+                batches = self.split_content_func(
+                    report_data,
+                    format_type,
+                    update_info,
+                    max_bytes=max_bytes,
+                    mode=mode,
+                    rss_items=rss_items,
+                    rss_new_items=rss_new_items,
+                )
+                self._render_cache[key] = batches
+        return list(batches)
+
+    def _account_jobs(
         self,
         channel_name: str,
         config_value: str,
         send_func: Callable[..., bool],
         **kwargs,
-    ) -> bool:
+    ) -> List[Callable[[], bool]]:
         """
-        通用多账号发送逻辑
+        通用多账号任务生成逻辑
 
         Args:
             channel_name: 渠道名称（用于日志和账号数量限制提示）
@@ -161,24 +267,23 @@ class NotificationDispatcher:
             **kwargs: 传递给发送函数的其他参数
 
         Returns:
-            bool: 任一账号发送成功则返回 True
+            每个有效账号一个无参发送任务
         """
         accounts = parse_multi_account_config(config_value)
         if not accounts:
-            return False
+            return []
 
         accounts = limit_accounts(accounts, self.max_accounts, channel_name)
-        results = []
+        jobs = []
 
         for i, account in enumerate(accounts):
             if account:
                 account_label = f"账号{i+1}" if len(accounts) > 1 else ""
-                result = send_func(account, account_label=account_label, **kwargs)
-                results.append(result)
+                jobs.append(partial(send_func, account, account_label=account_label, **kwargs))
 
-        return any(results) if results else False
+        return jobs
 
-    def _send_feishu(
+    def _feishu_jobs(
         self,
         report_data: Dict,
         report_type: str,
@@ -187,9 +292,10 @@ class NotificationDispatcher:
         mode: str,
         rss_items: Optional[List[Dict]] = None,
         rss_new_items: Optional[List[Dict]] = None,
-    ) -> bool:
-        """发送到飞书（多账号，支持热榜+RSS合并）"""
-        return self._send_to_multi_accounts(
+        rate_limiter: Optional[BatchRateLimiter] = None,
+    ) -> List[Callable[[], bool]]:
+        """生成飞书各账号的发送任务（多账号，支持热榜+RSS合并）"""
+        return self._account_jobs(
             channel_name="飞书",
             config_value=self.config["FEISHU_WEBHOOK_URL"],
             send_func=lambda url, account_label: send_to_feishu(
@@ -202,14 +308,15 @@ class NotificationDispatcher:
                 account_label=account_label,
                 batch_size=self.config.get("FEISHU_BATCH_SIZE", 29000),
                 batch_interval=self.config.get("BATCH_SEND_INTERVAL", 1.0),
-                split_content_func=self.split_content_func,
+                split_content_func=self._split_content_cached,
                 get_time_func=self.get_time_func,
                 rss_items=rss_items,
                 rss_new_items=rss_new_items,
+                rate_limiter=rate_limiter,
             ),
         )
 
-    def _send_dingtalk(
+    def _dingtalk_jobs(
         self,
         report_data: Dict,
         report_type: str,
@@ -218,9 +325,10 @@ class NotificationDispatcher:
         mode: str,
         rss_items: Optional[List[Dict]] = None,
         rss_new_items: Optional[List[Dict]] = None,
-    ) -> bool:
-        """发送到钉钉（多账号，支持热榜+RSS合并）"""
-        return self._send_to_multi_accounts(
+        rate_limiter: Optional[BatchRateLimiter] = None,
+    ) -> List[Callable[[], bool]]:
+        """生成钉钉各账号的发送任务（多账号，支持热榜+RSS合并）"""
+        return self._account_jobs(
             channel_name="钉钉",
             config_value=self.config["DINGTALK_WEBHOOK_URL"],
             send_func=lambda url, account_label: send_to_dingtalk(
@@ -233,13 +341,14 @@ class NotificationDispatcher:
                 account_label=account_label,
                 batch_size=self.config.get("DINGTALK_BATCH_SIZE", 20000),
                 batch_interval=self.config.get("BATCH_SEND_INTERVAL", 1.0),
-                split_content_func=self.split_content_func,
+                split_content_func=self._split_content_cached,
                 rss_items=rss_items,
                 rss_new_items=rss_new_items,
+                rate_limiter=rate_limiter,
             ),
         )
 
-    def _send_wework(
+    def _wework_jobs(
         self,
         report_data: Dict,
         report_type: str,
@@ -248,9 +357,10 @@ class NotificationDispatcher:
         mode: str,
         rss_items: Optional[List[Dict]] = None,
         rss_new_items: Optional[List[Dict]] = None,
-    ) -> bool:
-        """发送到企业微信（多账号，支持热榜+RSS合并）"""
-        return self._send_to_multi_accounts(
+        rate_limiter: Optional[BatchRateLimiter] = None,
+    ) -> List[Callable[[], bool]]:
+        """生成企业微信各账号的发送任务（多账号，支持热榜+RSS合并）"""
+        return self._account_jobs(
             channel_name="企业微信",
             config_value=self.config["WEWORK_WEBHOOK_URL"],
             send_func=lambda url, account_label: send_to_wework(
@@ -264,13 +374,14 @@ class NotificationDispatcher:
                 batch_size=self.config.get("MESSAGE_BATCH_SIZE", 4000),
                 batch_interval=self.config.get("BATCH_SEND_INTERVAL", 1.0),
                 msg_type=self.config.get("WEWORK_MSG_TYPE", "markdown"),
-                split_content_func=self.split_content_func,
+                split_content_func=self._split_content_cached,
                 rss_items=rss_items,
                 rss_new_items=rss_new_items,
+                rate_limiter=rate_limiter,
             ),
         )
 
-    def _send_telegram(
+    def _telegram_jobs(
         self,
         report_data: Dict,
         report_type: str,
@@ -279,13 +390,14 @@ class NotificationDispatcher:
         mode: str,
         rss_items: Optional[List[Dict]] = None,
         rss_new_items: Optional[List[Dict]] = None,
-    ) -> bool:
-        """发送到 Telegram（多账号，需验证 token 和 chat_id 配对，支持热榜+RSS合并）"""
+        rate_limiter: Optional[BatchRateLimiter] = None,
+    ) -> List[Callable[[], bool]]:
+        """生成 Telegram 各账号的发送任务（多账号，需验证 token 和 chat_id 配对，支持热榜+RSS合并）"""
         telegram_tokens = parse_multi_account_config(self.config["TELEGRAM_BOT_TOKEN"])
         telegram_chat_ids = parse_multi_account_config(self.config["TELEGRAM_CHAT_ID"])
 
         if not telegram_tokens or not telegram_chat_ids:
-            return False
+            return []
 
         # 验证配对
         valid, count = validate_paired_configs(
@@ -294,19 +406,20 @@ class NotificationDispatcher:
             required_keys=["bot_token", "chat_id"],
         )
         if not valid or count == 0:
-            return False
+            return []
 
         # 限制账号数量
         telegram_tokens = limit_accounts(telegram_tokens, self.max_accounts, "Telegram")
         telegram_chat_ids = telegram_chat_ids[: len(telegram_tokens)]
 
-        results = []
+        jobs = []
         for i in range(len(telegram_tokens)):
             token = telegram_tokens[i]
             chat_id = telegram_chat_ids[i]
             if token and chat_id:
                 account_label = f"账号{i+1}" if len(telegram_tokens) > 1 else ""
-                result = send_to_telegram(
+                jobs.append(partial(
+                    send_to_telegram,
                     bot_token=token,
                     chat_id=chat_id,
                     report_data=report_data,
@@ -317,15 +430,15 @@ class NotificationDispatcher:
                     account_label=account_label,
                     batch_size=self.config.get("MESSAGE_BATCH_SIZE", 4000),
                     batch_interval=self.config.get("BATCH_SEND_INTERVAL", 1.0),
-                    split_content_func=self.split_content_func,
+                    split_content_func=self._split_content_cached,
                     rss_items=rss_items,
                     rss_new_items=rss_new_items,
-                )
-                results.append(result)
+                    rate_limiter=rate_limiter,
+                ))
 
-        return any(results) if results else False
+        return jobs
 
-    def _send_ntfy(
+    def _ntfy_jobs(
         self,
         report_data: Dict,
         report_type: str,
@@ -334,33 +447,35 @@ class NotificationDispatcher:
         mode: str,
         rss_items: Optional[List[Dict]] = None,
         rss_new_items: Optional[List[Dict]] = None,
-    ) -> bool:
-        """发送到 ntfy（多账号，需验证 topic 和 token 配对，支持热榜+RSS合并）"""
+        rate_limiter: Optional[BatchRateLimiter] = None,
+    ) -> List[Callable[[], bool]]:
+        """生成 ntfy 各账号的发送任务（多账号，需验证 topic 和 token 配对，支持热榜+RSS合并）"""
         ntfy_server_url = self.config["NTFY_SERVER_URL"]
         ntfy_topics = parse_multi_account_config(self.config["NTFY_TOPIC"])
         ntfy_tokens = parse_multi_account_config(self.config.get("NTFY_TOKEN", ""))
 
         if not ntfy_server_url or not ntfy_topics:
-            return False
+            return []
 
         # 验证 token 和 topic 数量一致（如果配置了 token）
         if ntfy_tokens and len(ntfy_tokens) != len(ntfy_topics):
             print(
                 f"❌ ntfy 配置错误：topic 数量({len(ntfy_topics)})与 token 数量({len(ntfy_tokens)})不一致，跳过 ntfy 推送"
             )
-            return False
+            return []
 
         # 限制账号数量
         ntfy_topics = limit_accounts(ntfy_topics, self.max_accounts, "ntfy")
         if ntfy_tokens:
             ntfy_tokens = ntfy_tokens[: len(ntfy_topics)]
 
-        results = []
+        jobs = []
         for i, topic in enumerate(ntfy_topics):
             if topic:
                 token = get_account_at_index(ntfy_tokens, i, "") if ntfy_tokens else ""
                 account_label = f"账号{i+1}" if len(ntfy_topics) > 1 else ""
-                result = send_to_ntfy(
+                jobs.append(partial(
+                    send_to_ntfy,
                     server_url=ntfy_server_url,
                     topic=topic,
                     token=token,
@@ -371,15 +486,15 @@ class NotificationDispatcher:
                     mode=mode,
                     account_label=account_label,
                     batch_size=3800,
-                    split_content_func=self.split_content_func,
+                    split_content_func=self._split_content_cached,
                     rss_items=rss_items,
                     rss_new_items=rss_new_items,
-                )
-                results.append(result)
+                    rate_limiter=rate_limiter,
+                ))
 
-        return any(results) if results else False
+        return jobs
 
-    def _send_bark(
+    def _bark_jobs(
         self,
         report_data: Dict,
         report_type: str,
@@ -388,9 +503,10 @@ class NotificationDispatcher:
         mode: str,
         rss_items: Optional[List[Dict]] = None,
         rss_new_items: Optional[List[Dict]] = None,
-    ) -> bool:
-        """发送到 Bark（多账号，支持热榜+RSS合并）"""
-        return self._send_to_multi_accounts(
+        rate_limiter: Optional[BatchRateLimiter] = None,
+    ) -> List[Callable[[], bool]]:
+        """生成 Bark 各账号的发送任务（多账号，支持热榜+RSS合并）"""
+        return self._account_jobs(
             channel_name="Bark",
             config_value=self.config["BARK_URL"],
             send_func=lambda url, account_label: send_to_bark(
@@ -403,13 +519,14 @@ class NotificationDispatcher:
                 account_label=account_label,
                 batch_size=self.config.get("BARK_BATCH_SIZE", 3600),
                 batch_interval=self.config.get("BATCH_SEND_INTERVAL", 1.0),
-                split_content_func=self.split_content_func,
+                split_content_func=self._split_content_cached,
                 rss_items=rss_items,
                 rss_new_items=rss_new_items,
+                rate_limiter=rate_limiter,
             ),
         )
 
-    def _send_slack(
+    def _slack_jobs(
         self,
         report_data: Dict,
         report_type: str,
@@ -418,9 +535,10 @@ class NotificationDispatcher:
         mode: str,
         rss_items: Optional[List[Dict]] = None,
         rss_new_items: Optional[List[Dict]] = None,
-    ) -> bool:
-        """发送到 Slack（多账号，支持热榜+RSS合并）"""
-        return self._send_to_multi_accounts(
+        rate_limiter: Optional[BatchRateLimiter] = None,
+    ) -> List[Callable[[], bool]]:
+        """生成 Slack 各账号的发送任务（多账号，支持热榜+RSS合并）"""
+        return self._account_jobs(
             channel_name="Slack",
             config_value=self.config["SLACK_WEBHOOK_URL"],
             send_func=lambda url, account_label: send_to_slack(
@@ -433,9 +551,10 @@ class NotificationDispatcher:
                 account_label=account_label,
                 batch_size=self.config.get("SLACK_BATCH_SIZE", 4000),
                 batch_interval=self.config.get("BATCH_SEND_INTERVAL", 1.0),
-                split_content_func=self.split_content_func,
+                split_content_func=self._split_content_cached,
                 rss_items=rss_items,
                 rss_new_items=rss_new_items,
+                rate_limiter=rate_limiter,
             ),
         )
 
@@ -32,7 +32,7 @@ from urllib.parse import urlparse
 
 import requests
 
-from .batch import add_batch_headers, get_max_batch_header_size
+from .batch import BatchRateLimiter, add_batch_headers, get_max_batch_header_size
 from .formatters import convert_markdown_to_mrkdwn, strip_markdown
 
 
@@ -77,6 +77,7 @@ def send_to_feishu(
     get_time_func: Callable = None,
     rss_items: Optional[list] = None,
     rss_new_items: Optional[list] = None,
+    rate_limiter: Optional[BatchRateLimiter] = None,
 ) -> bool:
     """
     发送到飞书（支持分批发送，支持热榜+RSS合并）
@@ -95,6 +96,7 @@ def send_to_feishu(
         get_time_func: 获取当前时间的函数
         rss_items: RSS 统计条目列表（可选，用于合并推送）
         rss_new_items: RSS 新增条目列表（可选，用于新增区块）
+        rate_limiter: 渠道批次限速器（并发发送时由调度器传入，替代批次间 sleep）
 
     Returns:
         bool: 发送是否成功
@@ -147,6 +149,8 @@ def send_to_feishu(
         }
 
         try:
+            if rate_limiter is not None:
+                rate_limiter.wait()
             response = requests.post(
                 webhook_url, headers=headers, json=payload, proxies=proxies, timeout=30
             )
@@ -156,7 +160,7 @@ def send_to_feishu(
                 if result.get("StatusCode") == 0 or result.get("code") == 0:
                     print(f"{log_prefix}第 {i}/{len(batches)} 批次发送成功 [{report_type}]")
                     # 批次间间隔
-                    if i < len(batches):
+                    if i < len(batches) and rate_limiter is None:
                         time.sleep(batch_interval)
                 else:
                     error_msg = result.get("msg") or result.get("StatusMessage", "未知错误")
@@ -191,6 +195,7 @@ def send_to_dingtalk(
     split_content_func: Callable = None,
     rss_items: Optional[list] = None,
     rss_new_items: Optional[list] = None,
+    rate_limiter: Optional[BatchRateLimiter] = None,
 ) -> bool:
     """
     发送到钉钉（支持分批发送，支持热榜+RSS合并）
@@ -208,6 +213,7 @@ def send_to_dingtalk(
         split_content_func: 内容分批函数
         rss_items: RSS 统计条目列表（可选，用于合并推送）
         rss_new_items: RSS 新增条目列表（可选，用于新增区块）
+        rate_limiter: 渠道批次限速器（并发发送时由调度器传入，替代批次间 sleep）
 
     Returns:
         bool: 发送是否成功
@@ -253,6 +259,8 @@ def send_to_dingtalk(
         }
 
         try:
+            if rate_limiter is not None:
+                rate_limiter.wait()
             response = requests.post(
                 webhook_url, headers=headers, json=payload, proxies=proxies, timeout=30
             )
@@ -261,7 +269,7 @@ def send_to_dingtalk(
                 if result.get("errcode") == 0:
                     print(f"{log_prefix}第 {i}/{len(batches)} 批次发送成功 [{report_type}]")
                     # 批次间间隔
-                    if i < len(batches):
+                    if i < len(batches) and rate_limiter is None:
                         time.sleep(batch_interval)
                 else:
                     print(
@@ -296,6 +304,7 @@ def send_to_wework(
     split_content_func: Callable = None,
     rss_items: Optional[list] = None,
     rss_new_items: Optional[list] = None,
+    rate_limiter: Optional[BatchRateLimiter] = None,
 ) -> bool:
     """
     发送到企业微信（支持分批发送，支持 markdown 和 text 两种格式，支持热榜+RSS合并）
@@ -314,6 +323,7 @@ def send_to_wework(
         split_content_func: 内容分批函数
         rss_items: RSS 统计条目列表（可选，用于合并推送）
         rss_new_items: RSS 新增条目列表（可选，用于新增区块）
+        rate_limiter: 渠道批次限速器（并发发送时由调度器传入，替代批次间 sleep）
 
     Returns:
         bool: 发送是否成功
@@ -368,6 +378,8 @@ def send_to_wework(
         )
 
         try:
+            if rate_limiter is not None:
+                rate_limiter.wait()
             response = requests.post(
                 webhook_url, headers=headers, json=payload, proxies=proxies, timeout=30
             )
@@ -376,7 +388,7 @@ def send_to_wework(
                 if result.get("errcode") == 0:
                     print(f"{log_prefix}第 {i}/{len(batches)} 批次发送成功 [{report_type}]")
                     # 批次间间隔
-                    if i < len(batches):
+                    if i < len(batches) and rate_limiter is None:
                         time.sleep(batch_interval)
                 else:
                     print(
@@ -411,6 +423,7 @@ def send_to_telegram(
     split_content_func: Callable = None,
     rss_items: Optional[list] = None,
     rss_new_items: Optional[list] = None,
+    rate_limiter: Optional[BatchRateLimiter] = None,
 ) -> bool:
     """
     发送到 Telegram（支持分批发送，支持热榜+RSS合并）
@@ -429,6 +442,7 @@ def send_to_telegram(
         split_content_func: 内容分批函数
         rss_items: RSS 统计条目列表（可选，用于合并推送）
         rss_new_items: RSS 新增条目列表（可选，用于新增区块）
+        rate_limiter: 渠道批次限速器（并发发送时由调度器传入，替代批次间 sleep）
 
     Returns:
         bool: 发送是否成功
@@ -471,6 +485,8 @@ def send_to_telegram(
         }
 
         try:
+            if rate_limiter is not None:
+                rate_limiter.wait()
             response = requests.post(
                 url, headers=headers, json=payload, proxies=proxies, timeout=30
             )
@@ -479,7 +495,7 @@ def send_to_telegram(
                 if result.get("ok"):
                     print(f"{log_prefix}第 {i}/{len(batches)} 批次发送成功 [{report_type}]")
                     # 批次间间隔
-                    if i < len(batches):
+                    if i < len(batches) and rate_limiter is None:
                         time.sleep(batch_interval)
                 else:
                     print(
@@ -670,6 +686,7 @@ def send_to_ntfy(
     split_content_func: Callable = None,
     rss_items: Optional[list] = None,
     rss_new_items: Optional[list] = None,
+    rate_limiter: Optional[BatchRateLimiter] = None,
 ) -> bool:
     """
     发送到 ntfy（支持分批发送，严格遵守4KB限制，支持热榜+RSS合并）
@@ -688,6 +705,7 @@ def send_to_ntfy(
         split_content_func: 内容分批函数
         rss_items: RSS 统计条目列表（可选，用于合并推送）
         rss_new_items: RSS 新增条目列表（可选，用于新增区块）
+        rate_limiter: 渠道批次限速器（并发发送时由调度器传入，替代批次间 sleep）
 
     Returns:
         bool: 发送是否成功
@@ -767,6 +785,8 @@ def send_to_ntfy(
             current_headers["Title"] = f"{report_type_en} ({actual_batch_num}/{total_batches})"
 
         try:
+            if rate_limiter is not None:
+                rate_limiter.wait()
             response = requests.post(
                 url,
                 headers=current_headers,
@@ -778,7 +798,7 @@ def send_to_ntfy(
             if response.status_code == 200:
                 print(f"{log_prefix}第 {actual_batch_num}/{total_batches} 批次发送成功 [{report_type}]")
                 success_count += 1
-                if idx < total_batches:
+                if idx < total_batches and rate_limiter is None:
                     # 公共服务器建议 2-3 秒，自托管可以更短
                     interval = 2 if "ntfy.sh" in server_url else 1
                     time.sleep(interval)
@@ -850,6 +870,7 @@ def send_to_bark(
     split_content_func: Callable = None,
     rss_items: Optional[list] = None,
     rss_new_items: Optional[list] = None,
+    rate_limiter: Optional[BatchRateLimiter] = None,
 ) -> bool:
     """
     发送到 Bark（支持分批发送，使用 markdown 格式，支持热榜+RSS合并）
@@ -867,6 +888,7 @@ def send_to_bark(
         split_content_func: 内容分批函数
         rss_items: RSS 统计条目列表（可选，用于合并推送）
         rss_new_items: RSS 新增条目列表（可选，用于新增区块）
+        rate_limiter: 渠道批次限速器（并发发送时由调度器传入，替代批次间 sleep）
 
     Returns:
         bool: 发送是否成功
@@ -938,6 +960,8 @@ def send_to_bark(
         }
 
         try:
+            if rate_limiter is not None:
+                rate_limiter.wait()
             response = requests.post(
                 api_endpoint,
                 json=payload,
@@ -951,7 +975,7 @@ def send_to_bark(
                     print(f"{log_prefix}第 {actual_batch_num}/{total_batches} 批次发送成功 [{report_type}]")
                     success_count += 1
                     # 批次间间隔
-                    if idx < total_batches:
+                    if idx < total_batches and rate_limiter is None:
                         time.sleep(batch_interval)
                 else:
                     print(
@@ -1001,6 +1025,7 @@ def send_to_slack(
     split_content_func: Callable = None,
     rss_items: Optional[list] = None,
     rss_new_items: Optional[list] = None,
+    rate_limiter: Optional[BatchRateLimiter] = None,
 ) -> bool:
     """
     发送到 Slack（支持分批发送，使用 mrkdwn 格式，支持热榜+RSS合并）
@@ -1018,6 +1043,7 @@ def send_to_slack(
         split_content_func: 内容分批函数
         rss_items: RSS 统计条目列表（可选，用于合并推送）
         rss_new_items: RSS 新增条目列表（可选，用于新增区块）
+        rate_limiter: 渠道批次限速器（并发发送时由调度器传入，替代批次间 sleep）
 
     Returns:
         bool: 发送是否成功
@@ -1057,6 +1083,8 @@ def send_to_slack(
         payload = {"text": mrkdwn_content}
 
         try:
+            if rate_limiter is not None:
+                rate_limiter.wait()
             response = requests.post(
                 webhook_url, headers=headers, json=payload, proxies=proxies, timeout=30
             )
@@ -1065,7 +1093,7 @@ def send_to_slack(
             if response.status_code == 200 and response.text == "ok":
                 print(f"{log_prefix}第 {i}/{len(batches)} 批次发送成功 [{report_type}]")
                 # 批次间间隔
-                if i < len(batches):
+                if i < len(batches) and rate_limiter is None:
                     time.sleep(batch_interval)
             else:
                 error_msg = response.text if response.text else f"状态码：{response.status_code}"
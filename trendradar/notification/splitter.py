@@ -21,6 +21,74 @@ DEFAULT_BATCH_SIZES = {
 }
 
 
+def _byte_len(text: str) -> int:
+    """UTF-8 字节数（纯 ASCII 文本直接取长度，无需编码）"""
+    return len(text) if text.isascii() else len(text.encode("utf-8"))
+
+
+class _BatchBuilder:
+    """
+    按字节预算累积批次内容
+
+    当前批次以片段列表 + 累计字节数维护，追加时只计算新片段的字节数，
+    每个批次完成时 join 一次，整体耗时与内容长度成线性关系。
+    判断规则与"拼接字符串后整体编码"完全一致（UTF-8 字节数可按片段相加）：
+    当前内容 + 新片段 + 尾部 < max_bytes 时追加，否则另起一批。
+    """
+
+    __slots__ = ("base_header", "base_footer", "max_bytes", "batches", "has_content",
+                 "_footer_size", "_parts", "_size")
+
+    def __init__(self, base_header: str, base_footer: str, max_bytes: int):
+        self.base_header = base_header
+        self.base_footer = base_footer
+        self.max_bytes = max_bytes
+        self.batches: List[str] = []
+        self.has_content = False
+        self._footer_size = _byte_len(base_footer)
+        self._parts = [base_header]
+        self._size = _byte_len(base_header)
+
+    def add(self, fragment: str, *restart_prefix: str) -> None:
+        """
+        追加内容片段并标记当前批次有内容
+
+        放不下时完成当前批次（如有内容），新批次为 基础头部 + restart_prefix + 片段，
+        用于在新批次中重复区块标题/词组标题。
+        """
+        size = _byte_len(fragment)
+        if self._size + size + self._footer_size < self.max_bytes:
+            self._parts.append(fragment)
+            self._size += size
+        else:
+            if self.has_content:
+                self.batches.append("".join(self._parts) + self.base_footer)
+            self._parts = [self.base_header, *restart_prefix, fragment]
+            self._size = sum(_byte_len(part) for part in self._parts)
+        self.has_content = True
+
+    def add_if_fits(self, fragment: str) -> None:
+        """放得下才追加（分隔符等可省略的片段），不改变内容标记"""
+        size = _byte_len(fragment)
+        if self._size + size + self._footer_size < self.max_bytes:
+            self._parts.append(fragment)
+            self._size += size
+
+    def append(self, fragment: str) -> None:
+        """无条件追加（不检查大小，不改变内容标记）"""
+        self._parts.append(fragment)
+        self._size += _byte_len(fragment)
+
+    def finish(self) -> List[str]:
+        """完成最后批次并返回全部批次"""
+        if self.has_content:
+            self.batches.append("".join(self._parts) + self.base_footer)
+            self.has_content = False
+            self._parts = [self.base_header]
+            self._size = _byte_len(self.base_header)
+        return self.batches
+
+
 def split_content_into_batches(
     report_data: Dict,
     format_type: str,
@@ -72,8 +140,6 @@ def split_content_into_batches(
         else:
             max_bytes = sizes.get("default", 4000)
 
-    batches = []
-
     total_titles = sum(
         len(stat["titles"]) for stat in report_data["stats"] if stat["count"] > 0
     )
@@ -139,9 +205,6 @@ def split_content_into_batches(
         elif format_type == "slack":
             stats_header = f"📊 *{stats_title}*\n\n"
 
-    current_batch = base_header
-    current_batch_has_content = False
-
     if (
         not report_data["stats"]
         and not report_data["new_titles"]
@@ -155,30 +218,20 @@ def split_content_into_batches(
             mode_text = "暂无匹配的热点词汇"
         simple_content = f"📭 {mode_text}\n\n"
         final_content = base_header + simple_content + base_footer
-        batches.append(final_content)
-        return batches
+        return [final_content]
+
+    builder = _BatchBuilder(base_header, base_footer, max_bytes)
 
     # 定义处理热点词汇统计的函数
-    def process_stats_section(current_batch, current_batch_has_content, batches):
+    def process_stats_section() -> None:
         """处理热点词汇统计"""
         if not report_data["stats"]:
-            return current_batch, current_batch_has_content, batches
+            return
 
         total_count = len(report_data["stats"])
 
         # 添加统计标题
-        test_content = current_batch + stats_header
-        if (
-            len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-            < max_bytes
-        ):
-            current_batch = test_content
-            current_batch_has_content = True
-        else:
-            if current_batch_has_content:
-                batches.append(current_batch + base_footer)
-            current_batch = base_header + stats_header
-            current_batch_has_content = True
+        builder.add(stats_header)
 
         # 逐个处理词组（确保词组标题+第一条新闻的原子性）
         for i, stat in enumerate(report_data["stats"]):
@@ -287,25 +340,10 @@ def split_content_into_batches(
 
             # 原子性检查：词组标题+第一条新闻必须一起处理
             word_with_first_news = word_header + first_news_line
-            test_content = current_batch + word_with_first_news
-
-            if (
-                len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                >= max_bytes
-            ):
-                # 当前批次容纳不下，开启新批次
-                if current_batch_has_content:
-                    batches.append(current_batch + base_footer)
-                current_batch = base_header + stats_header + word_with_first_news
-                current_batch_has_content = True
-                start_index = 1
-            else:
-                current_batch = test_content
-                current_batch_has_content = True
-                start_index = 1
+            builder.add(word_with_first_news, stats_header)
 
             # 处理剩余新闻条目
-            for j in range(start_index, len(stat["titles"])):
+            for j in range(1, len(stat["titles"])):
                 title_data = stat["titles"][j]
                 if format_type in ("wework", "bark"):
                     formatted_title = format_title_for_platform(
@@ -338,18 +376,7 @@ def split_content_into_batches(
                 if j < len(stat["titles"]) - 1:
                     news_line += "\n"
 
-                test_content = current_batch + news_line
-                if (
-                    len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                    >= max_bytes
-                ):
-                    if current_batch_has_content:
-                        batches.append(current_batch + base_footer)
-                    current_batch = base_header + stats_header + word_header + news_line
-                    current_batch_has_content = True
-                else:
-                    current_batch = test_content
-                    current_batch_has_content = True
+                builder.add(news_line, stats_header, word_header)
 
             # 词组间分隔符
             if i < len(report_data["stats"]) - 1:
@@ -367,20 +394,13 @@ def split_content_into_batches(
                 elif format_type == "slack":
                     separator = f"\n\n"
 
-                test_content = current_batch + separator
-                if (
-                    len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                    < max_bytes
-                ):
-                    current_batch = test_content
-
-        return current_batch, current_batch_has_content, batches
+                builder.add_if_fits(separator)
 
     # 定义处理新增新闻的函数
-    def process_new_titles_section(current_batch, current_batch_has_content, batches):
+    def process_new_titles_section() -> None:
         """处理新增新闻"""
         if not report_data["new_titles"]:
-            return current_batch, current_batch_has_content, batches
+            return
 
         new_header = ""
         if format_type in ("wework", "bark"):
@@ -398,18 +418,7 @@ def split_content_into_batches(
         elif format_type == "slack":
             new_header = f"\n\n🆕 *本次新增热点新闻* (共 {report_data['total_new_count']} 条)\n\n"
 
-        test_content = current_batch + new_header
-        if (
-            len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-            >= max_bytes
-        ):
-            if current_batch_has_content:
-                batches.append(current_batch + base_footer)
-            current_batch = base_header + new_header
-            current_batch_has_content = True
-        else:
-            current_batch = test_content
-            current_batch_has_content = True
+        builder.add(new_header)
 
         # 逐个处理新增新闻来源
         for source_data in report_data["new_titles"]:
@@ -461,24 +470,10 @@ def split_content_into_batches(
 
             # 原子性检查：来源标题+第一条新闻
             source_with_first_news = source_header + first_news_line
-            test_content = current_batch + source_with_first_news
-
-            if (
-                len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                >= max_bytes
-            ):
-                if current_batch_has_content:
-                    batches.append(current_batch + base_footer)
-                current_batch = base_header + new_header + source_with_first_news
-                current_batch_has_content = True
-                start_index = 1
-            else:
-                current_batch = test_content
-                current_batch_has_content = True
-                start_index = 1
+            builder.add(source_with_first_news, new_header)
 
             # 处理剩余新增新闻
-            for j in range(start_index, len(source_data["titles"])):
+            for j in range(1, len(source_data["titles"])):
                 title_data = source_data["titles"][j]
                 title_data_copy = title_data.copy()
                 title_data_copy["is_new"] = False
@@ -508,68 +503,35 @@ def split_content_into_batches(
 
                 news_line = f"  {j + 1}. {formatted_title}\n"
 
-                test_content = current_batch + news_line
-                if (
-                    len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                    >= max_bytes
-                ):
-                    if current_batch_has_content:
-                        batches.append(current_batch + base_footer)
-                    current_batch = base_header + new_header + source_header + news_line
-                    current_batch_has_content = True
-                else:
-                    current_batch = test_content
-                    current_batch_has_content = True
-
-            current_batch += "\n"
+                builder.add(news_line, new_header, source_header)
 
-        return current_batch, current_batch_has_content, batches
+            builder.append("\n")
 
     # 根据配置决定处理顺序
     if reverse_content_order:
         # 新增热点在前，热点词汇统计在后
         # 1. 处理热榜新增
-        current_batch, current_batch_has_content, batches = process_new_titles_section(
-            current_batch, current_batch_has_content, batches
-        )
+        process_new_titles_section()
         # 2. 处理 RSS 新增（如果有）
         if rss_new_items:
-            current_batch, current_batch_has_content, batches = _process_rss_new_titles_section(
-                rss_new_items, format_type, feishu_separator, base_header, base_footer,
-                max_bytes, current_batch, current_batch_has_content, batches, timezone
-            )
+            _process_rss_new_titles_section(rss_new_items, format_type, feishu_separator, builder, timezone)
         # 3. 处理热榜统计
-        current_batch, current_batch_has_content, batches = process_stats_section(
-            current_batch, current_batch_has_content, batches
-        )
+        process_stats_section()
         # 4. 处理 RSS 统计（如果有）
         if rss_items:
-            current_batch, current_batch_has_content, batches = _process_rss_stats_section(
-                rss_items, format_type, feishu_separator, base_header, base_footer,
-                max_bytes, current_batch, current_batch_has_content, batches, timezone
-            )
+            _process_rss_stats_section(rss_items, format_type, feishu_separator, builder, timezone)
     else:
         # 默认：热点词汇统计在前，新增热点在后
         # 1. 处理热榜统计
-        current_batch, current_batch_has_content, batches = process_stats_section(
-            current_batch, current_batch_has_content, batches
-        )
+        process_stats_section()
         # 2. 处理 RSS 统计（如果有）
         if rss_items:
-            current_batch, current_batch_has_content, batches = _process_rss_stats_section(
-                rss_items, format_type, feishu_separator, base_header, base_footer,
-                max_bytes, current_batch, current_batch_has_content, batches, timezone
-            )
+            _process_rss_stats_section(rss_items, format_type, feishu_separator, builder, timezone)
         # 3. 处理热榜新增
-        current_batch, current_batch_has_content, batches = process_new_titles_section(
-            current_batch, current_batch_has_content, batches
-        )
+        process_new_titles_section()
         # 4. 处理 RSS 新增（如果有）
         if rss_new_items:
-            current_batch, current_batch_has_content, batches = _process_rss_new_titles_section(
-                rss_new_items, format_type, feishu_separator, base_header, base_footer,
-                max_bytes, current_batch, current_batch_has_content, batches, timezone
-            )
+            _process_rss_new_titles_section(rss_new_items, format_type, feishu_separator, builder, timezone)
 
     if report_data["failed_ids"]:
         failed_header = ""
@@ -584,18 +546,7 @@ def split_content_into_batches(
         elif format_type == "dingtalk":
             failed_header = f"\n---\n\n⚠️ **数据获取失败的平台：**\n\n"
 
-        test_content = current_batch + failed_header
-        if (
-            len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-            >= max_bytes
-        ):
-            if current_batch_has_content:
-                batches.append(current_batch + base_footer)
-            current_batch = base_header + failed_header
-            current_batch_has_content = True
-        else:
-            current_batch = test_content
-            current_batch_has_content = True
+        builder.add(failed_header)
 
         for i, id_value in enumerate(report_data["failed_ids"], 1):
             if format_type == "feishu":
@@ -605,38 +556,19 @@ def split_content_into_batches(
             else:
                 failed_line = f"  • {id_value}\n"
 
-            test_content = current_batch + failed_line
-            if (
-                len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                >= max_bytes
-            ):
-                if current_batch_has_content:
-                    batches.append(current_batch + base_footer)
-                current_batch = base_header + failed_header + failed_line
-                current_batch_has_content = True
-            else:
-                current_batch = test_content
-                current_batch_has_content = True
+            builder.add(failed_line, failed_header)
 
     # 完成最后批次
-    if current_batch_has_content:
-        batches.append(current_batch + base_footer)
-
-    return batches  # type: ignore[no-any-return]
+    return builder.finish()
 
 
 def _process_rss_stats_section(
     rss_stats: list,
     format_type: str,
     feishu_separator: str,
-    base_header: str,
-    base_footer: str,
-    max_bytes: int,
-    current_batch: str,
-    current_batch_has_content: bool,
-    batches: List[str],
+    builder: "_BatchBuilder",
     timezone: str = "Asia/Shanghai",
-) -> tuple:
+) -> None:
     """处理 RSS 统计区块（按关键词分组，与热榜统计格式一致）
 
     Args:
@@ -644,19 +576,11 @@ def _process_rss_stats_section(
             [{"word": "AI", "count": 5, "titles": [...]}]
         format_type: 格式类型
         feishu_separator: 飞书分隔符
-        base_header: 基础头部
-        base_footer: 基础尾部
-        max_bytes: 最大字节数
-        current_batch: 当前批次内容
-        current_batch_has_content: 当前批次是否有内容
-        batches: 已完成的批次列表
+        builder: 批次构建器（累积当前批次与已完成的批次）
         timezone: 时区名称
-
-    Returns:
-        (current_batch, current_batch_has_content, batches) 元组
     """
     if not rss_stats:
-        return current_batch, current_batch_has_content, batches
+        return
 
     # 计算总条目数
     total_items = sum(stat["count"] for stat in rss_stats)
@@ -676,15 +600,7 @@ def _process_rss_stats_section(
         rss_header = f"\n\n📰 **RSS 订阅统计** (共 {total_items} 条)\n\n"
 
     # 添加 RSS 标题
-    test_content = current_batch + rss_header
-    if len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8")) < max_bytes:
-        current_batch = test_content
-        current_batch_has_content = True
-    else:
-        if current_batch_has_content:
-            batches.append(current_batch + base_footer)
-        current_batch = base_header + rss_header
-        current_batch_has_content = True
+    builder.add(rss_header)
 
     # 逐个处理关键词组（与热榜一致）
     for i, stat in enumerate(rss_stats):
@@ -762,21 +678,10 @@ def _process_rss_stats_section(
 
         # 原子性检查：关键词标题 + 第一条新闻必须一起处理
         word_with_first_news = word_header + first_news_line
-        test_content = current_batch + word_with_first_news
-
-        if len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8")) >= max_bytes:
-            if current_batch_has_content:
-                batches.append(current_batch + base_footer)
-            current_batch = base_header + rss_header + word_with_first_news
-            current_batch_has_content = True
-            start_index = 1
-        else:
-            current_batch = test_content
-            current_batch_has_content = True
-            start_index = 1
+        builder.add(word_with_first_news, rss_header)
 
         # 处理剩余新闻条目
-        for j in range(start_index, len(stat["titles"])):
+        for j in range(1, len(stat["titles"])):
             title_data = stat["titles"][j]
             if format_type in ("wework", "bark"):
                 formatted_title = format_title_for_platform("wework", title_data, show_source=True)
@@ -797,15 +702,7 @@ def _process_rss_stats_section(
             if j < len(stat["titles"]) - 1:
                 news_line += "\n"
 
-            test_content = current_batch + news_line
-            if len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8")) >= max_bytes:
-                if current_batch_has_content:
-                    batches.append(current_batch + base_footer)
-                current_batch = base_header + rss_header + word_header + news_line
-                current_batch_has_content = True
-            else:
-                current_batch = test_content
-                current_batch_has_content = True
+            builder.add(news_line, rss_header, word_header)
 
         # 关键词间分隔符
         if i < len(rss_stats) - 1:
@@ -823,25 +720,16 @@ def _process_rss_stats_section(
             elif format_type == "slack":
                 separator = "\n\n"
 
-            test_content = current_batch + separator
-            if len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8")) < max_bytes:
-                current_batch = test_content
-
-    return current_batch, current_batch_has_content, batches
+            builder.add_if_fits(separator)
 
 
 def _process_rss_new_titles_section(
     rss_new_stats: list,
     format_type: str,
     feishu_separator: str,
-    base_header: str,
-    base_footer: str,
-    max_bytes: int,
-    current_batch: str,
-    current_batch_has_content: bool,
-    batches: List[str],
+    builder: "_BatchBuilder",
     timezone: str = "Asia/Shanghai",
-) -> tuple:
+) -> None:
     """处理 RSS 新增区块（按来源分组，与热榜新增格式一致）
 
     Args:
@@ -849,19 +737,11 @@ def _process_rss_new_titles_section(
             [{"word": "AI", "count": 5, "titles": [...]}]
         format_type: 格式类型
         feishu_separator: 飞书分隔符
-        base_header: 基础头部
-        base_footer: 基础尾部
-        max_bytes: 最大字节数
-        current_batch: 当前批次内容
-        current_batch_has_content: 当前批次是否有内容
-        batches: 已完成的批次列表
+        builder: 批次构建器（累积当前批次与已完成的批次）
         timezone: 时区名称
-
-    Returns:
-        (current_batch, current_batch_has_content, batches) 元组
     """
     if not rss_new_stats:
-        return current_batch, current_batch_has_content, batches
+        return
 
     # 从关键词分组中提取所有条目，重新按来源分组
     source_map: dict[str, list] = {}
@@ -873,7 +753,7 @@ def _process_rss_new_titles_section(
             source_map[source_name].append(title_data)
 
     if not source_map:
-        return current_batch, current_batch_has_content, batches
+        return
 
     # 计算总条目数
     total_items = sum(len(titles) for titles in source_map.values())
@@ -894,15 +774,7 @@ def _process_rss_new_titles_section(
         new_header = f"\n\n🆕 *RSS 本次新增* (共 {total_items} 条)\n\n"
 
     # 添加 RSS 新增标题
-    test_content = current_batch + new_header
-    if len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8")) >= max_bytes:
-        if current_batch_has_content:
-            batches.append(current_batch + base_footer)
-        current_batch = base_header + new_header
-        current_batch_has_content = True
-    else:
-        current_batch = test_content
-        current_batch_has_content = True
+    builder.add(new_header)
 
     # 按来源分组显示（与热榜新增格式一致）
     source_list = list(source_map.items())
@@ -948,21 +820,10 @@ def _process_rss_new_titles_section(
 
         # 原子性检查：来源标题 + 第一条新闻必须一起处理
         source_with_first_news = source_header + first_news_line
-        test_content = current_batch + source_with_first_news
-
-        if len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8")) >= max_bytes:
-            if current_batch_has_content:
-                batches.append(current_batch + base_footer)
-            current_batch = base_header + new_header + source_with_first_news
-            current_batch_has_content = True
-            start_index = 1
-        else:
-            current_batch = test_content
-            current_batch_has_content = True
-            start_index = 1
+        builder.add(source_with_first_news, new_header)
 
         # 处理剩余新闻条目（禁用 new emoji）
-        for j in range(start_index, len(titles)):
+        for j in range(1, len(titles)):
             title_data = titles[j].copy()
             title_data["is_new"] = False
             if format_type in ("wework", "bark"):
@@ -982,20 +843,10 @@ def _process_rss_new_titles_section(
 
             news_line = f"  {j + 1}. {formatted_title}\n"
 
-            test_content = current_batch + news_line
-            if len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8")) >= max_bytes:
-                if current_batch_has_content:
-                    batches.append(current_batch + base_footer)
-                current_batch = base_header + new_header + source_header + news_line
-                current_batch_has_content = True
-            else:
-                current_batch = test_content
-                current_batch_has_content = True
+            builder.add(news_line, new_header, source_header)
 
         # 来源间添加空行（与热榜新增格式一致）
-        current_batch += "\n"
-
-    return current_batch, current_batch_has_content, batches
+        builder.append("\n")
 
 
 def _format_rss_item_line(
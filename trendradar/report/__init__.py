@@ -17,9 +17,10 @@ from trendradar.report.helpers import (
     clean_title,
     html_escape,
     format_rank_display,
+    write_html,
 )
 from trendradar.report.formatter import format_title_for_platform
-from trendradar.report.html import render_html_content
+from trendradar.report.html import iter_html_content, render_html_content
 from trendradar.report.generator import (
     prepare_report_data,
     generate_html_report,
@@ -30,10 +31,12 @@ __all__ = [
     "clean_title",
     "html_escape",
     "format_rank_display",
+    "write_html",
     # 格式化函数
     "format_title_for_platform",
     # HTML 渲染
     "render_html_content",
+    "iter_html_content",
     # 报告生成器
     "prepare_report_data",
     "generate_html_report",
@@ -7,9 +7,12 @@
 - generate_html_report: 生成 HTML 报告
 """
 
+import shutil
 from pathlib import Path
 from typing import Dict, List, Optional, Callable
 
+from trendradar.storage.manifest import MANIFEST_FILENAME, ContentManifest, write_html_if_changed
+
 
 def prepare_report_data(
     stats: List[Dict],
@@ -171,7 +174,7 @@ def generate_html_report(
         output_dir: 输出目录
         date_folder: 日期文件夹名称
         time_filename: 时间文件名
-        render_html_func: HTML 渲染函数
+        render_html_func: HTML 渲染函数，返回 HTML 字符串或片段迭代器
         matches_word_groups_func: 词组匹配函数
         load_frequency_words_func: 加载频率词函数
         enable_index_copy: 是否复制到 index.html
@@ -215,21 +218,17 @@ def generate_html_report(
         # 默认简单 HTML
         html_content = f"<html><body><h1>Report</h1><pre>{report_data}</pre></body></html>"
 
-    # 写入文件
-    with open(file_path, "w", encoding="utf-8") as f:
-        f.write(html_content)
+    # 写入文件（渲染函数返回片段迭代器时边渲染边写入；内容与当日清单一致时保留原文件）
+    manifest = ContentManifest(output_path / MANIFEST_FILENAME)
+    changed = write_html_if_changed(file_path, html_content, manifest)
 
-    # 如果是每日汇总且启用 index 复制
+    # 如果是每日汇总且启用 index 复制（直接复制已写入的文件，内容未变化且副本存在时跳过）
     if is_daily_summary and enable_index_copy:
         # 生成到根目录（供 GitHub Pages 访问）
-        root_index_path = Path("index.html")
-        with open(root_index_path, "w", encoding="utf-8") as f:
-            f.write(html_content)
-
         # 同时生成到 output 目录（供 Docker Volume 挂载访问）
-        output_index_path = Path(output_dir) / "index.html"
         Path(output_dir).mkdir(parents=True, exist_ok=True)
-        with open(output_index_path, "w", encoding="utf-8") as f:
-            f.write(html_content)
+        for index_path in (Path("index.html"), Path(output_dir) / "index.html"):
+            if changed or not index_path.exists():
+                shutil.copyfile(file_path, index_path)
 
     return file_path
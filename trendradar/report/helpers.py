@@ -8,6 +8,9 @@
 import re
 from typing import List
 
+# HTML 写入由存储层提供（存储后端也要写报告），这里重新导出供报告模块使用
+from trendradar.storage.base import write_html
+
 
 def clean_title(title: str) -> str:
     """清理标题中的特殊字符
@@ -3,10 +3,13 @@
 HTML 报告渲染模块
 
 提供 HTML 格式的热点新闻报告生成功能
+
+页面的静态部分（头部 CSS、底部脚本）在模块加载时构建一次，
+动态内容由 iter_html_content 逐段生成，可直接流式写入文件。
 """
 
 from datetime import datetime
-from typing import Dict, List, Optional, Callable
+from typing import Dict, Iterator, List, Optional, Callable
 
 from trendradar.report.helpers import html_escape
 
@@ -41,7 +44,372 @@ def render_html_content(
     Returns:
         渲染后的 HTML 字符串
     """
-    html = """
+    return "".join(iter_html_content(
+        report_data,
+        total_titles,
+        is_daily_summary,
+        mode,
+        update_info,
+        reverse_content_order=reverse_content_order,
+        get_time_func=get_time_func,
+        rss_items=rss_items,
+        rss_new_items=rss_new_items,
+        display_mode=display_mode,
+    ))
+
+
+def iter_html_content(
+    report_data: Dict,
+    total_titles: int,
+    is_daily_summary: bool = False,
+    mode: str = "daily",
+    update_info: Optional[Dict] = None,
+    *,
+    reverse_content_order: bool = False,
+    get_time_func: Optional[Callable[[], datetime]] = None,
+    rss_items: Optional[List[Dict]] = None,
+    rss_new_items: Optional[List[Dict]] = None,
+    display_mode: str = "keyword",
+) -> Iterator[str]:
+    """逐段生成 HTML 内容（参数同 render_html_content）
+
+    每条新闻/订阅条目作为一个片段产出，配合 write_html 可边渲染边写入文件，
+    无需在内存中拼出整页。
+
+    Yields:
+        HTML 片段，按顺序拼接即为完整页面
+    """
+    yield _PAGE_HEAD
+
+    # 处理报告类型显示
+    if is_daily_summary:
+        if mode == "current":
+            yield "当前榜单"
+        elif mode == "incremental":
+            yield "增量模式"
+        else:
+            yield "当日汇总"
+    else:
+        yield "实时分析"
+
+    # 计算筛选后的热点新闻数量
+    hot_news_count = sum(len(stat["titles"]) for stat in report_data["stats"])
+
+    # 使用提供的时间函数或默认 datetime.now
+    if get_time_func:
+        now = get_time_func()
+    else:
+        now = datetime.now()
+
+    yield f"""</span>
+                    </div>
+                    <div class="info-item">
+                        <span class="info-label">新闻总数</span>
+                        <span class="info-value">{total_titles} 条</span>
+                    </div>
+                    <div class="info-item">
+                        <span class="info-label">热点新闻</span>
+                        <span class="info-value">{hot_news_count} 条</span>
+                    </div>
+                    <div class="info-item">
+                        <span class="info-label">生成时间</span>
+                        <span class="info-value">{now.strftime("%m-%d %H:%M")}</span>
+                    </div>
+                </div>
+            </div>
+
+            <div class="content">"""
+
+    # 处理失败ID错误信息
+    if report_data["failed_ids"]:
+        yield """
+                <div class="error-section">
+                    <div class="error-title">⚠️ 请求失败的平台</div>
+                    <ul class="error-list">"""
+        for id_value in report_data["failed_ids"]:
+            yield f'<li class="error-item">{html_escape(id_value)}</li>'
+        yield """
+                    </ul>
+                </div>"""
+
+    stats_section = _iter_stats_section(report_data["stats"], display_mode)
+    new_titles_section = _iter_new_titles_section(report_data)
+    rss_stats_section = _iter_rss_section(rss_items, "RSS 订阅更新")
+    rss_new_section = _iter_rss_section(rss_new_items, "RSS 新增更新")
+
+    # 根据配置决定内容顺序（与推送逻辑一致）
+    if reverse_content_order:
+        # 新增在前，统计在后
+        # 顺序：热榜新增 → RSS新增 → 热榜统计 → RSS统计
+        sections = (new_titles_section, rss_new_section, stats_section, rss_stats_section)
+    else:
+        # 默认：统计在前，新增在后
+        # 顺序：热榜统计 → RSS统计 → 热榜新增 → RSS新增
+        sections = (stats_section, rss_stats_section, new_titles_section, rss_new_section)
+    for section in sections:
+        yield from section
+
+    yield _FOOTER_HEAD
+
+    if update_info:
+        yield f"""
+                    <br>
+                    <span style="color: #ea580c; font-weight: 500;">
+                        发现新版本 {update_info['remote_version']}，当前版本 {update_info['current_version']}
+                    </span>"""
+
+    yield _PAGE_TAIL
+
+
+def _iter_stats_section(stats: List[Dict], display_mode: str) -> Iterator[str]:
+    """生成热点词汇统计部分，每条新闻一个片段"""
+    total_count = len(stats)
+
+    for i, stat in enumerate(stats, 1):
+        count = stat["count"]
+
+        # 确定热度等级
+        if count >= 10:
+            count_class = "hot"
+        elif count >= 5:
+            count_class = "warm"
+        else:
+            count_class = ""
+
+        escaped_word = html_escape(stat["word"])
+
+        yield f"""
+                <div class="word-group">
+                    <div class="word-header">
+                        <div class="word-info">
+                            <div class="word-name">{escaped_word}</div>
+                            <div class="word-count {count_class}">{count} 条</div>
+                        </div>
+                        <div class="word-index">{i}/{total_count}</div>
+                    </div>"""
+
+        # 处理每个词组下的新闻标题，给每条新闻标上序号
+        for j, title_data in enumerate(stat["titles"], 1):
+            is_new = title_data.get("is_new", False)
+            new_class = "new" if is_new else ""
+
+            parts = [f"""
+                    <div class="news-item {new_class}">
+                        <div class="news-number">{j}</div>
+                        <div class="news-content">
+                            <div class="news-header">"""]
+
+            # 根据 display_mode 决定显示来源还是关键词
+            if display_mode == "keyword":
+                # keyword 模式：显示来源
+                parts.append(f'<span class="source-name">{html_escape(title_data["source_name"])}</span>')
+            else:
+                # platform 模式：显示关键词
+                matched_keyword = title_data.get("matched_keyword", "")
+                if matched_keyword:
+                    parts.append(f'<span class="keyword-tag">[{html_escape(matched_keyword)}]</span>')
+
+            # 处理排名显示
+            ranks = title_data.get("ranks", [])
+            if ranks:
+                min_rank = min(ranks)
+                max_rank = max(ranks)
+                rank_threshold = title_data.get("rank_threshold", 10)
+
+                # 确定排名等级
+                if min_rank <= 3:
+                    rank_class = "top"
+                elif min_rank <= rank_threshold:
+                    rank_class = "high"
+                else:
+                    rank_class = ""
+
+                if min_rank == max_rank:
+                    rank_text = str(min_rank)
+                else:
+                    rank_text = f"{min_rank}-{max_rank}"
+
+                parts.append(f'<span class="rank-num {rank_class}">{rank_text}</span>')
+
+            # 处理时间显示
+            time_display = title_data.get("time_display", "")
+            if time_display:
+                # 简化时间显示格式，将波浪线替换为~
+                simplified_time = (
+                    time_display.replace(" ~ ", "~")
+                    .replace("[", "")
+                    .replace("]", "")
+                )
+                parts.append(f'<span class="time-info">{html_escape(simplified_time)}</span>')
+
+            # 处理出现次数
+            count_info = title_data.get("count", 1)
+            if count_info > 1:
+                parts.append(f'<span class="count-info">{count_info}次</span>')
+
+            parts.append("""
+                            </div>
+                            <div class="news-title">""")
+
+            # 处理标题和链接
+            parts.append(_title_link(title_data, "news-link"))
+
+            parts.append("""
+                            </div>
+                        </div>
+                    </div>""")
+            yield "".join(parts)
+
+        yield """
+                </div>"""
+
+
+def _iter_new_titles_section(report_data: Dict) -> Iterator[str]:
+    """生成新增新闻区域，每条新闻一个片段"""
+    if not report_data["new_titles"]:
+        return
+
+    yield f"""
+                <div class="new-section">
+                    <div class="new-section-title">本次新增热点 (共 {report_data['total_new_count']} 条)</div>"""
+
+    for source_data in report_data["new_titles"]:
+        escaped_source = html_escape(source_data["source_name"])
+        titles_count = len(source_data["titles"])
+
+        yield f"""
+                    <div class="new-source-group">
+                        <div class="new-source-title">{escaped_source} · {titles_count}条</div>"""
+
+        # 为新增新闻也添加序号
+        for idx, title_data in enumerate(source_data["titles"], 1):
+            ranks = title_data.get("ranks", [])
+
+            # 处理新增新闻的排名显示
+            rank_class = ""
+            if ranks:
+                min_rank = min(ranks)
+                if min_rank <= 3:
+                    rank_class = "top"
+                elif min_rank <= title_data.get("rank_threshold", 10):
+                    rank_class = "high"
+
+                if len(ranks) == 1:
+                    rank_text = str(ranks[0])
+                else:
+                    rank_text = f"{min(ranks)}-{max(ranks)}"
+            else:
+                rank_text = "?"
+
+            yield "".join((f"""
+                        <div class="new-item">
+                            <div class="new-item-number">{idx}</div>
+                            <div class="new-item-rank {rank_class}">{rank_text}</div>
+                            <div class="new-item-content">
+                                <div class="new-item-title">""", _title_link(title_data, "news-link"), """
+                                </div>
+                            </div>
+                        </div>"""))
+
+        yield """
+                    </div>"""
+
+    yield """
+                </div>"""
+
+
+def _iter_rss_section(items: Optional[List[Dict]], title: str) -> Iterator[str]:
+    """生成 RSS 统计/新增区域，每个条目一个片段"""
+    if not items:
+        return
+
+    yield f"""
+                <div class="rss-section">
+                    <div class="rss-section-header">
+                        <div class="rss-section-title">{title}</div>
+                        <div class="rss-section-count">{len(items)} 条</div>
+                    </div>"""
+
+    # 按 feed_id 分组
+    feeds_grouped = {}
+    for item in items:
+        feed_id = item.get("feed_id", "unknown")
+        if feed_id not in feeds_grouped:
+            feeds_grouped[feed_id] = {
+                "name": item.get("feed_name", feed_id),
+                "items": []
+            }
+        feeds_grouped[feed_id]["items"].append(item)
+
+    # 渲染每个 feed 分组
+    for feed_data in feeds_grouped.values():
+        feed_items = feed_data["items"]
+
+        yield f"""
+                    <div class="feed-group">
+                        <div class="feed-header">
+                            <div class="feed-name">{html_escape(feed_data["name"])}</div>
+                            <div class="feed-count">{len(feed_items)} 条</div>
+                        </div>"""
+
+        for item in feed_items:
+            url = item.get("url", "")
+            published_at = item.get("published_at", "")
+            author = item.get("author", "")
+
+            # 格式化发布时间
+            time_str = ""
+            if published_at:
+                if isinstance(published_at, datetime):
+                    time_str = published_at.strftime("%m-%d %H:%M")
+                else:
+                    time_str = str(published_at)[:16] if len(str(published_at)) > 16 else str(published_at)
+
+            parts = ["""
+                        <div class="rss-item">
+                            <div class="rss-meta">"""]
+
+            if time_str:
+                parts.append(f'<span class="rss-time">{html_escape(time_str)}</span>')
+
+            if author:
+                parts.append(f'<span class="rss-author">by {html_escape(author)}</span>')
+
+            parts.append("""
+                            </div>
+                            <div class="rss-title">""")
+
+            escaped_title = html_escape(item.get("title", ""))
+            if url:
+                parts.append(f'<a href="{html_escape(url)}" target="_blank" class="rss-link">{escaped_title}</a>')
+            else:
+                parts.append(escaped_title)
+
+            parts.append("""
+                            </div>
+                        </div>""")
+            yield "".join(parts)
+
+        yield """
+                    </div>"""
+
+    yield """
+                </div>"""
+
+
+def _title_link(title_data: Dict, link_class: str) -> str:
+    """渲染标题（有链接时渲染为 a 标签，优先使用移动端链接）"""
+    escaped_title = html_escape(title_data["title"])
+    link_url = title_data.get("mobile_url") or title_data.get("url", "")
+    if link_url:
+        return f'<a href="{html_escape(link_url)}" target="_blank" class="{link_class}">{escaped_title}</a>'
+    return escaped_title
+
+
+# === 静态页面片段（模块加载时构建一次） ===
+
+# 页面头部：文档头、样式与页眉，结尾处为"报告类型"的值
+_PAGE_HEAD = """
     <!DOCTYPE html>
     <html>
     <head>
@@ -607,341 +975,8 @@ def render_html_content(
                         <span class="info-label">报告类型</span>
                         <span class="info-value">"""
 
-    # 处理报告类型显示
-    if is_daily_summary:
-        if mode == "current":
-            html += "当前榜单"
-        elif mode == "incremental":
-            html += "增量模式"
-        else:
-            html += "当日汇总"
-    else:
-        html += "实时分析"
-
-    html += """</span>
-                    </div>
-                    <div class="info-item">
-                        <span class="info-label">新闻总数</span>
-                        <span class="info-value">"""
-
-    html += f"{total_titles} 条"
-
-    # 计算筛选后的热点新闻数量
-    hot_news_count = sum(len(stat["titles"]) for stat in report_data["stats"])
-
-    html += """</span>
-                    </div>
-                    <div class="info-item">
-                        <span class="info-label">热点新闻</span>
-                        <span class="info-value">"""
-
-    html += f"{hot_news_count} 条"
-
-    html += """</span>
-                    </div>
-                    <div class="info-item">
-                        <span class="info-label">生成时间</span>
-                        <span class="info-value">"""
-
-    # 使用提供的时间函数或默认 datetime.now
-    if get_time_func:
-        now = get_time_func()
-    else:
-        now = datetime.now()
-    html += now.strftime("%m-%d %H:%M")
-
-    html += """</span>
-                    </div>
-                </div>
-            </div>
-
-            <div class="content">"""
-
-    # 处理失败ID错误信息
-    if report_data["failed_ids"]:
-        html += """
-                <div class="error-section">
-                    <div class="error-title">⚠️ 请求失败的平台</div>
-                    <ul class="error-list">"""
-        for id_value in report_data["failed_ids"]:
-            html += f'<li class="error-item">{html_escape(id_value)}</li>'
-        html += """
-                    </ul>
-                </div>"""
-
-    # 生成热点词汇统计部分的HTML
-    stats_html = ""
-    if report_data["stats"]:
-        total_count = len(report_data["stats"])
-
-        for i, stat in enumerate(report_data["stats"], 1):
-            count = stat["count"]
-
-            # 确定热度等级
-            if count >= 10:
-                count_class = "hot"
-            elif count >= 5:
-                count_class = "warm"
-            else:
-                count_class = ""
-
-            escaped_word = html_escape(stat["word"])
-
-            stats_html += f"""
-                <div class="word-group">
-                    <div class="word-header">
-                        <div class="word-info">
-                            <div class="word-name">{escaped_word}</div>
-                            <div class="word-count {count_class}">{count} 条</div>
-                        </div>
-                        <div class="word-index">{i}/{total_count}</div>
-                    </div>"""
-
-            # 处理每个词组下的新闻标题，给每条新闻标上序号
-            for j, title_data in enumerate(stat["titles"], 1):
-                is_new = title_data.get("is_new", False)
-                new_class = "new" if is_new else ""
-
-                stats_html += f"""
-                    <div class="news-item {new_class}">
-                        <div class="news-number">{j}</div>
-                        <div class="news-content">
-                            <div class="news-header">"""
-
-                # 根据 display_mode 决定显示来源还是关键词
-                if display_mode == "keyword":
-                    # keyword 模式：显示来源
-                    stats_html += f'<span class="source-name">{html_escape(title_data["source_name"])}</span>'
-                else:
-                    # platform 模式：显示关键词
-                    matched_keyword = title_data.get("matched_keyword", "")
-                    if matched_keyword:
-                        stats_html += f'<span class="keyword-tag">[{html_escape(matched_keyword)}]</span>'
-
-                # 处理排名显示
-                ranks = title_data.get("ranks", [])
-                if ranks:
-                    min_rank = min(ranks)
-                    max_rank = max(ranks)
-                    rank_threshold = title_data.get("rank_threshold", 10)
-
-                    # 确定排名等级
-                    if min_rank <= 3:
-                        rank_class = "top"
-                    elif min_rank <= rank_threshold:
-                        rank_class = "high"
-                    else:
-                        rank_class = ""
-
-                    if min_rank == max_rank:
-                        rank_text = str(min_rank)
-                    else:
-                        rank_text = f"{min_rank}-{max_rank}"
-
-                    stats_html += f'<span class="rank-num {rank_class}">{rank_text}</span>'
-
-                # 处理时间显示
-                time_display = title_data.get("time_display", "")
-                if time_display:
-                    # 简化时间显示格式，将波浪线替换为~
-                    simplified_time = (
-                        time_display.replace(" ~ ", "~")
-                        .replace("[", "")
-                        .replace("]", "")
-                    )
-                    stats_html += (
-                        f'<span class="time-info">{html_escape(simplified_time)}</span>'
-                    )
-
-                # 处理出现次数
-                count_info = title_data.get("count", 1)
-                if count_info > 1:
-                    stats_html += f'<span class="count-info">{count_info}次</span>'
-
-                stats_html += """
-                            </div>
-                            <div class="news-title">"""
-
-                # 处理标题和链接
-                escaped_title = html_escape(title_data["title"])
-                link_url = title_data.get("mobile_url") or title_data.get("url", "")
-
-                if link_url:
-                    escaped_url = html_escape(link_url)
-                    stats_html += f'<a href="{escaped_url}" target="_blank" class="news-link">{escaped_title}</a>'
-                else:
-                    stats_html += escaped_title
-
-                stats_html += """
-                            </div>
-                        </div>
-                    </div>"""
-
-            stats_html += """
-                </div>"""
-
-    # 生成新增新闻区域的HTML
-    new_titles_html = ""
-    if report_data["new_titles"]:
-        new_titles_html += f"""
-                <div class="new-section">
-                    <div class="new-section-title">本次新增热点 (共 {report_data['total_new_count']} 条)</div>"""
-
-        for source_data in report_data["new_titles"]:
-            escaped_source = html_escape(source_data["source_name"])
-            titles_count = len(source_data["titles"])
-
-            new_titles_html += f"""
-                    <div class="new-source-group">
-                        <div class="new-source-title">{escaped_source} · {titles_count}条</div>"""
-
-            # 为新增新闻也添加序号
-            for idx, title_data in enumerate(source_data["titles"], 1):
-                ranks = title_data.get("ranks", [])
-
-                # 处理新增新闻的排名显示
-                rank_class = ""
-                if ranks:
-                    min_rank = min(ranks)
-                    if min_rank <= 3:
-                        rank_class = "top"
-                    elif min_rank <= title_data.get("rank_threshold", 10):
-                        rank_class = "high"
-
-                    if len(ranks) == 1:
-                        rank_text = str(ranks[0])
-                    else:
-                        rank_text = f"{min(ranks)}-{max(ranks)}"
-                else:
-                    rank_text = "?"
-
-                new_titles_html += f"""
-                        <div class="new-item">
-                            <div class="new-item-number">{idx}</div>
-                            <div class="new-item-rank {rank_class}">{rank_text}</div>
-                            <div class="new-item-content">
-                                <div class="new-item-title">"""
-
-                # 处理新增新闻的链接
-                escaped_title = html_escape(title_data["title"])
-                link_url = title_data.get("mobile_url") or title_data.get("url", "")
-
-                if link_url:
-                    escaped_url = html_escape(link_url)
-                    new_titles_html += f'<a href="{escaped_url}" target="_blank" class="news-link">{escaped_title}</a>'
-                else:
-                    new_titles_html += escaped_title
-
-                new_titles_html += """
-                                </div>
-                            </div>
-                        </div>"""
-
-            new_titles_html += """
-                    </div>"""
-
-        new_titles_html += """
-                </div>"""
-
-    # 生成 RSS 统计内容
-    def render_rss_stats_html(items: List[Dict], title: str = "RSS 订阅更新") -> str:
-        if not items:
-            return ""
-
-        rss_html = ""
-        rss_count = len(items)
-        rss_html += f"""
-                <div class="rss-section">
-                    <div class="rss-section-header">
-                        <div class="rss-section-title">{title}</div>
-                        <div class="rss-section-count">{rss_count} 条</div>
-                    </div>"""
-
-        # 按 feed_id 分组
-        feeds_grouped = {}
-        for item in items:
-            feed_id = item.get("feed_id", "unknown")
-            if feed_id not in feeds_grouped:
-                feeds_grouped[feed_id] = {
-                    "name": item.get("feed_name", feed_id),
-                    "items": []
-                }
-            feeds_grouped[feed_id]["items"].append(item)
-
-        # 渲染每个 feed 分组
-        for feed_id, feed_data in feeds_grouped.items():
-            feed_name = feed_data["name"]
-            feed_items = feed_data["items"]
-            feed_item_count = len(feed_items)
-
-            rss_html += f"""
-                    <div class="feed-group">
-                        <div class="feed-header">
-                            <div class="feed-name">{html_escape(feed_name)}</div>
-                            <div class="feed-count">{feed_item_count} 条</div>
-                        </div>"""
-
-            for item in feed_items:
-                item_title = item.get("title", "")
-                url = item.get("url", "")
-                published_at = item.get("published_at", "")
-                author = item.get("author", "")
-
-                # 格式化发布时间
-                time_str = ""
-                if published_at:
-                    if isinstance(published_at, datetime):
-                        time_str = published_at.strftime("%m-%d %H:%M")
-                    else:
-                        time_str = str(published_at)[:16] if len(str(published_at)) > 16 else str(published_at)
-
-                rss_html += """
-                        <div class="rss-item">
-                            <div class="rss-meta">"""
-
-                if time_str:
-                    rss_html += f'<span class="rss-time">{html_escape(time_str)}</span>'
-
-                if author:
-                    rss_html += f'<span class="rss-author">by {html_escape(author)}</span>'
-
-                rss_html += """
-                            </div>
-                            <div class="rss-title">"""
-
-                escaped_title = html_escape(item_title)
-                if url:
-                    escaped_url = html_escape(url)
-                    rss_html += f'<a href="{escaped_url}" target="_blank" class="rss-link">{escaped_title}</a>'
-                else:
-                    rss_html += escaped_title
-
-                rss_html += """
-                            </div>
-                        </div>"""
-
-            rss_html += """
-                    </div>"""
-
-        rss_html += """
-                </div>"""
-        return rss_html
-
-    # 生成 RSS 统计和新增 HTML
-    rss_stats_html = render_rss_stats_html(rss_items, "RSS 订阅更新") if rss_items else ""
-    rss_new_html = render_rss_stats_html(rss_new_items, "RSS 新增更新") if rss_new_items else ""
-
-    # 根据配置决定内容顺序（与推送逻辑一致）
-    if reverse_content_order:
-        # 新增在前，统计在后
-        # 顺序：热榜新增 → RSS新增 → 热榜统计 → RSS统计
-        html += new_titles_html + rss_new_html + stats_html + rss_stats_html
-    else:
-        # 默认：统计在前，新增在后
-        # 顺序：热榜统计 → RSS统计 → 热榜新增 → RSS新增
-        html += stats_html + rss_stats_html + new_titles_html + rss_new_html
-
-    html += """
+# 页脚开头（版本更新提示之前）
+_FOOTER_HEAD = """
             </div>
 
             <div class="footer">
@@ -951,14 +986,8 @@ def render_html_content(
                         GitHub 开源项目
                     </a>"""
 
-    if update_info:
-        html += f"""
-                    <br>
-                    <span style="color: #ea580c; font-weight: 500;">
-                        发现新版本 {update_info['remote_version']}，当前版本 {update_info['current_version']}
-                    </span>"""
-
-    html += """
+# 页脚结尾与截图脚本
+_PAGE_TAIL = """
                 </div>
             </div>
         </div>
@@ -1273,5 +1302,3 @@ def render_html_content(
     </body>
     </html>
     """
-
-    return html
@@ -6,7 +6,7 @@ RSS HTML 报告渲染模块
 """
 
 from datetime import datetime
-from typing import Dict, List, Optional, Callable
+from typing import Dict, Iterator, List, Optional, Callable
 
 from trendradar.report.helpers import html_escape
 
@@ -36,7 +36,114 @@ def render_rss_html_content(
     Returns:
         渲染后的 HTML 字符串
     """
-    html = """
+    return "".join(iter_rss_html_content(
+        rss_items, total_count, feeds_info, get_time_func=get_time_func
+    ))
+
+
+def iter_rss_html_content(
+    rss_items: List[Dict],
+    total_count: int,
+    feeds_info: Optional[Dict[str, str]] = None,
+    *,
+    get_time_func: Optional[Callable[[], datetime]] = None,
+) -> Iterator[str]:
+    """逐段生成 RSS HTML 内容（参数同 render_rss_html_content）
+
+    Yields:
+        HTML 片段，每个订阅条目一个片段，按顺序拼接即为完整页面
+    """
+    # 使用提供的时间函数或默认 datetime.now
+    if get_time_func:
+        now = get_time_func()
+    else:
+        now = datetime.now()
+
+    yield _PAGE_HEAD
+    yield f"""{total_count} 条</span>
+                    </div>
+                    <div class="info-item">
+                        <span class="info-label">生成时间</span>
+                        <span class="info-value">{now.strftime("%m-%d %H:%M")}</span>
+                    </div>
+                </div>
+            </div>
+
+            <div class="content">"""
+
+    # 按 feed_id 分组
+    feeds_map: Dict[str, List[Dict]] = {}
+    for item in rss_items:
+        feed_id = item.get("feed_id", "unknown")
+        if feed_id not in feeds_map:
+            feeds_map[feed_id] = []
+        feeds_map[feed_id].append(item)
+
+    # 渲染每个 RSS 源的内容
+    for feed_id, items in feeds_map.items():
+        feed_name = items[0].get("feed_name", feed_id) if items else feed_id
+        if feeds_info and feed_id in feeds_info:
+            feed_name = feeds_info[feed_id]
+
+        yield f"""
+                <div class="feed-group">
+                    <div class="feed-header">
+                        <div class="feed-name">{html_escape(feed_name)}</div>
+                        <div class="feed-count">{len(items)} 条</div>
+                    </div>"""
+
+        for item in items:
+            yield _render_rss_item(item)
+
+        yield """
+                </div>"""
+
+    yield _PAGE_TAIL
+
+
+def _render_rss_item(item: Dict) -> str:
+    """渲染单个订阅条目"""
+    escaped_title = html_escape(item.get("title", ""))
+    url = item.get("url", "")
+    published_at = item.get("published_at", "")
+    author = item.get("author", "")
+    summary = item.get("summary", "")
+
+    parts = ["""
+                    <div class="rss-item">
+                        <div class="rss-meta">"""]
+
+    if published_at:
+        parts.append(f'<span class="rss-time">{html_escape(published_at)}</span>')
+
+    if author:
+        parts.append(f'<span class="rss-author">by {html_escape(author)}</span>')
+
+    parts.append("""
+                        </div>
+                        <div class="rss-title">""")
+
+    if url:
+        parts.append(f'<a href="{html_escape(url)}" target="_blank" class="rss-link">{escaped_title}</a>')
+    else:
+        parts.append(escaped_title)
+
+    parts.append("""
+                        </div>""")
+
+    if summary:
+        parts.append(f"""
+                        <p class="rss-summary">{html_escape(summary)}</p>""")
+
+    parts.append("""
+                    </div>""")
+    return "".join(parts)
+
+
+# === 静态页面片段（模块加载时构建一次） ===
+
+# 页面头部：文档头、样式与页眉，结尾处为"订阅条目"的值
+_PAGE_HEAD = """
     <!DOCTYPE html>
     <html>
     <head>
@@ -301,93 +408,8 @@ def render_rss_html_content(
                         <span class="info-label">订阅条目</span>
                         <span class="info-value">"""
 
-    html += f"{total_count} 条"
-
-    html += """</span>
-                    </div>
-                    <div class="info-item">
-                        <span class="info-label">生成时间</span>
-                        <span class="info-value">"""
-
-    # 使用提供的时间函数或默认 datetime.now
-    if get_time_func:
-        now = get_time_func()
-    else:
-        now = datetime.now()
-    html += now.strftime("%m-%d %H:%M")
-
-    html += """</span>
-                    </div>
-                </div>
-            </div>
-
-            <div class="content">"""
-
-    # 按 feed_id 分组
-    feeds_map: Dict[str, List[Dict]] = {}
-    for item in rss_items:
-        feed_id = item.get("feed_id", "unknown")
-        if feed_id not in feeds_map:
-            feeds_map[feed_id] = []
-        feeds_map[feed_id].append(item)
-
-    # 渲染每个 RSS 源的内容
-    for feed_id, items in feeds_map.items():
-        feed_name = items[0].get("feed_name", feed_id) if items else feed_id
-        if feeds_info and feed_id in feeds_info:
-            feed_name = feeds_info[feed_id]
-
-        escaped_feed_name = html_escape(feed_name)
-
-        html += f"""
-                <div class="feed-group">
-                    <div class="feed-header">
-                        <div class="feed-name">{escaped_feed_name}</div>
-                        <div class="feed-count">{len(items)} 条</div>
-                    </div>"""
-
-        for item in items:
-            escaped_title = html_escape(item.get("title", ""))
-            url = item.get("url", "")
-            published_at = item.get("published_at", "")
-            author = item.get("author", "")
-            summary = item.get("summary", "")
-
-            html += """
-                    <div class="rss-item">
-                        <div class="rss-meta">"""
-
-            if published_at:
-                html += f'<span class="rss-time">{html_escape(published_at)}</span>'
-
-            if author:
-                html += f'<span class="rss-author">by {html_escape(author)}</span>'
-
-            html += """
-                        </div>
-                        <div class="rss-title">"""
-
-            if url:
-                escaped_url = html_escape(url)
-                html += f'<a href="{escaped_url}" target="_blank" class="rss-link">{escaped_title}</a>'
-            else:
-                html += escaped_title
-
-            html += """
-                        </div>"""
-
-            if summary:
-                escaped_summary = html_escape(summary)
-                html += f"""
-                        <p class="rss-summary">{escaped_summary}</p>"""
-
-            html += """
-                    </div>"""
-
-        html += """
-                </div>"""
-
-    html += """
+# 页脚与截图脚本
+_PAGE_TAIL = """
             </div>
 
             <div class="footer">
@@ -475,5 +497,3 @@ def render_rss_html_content(
     </body>
     </html>
     """
-
-    return html
@@ -16,6 +16,7 @@ from trendradar.storage.base import (
     convert_crawl_results_to_news_data,
     convert_news_data_to_results,
 )
+from trendradar.storage.snapshot import DaySnapshot
 from trendradar.storage.local import LocalStorageBackend
 from trendradar.storage.manager import StorageManager, get_storage_manager
 
@@ -36,6 +37,7 @@ __all__ = [
     "StorageBackend",
     "NewsItem",
     "NewsData",
+    "DaySnapshot",
     # 转换函数
     "convert_crawl_results_to_news_data",
     "convert_news_data_to_results",
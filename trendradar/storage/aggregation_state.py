@@ -0,0 +1,261 @@
+# coding=utf-8
+"""
+增量汇总状态读写
+
+当日汇总（daily 模式）每次运行都要读取整天数据并重新匹配、统计。这里为
+trendradar.core.aggregation 提供日库内的持久化支持：
+
+- aggregation_state 表（迁移 v3 / schema.sql）：按配置哈希保存汇总元数据 JSON
+  （水位、平台名称、标题总数等），只保留最新配置对应的一行
+- aggregation_titles 表（迁移 v4、v5 / schema.sql）：每个标题一行，主键
+  (state_key, platform_id, title)，另有 URL 索引；row_count 为该标题在 news_items 中的
+  行数（决定条目刷新后标题位置是否变化）；增量合并只 upsert 本批次变化的行
+- load_news_by_last_crawl：读取某次抓取更新过的条目（last_crawl_time = 该批次），
+  即增量合并所需的全部数据，通过 idx_news_crawl_time 索引读取
+
+本地与远程后端共用这些函数；远程后端的状态随当次运行的日库上传一并同步。
+"""
+
+import json
+import sqlite3
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from trendradar.storage.base import NewsData, NewsItem
+from trendradar.storage.rank_history import load_rank_history
+
+
+def read_crawl_times(cursor: sqlite3.Cursor) -> List[str]:
+    """读取当天所有抓取时间（升序）"""
+    cursor.execute("""
+        SELECT crawl_time FROM crawl_records
+        ORDER BY crawl_time
+    """)
+    return [row[0] for row in cursor.fetchall()]
+
+
+def load_news_by_last_crawl(
+    cursor: sqlite3.Cursor,
+    crawl_time: str,
+    crawl_date: str,
+) -> NewsData:
+    """
+    读取指定批次更新过的新闻条目
+
+    条目按 (platform_id, id) 排序，与 get_today_all_data 中同一平台内的顺序一致；
+    排名历史为完整历史（与整天读取相同的去重规则）。
+
+    Args:
+        cursor: 数据库游标
+        crawl_time: 抓取时间（crawl_records.crawl_time）
+        crawl_date: 日期字符串（写入 NewsData.date）
+
+    Returns:
+        NewsData（该批次没有更新任何条目时 items 为空）
+    """
+    cursor.execute("""
+        SELECT n.id, n.title, n.platform_id, p.name as platform_name,
+               n.rank, n.url, n.mobile_url,
+               n.first_crawl_time, n.last_crawl_time, n.crawl_count
+        FROM news_items n
+        LEFT JOIN platforms p ON n.platform_id = p.id
+        WHERE n.last_crawl_time = ?
+        ORDER BY n.platform_id, n.id
+    """, (crawl_time,))
+    rows = cursor.fetchall()
+
+    rank_history_map = load_rank_history(cursor, "n.last_crawl_time = ?", (crawl_time,)) if rows else {}
+
+    items: Dict[str, List[NewsItem]] = {}
+    id_to_name: Dict[str, str] = {}
+    for row in rows:
+        platform_id = row[2]
+        platform_name = row[3] or platform_id
+        id_to_name[platform_id] = platform_name
+        items.setdefault(platform_id, []).append(NewsItem(
+            title=row[1],
+            source_id=platform_id,
+            source_name=platform_name,
+            rank=row[4],
+            url=row[5] or "",
+            mobile_url=row[6] or "",
+            crawl_time=row[8],  # last_crawl_time
+            ranks=rank_history_map.get(row[0], [row[4]]),
+            first_time=row[7],  # first_crawl_time
+            last_time=row[8],   # last_crawl_time
+            count=row[9],       # crawl_count
+        ))
+
+    cursor.execute("""
+        SELECT css.platform_id
+        FROM crawl_source_status css
+        JOIN crawl_records cr ON css.crawl_record_id = cr.id
+        WHERE cr.crawl_time = ? AND css.status = 'failed'
+    """, (crawl_time,))
+    failed_ids = [row[0] for row in cursor.fetchall()]
+
+    return NewsData(
+        date=crawl_date,
+        crawl_time=crawl_time,
+        items=items,
+        id_to_name=id_to_name,
+        failed_ids=failed_ids,
+    )
+
+
+def read_aggregation_state(cursor: sqlite3.Cursor, state_key: str) -> Optional[Dict[str, Any]]:
+    """
+    读取汇总状态：元数据与匹配到词组的标题行
+
+    未匹配的标题行只用于计数和冲突检测，不在这里读取。
+
+    Args:
+        cursor: 数据库游标
+        state_key: 配置哈希
+
+    Returns:
+        状态字典（元数据 + "titles": {platform_id: {title: entry}}，同一平台内按位置排序）；
+        不存在或内容损坏时返回 None
+    """
+    cursor.execute(
+        "SELECT payload FROM aggregation_state WHERE state_key = ?",
+        (state_key,),
+    )
+    row = cursor.fetchone()
+    if not row:
+        return None
+    try:
+        state = json.loads(row[0])
+    except (TypeError, ValueError):
+        return None
+    if not isinstance(state, dict):
+        return None
+
+    cursor.execute("""
+        SELECT platform_id, title, group_index, url, mobile_url,
+               first_time, last_time, count, ranks
+        FROM aggregation_titles
+        WHERE state_key = ? AND group_index >= 0
+        ORDER BY platform_id, position
+    """, (state_key,))
+    titles: Dict[str, Dict[str, List[Any]]] = {}
+    try:
+        for row in cursor:
+            titles.setdefault(row[0], {})[row[1]] = [
+                row[2], row[3], row[4] or "", row[5], row[6], row[7], json.loads(row[8] or "[]"),
+            ]
+    except (TypeError, ValueError):
+        return None
+    state["titles"] = titles
+    return state
+
+
+# 按标题/URL 查找状态行时每次查询的参数数（低于旧版 SQLite 的 999 个变量上限）
+_LOOKUP_CHUNK = 500
+
+
+def find_aggregation_titles(
+    cursor: sqlite3.Cursor,
+    state_key: str,
+    lookups: Dict[str, Tuple[Sequence[str], Sequence[str]]],
+) -> Dict[str, List[Tuple[str, int, int, str, int]]]:
+    """
+    查找与某批次条目相关的状态行（同名标题或相同 URL），用于增量合并前的冲突检测
+
+    通过主键 (state_key, platform_id, title) 与 idx_aggregation_titles_url 读取，
+    耗时与批次条目数成正比。
+
+    Args:
+        cursor: 数据库游标
+        state_key: 配置哈希
+        lookups: {platform_id: (标题列表, URL 列表)}
+
+    Returns:
+        {platform_id: [(title, position, group_index, url, row_count), ...]}，同一平台内按位置排序
+    """
+    found: Dict[str, List[Tuple[str, int, int, str, int]]] = {}
+    for platform_id, (titles, urls) in lookups.items():
+        rows: Dict[str, Tuple[str, int, int, str, int]] = {}
+        for column, values in (("title", list(titles)), ("url", [u for u in urls if u])):
+            for start in range(0, len(values), _LOOKUP_CHUNK):
+                chunk = values[start:start + _LOOKUP_CHUNK]
+                cursor.execute(f"""
+                    SELECT title, position, group_index, url, row_count
+                    FROM aggregation_titles
+                    WHERE state_key = ? AND platform_id = ?
+                      AND {column} IN ({','.join('?' for _ in chunk)})
+                """, (state_key, platform_id, *chunk))
+                for row in cursor:
+                    rows[row[0]] = tuple(row)
+        if rows:
+            found[platform_id] = sorted(rows.values(), key=lambda row: row[1])
+    return found
+
+
+def write_aggregation_state(
+    conn: sqlite3.Connection,
+    state_key: str,
+    state: Dict[str, Any],
+    rows: Iterable[Tuple[str, str, int, int, List[Any]]],
+    updated_at: str,
+    replace: bool = False,
+) -> None:
+    """
+    写入汇总状态：元数据整行替换，标题行只 upsert 本次变化的行
+
+    Args:
+        conn: 数据库连接
+        state_key: 配置哈希
+        state: 元数据字典（可 JSON 序列化，不含标题行）
+        rows: 变化的标题行 [(platform_id, title, position, row_count, entry)]，
+              entry 为 [group_index, url, ...]（未匹配标题只有前两项）
+        updated_at: 更新时间
+        replace: 是否整体替换（整天重算时为 True：先删除所有旧状态与标题行）
+    """
+    payload = json.dumps(state, ensure_ascii=False, separators=(",", ":"))
+    cursor = conn.cursor()
+    cursor.execute("BEGIN IMMEDIATE")
+    try:
+        if replace:
+            # 每个日库只保留当前配置的状态
+            cursor.execute("DELETE FROM aggregation_state")
+            cursor.execute("DELETE FROM aggregation_titles")
+        cursor.executemany("""
+            INSERT INTO aggregation_titles (
+                state_key, platform_id, title, position, row_count, group_index, url,
+                mobile_url, first_time, last_time, count, ranks
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(state_key, platform_id, title) DO UPDATE SET
+                position = excluded.position,
+                row_count = excluded.row_count,
+                group_index = excluded.group_index,
+                url = excluded.url,
+                mobile_url = excluded.mobile_url,
+                first_time = excluded.first_time,
+                last_time = excluded.last_time,
+                count = excluded.count,
+                ranks = excluded.ranks
+        """, (
+            (state_key, platform_id, title, position, row_count, *_row_values(entry))
+            for platform_id, title, position, row_count, entry in rows
+        ))
+        cursor.execute("""
+            INSERT INTO aggregation_state (state_key, payload, updated_at)
+            VALUES (?, ?, ?)
+            ON CONFLICT(state_key) DO UPDATE SET
+                payload = excluded.payload,
+                updated_at = excluded.updated_at
+        """, (state_key, payload, updated_at))
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+
+
+def _row_values(entry: List[Any]) -> Tuple[Any, ...]:
+    """entry → (group_index, url, mobile_url, first_time, last_time, count, ranks)"""
+    if entry[0] < 0:
+        return (entry[0], entry[1], None, None, None, None, None)
+    group_index, url, mobile_url, first_time, last_time, count, ranks = entry
+    return (group_index, url, mobile_url, first_time, last_time, count,
+            json.dumps(list(ranks), separators=(",", ":")))
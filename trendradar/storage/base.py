@@ -5,28 +5,132 @@
 定义统一的存储接口，所有存储后端都需要实现这些方法
 """
 
+import sys
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from array import array
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+from typing import IO, TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Any, Set, Tuple, Union
+
+if TYPE_CHECKING:
+    from trendradar.storage.snapshot import DaySnapshot
+
+
+# HTML 报告内容：完整字符串，或按顺序产出片段的可迭代对象（流式写入）
+HtmlContent = Union[str, Iterable[str]]
+
+
+def write_html(file: IO[str], html_content: HtmlContent) -> None:
+    """将 HTML 内容写入文件
+
+    Args:
+        file: 以文本模式打开的文件对象
+        html_content: 完整 HTML 字符串，或按顺序产出片段的可迭代对象
+            （如 iter_html_content 的返回值，边渲染边写入，不在内存中拼出整页）
+    """
+    if isinstance(html_content, str):
+        file.write(html_content)
+    else:
+        file.writelines(html_content)
+
+
+def _pack_ranks(ranks: Optional[Iterable[int]]) -> array:
+    """排名列表压缩存储：常规排名用 unsigned short，超出范围时退回有符号长整型"""
+    if isinstance(ranks, array):
+        return array(ranks.typecode, ranks)
+    values = list(ranks) if ranks else []
+    try:
+        return array("H", values)
+    except OverflowError:
+        return array("l", values)
+
+
+def _intern(value: Any) -> Any:
+    """驻留重复度高的短字符串（平台 ID/名称、抓取时间等），非字符串原样返回"""
+    return sys.intern(value) if type(value) is str else value
 
 
-@dataclass
 class NewsItem:
-    """新闻条目数据模型（热榜数据）"""
-
-    title: str                          # 新闻标题
-    source_id: str                      # 来源平台ID（如 toutiao, baidu）
-    source_name: str = ""               # 来源平台名称（运行时使用，数据库不存储）
-    rank: int = 0                       # 排名
-    url: str = ""                       # 链接 URL
-    mobile_url: str = ""                # 移动端 URL
-    crawl_time: str = ""                # 抓取时间（HH:MM 格式）
+    """
+    新闻条目数据模型（热榜数据）
+
+    使用 __slots__ 节省内存（MCP 服务会常驻多天数据）：
+    - 历史排名以 array('H') 存储，读取 ranks 时才解码为列表（返回副本，修改需整体赋值）
+    - 平台 ID/名称和抓取时间等重复字符串统一驻留
+    构造参数、属性名、相等比较与 to_dict/from_dict 与原 dataclass 一致。
+    """
+
+    __slots__ = (
+        "title",            # 新闻标题
+        "source_id",        # 来源平台ID（如 toutiao, baidu）
+        "source_name",      # 来源平台名称（运行时使用，数据库不存储）
+        "rank",             # 排名
+        "url",              # 链接 URL
+        "mobile_url",       # 移动端 URL
+        "crawl_time",       # 抓取时间（HH:MM 格式）
+        "_ranks",           # 历史排名（压缩存储）
+        "first_time",       # 首次出现时间
+        "last_time",        # 最后出现时间
+        "count",            # 出现次数
+    )
+
+    def __init__(
+        self,
+        title: str,
+        source_id: str,
+        source_name: str = "",
+        rank: int = 0,
+        url: str = "",
+        mobile_url: str = "",
+        crawl_time: str = "",
+        ranks: Optional[Iterable[int]] = None,
+        first_time: str = "",
+        last_time: str = "",
+        count: int = 1,
+    ):
+        self.title = title
+        self.source_id = _intern(source_id)
+        self.source_name = _intern(source_name)
+        self.rank = rank
+        self.url = url
+        self.mobile_url = mobile_url
+        self.crawl_time = _intern(crawl_time)
+        self._ranks = _pack_ranks(ranks)
+        self.first_time = _intern(first_time)
+        self.last_time = _intern(last_time)
+        self.count = count
+
+    @property
+    def ranks(self) -> List[int]:
+        """历史排名列表"""
+        return self._ranks.tolist()
+
+    @ranks.setter
+    def ranks(self, value: Optional[Iterable[int]]) -> None:
+        self._ranks = _pack_ranks(value)
+
+    def _astuple(self) -> tuple:
+        return (
+            self.title, self.source_id, self.source_name, self.rank, self.url,
+            self.mobile_url, self.crawl_time, self._ranks.tolist(),
+            self.first_time, self.last_time, self.count,
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._astuple() == other._astuple()  # type: ignore[attr-defined]
 
-    # 统计信息（用于分析）
-    ranks: List[int] = field(default_factory=list)  # 历史排名列表
-    first_time: str = ""                # 首次出现时间
-    last_time: str = ""                 # 最后出现时间
-    count: int = 1                      # 出现次数
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return (
+            f"NewsItem(title={self.title!r}, source_id={self.source_id!r}, "
+            f"source_name={self.source_name!r}, rank={self.rank!r}, url={self.url!r}, "
+            f"mobile_url={self.mobile_url!r}, crawl_time={self.crawl_time!r}, "
+            f"ranks={self.ranks!r}, first_time={self.first_time!r}, "
+            f"last_time={self.last_time!r}, count={self.count!r})"
+        )
 
     def to_dict(self) -> Dict[str, Any]:
         """转换为字典"""
@@ -62,9 +166,9 @@ class NewsItem:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class RSSItem:
-    """RSS 条目数据模型"""
+    """RSS 条目数据模型（__slots__，源 ID/名称、作者和抓取时间驻留）"""
 
     title: str                          # 标题
     feed_id: str                        # RSS 源 ID（如 "hacker-news"）
@@ -80,6 +184,14 @@ class RSSItem:
     last_time: str = ""                 # 最后抓取时间
     count: int = 1                      # 抓取次数
 
+    def __post_init__(self) -> None:
+        self.feed_id = _intern(self.feed_id)
+        self.feed_name = _intern(self.feed_name)
+        self.author = _intern(self.author)
+        self.crawl_time = _intern(self.crawl_time)
+        self.first_time = _intern(self.first_time)
+        self.last_time = _intern(self.last_time)
+
     def to_dict(self) -> Dict[str, Any]:
         """转换为字典"""
         return {
@@ -290,6 +402,13 @@ class NewsData:
         )
 
 
+@dataclass
+class SyncResult:
+    """deferred_sync 的同步结果（退出上下文后才是最终结果）"""
+    ok: bool = True
+    failed: List[str] = field(default_factory=list)  # 上传失败的远程对象键
+
+
 class StorageBackend(ABC):
     """
     存储后端抽象基类
@@ -340,6 +459,158 @@ class StorageBackend(ABC):
         """
         pass
 
+    def get_today_snapshot(self, date: Optional[str] = None) -> Optional["DaySnapshot"]:
+        """
+        获取指定日期的列式快照（见 snapshot.py）
+
+        默认实现基于 get_today_all_data，SQLite 后端应覆盖为直接读取列式数据。
+
+        Args:
+            date: 日期字符串，默认为今天
+
+        Returns:
+            DaySnapshot；没有数据时返回 None
+        """
+        from trendradar.storage.snapshot import DaySnapshot
+
+        data = self.get_today_all_data(date)
+        if not data or not data.items:
+            return None
+        return DaySnapshot.from_news_data(data)
+
+    def get_historical_titles(
+        self,
+        before_time: str,
+        date: Optional[str] = None,
+        platform_ids: Optional[List[str]] = None,
+    ) -> Optional[Dict[str, Set[str]]]:
+        """
+        获取首次出现时间早于指定批次的标题（用于新增检测）
+
+        默认实现基于 get_today_all_data，SQLite 后端应覆盖为索引查询，
+        避免为构建标题集合而加载整天数据。
+
+        Args:
+            before_time: 批次时间（HH-MM），只返回 first_time < before_time 的标题
+            date: 日期字符串，默认为今天
+            platform_ids: 平台 ID 列表，None 表示所有平台
+
+        Returns:
+            {platform_id: {title}}（只包含非空集合）；当天没有任何数据时返回 None
+        """
+        all_data = self.get_today_all_data(date)
+        if not all_data:
+            return None
+
+        historical_titles: Dict[str, Set[str]] = {}
+        for source_id, news_list in all_data.items.items():
+            if platform_ids is not None and source_id not in platform_ids:
+                continue
+            titles = {
+                item.title for item in news_list
+                if getattr(item, "first_time", item.crawl_time) < before_time
+            }
+            if titles:
+                historical_titles[source_id] = titles
+        return historical_titles
+
+    # === 增量汇总相关方法（默认实现表示不支持，调用方回退到整天读取） ===
+
+    def get_crawl_times(self, date: Optional[str] = None) -> List[str]:
+        """
+        获取指定日期的所有抓取时间列表
+
+        Args:
+            date: 日期字符串，默认为今天
+
+        Returns:
+            抓取时间列表（按时间排序），不支持时返回空列表
+        """
+        return []
+
+    def get_news_by_last_crawl(self, crawl_time: str, date: Optional[str] = None) -> Optional[NewsData]:
+        """
+        获取指定批次更新过的新闻条目（last_crawl_time 等于该批次，含完整排名历史）
+
+        Args:
+            crawl_time: 抓取时间
+            date: 日期字符串，默认为今天
+
+        Returns:
+            新闻数据，不支持或读取失败时返回 None
+        """
+        return None
+
+    @contextmanager
+    def deferred_sync(self) -> Iterator[SyncResult]:
+        """
+        在上下文内合并对远程存储的同步（本地后端无需同步，直接执行）
+
+        远程后端在上下文内只记录需要上传的日库，退出时每个日库上传一次，
+        使同一运行中的多次写入（如热榜数据与汇总状态）共用一次上传。
+        上下文内 save_* 返回 True 只表示已写入本地日库，是否已同步到远程
+        以退出上下文后 SyncResult.ok 为准。
+
+        Yields:
+            SyncResult（退出上下文时填入上传结果）
+        """
+        yield SyncResult()
+
+    def load_aggregation_state(self, state_key: str, date: Optional[str] = None) -> Optional[Dict]:
+        """
+        读取当日增量汇总状态
+
+        Args:
+            state_key: 配置哈希
+            date: 日期字符串，默认为今天
+
+        Returns:
+            状态字典，不存在或不支持时返回 None
+        """
+        return None
+
+    def find_aggregation_titles(
+        self,
+        state_key: str,
+        lookups: Dict[str, Tuple[List[str], List[str]]],
+        date: Optional[str] = None,
+    ) -> Optional[Dict[str, List[Tuple[str, int, int, str, int]]]]:
+        """
+        查找汇总状态中与指定标题或 URL 相关的行（增量合并前的冲突检测）
+
+        Args:
+            state_key: 配置哈希
+            lookups: {platform_id: (标题列表, URL 列表)}
+            date: 日期字符串，默认为今天
+
+        Returns:
+            {platform_id: [(title, position, group_index, url, row_count)]}，不支持或读取失败时返回 None
+        """
+        return None
+
+    def save_aggregation_state(
+        self,
+        state_key: str,
+        state: Dict,
+        rows: List[Tuple[str, str, int, int, List]],
+        replace: bool = False,
+        date: Optional[str] = None,
+    ) -> bool:
+        """
+        保存当日增量汇总状态
+
+        Args:
+            state_key: 配置哈希
+            state: 元数据字典
+            rows: 变化的标题行 [(platform_id, title, position, row_count, entry)]
+            replace: 是否整体替换已有状态（整天重算）
+            date: 日期字符串，默认为今天
+
+        Returns:
+            是否保存成功
+        """
+        return False
+
     @abstractmethod
     def detect_new_titles(self, current_data: NewsData) -> Dict[str, Dict]:
         """
@@ -367,12 +638,12 @@ class StorageBackend(ABC):
         pass
 
     @abstractmethod
-    def save_html_report(self, html_content: str, filename: str, is_summary: bool = False) -> Optional[str]:
+    def save_html_report(self, html_content: HtmlContent, filename: str, is_summary: bool = False) -> Optional[str]:
         """
         保存 HTML 报告
 
         Args:
-            html_content: HTML 内容
+            html_content: HTML 字符串，或按顺序产出片段的可迭代对象（边渲染边写入）
             filename: 文件名
             is_summary: 是否为汇总报告
 
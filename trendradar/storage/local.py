@@ -11,15 +11,29 @@ import pytz
 import re
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional
-
-from trendradar.storage.base import StorageBackend, NewsItem, NewsData, RSSItem, RSSData
+from typing import Dict, List, Optional, Set, Tuple
+
+from trendradar.storage.base import StorageBackend, NewsItem, NewsData, RSSItem, RSSData, HtmlContent
+from trendradar.storage.aggregation_state import (
+    find_aggregation_titles,
+    load_news_by_last_crawl,
+    read_aggregation_state,
+    read_crawl_times,
+    write_aggregation_state,
+)
+from trendradar.storage.manifest import MANIFEST_FILENAME, ContentManifest, write_html_if_changed
+from trendradar.storage.migrations import is_fresh_database, migrate, stamp_latest
+from trendradar.storage.rank_history import load_rank_history
+from trendradar.storage.search_index import SEARCH_INDEX_FILENAME, SearchIndex
+from trendradar.storage.snapshot import DaySnapshot, load_day_snapshot
+from trendradar.storage.sqlite_profile import SQLiteProfile, db_signature
+from trendradar.storage.sqlite_writer import SQLiteBatchWriter
+from trendradar.storage.title_history import load_historical_titles
 from trendradar.utils.time import (
     get_configured_time,
     format_date_folder,
     format_time_filename,
 )
-from trendradar.utils.url import normalize_url
 
 
 class LocalStorageBackend(StorageBackend):
@@ -38,6 +52,7 @@ class LocalStorageBackend(StorageBackend):
         enable_txt: bool = True,
         enable_html: bool = True,
         timezone: str = "Asia/Shanghai",
+        sqlite_profile: Optional[SQLiteProfile] = None,
     ):
         """
         初始化本地存储后端
@@ -47,12 +62,16 @@ class LocalStorageBackend(StorageBackend):
             enable_txt: 是否启用 TXT 快照
             enable_html: 是否启用 HTML 报告
             timezone: 时区配置（默认 Asia/Shanghai）
+            sqlite_profile: SQLite 连接参数（默认 WAL + NORMAL）
         """
         self.data_dir = Path(data_dir)
         self.enable_txt = enable_txt
         self.enable_html = enable_html
         self.timezone = timezone
+        self.sqlite_profile = sqlite_profile or SQLiteProfile()
         self._db_connections: Dict[str, sqlite3.Connection] = {}
+        self._writer = SQLiteBatchWriter("[本地存储]")
+        self._search_index: Optional[SearchIndex] = None
 
     @property
     def backend_name(self) -> str:
@@ -108,7 +127,7 @@ class LocalStorageBackend(StorageBackend):
         db_path = str(self._get_db_path(date, db_type))
 
         if db_path not in self._db_connections:
-            conn = sqlite3.connect(db_path)
+            conn = self.sqlite_profile.connect(db_path)
             conn.row_factory = sqlite3.Row
             self._init_tables(conn, db_type)
             self._db_connections[db_path] = conn
@@ -131,7 +150,7 @@ class LocalStorageBackend(StorageBackend):
 
     def _init_tables(self, conn: sqlite3.Connection, db_type: str = "news") -> None:
         """
-        从 schema.sql 初始化数据库表结构
+        从 schema.sql 初始化数据库表结构，并执行版本迁移
 
         Args:
             conn: 数据库连接
@@ -142,12 +161,23 @@ class LocalStorageBackend(StorageBackend):
         if schema_path.exists():
             with open(schema_path, "r", encoding="utf-8") as f:
                 schema_sql = f.read()
+            fresh = is_fresh_database(conn)
             conn.executescript(schema_sql)
         else:
             raise FileNotFoundError(f"Schema file not found: {schema_path}")
 
         conn.commit()
 
+        # 新库由 schema 文件直接建出最新结构；已有日库执行未应用的迁移
+        if fresh:
+            stamp_latest(conn, db_type)
+        else:
+            try:
+                migrate(conn, db_type)
+            except sqlite3.Error as e:
+                # 迁移失败不影响读写（旧结构仍可用），下次打开时重试
+                print(f"[本地存储] 数据库迁移失败: {e}")
+
     def save_news_data(self, data: NewsData) -> bool:
         """
         保存新闻数据到 SQLite（以 URL 为唯一标识，支持标题更新检测）
@@ -160,159 +190,14 @@ class LocalStorageBackend(StorageBackend):
         """
         try:
             conn = self._get_connection(data.date)
-            cursor = conn.cursor()
 
             # 获取配置时区的当前时间
             now_str = self._get_configured_time().strftime("%Y-%m-%d %H:%M:%S")
 
-            # 首先同步平台信息到 platforms 表
-            for source_id, source_name in data.id_to_name.items():
-                cursor.execute("""
-                    INSERT INTO platforms (id, name, updated_at)
-                    VALUES (?, ?, ?)
-                    ON CONFLICT(id) DO UPDATE SET
-                        name = excluded.name,
-                        updated_at = excluded.updated_at
-                """, (source_id, source_name, now_str))
-
-            # 统计计数器
-            new_count = 0
-            updated_count = 0
-            title_changed_count = 0
-            success_sources = []
-
-            for source_id, news_list in data.items.items():
-                success_sources.append(source_id)
-
-                for item in news_list:
-                    try:
-                        # 标准化 URL（去除动态参数，如微博的 band_rank）
-                        normalized_url = normalize_url(item.url, source_id) if item.url else ""
-
-                        # 检查是否已存在（通过标准化 URL + platform_id）
-                        if normalized_url:
-                            cursor.execute("""
-                                SELECT id, title FROM news_items
-                                WHERE url = ? AND platform_id = ?
-                            """, (normalized_url, source_id))
-                            existing = cursor.fetchone()
-
-                            if existing:
-                                # 已存在，更新记录
-                                existing_id, existing_title = existing
-
-                                # 检查标题是否变化
-                                if existing_title != item.title:
-                                    # 记录标题变更
-                                    cursor.execute("""
-                                        INSERT INTO title_changes
-                                        (news_item_id, old_title, new_title, changed_at)
-                                        VALUES (?, ?, ?, ?)
-                                    """, (existing_id, existing_title, item.title, now_str))
-                                    title_changed_count += 1
-
-                                # 记录排名历史
-                                cursor.execute("""
-                                    INSERT INTO rank_history
-                                    (news_item_id, rank, crawl_time, created_at)
-                                    VALUES (?, ?, ?, ?)
-                                """, (existing_id, item.rank, data.crawl_time, now_str))
-
-                                # 更新现有记录
-                                cursor.execute("""
-                                    UPDATE news_items SET
-                                        title = ?,
-                                        rank = ?,
-                                        mobile_url = ?,
-                                        last_crawl_time = ?,
-                                        crawl_count = crawl_count + 1,
-                                        updated_at = ?
-                                    WHERE id = ?
-                                """, (item.title, item.rank, item.mobile_url,
-                                      data.crawl_time, now_str, existing_id))
-                                updated_count += 1
-                            else:
-                                # 不存在，插入新记录（存储标准化后的 URL）
-                                cursor.execute("""
-                                    INSERT INTO news_items
-                                    (title, platform_id, rank, url, mobile_url,
-                                     first_crawl_time, last_crawl_time, crawl_count,
-                                     created_at, updated_at)
-                                    VALUES (?, ?, ?, ?, ?, ?, ?, 1, ?, ?)
-                                """, (item.title, source_id, item.rank, normalized_url,
-                                      item.mobile_url, data.crawl_time, data.crawl_time,
-                                      now_str, now_str))
-                                new_id = cursor.lastrowid
-                                # 记录初始排名
-                                cursor.execute("""
-                                    INSERT INTO rank_history
-                                    (news_item_id, rank, crawl_time, created_at)
-                                    VALUES (?, ?, ?, ?)
-                                """, (new_id, item.rank, data.crawl_time, now_str))
-                                new_count += 1
-                        else:
-                            # URL 为空的情况，直接插入（不做去重）
-                            cursor.execute("""
-                                INSERT INTO news_items
-                                (title, platform_id, rank, url, mobile_url,
-                                 first_crawl_time, last_crawl_time, crawl_count,
-                                 created_at, updated_at)
-                                VALUES (?, ?, ?, ?, ?, ?, ?, 1, ?, ?)
-                            """, (item.title, source_id, item.rank, "",
-                                  item.mobile_url, data.crawl_time, data.crawl_time,
-                                  now_str, now_str))
-                            new_id = cursor.lastrowid
-                            # 记录初始排名
-                            cursor.execute("""
-                                INSERT INTO rank_history
-                                (news_item_id, rank, crawl_time, created_at)
-                                VALUES (?, ?, ?, ?)
-                            """, (new_id, item.rank, data.crawl_time, now_str))
-                            new_count += 1
-
-                    except sqlite3.Error as e:
-                        print(f"保存新闻条目失败 [{item.title[:30]}...]: {e}")
-
-            total_items = new_count + updated_count
-
-            # 记录抓取信息
-            cursor.execute("""
-                INSERT OR REPLACE INTO crawl_records
-                (crawl_time, total_items, created_at)
-                VALUES (?, ?, ?)
-            """, (data.crawl_time, total_items, now_str))
-
-            # 获取刚插入的 crawl_record 的 ID
-            cursor.execute("""
-                SELECT id FROM crawl_records WHERE crawl_time = ?
-            """, (data.crawl_time,))
-            record_row = cursor.fetchone()
-            if record_row:
-                crawl_record_id = record_row[0]
-
-                # 记录成功的来源
-                for source_id in success_sources:
-                    cursor.execute("""
-                        INSERT OR REPLACE INTO crawl_source_status
-                        (crawl_record_id, platform_id, status)
-                        VALUES (?, ?, 'success')
-                    """, (crawl_record_id, source_id))
-
-                # 记录失败的来源
-                for failed_id in data.failed_ids:
-                    # 确保失败的平台也在 platforms 表中
-                    cursor.execute("""
-                        INSERT OR IGNORE INTO platforms (id, name, updated_at)
-                        VALUES (?, ?, ?)
-                    """, (failed_id, failed_id, now_str))
-
-                    cursor.execute("""
-                        INSERT OR REPLACE INTO crawl_source_status
-                        (crawl_record_id, platform_id, status)
-                        VALUES (?, ?, 'failed')
-                    """, (crawl_record_id, failed_id))
-
-            conn.commit()
+            # 单事务批量写入（失败时整体回滚）
+            new_count, updated_count, title_changed_count = self._writer.save_news(
+                conn, data, now_str
+            )
 
             # 输出详细的存储统计日志
             log_parts = [f"[本地存储] 处理完成：新增 {new_count} 条"]
@@ -322,12 +207,35 @@ class LocalStorageBackend(StorageBackend):
                 log_parts.append(f"标题变更 {title_changed_count} 条")
             print("，".join(log_parts))
 
+            self._update_search_index(data.date, data.crawl_time, conn)
+
             return True
 
         except Exception as e:
             print(f"[本地存储] 保存失败: {e}")
             return False
 
+    def _get_search_index(self) -> SearchIndex:
+        """获取跨日期标题检索索引（output/news/search_index.db）"""
+        if self._search_index is None:
+            self._search_index = SearchIndex(
+                self.data_dir / "news" / SEARCH_INDEX_FILENAME, self.sqlite_profile
+            )
+        return self._search_index
+
+    def _update_search_index(self, date: Optional[str], crawl_time: str, conn: sqlite3.Connection) -> None:
+        """
+        保存后只把本批次新增/更新的行同步到当天的检索索引
+
+        索引只是派生数据，失败时仅打印警告，读取方查询前会按日库状态补齐。
+        """
+        try:
+            state = db_signature(self._get_db_path(date))
+            if state is not None:
+                self._get_search_index().index_crawl(self._format_date_folder(date), conn, crawl_time, state)
+        except Exception as e:
+            print(f"[本地存储] 更新检索索引失败: {e}")
+
     def get_today_all_data(self, date: Optional[str] = None) -> Optional[NewsData]:
         """
         获取指定日期的所有新闻数据（合并后）
@@ -353,31 +261,15 @@ class LocalStorageBackend(StorageBackend):
                        n.first_crawl_time, n.last_crawl_time, n.crawl_count
                 FROM news_items n
                 LEFT JOIN platforms p ON n.platform_id = p.id
-                ORDER BY n.platform_id, n.last_crawl_time
+                ORDER BY n.platform_id, n.last_crawl_time, n.id
             """)
 
             rows = cursor.fetchall()
             if not rows:
                 return None
 
-            # 收集所有 news_item_id
-            news_ids = [row[0] for row in rows]
-
-            # 批量查询排名历史
-            rank_history_map: Dict[int, List[int]] = {}
-            if news_ids:
-                placeholders = ",".join("?" * len(news_ids))
-                cursor.execute(f"""
-                    SELECT news_item_id, rank FROM rank_history
-                    WHERE news_item_id IN ({placeholders})
-                    ORDER BY news_item_id, crawl_time
-                """, news_ids)
-                for rh_row in cursor.fetchall():
-                    news_id, rank = rh_row[0], rh_row[1]
-                    if news_id not in rank_history_map:
-                        rank_history_map[news_id] = []
-                    if rank not in rank_history_map[news_id]:
-                        rank_history_map[news_id].append(rank)
+            # 流式加载排名历史（按复合索引顺序读取，无 IN 列表）
+            rank_history_map = load_rank_history(cursor)
 
             # 按 platform_id 分组
             items: Dict[str, List[NewsItem]] = {}
@@ -445,6 +337,20 @@ class LocalStorageBackend(StorageBackend):
             print(f"[本地存储] 读取数据失败: {e}")
             return None
 
+    def get_today_snapshot(self, date: Optional[str] = None) -> Optional[DaySnapshot]:
+        """获取指定日期的列式快照（直接从 SQLite 读取，不经过 NewsItem）"""
+        try:
+            db_path = self._get_db_path(date)
+            if not db_path.exists():
+                return None
+
+            conn = self._get_connection(date)
+            return load_day_snapshot(conn.cursor(), self._format_date_folder(date))
+
+        except Exception as e:
+            print(f"[本地存储] 读取快照失败: {e}")
+            return None
+
     def get_latest_crawl_data(self, date: Optional[str] = None) -> Optional[NewsData]:
         """
         获取最新一次抓取的数据
@@ -490,24 +396,10 @@ class LocalStorageBackend(StorageBackend):
             if not rows:
                 return None
 
-            # 收集所有 news_item_id
-            news_ids = [row[0] for row in rows]
-
-            # 批量查询排名历史
-            rank_history_map: Dict[int, List[int]] = {}
-            if news_ids:
-                placeholders = ",".join("?" * len(news_ids))
-                cursor.execute(f"""
-                    SELECT news_item_id, rank FROM rank_history
-                    WHERE news_item_id IN ({placeholders})
-                    ORDER BY news_item_id, crawl_time
-                """, news_ids)
-                for rh_row in cursor.fetchall():
-                    news_id, rank = rh_row[0], rh_row[1]
-                    if news_id not in rank_history_map:
-                        rank_history_map[news_id] = []
-                    if rank not in rank_history_map[news_id]:
-                        rank_history_map[news_id].append(rank)
+            # 只加载最新批次条目的排名历史
+            rank_history_map = load_rank_history(
+                cursor, "n.last_crawl_time = ?", (latest_time,)
+            )
 
             items: Dict[str, List[NewsItem]] = {}
             id_to_name: Dict[str, str] = {}
@@ -575,32 +467,20 @@ class LocalStorageBackend(StorageBackend):
             新增的标题数据 {source_id: {title: NewsItem}}
         """
         try:
-            # 获取历史数据
-            historical_data = self.get_today_all_data(current_data.date)
+            current_time = current_data.crawl_time
 
-            if not historical_data:
+            # 收集历史标题（first_time < current_time 的标题）
+            # 这样可以正确处理同一标题因 URL 变化而产生多条记录的情况
+            historical_titles = self.get_historical_titles(current_time, current_data.date)
+
+            if historical_titles is None:
                 # 没有历史数据，所有都是新的
                 new_titles = {}
                 for source_id, news_list in current_data.items.items():
                     new_titles[source_id] = {item.title: item for item in news_list}
                 return new_titles
 
-            # 获取当前批次时间
-            current_time = current_data.crawl_time
-
-            # 收集历史标题（first_time < current_time 的标题）
-            # 这样可以正确处理同一标题因 URL 变化而产生多条记录的情况
-            historical_titles: Dict[str, set] = {}
-            for source_id, news_list in historical_data.items.items():
-                historical_titles[source_id] = set()
-                for item in news_list:
-                    first_time = getattr(item, 'first_time', item.crawl_time)
-                    if first_time < current_time:
-                        historical_titles[source_id].add(item.title)
-
-            # 检查是否有历史数据
-            has_historical_data = any(len(titles) > 0 for titles in historical_titles.values())
-            if not has_historical_data:
+            if not historical_titles:
                 # 第一次抓取，没有"新增"概念
                 return {}
 
@@ -620,6 +500,32 @@ class LocalStorageBackend(StorageBackend):
             print(f"[本地存储] 检测新标题失败: {e}")
             return {}
 
+    def get_historical_titles(
+        self,
+        before_time: str,
+        date: Optional[str] = None,
+        platform_ids: Optional[List[str]] = None,
+    ) -> Optional[Dict[str, Set[str]]]:
+        """
+        获取首次出现时间早于指定批次的标题
+
+        只查询 (platform_id, title)，由 idx_news_platform_first_time 覆盖索引支撑，
+        不加载整天数据与排名历史。
+
+        Args:
+            before_time: 批次时间（HH-MM），只返回 first_crawl_time < before_time 的标题
+            date: 日期字符串，默认为今天
+            platform_ids: 平台 ID 列表，None 表示所有平台
+
+        Returns:
+            {platform_id: {title}}（只包含非空集合）；当天没有任何数据时返回 None
+        """
+        if not self._get_db_path(date).exists():
+            return None
+
+        conn = self._get_connection(date)
+        return load_historical_titles(conn.cursor(), before_time, platform_ids)
+
     def save_txt_snapshot(self, data: NewsData) -> Optional[str]:
         """
         保存 TXT 快照
@@ -678,14 +584,15 @@ class LocalStorageBackend(StorageBackend):
             print(f"[本地存储] 保存 TXT 快照失败: {e}")
             return None
 
-    def save_html_report(self, html_content: str, filename: str, is_summary: bool = False) -> Optional[str]:
+    def save_html_report(self, html_content: HtmlContent, filename: str, is_summary: bool = False) -> Optional[str]:
         """
         保存 HTML 报告
 
         新结构：output/html/{date}/{filename}
+        内容与当日清单（.manifest.json）记录一致时保留原文件
 
         Args:
-            html_content: HTML 内容
+            html_content: HTML 字符串，或按顺序产出片段的可迭代对象（流式写入）
             filename: 文件名
             is_summary: 是否为汇总报告
 
@@ -701,11 +608,12 @@ class LocalStorageBackend(StorageBackend):
             html_dir.mkdir(parents=True, exist_ok=True)
 
             file_path = html_dir / filename
+            manifest = ContentManifest(html_dir / MANIFEST_FILENAME)
 
-            with open(file_path, "w", encoding="utf-8") as f:
-                f.write(html_content)
-
-            print(f"[本地存储] HTML 报告已保存: {file_path}")
+            if write_html_if_changed(file_path, html_content, manifest):
+                print(f"[本地存储] HTML 报告已保存: {file_path}")
+            else:
+                print(f"[本地存储] HTML 报告内容未变化，跳过写入: {file_path}")
             return str(file_path)
 
         except Exception as e:
@@ -760,20 +668,118 @@ class LocalStorageBackend(StorageBackend):
                 return []
 
             conn = self._get_connection(date)
-            cursor = conn.cursor()
-
-            cursor.execute("""
-                SELECT crawl_time FROM crawl_records
-                ORDER BY crawl_time
-            """)
-
-            rows = cursor.fetchall()
-            return [row[0] for row in rows]
+            return read_crawl_times(conn.cursor())
 
         except Exception as e:
             print(f"[本地存储] 获取抓取时间列表失败: {e}")
             return []
 
+    def get_news_by_last_crawl(self, crawl_time: str, date: Optional[str] = None) -> Optional[NewsData]:
+        """
+        获取指定批次更新过的新闻条目（用于增量汇总）
+
+        Args:
+            crawl_time: 抓取时间
+            date: 日期字符串，默认为今天
+
+        Returns:
+            新闻数据（含完整排名历史），读取失败时返回 None
+        """
+        try:
+            db_path = self._get_db_path(date)
+            if not db_path.exists():
+                return None
+
+            conn = self._get_connection(date)
+            return load_news_by_last_crawl(conn.cursor(), crawl_time, self._format_date_folder(date))
+
+        except Exception as e:
+            print(f"[本地存储] 读取批次数据失败: {e}")
+            return None
+
+    def load_aggregation_state(self, state_key: str, date: Optional[str] = None) -> Optional[Dict]:
+        """
+        读取当日增量汇总状态
+
+        Args:
+            state_key: 配置哈希
+            date: 日期字符串，默认为今天
+
+        Returns:
+            状态字典，不存在时返回 None
+        """
+        try:
+            db_path = self._get_db_path(date)
+            if not db_path.exists():
+                return None
+
+            conn = self._get_connection(date)
+            return read_aggregation_state(conn.cursor(), state_key)
+
+        except Exception as e:
+            print(f"[本地存储] 读取汇总状态失败: {e}")
+            return None
+
+    def find_aggregation_titles(
+        self,
+        state_key: str,
+        lookups: Dict[str, Tuple[List[str], List[str]]],
+        date: Optional[str] = None,
+    ) -> Optional[Dict[str, List[Tuple[str, int, int, str, int]]]]:
+        """
+        查找汇总状态中与指定标题或 URL 相关的行
+
+        Args:
+            state_key: 配置哈希
+            lookups: {platform_id: (标题列表, URL 列表)}
+            date: 日期字符串，默认为今天
+
+        Returns:
+            {platform_id: [(title, position, group_index, url, row_count)]}，读取失败时返回 None
+        """
+        try:
+            db_path = self._get_db_path(date)
+            if not db_path.exists():
+                return None
+
+            conn = self._get_connection(date)
+            return find_aggregation_titles(conn.cursor(), state_key, lookups)
+
+        except Exception as e:
+            print(f"[本地存储] 读取汇总状态失败: {e}")
+            return None
+
+    def save_aggregation_state(
+        self,
+        state_key: str,
+        state: Dict,
+        rows: List[Tuple[str, str, int, int, List]],
+        replace: bool = False,
+        date: Optional[str] = None,
+    ) -> bool:
+        """
+        保存当日增量汇总状态
+
+        Args:
+            state_key: 配置哈希
+            state: 元数据字典
+            rows: 变化的标题行 [(platform_id, title, position, row_count, entry)]
+            replace: 是否整体替换已有状态（整天重算）
+            date: 日期字符串，默认为今天
+
+        Returns:
+            是否保存成功
+        """
+        try:
+            conn = self._get_connection(date)
+            now_str = self._get_configured_time().strftime("%Y-%m-%d %H:%M:%S")
+            write_aggregation_state(conn, state_key, state, rows, now_str, replace)
+            return True
+
+        except Exception as e:
+            print(f"[本地存储] 保存汇总状态失败: {e}")
+            return False
+
     def cleanup(self) -> None:
         """清理资源（关闭数据库连接）"""
         for db_path, conn in self._db_connections.items():
@@ -785,6 +791,10 @@ class LocalStorageBackend(StorageBackend):
 
         self._db_connections.clear()
 
+        if self._search_index is not None:
+            self._search_index.close()
+            self._search_index = None
+
     def cleanup_old_data(self, retention_days: int) -> int:
         """
         清理过期数据
@@ -856,11 +866,15 @@ class LocalStorageBackend(StorageBackend):
                             except Exception:
                                 pass
 
-                        # 删除文件
+                        # 删除文件（连同 WAL 模式下的 -wal / -shm 文件）
                         try:
                             db_file.unlink()
+                            for suffix in ("-wal", "-shm"):
+                                Path(f"{db_path}{suffix}").unlink(missing_ok=True)
                             deleted_count += 1
                             print(f"[本地存储] 清理过期数据: {db_type}/{db_file.name}")
+                            if db_type == "news" and (db_dir / SEARCH_INDEX_FILENAME).exists():
+                                self._get_search_index().remove_day(db_file.stem)
                         except Exception as e:
                             print(f"[本地存储] 删除文件失败 {db_file}: {e}")
 
@@ -973,118 +987,11 @@ class LocalStorageBackend(StorageBackend):
         """
         try:
             conn = self._get_connection(data.date, db_type="rss")
-            cursor = conn.cursor()
 
             now_str = self._get_configured_time().strftime("%Y-%m-%d %H:%M:%S")
 
-            # 同步 RSS 源信息到 rss_feeds 表
-            for feed_id, feed_name in data.id_to_name.items():
-                cursor.execute("""
-                    INSERT INTO rss_feeds (id, name, updated_at)
-                    VALUES (?, ?, ?)
-                    ON CONFLICT(id) DO UPDATE SET
-                        name = excluded.name,
-                        updated_at = excluded.updated_at
-                """, (feed_id, feed_name, now_str))
-
-            # 统计计数器
-            new_count = 0
-            updated_count = 0
-
-            for feed_id, rss_list in data.items.items():
-                for item in rss_list:
-                    try:
-                        # 检查是否已存在（通过 URL + feed_id）
-                        if item.url:
-                            cursor.execute("""
-                                SELECT id, title FROM rss_items
-                                WHERE url = ? AND feed_id = ?
-                            """, (item.url, feed_id))
-                            existing = cursor.fetchone()
-
-                            if existing:
-                                # 已存在，更新记录
-                                existing_id = existing[0]
-                                cursor.execute("""
-                                    UPDATE rss_items SET
-                                        title = ?,
-                                        published_at = ?,
-                                        summary = ?,
-                                        author = ?,
-                                        last_crawl_time = ?,
-                                        crawl_count = crawl_count + 1,
-                                        updated_at = ?
-                                    WHERE id = ?
-                                """, (item.title, item.published_at, item.summary,
-                                      item.author, data.crawl_time, now_str, existing_id))
-                                updated_count += 1
-                            else:
-                                # 不存在，插入新记录
-                                cursor.execute("""
-                                    INSERT INTO rss_items
-                                    (title, feed_id, url, published_at, summary, author,
-                                     first_crawl_time, last_crawl_time, crawl_count,
-                                     created_at, updated_at)
-                                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, 1, ?, ?)
-                                """, (item.title, feed_id, item.url, item.published_at,
-                                      item.summary, item.author, data.crawl_time,
-                                      data.crawl_time, now_str, now_str))
-                                new_count += 1
-                        else:
-                            # URL 为空，直接插入
-                            cursor.execute("""
-                                INSERT INTO rss_items
-                                (title, feed_id, url, published_at, summary, author,
-                                 first_crawl_time, last_crawl_time, crawl_count,
-                                 created_at, updated_at)
-                                VALUES (?, ?, ?, ?, ?, ?, ?, ?, 1, ?, ?)
-                            """, (item.title, feed_id, "", item.published_at,
-                                  item.summary, item.author, data.crawl_time,
-                                  data.crawl_time, now_str, now_str))
-                            new_count += 1
-
-                    except sqlite3.Error as e:
-                        print(f"[本地存储] 保存 RSS 条目失败 [{item.title[:30]}...]: {e}")
-
-            total_items = new_count + updated_count
-
-            # 记录抓取信息
-            cursor.execute("""
-                INSERT OR REPLACE INTO rss_crawl_records
-                (crawl_time, total_items, created_at)
-                VALUES (?, ?, ?)
-            """, (data.crawl_time, total_items, now_str))
-
-            # 记录抓取状态
-            cursor.execute("""
-                SELECT id FROM rss_crawl_records WHERE crawl_time = ?
-            """, (data.crawl_time,))
-            record_row = cursor.fetchone()
-            if record_row:
-                crawl_record_id = record_row[0]
-
-                # 记录成功的源
-                for feed_id in data.items.keys():
-                    cursor.execute("""
-                        INSERT OR REPLACE INTO rss_crawl_status
-                        (crawl_record_id, feed_id, status)
-                        VALUES (?, ?, 'success')
-                    """, (crawl_record_id, feed_id))
-
-                # 记录失败的源
-                for failed_id in data.failed_ids:
-                    cursor.execute("""
-                        INSERT OR IGNORE INTO rss_feeds (id, name, updated_at)
-                        VALUES (?, ?, ?)
-                    """, (failed_id, failed_id, now_str))
-
-                    cursor.execute("""
-                        INSERT OR REPLACE INTO rss_crawl_status
-                        (crawl_record_id, feed_id, status)
-                        VALUES (?, ?, 'failed')
-                    """, (crawl_record_id, failed_id))
-
-            conn.commit()
+            # 单事务批量写入（失败时整体回滚）
+            new_count, updated_count = self._writer.save_rss(conn, data, now_str)
 
             # 输出统计日志
             log_parts = [f"[本地存储] RSS 处理完成：新增 {new_count} 条"]
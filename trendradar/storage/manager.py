@@ -6,9 +6,11 @@
 """
 
 import os
-from typing import Optional
+from typing import ContextManager, Dict, List, Optional, Set, Tuple
 
-from trendradar.storage.base import StorageBackend, NewsData, RSSData
+from trendradar.storage.base import StorageBackend, NewsData, RSSData, HtmlContent, SyncResult
+from trendradar.storage.snapshot import DaySnapshot
+from trendradar.storage.sqlite_profile import SQLiteProfile
 
 
 # 存储管理器单例
@@ -38,6 +40,7 @@ class StorageManager:
         pull_enabled: bool = False,
         pull_days: int = 0,
         timezone: str = "Asia/Shanghai",
+        sqlite_config: Optional[dict] = None,
     ):
         """
         初始化存储管理器
@@ -53,6 +56,7 @@ class StorageManager:
             pull_enabled: 是否启用启动时自动拉取
             pull_days: 拉取最近 N 天的数据
             timezone: 时区配置（默认 Asia/Shanghai）
+            sqlite_config: SQLite 连接参数配置（journal_mode, synchronous 等）
         """
         self.backend_type = backend_type
         self.data_dir = data_dir
@@ -64,6 +68,7 @@ class StorageManager:
         self.pull_enabled = pull_enabled
         self.pull_days = pull_days
         self.timezone = timezone
+        self.sqlite_profile = SQLiteProfile.from_config(sqlite_config)
 
         self._backend: Optional[StorageBackend] = None
         self._remote_backend: Optional[StorageBackend] = None
@@ -137,6 +142,7 @@ class StorageManager:
                 enable_txt=self.enable_txt,
                 enable_html=self.enable_html,
                 timezone=self.timezone,
+                sqlite_profile=self.sqlite_profile,
             )
         except ImportError as e:
             print(f"[存储管理器] 远程后端导入失败: {e}")
@@ -167,6 +173,7 @@ class StorageManager:
                     enable_txt=self.enable_txt,
                     enable_html=self.enable_html,
                     timezone=self.timezone,
+                    sqlite_profile=self.sqlite_profile,
                 )
                 print(f"[存储管理器] 使用本地存储后端 (数据目录: {self.data_dir})")
 
@@ -221,6 +228,10 @@ class StorageManager:
         """获取当天所有数据"""
         return self.get_backend().get_today_all_data(date)
 
+    def get_today_snapshot(self, date: Optional[str] = None) -> Optional[DaySnapshot]:
+        """获取当天数据的列式快照"""
+        return self.get_backend().get_today_snapshot(date)
+
     def get_latest_crawl_data(self, date: Optional[str] = None) -> Optional[NewsData]:
         """获取最新抓取数据"""
         return self.get_backend().get_latest_crawl_data(date)
@@ -229,11 +240,56 @@ class StorageManager:
         """检测新增标题"""
         return self.get_backend().detect_new_titles(current_data)
 
+    def get_historical_titles(
+        self,
+        before_time: str,
+        date: Optional[str] = None,
+        platform_ids: Optional[List[str]] = None,
+    ) -> Optional[Dict[str, Set[str]]]:
+        """获取首次出现时间早于指定批次的标题（用于新增检测）"""
+        return self.get_backend().get_historical_titles(before_time, date, platform_ids)
+
+    def get_crawl_times(self, date: Optional[str] = None) -> List[str]:
+        """获取当天所有抓取时间"""
+        return self.get_backend().get_crawl_times(date)
+
+    def get_news_by_last_crawl(self, crawl_time: str, date: Optional[str] = None) -> Optional[NewsData]:
+        """获取指定批次更新过的新闻条目"""
+        return self.get_backend().get_news_by_last_crawl(crawl_time, date)
+
+    def deferred_sync(self) -> ContextManager[SyncResult]:
+        """在上下文内合并远程同步（退出时每个日库上传一次，结果见 SyncResult.ok）"""
+        return self.get_backend().deferred_sync()
+
+    def load_aggregation_state(self, state_key: str, date: Optional[str] = None) -> Optional[Dict]:
+        """读取当日增量汇总状态"""
+        return self.get_backend().load_aggregation_state(state_key, date)
+
+    def find_aggregation_titles(
+        self,
+        state_key: str,
+        lookups: Dict[str, Tuple[List[str], List[str]]],
+        date: Optional[str] = None,
+    ) -> Optional[Dict[str, List[Tuple[str, int, int, str, int]]]]:
+        """查找汇总状态中与指定标题或 URL 相关的行"""
+        return self.get_backend().find_aggregation_titles(state_key, lookups, date)
+
+    def save_aggregation_state(
+        self,
+        state_key: str,
+        state: Dict,
+        rows: List[Tuple[str, str, int, int, List]],
+        replace: bool = False,
+        date: Optional[str] = None,
+    ) -> bool:
+        """保存当日增量汇总状态"""
+        return self.get_backend().save_aggregation_state(state_key, state, rows, replace, date)
+
     def save_txt_snapshot(self, data: NewsData) -> Optional[str]:
         """保存 TXT 快照"""
         return self.get_backend().save_txt_snapshot(data)
 
-    def save_html_report(self, html_content: str, filename: str, is_summary: bool = False) -> Optional[str]:
+    def save_html_report(self, html_content: HtmlContent, filename: str, is_summary: bool = False) -> Optional[str]:
         """保存 HTML 报告"""
         return self.get_backend().save_html_report(html_content, filename, is_summary)
 
@@ -319,6 +375,7 @@ def get_storage_manager(
     pull_enabled: bool = False,
     pull_days: int = 0,
     timezone: str = "Asia/Shanghai",
+    sqlite_config: Optional[dict] = None,
     force_new: bool = False,
 ) -> StorageManager:
     """
@@ -335,6 +392,7 @@ def get_storage_manager(
         pull_enabled: 是否启用启动时自动拉取
         pull_days: 拉取最近 N 天的数据
         timezone: 时区配置（默认 Asia/Shanghai）
+        sqlite_config: SQLite 连接参数配置
         force_new: 是否强制创建新实例
 
     Returns:
@@ -354,6 +412,7 @@ def get_storage_manager(
             pull_enabled=pull_enabled,
             pull_days=pull_days,
             timezone=timezone,
+            sqlite_config=sqlite_config,
         )
 
     return _storage_manager
@@ -0,0 +1,136 @@
+# coding=utf-8
+"""
+内容摘要清单
+
+按日期记录已写入/已上传文件的内容摘要（sha256）、大小和远程 ETag，
+内容未变化时跳过重复的文件写入和上传：
+- HTML 报告：write_html_if_changed 与上次写入的摘要一致时保留原文件（含修改时间），
+  不再覆盖和复制
+- 远程 SQLite：与本次运行下载时/上次上传时的摘要一致时不再上传（日库每次抓取都会
+  变化，这只会跳过同一运行内的重复上传），上传后以 put_object 返回的 ETag 与本地 MD5
+  比对完成校验
+"""
+
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Union
+
+MANIFEST_FILENAME = ".manifest.json"
+
+# 页面中的生成时间不参与内容摘要：仅生成时间不同的页面视为内容未变化
+_GENERATED_AT_PATTERN = re.compile(
+    r'(<span class="info-label">生成时间</span>\s*<span class="info-value">)[^<]*'
+)
+
+
+def content_digests(data: bytes) -> Dict[str, str]:
+    """
+    计算内容摘要
+
+    Returns:
+        {"sha256": 内容摘要, "md5": 单次 PUT 上传时 S3 兼容存储返回的 ETag 值}
+    """
+    return {
+        "sha256": hashlib.sha256(data).hexdigest(),
+        "md5": hashlib.md5(data).hexdigest(),
+    }
+
+
+class ContentManifest:
+    """
+    单日内容摘要清单（JSON 文件）
+
+    条目以文件名或远程对象键为键，值为 {"sha256", "size", "etag"}。
+    清单文件损坏或不存在时视为空清单（所有内容都会重新写入/上传）。
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        初始化清单
+
+        Args:
+            path: 清单文件路径
+        """
+        self.path = Path(path)
+        self._entries: Dict[str, Dict] = self._load()
+
+    def _load(self) -> Dict[str, Dict]:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                entries = json.load(f)
+            return entries if isinstance(entries, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def get(self, key: str) -> Optional[Dict]:
+        """获取条目"""
+        return self._entries.get(key)
+
+    def is_unchanged(self, key: str, sha256: str) -> bool:
+        """内容摘要是否与清单记录一致"""
+        entry = self._entries.get(key)
+        return entry is not None and entry.get("sha256") == sha256
+
+    def record(self, key: str, sha256: str, size: int, etag: Optional[str] = None) -> None:
+        """记录条目并立即落盘"""
+        entry = {"sha256": sha256, "size": size}
+        if etag:
+            entry["etag"] = etag
+        self._entries[key] = entry
+        self.save()
+
+    def discard(self, key: str) -> None:
+        """删除条目（内容状态未知时调用，下次必定重新写入/上传）"""
+        if self._entries.pop(key, None) is not None:
+            self.save()
+
+    def save(self) -> None:
+        """原子写入清单文件"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._entries, f, ensure_ascii=False, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+
+def write_html_if_changed(
+    file_path: Union[str, Path],
+    html_content: Union[str, Iterable[str]],
+    manifest: ContentManifest,
+    key: Optional[str] = None,
+) -> bool:
+    """写入 HTML 报告，内容与清单记录一致时保留原文件
+
+    边写临时文件边计算摘要（生成时间不参与摘要）。内容未变化时丢弃临时文件，
+    原文件及其修改时间保持不变，调用方据此跳过后续复制/上传。
+
+    Args:
+        file_path: 目标文件路径
+        html_content: 完整 HTML 字符串，或按顺序产出片段的可迭代对象
+        manifest: 所在日期的内容摘要清单
+        key: 清单条目键（默认使用文件名）
+
+    Returns:
+        是否写入了新内容
+    """
+    file_path = Path(file_path)
+    key = key or file_path.name
+    tmp_path = file_path.with_name(file_path.name + ".tmp")
+    digest = hashlib.sha256()
+
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        for fragment in ((html_content,) if isinstance(html_content, str) else html_content):
+            f.write(fragment)
+            digest.update(_GENERATED_AT_PATTERN.sub(r"\1", fragment).encode("utf-8"))
+
+    sha256 = digest.hexdigest()
+    if file_path.exists() and manifest.is_unchanged(key, sha256):
+        tmp_path.unlink()
+        return False
+
+    os.replace(tmp_path, file_path)
+    manifest.record(key, sha256, file_path.stat().st_size)
+    return True
@@ -0,0 +1,312 @@
+# coding=utf-8
+"""
+日库 Schema 迁移
+
+schema.sql / rss_schema.sql 只能 CREATE ... IF NOT EXISTS，无法给已有日库
+删改索引、增加列或回填数据。这里按版本号维护有序迁移：
+
+- 版本记录在 SQLite 的 PRAGMA user_version 中
+- 存储后端打开连接时（_init_tables 之后）惰性执行未应用的迁移；只读方（MCP 服务）不迁移，
+  旧日库需等爬虫写入或由下面的批量迁移命令升级
+- 每个迁移在独立的 BEGIN IMMEDIATE 事务中执行，并与 user_version 一同提交
+- 新建数据库由 schema 文件直接建出最新结构，迁移需保持幂等（IF [NOT] EXISTS 等）
+
+批量迁移所有日库:
+    python -m trendradar.storage.migrations [--data-dir output] [--type all|news|rss] [--config config/config.yaml]
+"""
+
+import argparse
+import os
+import re
+import sqlite3
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import yaml
+
+from trendradar.storage.sqlite_profile import SQLiteProfile
+
+
+@dataclass(frozen=True)
+class Migration:
+    """单个迁移"""
+    version: int                                           # 迁移后的 user_version
+    description: str                                       # 迁移说明
+    statements: Tuple[str, ...] = ()                       # 依次执行的 SQL
+    apply: Optional[Callable[[sqlite3.Cursor], None]] = None  # 需要 Python 逻辑时使用（如数据回填）
+
+
+def _add_aggregation_row_count(cursor: sqlite3.Cursor) -> None:
+    """给 aggregation_titles 增加 row_count 列（已存在时跳过，保持幂等），旧状态下次运行整天重算"""
+    columns = {row[1] for row in cursor.execute("PRAGMA table_info(aggregation_titles)")}
+    if "row_count" not in columns:
+        cursor.execute("ALTER TABLE aggregation_titles ADD COLUMN row_count INTEGER NOT NULL DEFAULT 1")
+    cursor.execute("DELETE FROM aggregation_state")
+    cursor.execute("DELETE FROM aggregation_titles")
+
+
+NEWS_MIGRATIONS: List[Migration] = [
+    Migration(
+        version=1,
+        description="新增检测覆盖索引、排名历史复合索引",
+        statements=(
+            """CREATE INDEX IF NOT EXISTS idx_news_platform_first_time
+               ON news_items(platform_id, first_crawl_time, title)""",
+            """CREATE INDEX IF NOT EXISTS idx_rank_history_item_time
+               ON rank_history(news_item_id, crawl_time)""",
+        ),
+    ),
+    Migration(
+        version=2,
+        description="删除被复合索引覆盖的 idx_rank_history_news",
+        statements=(
+            "DROP INDEX IF EXISTS idx_rank_history_news",
+        ),
+    ),
+    Migration(
+        version=3,
+        description="新增当日增量汇总状态表",
+        statements=(
+            """CREATE TABLE IF NOT EXISTS aggregation_state (
+                   state_key TEXT PRIMARY KEY,
+                   payload TEXT NOT NULL,
+                   updated_at TEXT
+               )""",
+        ),
+    ),
+    Migration(
+        version=4,
+        description="当日汇总改为逐标题行存储（增量 upsert）",
+        statements=(
+            """CREATE TABLE IF NOT EXISTS aggregation_titles (
+                   state_key TEXT NOT NULL,
+                   platform_id TEXT NOT NULL,
+                   title TEXT NOT NULL,
+                   position INTEGER NOT NULL,
+                   group_index INTEGER NOT NULL,
+                   url TEXT NOT NULL DEFAULT '',
+                   mobile_url TEXT,
+                   first_time TEXT,
+                   last_time TEXT,
+                   count INTEGER,
+                   ranks TEXT,
+                   PRIMARY KEY (state_key, platform_id, title)
+               )""",
+            """CREATE INDEX IF NOT EXISTS idx_aggregation_titles_url
+               ON aggregation_titles(state_key, platform_id, url)""",
+            # 旧格式的整块 JSON 状态不再使用，下次运行整天重算
+            "DELETE FROM aggregation_state",
+        ),
+    ),
+    Migration(
+        version=5,
+        description="当日汇总标题行记录 news_items 行数",
+        apply=_add_aggregation_row_count,
+    ),
+]
+
+RSS_MIGRATIONS: List[Migration] = []
+
+MIGRATIONS: Dict[str, List[Migration]] = {
+    "news": NEWS_MIGRATIONS,
+    "rss": RSS_MIGRATIONS,
+}
+
+# 日库文件名（YYYY-MM-DD.db），用于批量迁移时跳过 feed_cache.db 等非日库文件
+DAY_DB_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}\.db$")
+
+
+def latest_version(db_type: str = "news") -> int:
+    """
+    获取指定数据库类型的最新 schema 版本
+
+    Args:
+        db_type: 数据库类型 ("news" 或 "rss")
+
+    Returns:
+        最新版本号（没有迁移时为 0）
+    """
+    migrations = MIGRATIONS[db_type]
+    return migrations[-1].version if migrations else 0
+
+
+def get_schema_version(conn: sqlite3.Connection) -> int:
+    """读取数据库的 user_version"""
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def migrate(conn: sqlite3.Connection, db_type: str = "news") -> int:
+    """
+    执行未应用的迁移
+
+    每个迁移独立提交；获取写锁后重新检查版本，多进程同时打开同一日库时不会重复执行。
+
+    Args:
+        conn: 数据库连接（调用方不应处于未提交事务中）
+        db_type: 数据库类型 ("news" 或 "rss")
+
+    Returns:
+        本次应用的迁移数量
+
+    Raises:
+        sqlite3.Error: 迁移执行失败（该迁移已回滚，版本号不变）
+    """
+    migrations = MIGRATIONS[db_type]
+    current = get_schema_version(conn)
+    target = latest_version(db_type)
+
+    if current > target:
+        print(f"[存储] 数据库 schema 版本 {current} 高于当前程序支持的 {target}，跳过迁移")
+        return 0
+
+    applied = 0
+    for migration in migrations:
+        if migration.version <= current:
+            continue
+
+        cursor = conn.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            current = get_schema_version(conn)
+            if migration.version <= current:
+                conn.rollback()
+                continue
+
+            for statement in migration.statements:
+                cursor.execute(statement)
+            if migration.apply is not None:
+                migration.apply(cursor)
+
+            cursor.execute(f"PRAGMA user_version = {migration.version}")
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+        current = migration.version
+        applied += 1
+
+    return applied
+
+
+def is_fresh_database(conn: sqlite3.Connection) -> bool:
+    """是否为尚未建表的新数据库（需在执行 schema 文件之前调用）"""
+    return conn.execute("SELECT COUNT(*) FROM sqlite_master WHERE type = 'table'").fetchone()[0] == 0
+
+
+def stamp_latest(conn: sqlite3.Connection, db_type: str = "news") -> None:
+    """
+    将新建数据库直接标记为最新版本
+
+    schema 文件已建出最新结构，无需再执行迁移。
+
+    Args:
+        conn: 数据库连接
+        db_type: 数据库类型 ("news" 或 "rss")
+    """
+    conn.execute(f"PRAGMA user_version = {latest_version(db_type)}")
+    conn.commit()
+
+
+def find_day_files(data_dir: Path, db_type: str) -> List[Path]:
+    """
+    列出指定类型的所有日库文件
+
+    Args:
+        data_dir: 数据目录（如 output）
+        db_type: 数据库类型 ("news" 或 "rss")
+
+    Returns:
+        按日期排序的日库路径列表
+    """
+    db_dir = Path(data_dir) / db_type
+    if not db_dir.exists():
+        return []
+    return sorted(p for p in db_dir.glob("*.db") if DAY_DB_PATTERN.match(p.name))
+
+
+def migrate_all_day_files(
+    data_dir: str = "output",
+    db_types: Tuple[str, ...] = ("news", "rss"),
+    sqlite_profile: Optional[SQLiteProfile] = None,
+) -> Dict[str, int]:
+    """
+    批量迁移所有日库
+
+    Args:
+        data_dir: 数据目录
+        db_types: 要迁移的数据库类型
+        sqlite_profile: 连接参数（busy_timeout 等），默认使用 SQLiteProfile 默认值
+
+    Returns:
+        统计信息 {"total": 文件数, "migrated": 实际迁移的文件数, "failed": 失败数}
+    """
+    stats = {"total": 0, "migrated": 0, "failed": 0}
+    profile = sqlite_profile or SQLiteProfile()
+
+    for db_type in db_types:
+        for db_path in find_day_files(Path(data_dir), db_type):
+            stats["total"] += 1
+            try:
+                conn = profile.connect(db_path)
+            except sqlite3.Error as e:
+                stats["failed"] += 1
+                print(f"[存储] 迁移失败 {db_type}/{db_path.name}: {e}")
+                continue
+            try:
+                before = get_schema_version(conn)
+                applied = migrate(conn, db_type)
+                if applied:
+                    stats["migrated"] += 1
+                    print(f"[存储] 已迁移 {db_type}/{db_path.name}: v{before} -> v{get_schema_version(conn)}")
+            except sqlite3.Error as e:
+                stats["failed"] += 1
+                print(f"[存储] 迁移失败 {db_type}/{db_path.name}: {e}")
+            finally:
+                conn.close()
+
+    return stats
+
+
+def load_sqlite_config(config_path: str) -> Dict[str, Any]:
+    """
+    读取配置文件中的 storage.sqlite 段
+
+    Args:
+        config_path: 配置文件路径
+
+    Returns:
+        storage.sqlite 配置字典，文件不存在时返回空字典（使用默认连接参数）
+    """
+    if not Path(config_path).exists():
+        print(f"[存储] 配置文件 {config_path} 不存在，使用默认 SQLite 连接参数")
+        return {}
+    with open(config_path, "r", encoding="utf-8") as f:
+        config_data = yaml.safe_load(f) or {}
+    return (config_data.get("storage") or {}).get("sqlite") or {}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="批量迁移 TrendRadar 日库 schema")
+    parser.add_argument("--data-dir", default="output", help="数据目录（默认 output）")
+    parser.add_argument("--type", choices=["all", "news", "rss"], default="all", help="数据库类型")
+    parser.add_argument(
+        "--config", default=os.environ.get("CONFIG_PATH", "config/config.yaml"),
+        help="配置文件路径，读取 storage.sqlite 连接参数（默认 CONFIG_PATH 或 config/config.yaml）",
+    )
+    args = parser.parse_args()
+
+    db_types = ("news", "rss") if args.type == "all" else (args.type,)
+    sqlite_profile = SQLiteProfile.from_config(load_sqlite_config(args.config))
+    stats = migrate_all_day_files(args.data_dir, db_types, sqlite_profile)
+    print(
+        f"[存储] 共 {stats['total']} 个日库，迁移 {stats['migrated']} 个，失败 {stats['failed']} 个"
+        f"（news 最新版本 v{latest_version('news')}，rss 最新版本 v{latest_version('rss')}）"
+    )
+    if stats["failed"]:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
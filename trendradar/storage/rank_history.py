@@ -0,0 +1,70 @@
+# coding=utf-8
+"""
+排名历史加载
+
+整天读取（get_today_all_data 等）需要每条新闻的排名历史。旧实现把当天所有
+news_item_id 拼成一个 IN (?,?,...) 查询，条目多时会触及 SQLite 变量数上限，
+且用 `rank not in list` 去重是 O(n²)。
+
+这里改为按 (news_item_id, crawl_time) 复合索引（idx_rank_history_item_time，
+由 schema.sql 与迁移 v1 创建）顺序流式读取：
+- 全天读取直接顺序扫描索引，无需 IN 列表
+- 部分读取（如最新批次、指定平台）通过 JOIN news_items 过滤
+- 行按 news_item_id 有序到达，逐条分组并用集合去重，整体 O(n)
+"""
+
+import sqlite3
+from typing import Dict, List, Sequence
+
+
+def load_rank_history(
+    cursor: sqlite3.Cursor,
+    item_filter: str = "",
+    params: Sequence = (),
+    dedupe: bool = True,
+) -> Dict[int, List[int]]:
+    """
+    流式加载排名历史
+
+    Args:
+        cursor: 数据库游标
+        item_filter: news_items 的过滤条件（别名 n，如 "n.last_crawl_time = ?"），
+                     为空表示当天全部条目
+        params: 过滤条件参数
+        dedupe: 是否去重（保留首次出现顺序）
+
+    Returns:
+        {news_item_id: [rank, ...]}，按抓取时间排序
+    """
+    if item_filter:
+        cursor.execute(f"""
+            SELECT rh.news_item_id, rh.rank
+            FROM news_items n
+            JOIN rank_history rh ON rh.news_item_id = n.id
+            WHERE {item_filter}
+            ORDER BY rh.news_item_id, rh.crawl_time
+        """, tuple(params))
+    else:
+        cursor.execute("""
+            SELECT news_item_id, rank FROM rank_history
+            ORDER BY news_item_id, crawl_time
+        """)
+
+    rank_history_map: Dict[int, List[int]] = {}
+    current_id = None
+    ranks: List[int] = []
+    seen: set = set()
+
+    for row in cursor:
+        news_id, rank = row[0], row[1]
+        if news_id != current_id:
+            current_id = news_id
+            ranks = rank_history_map[news_id] = []
+            seen = set()
+        if dedupe:
+            if rank in seen:
+                continue
+            seen.add(rank)
+        ranks.append(rank)
+
+    return rank_history_map
@@ -7,15 +7,17 @@
 数据流程：下载当天 SQLite → 合并新数据 → 上传回远程
 """
 
+import hashlib
 import pytz
 import re
 import shutil
 import sys
 import tempfile
 import sqlite3
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 
 try:
     import boto3
@@ -28,13 +30,28 @@ except ImportError:
     BotoConfig = None
     ClientError = Exception
 
-from trendradar.storage.base import StorageBackend, NewsItem, NewsData, RSSItem, RSSData
+from trendradar.storage.base import (
+    StorageBackend, NewsItem, NewsData, RSSItem, RSSData, HtmlContent, SyncResult, write_html,
+)
+from trendradar.storage.aggregation_state import (
+    find_aggregation_titles,
+    load_news_by_last_crawl,
+    read_aggregation_state,
+    read_crawl_times,
+    write_aggregation_state,
+)
+from trendradar.storage.manifest import MANIFEST_FILENAME, ContentManifest, content_digests
+from trendradar.storage.migrations import is_fresh_database, migrate, stamp_latest
+from trendradar.storage.rank_history import load_rank_history
+from trendradar.storage.snapshot import DaySnapshot, load_day_snapshot
+from trendradar.storage.sqlite_profile import SQLiteProfile, checkpoint
+from trendradar.storage.sqlite_writer import SQLiteBatchWriter
+from trendradar.storage.title_history import load_historical_titles
 from trendradar.utils.time import (
     get_configured_time,
     format_date_folder,
     format_time_filename,
 )
-from trendradar.utils.url import normalize_url
 
 
 class RemoteStorageBackend(StorageBackend):
@@ -61,6 +78,7 @@ class RemoteStorageBackend(StorageBackend):
         enable_html: bool = True,
         temp_dir: Optional[str] = None,
         timezone: str = "Asia/Shanghai",
+        sqlite_profile: Optional[SQLiteProfile] = None,
     ):
         """
         初始化远程存储后端
@@ -75,6 +93,7 @@ class RemoteStorageBackend(StorageBackend):
             enable_html: 是否启用 HTML 报告
             temp_dir: 临时目录路径（默认使用系统临时目录）
             timezone: 时区配置（默认 Asia/Shanghai）
+            sqlite_profile: SQLite 连接参数（默认 WAL + NORMAL）
         """
         if not HAS_BOTO3:
             raise ImportError("远程存储后端需要安装 boto3: pip install boto3")
@@ -85,6 +104,7 @@ class RemoteStorageBackend(StorageBackend):
         self.enable_txt = enable_txt
         self.enable_html = enable_html
         self.timezone = timezone
+        self.sqlite_profile = sqlite_profile or SQLiteProfile()
 
         # 创建临时目录
         self.temp_dir = Path(temp_dir) if temp_dir else Path(tempfile.mkdtemp(prefix="trendradar_"))
@@ -117,6 +137,11 @@ class RemoteStorageBackend(StorageBackend):
         # 跟踪下载的文件（用于清理）
         self._downloaded_files: List[Path] = []
         self._db_connections: Dict[str, sqlite3.Connection] = {}
+        self._manifests: Dict[str, ContentManifest] = {}
+        self._writer = SQLiteBatchWriter("[远程存储]")
+        # deferred_sync 上下文内待上传的日库 {(日期, 数据库类型): date 参数}
+        self._sync_depth = 0
+        self._pending_uploads: Dict[Tuple[str, str], Optional[str]] = {}
 
         print(f"[远程存储] 初始化完成，存储桶: {bucket_name}，签名版本: {signature_version}")
 
@@ -170,6 +195,21 @@ class RemoteStorageBackend(StorageBackend):
         db_dir.mkdir(parents=True, exist_ok=True)
         return db_dir / f"{date_folder}.db"
 
+    def _get_manifest(self, date: Optional[str] = None) -> ContentManifest:
+        """
+        获取指定日期的内容摘要清单
+
+        记录本次运行下载/上传的 SQLite 的摘要和 ETag。清单位于本次运行的临时目录，
+        只能跳过同一运行内字节完全相同的重复上传（两次上传之间没有写入）；
+        每次抓取都会新增 crawl_records 行，保存热榜数据后的上传不会被跳过。
+        """
+        date_folder = self._format_date_folder(date)
+        manifest = self._manifests.get(date_folder)
+        if manifest is None:
+            manifest = ContentManifest(self.temp_dir / date_folder / MANIFEST_FILENAME)
+            self._manifests[date_folder] = manifest
+        return manifest
+
     def _check_object_exists(self, r2_key: str) -> bool:
         """
         检查远程存储中对象是否存在
@@ -224,10 +264,18 @@ class RemoteStorageBackend(StorageBackend):
             # 使用 get_object + iter_chunks 替代 download_file
             # iter_chunks 会自动处理 chunked transfer encoding
             response = self.s3_client.get_object(Bucket=self.bucket_name, Key=r2_key)
+            sha256 = hashlib.sha256()
+            size = 0
             with open(local_path, 'wb') as f:
                 for chunk in response['Body'].iter_chunks(chunk_size=1024*1024):
                     f.write(chunk)
+                    sha256.update(chunk)
+                    size += len(chunk)
             self._downloaded_files.append(local_path)
+            # 记录下载内容的摘要：上传前内容未变化则无需回传
+            self._get_manifest(date).record(
+                r2_key, sha256.hexdigest(), size, str(response.get("ETag", "")).strip('"')
+            )
             print(f"[远程存储] 已下载: {r2_key} -> {local_path}")
             return local_path
         except ClientError as e:
@@ -261,19 +309,35 @@ class RemoteStorageBackend(StorageBackend):
             print(f"[远程存储] 本地文件不存在，无法上传: {local_path}")
             return False
 
-        try:
-            # 获取本地文件大小
-            local_size = local_path.stat().st_size
-            print(f"[远程存储] 准备上传: {local_path} ({local_size} bytes) -> {r2_key}")
+        # deferred_sync 上下文内只记录，退出时统一上传一次
+        if self._sync_depth:
+            self._pending_uploads[(self._format_date_folder(date), db_type)] = date
+            return True
+
+        # WAL 模式下先将 -wal 内容合并回主文件，保证上传的单个文件数据完整
+        conn = self._db_connections.get(str(local_path))
+        if conn is not None:
+            checkpoint(conn)
 
+        try:
             # 读取文件内容为 bytes 后上传
             # 避免传入文件对象时 requests 库使用 chunked transfer encoding
             # 腾讯云 COS 等 S3 兼容服务可能无法正确处理 chunked encoding
             with open(local_path, 'rb') as f:
                 file_content = f.read()
+            local_size = len(file_content)
+
+            # 与本次运行下载时/上次上传时的字节一致，远程已是最新，跳过上传
+            manifest = self._get_manifest(date)
+            digests = content_digests(file_content)
+            if manifest.is_unchanged(r2_key, digests["sha256"]):
+                print(f"[远程存储] 内容未变化，跳过上传: {r2_key}")
+                return True
+
+            print(f"[远程存储] 准备上传: {local_path} ({local_size} bytes) -> {r2_key}")
 
             # 使用 put_object 并明确设置 ContentLength，确保不使用 chunked encoding
-            self.s3_client.put_object(
+            response = self.s3_client.put_object(
                 Bucket=self.bucket_name,
                 Key=r2_key,
                 Body=file_content,
@@ -282,18 +346,51 @@ class RemoteStorageBackend(StorageBackend):
             )
             print(f"[远程存储] 已上传: {local_path} -> {r2_key}")
 
-            # 验证上传成功
-            if self._check_object_exists(r2_key):
+            # 验证上传成功：单次 PUT 返回的 ETag 即内容 MD5，与本地摘要一致即可，无需 HEAD 请求
+            # 部分服务商（如启用 SSE-KMS 加密）的 ETag 不是 MD5，此时回退到 HEAD 检查
+            etag = str(response.get("ETag", "")).strip('"')
+            if etag == digests["md5"]:
+                print(f"[远程存储] 上传验证成功 (ETag): {r2_key}")
+            elif self._check_object_exists(r2_key):
                 print(f"[远程存储] 上传验证成功: {r2_key}")
-                return True
             else:
+                manifest.discard(r2_key)
                 print(f"[远程存储] 上传验证失败: 文件未在远程存储中找到")
                 return False
 
+            manifest.record(r2_key, digests["sha256"], local_size, etag)
+            return True
+
         except Exception as e:
             print(f"[远程存储] 上传失败: {e}")
             return False
 
+    @contextmanager
+    def deferred_sync(self) -> Iterator[SyncResult]:
+        """
+        在上下文内合并日库上传
+
+        上下文内的 _upload_sqlite 只记录待上传的日库，退出时（含异常退出）每个日库
+        上传一次，使热榜数据与汇总状态等同一运行中的写入共用一次 PUT。
+        上传失败时 SyncResult.ok 为 False，调用方需据此判断数据是否已同步。
+        """
+        result = SyncResult()
+        self._sync_depth += 1
+        try:
+            yield result
+        finally:
+            self._sync_depth -= 1
+            if not self._sync_depth:
+                pending, self._pending_uploads = self._pending_uploads, {}
+                for (_, db_type), date in pending.items():
+                    r2_key = self._get_remote_db_key(date, db_type)
+                    if self._upload_sqlite(date, db_type):
+                        print(f"[远程存储] 数据已同步到远程存储: {r2_key}")
+                    else:
+                        print(f"[远程存储] 上传远程存储失败: {r2_key}")
+                        result.ok = False
+                        result.failed.append(r2_key)
+
     def _get_connection(self, date: Optional[str] = None, db_type: str = "news") -> sqlite3.Connection:
         """
         获取数据库连接
@@ -316,7 +413,7 @@ class RemoteStorageBackend(StorageBackend):
             if not local_path.exists():
                 self._download_sqlite(date, db_type)
 
-            conn = sqlite3.connect(db_path)
+            conn = self.sqlite_profile.connect(db_path)
             conn.row_factory = sqlite3.Row
             self._init_tables(conn, db_type)
             self._db_connections[db_path] = conn
@@ -339,7 +436,7 @@ class RemoteStorageBackend(StorageBackend):
 
     def _init_tables(self, conn: sqlite3.Connection, db_type: str = "news") -> None:
         """
-        从 schema.sql 初始化数据库表结构
+        从 schema.sql 初始化数据库表结构，并执行版本迁移
 
         Args:
             conn: 数据库连接
@@ -350,12 +447,23 @@ class RemoteStorageBackend(StorageBackend):
         if schema_path.exists():
             with open(schema_path, "r", encoding="utf-8") as f:
                 schema_sql = f.read()
+            fresh = is_fresh_database(conn)
             conn.executescript(schema_sql)
         else:
             raise FileNotFoundError(f"Schema file not found: {schema_path}")
 
         conn.commit()
 
+        # 新库由 schema 文件直接建出最新结构；已有日库执行未应用的迁移
+        if fresh:
+            stamp_latest(conn, db_type)
+        else:
+            try:
+                migrate(conn, db_type)
+            except sqlite3.Error as e:
+                # 迁移失败不影响读写（旧结构仍可用），下次打开时重试
+                print(f"[远程存储] 数据库迁移失败: {e}")
+
     def save_news_data(self, data: NewsData) -> bool:
         """
         保存新闻数据到远程存储（以 URL 为唯一标识，支持标题更新检测）
@@ -382,154 +490,10 @@ class RemoteStorageBackend(StorageBackend):
             # 获取配置时区的当前时间
             now_str = self._get_configured_time().strftime("%Y-%m-%d %H:%M:%S")
 
-            # 首先同步平台信息到 platforms 表
-            for source_id, source_name in data.id_to_name.items():
-                cursor.execute("""
-                    INSERT INTO platforms (id, name, updated_at)
-                    VALUES (?, ?, ?)
-                    ON CONFLICT(id) DO UPDATE SET
-                        name = excluded.name,
-                        updated_at = excluded.updated_at
-                """, (source_id, source_name, now_str))
-
-            # 统计计数器
-            new_count = 0
-            updated_count = 0
-            title_changed_count = 0
-            success_sources = []
-
-            for source_id, news_list in data.items.items():
-                success_sources.append(source_id)
-
-                for item in news_list:
-                    try:
-                        # 标准化 URL（去除动态参数，如微博的 band_rank）
-                        normalized_url = normalize_url(item.url, source_id) if item.url else ""
-
-                        # 检查是否已存在（通过标准化 URL + platform_id）
-                        if normalized_url:
-                            cursor.execute("""
-                                SELECT id, title FROM news_items
-                                WHERE url = ? AND platform_id = ?
-                            """, (normalized_url, source_id))
-                            existing = cursor.fetchone()
-
-                            if existing:
-                                # 已存在，更新记录
-                                existing_id, existing_title = existing
-
-                                # 检查标题是否变化
-                                if existing_title != item.title:
-                                    # 记录标题变更
-                                    cursor.execute("""
-                                        INSERT INTO title_changes
-                                        (news_item_id, old_title, new_title, changed_at)
-                                        VALUES (?, ?, ?, ?)
-                                    """, (existing_id, existing_title, item.title, now_str))
-                                    title_changed_count += 1
-
-                                # 记录排名历史
-                                cursor.execute("""
-                                    INSERT INTO rank_history
-                                    (news_item_id, rank, crawl_time, created_at)
-                                    VALUES (?, ?, ?, ?)
-                                """, (existing_id, item.rank, data.crawl_time, now_str))
-
-                                # 更新现有记录
-                                cursor.execute("""
-                                    UPDATE news_items SET
-                                        title = ?,
-                                        rank = ?,
-                                        mobile_url = ?,
-                                        last_crawl_time = ?,
-                                        crawl_count = crawl_count + 1,
-                                        updated_at = ?
-                                    WHERE id = ?
-                                """, (item.title, item.rank, item.mobile_url,
-                                      data.crawl_time, now_str, existing_id))
-                                updated_count += 1
-                            else:
-                                # 不存在，插入新记录（存储标准化后的 URL）
-                                cursor.execute("""
-                                    INSERT INTO news_items
-                                    (title, platform_id, rank, url, mobile_url,
-                                     first_crawl_time, last_crawl_time, crawl_count,
-                                     created_at, updated_at)
-                                    VALUES (?, ?, ?, ?, ?, ?, ?, 1, ?, ?)
-                                """, (item.title, source_id, item.rank, normalized_url,
-                                      item.mobile_url, data.crawl_time, data.crawl_time,
-                                      now_str, now_str))
-                                new_id = cursor.lastrowid
-                                # 记录初始排名
-                                cursor.execute("""
-                                    INSERT INTO rank_history
-                                    (news_item_id, rank, crawl_time, created_at)
-                                    VALUES (?, ?, ?, ?)
-                                """, (new_id, item.rank, data.crawl_time, now_str))
-                                new_count += 1
-                        else:
-                            # URL 为空的情况，直接插入（不做去重）
-                            cursor.execute("""
-                                INSERT INTO news_items
-                                (title, platform_id, rank, url, mobile_url,
-                                 first_crawl_time, last_crawl_time, crawl_count,
-                                 created_at, updated_at)
-                                VALUES (?, ?, ?, ?, ?, ?, ?, 1, ?, ?)
-                            """, (item.title, source_id, item.rank, "",
-                                  item.mobile_url, data.crawl_time, data.crawl_time,
-                                  now_str, now_str))
-                            new_id = cursor.lastrowid
-                            # 记录初始排名
-                            cursor.execute("""
-                                INSERT INTO rank_history
-                                (news_item_id, rank, crawl_time, created_at)
-                                VALUES (?, ?, ?, ?)
-                            """, (new_id, item.rank, data.crawl_time, now_str))
-                            new_count += 1
-
-                    except sqlite3.Error as e:
-                        print(f"[远程存储] 保存新闻条目失败 [{item.title[:30]}...]: {e}")
-
-            total_items = new_count + updated_count
-
-            # 记录抓取信息
-            cursor.execute("""
-                INSERT OR REPLACE INTO crawl_records
-                (crawl_time, total_items, created_at)
-                VALUES (?, ?, ?)
-            """, (data.crawl_time, total_items, now_str))
-
-            # 获取刚插入的 crawl_record 的 ID
-            cursor.execute("""
-                SELECT id FROM crawl_records WHERE crawl_time = ?
-            """, (data.crawl_time,))
-            record_row = cursor.fetchone()
-            if record_row:
-                crawl_record_id = record_row[0]
-
-                # 记录成功的来源
-                for source_id in success_sources:
-                    cursor.execute("""
-                        INSERT OR REPLACE INTO crawl_source_status
-                        (crawl_record_id, platform_id, status)
-                        VALUES (?, ?, 'success')
-                    """, (crawl_record_id, source_id))
-
-                # 记录失败的来源
-                for failed_id in data.failed_ids:
-                    # 确保失败的平台也在 platforms 表中
-                    cursor.execute("""
-                        INSERT OR IGNORE INTO platforms (id, name, updated_at)
-                        VALUES (?, ?, ?)
-                    """, (failed_id, failed_id, now_str))
-
-                    cursor.execute("""
-                        INSERT OR REPLACE INTO crawl_source_status
-                        (crawl_record_id, platform_id, status)
-                        VALUES (?, ?, 'failed')
-                    """, (crawl_record_id, failed_id))
-
-            conn.commit()
+            # 单事务批量写入（失败时整体回滚）
+            new_count, updated_count, title_changed_count = self._writer.save_news(
+                conn, data, now_str
+            )
 
             # 查询合并后的总记录数
             cursor.execute("SELECT COUNT(*) as count FROM news_items")
@@ -545,9 +509,12 @@ class RemoteStorageBackend(StorageBackend):
             log_parts.append(f"(去重后总计: {final_count} 条)")
             print("，".join(log_parts))
 
-            # 上传到远程存储
+            # 上传到远程存储（deferred_sync 内只记录，退出上下文时才上传）
             if self._upload_sqlite(data.date):
-                print(f"[远程存储] 数据已同步到远程存储")
+                if self._sync_depth:
+                    print(f"[远程存储] 数据已写入本地日库，退出同步上下文时上传")
+                else:
+                    print(f"[远程存储] 数据已同步到远程存储")
                 return True
             else:
                 print(f"[远程存储] 上传远程存储失败")
@@ -570,31 +537,15 @@ class RemoteStorageBackend(StorageBackend):
                        n.first_crawl_time, n.last_crawl_time, n.crawl_count
                 FROM news_items n
                 LEFT JOIN platforms p ON n.platform_id = p.id
-                ORDER BY n.platform_id, n.last_crawl_time
+                ORDER BY n.platform_id, n.last_crawl_time, n.id
             """)
 
             rows = cursor.fetchall()
             if not rows:
                 return None
 
-            # 收集所有 news_item_id
-            news_ids = [row[0] for row in rows]
-
-            # 批量查询排名历史
-            rank_history_map: Dict[int, List[int]] = {}
-            if news_ids:
-                placeholders = ",".join("?" * len(news_ids))
-                cursor.execute(f"""
-                    SELECT news_item_id, rank FROM rank_history
-                    WHERE news_item_id IN ({placeholders})
-                    ORDER BY news_item_id, crawl_time
-                """, news_ids)
-                for rh_row in cursor.fetchall():
-                    news_id, rank = rh_row[0], rh_row[1]
-                    if news_id not in rank_history_map:
-                        rank_history_map[news_id] = []
-                    if rank not in rank_history_map[news_id]:
-                        rank_history_map[news_id].append(rank)
+            # 流式加载排名历史（按复合索引顺序读取，无 IN 列表）
+            rank_history_map = load_rank_history(cursor)
 
             # 按 platform_id 分组
             items: Dict[str, List[NewsItem]] = {}
@@ -662,6 +613,16 @@ class RemoteStorageBackend(StorageBackend):
             print(f"[远程存储] 读取数据失败: {e}")
             return None
 
+    def get_today_snapshot(self, date: Optional[str] = None) -> Optional[DaySnapshot]:
+        """获取指定日期的列式快照（直接从 SQLite 读取，不经过 NewsItem）"""
+        try:
+            conn = self._get_connection(date)
+            return load_day_snapshot(conn.cursor(), self._format_date_folder(date))
+
+        except Exception as e:
+            print(f"[远程存储] 读取快照失败: {e}")
+            return None
+
     def get_latest_crawl_data(self, date: Optional[str] = None) -> Optional[NewsData]:
         """获取最新一次抓取的数据"""
         try:
@@ -751,33 +712,24 @@ class RemoteStorageBackend(StorageBackend):
         关键逻辑：只有在历史批次中从未出现过的标题才算新增。
         """
         try:
-            historical_data = self.get_today_all_data(current_data.date)
+            current_time = current_data.crawl_time
 
-            if not historical_data:
+            # 收集历史标题（first_time < current_time 的标题）
+            # 这样可以正确处理同一标题因 URL 变化而产生多条记录的情况
+            historical_titles = self.get_historical_titles(current_time, current_data.date)
+
+            if historical_titles is None:
+                # 没有历史数据，所有都是新的
                 new_titles = {}
                 for source_id, news_list in current_data.items.items():
                     new_titles[source_id] = {item.title: item for item in news_list}
                 return new_titles
 
-            # 获取当前批次时间
-            current_time = current_data.crawl_time
-
-            # 收集历史标题（first_time < current_time 的标题）
-            # 这样可以正确处理同一标题因 URL 变化而产生多条记录的情况
-            historical_titles: Dict[str, set] = {}
-            for source_id, news_list in historical_data.items.items():
-                historical_titles[source_id] = set()
-                for item in news_list:
-                    first_time = getattr(item, 'first_time', item.crawl_time)
-                    if first_time < current_time:
-                        historical_titles[source_id].add(item.title)
-
-            # 检查是否有历史数据
-            has_historical_data = any(len(titles) > 0 for titles in historical_titles.values())
-            if not has_historical_data:
+            if not historical_titles:
                 # 第一次抓取，没有"新增"概念
                 return {}
 
+            # 检测新增
             new_titles = {}
             for source_id, news_list in current_data.items.items():
                 hist_set = historical_titles.get(source_id, set())
@@ -793,6 +745,29 @@ class RemoteStorageBackend(StorageBackend):
             print(f"[远程存储] 检测新标题失败: {e}")
             return {}
 
+    def get_historical_titles(
+        self,
+        before_time: str,
+        date: Optional[str] = None,
+        platform_ids: Optional[List[str]] = None,
+    ) -> Optional[Dict[str, Set[str]]]:
+        """
+        获取首次出现时间早于指定批次的标题
+
+        只查询 (platform_id, title)，由 idx_news_platform_first_time 覆盖索引支撑，
+        不加载整天数据与排名历史。
+
+        Args:
+            before_time: 批次时间（HH-MM），只返回 first_crawl_time < before_time 的标题
+            date: 日期字符串，默认为今天
+            platform_ids: 平台 ID 列表，None 表示所有平台
+
+        Returns:
+            {platform_id: {title}}（只包含非空集合）；当天没有任何数据时返回 None
+        """
+        conn = self._get_connection(date)
+        return load_historical_titles(conn.cursor(), before_time, platform_ids)
+
     def save_txt_snapshot(self, data: NewsData) -> Optional[str]:
         """保存 TXT 快照（远程存储模式下默认不支持）"""
         if not self.enable_txt:
@@ -839,7 +814,7 @@ class RemoteStorageBackend(StorageBackend):
             print(f"[远程存储] 保存 TXT 快照失败: {e}")
             return None
 
-    def save_html_report(self, html_content: str, filename: str, is_summary: bool = False) -> Optional[str]:
+    def save_html_report(self, html_content: HtmlContent, filename: str, is_summary: bool = False) -> Optional[str]:
         """保存 HTML 报告到临时目录"""
         if not self.enable_html:
             return None
@@ -852,7 +827,7 @@ class RemoteStorageBackend(StorageBackend):
             file_path = html_dir / filename
 
             with open(file_path, "w", encoding="utf-8") as f:
-                f.write(html_content)
+                write_html(f, html_content)
 
             print(f"[远程存储] HTML 报告已保存: {file_path}")
             return str(file_path)
@@ -880,6 +855,79 @@ class RemoteStorageBackend(StorageBackend):
             print(f"[远程存储] 检查首次抓取失败: {e}")
             return True
 
+    def get_crawl_times(self, date: Optional[str] = None) -> List[str]:
+        """获取指定日期的所有抓取时间列表（按时间排序）"""
+        try:
+            conn = self._get_connection(date)
+            return read_crawl_times(conn.cursor())
+
+        except Exception as e:
+            print(f"[远程存储] 获取抓取时间列表失败: {e}")
+            return []
+
+    def get_news_by_last_crawl(self, crawl_time: str, date: Optional[str] = None) -> Optional[NewsData]:
+        """获取指定批次更新过的新闻条目（用于增量汇总）"""
+        try:
+            conn = self._get_connection(date)
+            return load_news_by_last_crawl(conn.cursor(), crawl_time, self._format_date_folder(date))
+
+        except Exception as e:
+            print(f"[远程存储] 读取批次数据失败: {e}")
+            return None
+
+    def load_aggregation_state(self, state_key: str, date: Optional[str] = None) -> Optional[Dict]:
+        """读取当日增量汇总状态"""
+        try:
+            conn = self._get_connection(date)
+            return read_aggregation_state(conn.cursor(), state_key)
+
+        except Exception as e:
+            print(f"[远程存储] 读取汇总状态失败: {e}")
+            return None
+
+    def find_aggregation_titles(
+        self,
+        state_key: str,
+        lookups: Dict[str, Tuple[List[str], List[str]]],
+        date: Optional[str] = None,
+    ) -> Optional[Dict[str, List[Tuple[str, int, int, str, int]]]]:
+        """查找汇总状态中与指定标题或 URL 相关的行"""
+        try:
+            conn = self._get_connection(date)
+            return find_aggregation_titles(conn.cursor(), state_key, lookups)
+
+        except Exception as e:
+            print(f"[远程存储] 读取汇总状态失败: {e}")
+            return None
+
+    def save_aggregation_state(
+        self,
+        state_key: str,
+        state: Dict,
+        rows: List[Tuple[str, str, int, int, List]],
+        replace: bool = False,
+        date: Optional[str] = None,
+    ) -> bool:
+        """
+        保存当日增量汇总状态
+
+        状态保存在日库中，需上传后下次运行（重新下载日库）才能复用；
+        在 deferred_sync 上下文内与热榜数据共用一次上传。
+        """
+        try:
+            conn = self._get_connection(date)
+            now_str = self._get_configured_time().strftime("%Y-%m-%d %H:%M:%S")
+            write_aggregation_state(conn, state_key, state, rows, now_str, replace)
+
+            if self._upload_sqlite(date):
+                return True
+            print(f"[远程存储] 汇总状态同步到远程存储失败")
+            return False
+
+        except Exception as e:
+            print(f"[远程存储] 保存汇总状态失败: {e}")
+            return False
+
     def cleanup(self) -> None:
         """清理资源（关闭连接和删除临时文件）"""
         # 检查 Python 是否正在关闭
@@ -898,6 +946,10 @@ class RemoteStorageBackend(StorageBackend):
         if db_connections:
             db_connections.clear()
 
+        manifests = getattr(self, "_manifests", None)
+        if manifests:
+            manifests.clear()
+
         # 删除临时目录
         temp_dir = getattr(self, "temp_dir", None)
         if temp_dir:
@@ -1093,118 +1145,11 @@ class RemoteStorageBackend(StorageBackend):
         """
         try:
             conn = self._get_connection(data.date, db_type="rss")
-            cursor = conn.cursor()
 
             now_str = self._get_configured_time().strftime("%Y-%m-%d %H:%M:%S")
 
-            # 同步 RSS 源信息到 rss_feeds 表
-            for feed_id, feed_name in data.id_to_name.items():
-                cursor.execute("""
-                    INSERT INTO rss_feeds (id, name, updated_at)
-                    VALUES (?, ?, ?)
-                    ON CONFLICT(id) DO UPDATE SET
-                        name = excluded.name,
-                        updated_at = excluded.updated_at
-                """, (feed_id, feed_name, now_str))
-
-            # 统计计数器
-            new_count = 0
-            updated_count = 0
-
-            for feed_id, rss_list in data.items.items():
-                for item in rss_list:
-                    try:
-                        # 检查是否已存在（通过 URL + feed_id）
-                        if item.url:
-                            cursor.execute("""
-                                SELECT id, title FROM rss_items
-                                WHERE url = ? AND feed_id = ?
-                            """, (item.url, feed_id))
-                            existing = cursor.fetchone()
-
-                            if existing:
-                                # 已存在，更新记录
-                                existing_id = existing[0]
-                                cursor.execute("""
-                                    UPDATE rss_items SET
-                                        title = ?,
-                                        published_at = ?,
-                                        summary = ?,
-                                        author = ?,
-                                        last_crawl_time = ?,
-                                        crawl_count = crawl_count + 1,
-                                        updated_at = ?
-                                    WHERE id = ?
-                                """, (item.title, item.published_at, item.summary,
-                                      item.author, data.crawl_time, now_str, existing_id))
-                                updated_count += 1
-                            else:
-                                # 不存在，插入新记录
-                                cursor.execute("""
-                                    INSERT INTO rss_items
-                                    (title, feed_id, url, published_at, summary, author,
-                                     first_crawl_time, last_crawl_time, crawl_count,
-                                     created_at, updated_at)
-                                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, 1, ?, ?)
-                                """, (item.title, feed_id, item.url, item.published_at,
-                                      item.summary, item.author, data.crawl_time,
-                                      data.crawl_time, now_str, now_str))
-                                new_count += 1
-                        else:
-                            # URL 为空，直接插入
-                            cursor.execute("""
-                                INSERT INTO rss_items
-                                (title, feed_id, url, published_at, summary, author,
-                                 first_crawl_time, last_crawl_time, crawl_count,
-                                 created_at, updated_at)
-                                VALUES (?, ?, ?, ?, ?, ?, ?, ?, 1, ?, ?)
-                            """, (item.title, feed_id, "", item.published_at,
-                                  item.summary, item.author, data.crawl_time,
-                                  data.crawl_time, now_str, now_str))
-                            new_count += 1
-
-                    except sqlite3.Error as e:
-                        print(f"[远程存储] 保存 RSS 条目失败 [{item.title[:30]}...]: {e}")
-
-            total_items = new_count + updated_count
-
-            # 记录抓取信息
-            cursor.execute("""
-                INSERT OR REPLACE INTO rss_crawl_records
-                (crawl_time, total_items, created_at)
-                VALUES (?, ?, ?)
-            """, (data.crawl_time, total_items, now_str))
-
-            # 记录抓取状态
-            cursor.execute("""
-                SELECT id FROM rss_crawl_records WHERE crawl_time = ?
-            """, (data.crawl_time,))
-            record_row = cursor.fetchone()
-            if record_row:
-                crawl_record_id = record_row[0]
-
-                # 记录成功的源
-                for feed_id in data.items.keys():
-                    cursor.execute("""
-                        INSERT OR REPLACE INTO rss_crawl_status
-                        (crawl_record_id, feed_id, status)
-                        VALUES (?, ?, 'success')
-                    """, (crawl_record_id, feed_id))
-
-                # 记录失败的源
-                for failed_id in data.failed_ids:
-                    cursor.execute("""
-                        INSERT OR IGNORE INTO rss_feeds (id, name, updated_at)
-                        VALUES (?, ?, ?)
-                    """, (failed_id, failed_id, now_str))
-
-                    cursor.execute("""
-                        INSERT OR REPLACE INTO rss_crawl_status
-                        (crawl_record_id, feed_id, status)
-                        VALUES (?, ?, 'failed')
-                    """, (crawl_record_id, failed_id))
-
-            conn.commit()
+            # 单事务批量写入（失败时整体回滚）
+            new_count, updated_count = self._writer.save_rss(conn, data, now_str)
 
             # 输出统计日志
             log_parts = [f"[远程存储] RSS 处理完成：新增 {new_count} 条"]
@@ -1214,7 +1159,10 @@ class RemoteStorageBackend(StorageBackend):
 
             # 上传到远程存储
             if self._upload_sqlite(data.date, db_type="rss"):
-                print(f"[远程存储] RSS 数据已同步到远程存储")
+                if self._sync_depth:
+                    print(f"[远程存储] RSS 数据已写入本地日库，退出同步上下文时上传")
+                else:
+                    print(f"[远程存储] RSS 数据已同步到远程存储")
                 return True
             else:
                 print(f"[远程存储] RSS 上传远程存储失败")
@@ -93,6 +93,35 @@ CREATE TABLE IF NOT EXISTS push_records (
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
+-- ============================================
+-- 当日增量汇总状态表
+-- 按配置哈希保存当日汇总的元数据（见 trendradar/core/aggregation.py），
+-- 只保留最新配置对应的一行
+-- ============================================
+CREATE TABLE IF NOT EXISTS aggregation_state (
+    state_key TEXT PRIMARY KEY,
+    payload TEXT NOT NULL,
+    updated_at TEXT
+);
+
+-- 当日汇总的逐标题统计（每个标题一行，增量合并时只 upsert 变化的行）
+-- group_index 为 -1 表示未匹配任何词组（只记录 URL，用于计数和冲突检测）
+CREATE TABLE IF NOT EXISTS aggregation_titles (
+    state_key TEXT NOT NULL,
+    platform_id TEXT NOT NULL,
+    title TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    row_count INTEGER NOT NULL DEFAULT 1,  -- 该标题在 news_items 中的行数
+    group_index INTEGER NOT NULL,
+    url TEXT NOT NULL DEFAULT '',
+    mobile_url TEXT,
+    first_time TEXT,
+    last_time TEXT,
+    count INTEGER,
+    ranks TEXT,
+    PRIMARY KEY (state_key, platform_id, title)
+);
+
 -- ============================================
 -- 索引定义
 -- ============================================
@@ -106,6 +135,10 @@ CREATE INDEX IF NOT EXISTS idx_news_crawl_time ON news_items(last_crawl_time);
 -- 标题索引（用于标题搜索）
 CREATE INDEX IF NOT EXISTS idx_news_title ON news_items(title);
 
+-- 平台 + 首次抓取时间覆盖索引（用于新增标题检测，只需读取索引即可得到 (platform_id, title)）
+CREATE INDEX IF NOT EXISTS idx_news_platform_first_time
+    ON news_items(platform_id, first_crawl_time, title);
+
 -- URL + platform_id 唯一索引（仅对非空 URL，实现去重）
 CREATE UNIQUE INDEX IF NOT EXISTS idx_news_url_platform
     ON news_items(url, platform_id) WHERE url != '';
@@ -113,5 +146,11 @@ CREATE UNIQUE INDEX IF NOT EXISTS idx_news_url_platform
 -- 抓取状态索引
 CREATE INDEX IF NOT EXISTS idx_crawl_status_record ON crawl_source_status(crawl_record_id);
 
--- 排名历史索引
-CREATE INDEX IF NOT EXISTS idx_rank_history_news ON rank_history(news_item_id);
+-- 排名历史复合索引（按条目 + 抓取时间顺序流式读取，见 rank_history.py）
+-- 旧的 idx_rank_history_news(news_item_id) 是其前缀，已由迁移 v2 删除（见 migrations.py）
+CREATE INDEX IF NOT EXISTS idx_rank_history_item_time
+    ON rank_history(news_item_id, crawl_time);
+
+-- 汇总标题行 URL 索引（增量合并时按批次 URL 查找原标题，见 aggregation_state.py）
+CREATE INDEX IF NOT EXISTS idx_aggregation_titles_url
+    ON aggregation_titles(state_key, platform_id, url);
@@ -0,0 +1,388 @@
+# coding=utf-8
+"""
+跨日期标题检索索引
+
+热榜日库按天分文件（output/news/{date}.db），按关键词检索一段时间时原先要逐天打开
+日库、加载全部标题再逐条做子串判断。这里为所有日期维护一个持久化的倒排索引：
+
+- 存储在 output/news/search_index.db（不符合 YYYY-MM-DD.db 格式，不会被当作日库处理或清理）
+- 标题以 Python 小写形式（str.lower）写入 FTS5 trigram 表，关键词同样小写后做子串查询，
+  结果与 `keyword.lower() in title.lower()` 完全一致
+- trigram 只能加速 3 个字符及以上的关键词；更短的关键词（如两个字的中文词）
+  以及不支持 FTS5 的 SQLite 上，退化为在索引表内按日期过滤后 instr 扫描，仍只读一个文件
+- 每个日期记录其日库的文件签名（sqlite_profile.db_signature：mtime、大小、-wal 状态）
+  和已同步到的抓取时间：本地存储后端每次保存后只同步本批次新增/更新的行
+  （id 大于已索引的最大行 id，或 last_crawl_time 为本批次），耗时与批次条目数成正比；
+  读取方查询前按签名补齐（如从远程同步下来的日库），签名不一致时整天比对
+
+索引只是日库的派生数据，结构版本变化或文件损坏时直接重建。
+"""
+
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from trendradar.storage.sqlite_profile import SQLiteProfile, db_signature
+
+
+# 索引文件名（与热榜日库同目录）
+SEARCH_INDEX_FILENAME = "search_index.db"
+
+# 索引结构版本（PRAGMA user_version），不一致时重建
+INDEX_VERSION = 2
+
+# trigram 分词器可加速的最短关键词长度
+_TRIGRAM_MIN_LENGTH = 3
+
+_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS indexed_days (
+        date TEXT PRIMARY KEY,
+        state TEXT NOT NULL,
+        crawl_time TEXT
+    );
+    CREATE TABLE IF NOT EXISTS titles (
+        id INTEGER PRIMARY KEY,
+        date TEXT NOT NULL,
+        platform_id TEXT NOT NULL,
+        title TEXT NOT NULL,
+        title_lower TEXT NOT NULL,
+        last_crawl_time TEXT,
+        item_id INTEGER
+    );
+    CREATE INDEX IF NOT EXISTS idx_titles_date ON titles(date, item_id);
+"""
+
+_FTS_SCHEMA = """
+    CREATE VIRTUAL TABLE IF NOT EXISTS titles_fts USING fts5(
+        title_lower, content='titles', content_rowid='id',
+        tokenize='trigram case_sensitive 1'
+    );
+    CREATE TRIGGER IF NOT EXISTS titles_ai AFTER INSERT ON titles BEGIN
+        INSERT INTO titles_fts(rowid, title_lower) VALUES (new.id, new.title_lower);
+    END;
+    CREATE TRIGGER IF NOT EXISTS titles_ad AFTER DELETE ON titles BEGIN
+        INSERT INTO titles_fts(titles_fts, rowid, title_lower) VALUES ('delete', old.id, old.title_lower);
+    END;
+"""
+
+_DAY_TITLES_QUERY = "SELECT id, platform_id, title, last_crawl_time FROM news_items"
+
+# 按 item_id 查询已索引行时每次查询的参数数（低于旧版 SQLite 的 999 个变量上限）
+_LOOKUP_CHUNK = 500
+
+
+class SearchIndex:
+    """
+    跨日期标题检索索引（SQLite 持久化，线程安全）
+
+    使用示例:
+        index = SearchIndex("output/news/search_index.db")
+        index.refresh({"2025-12-28": Path("output/news/2025-12-28.db")})
+        index.search("人工智能", ["2025-12-28"])  # {"2025-12-28": [(platform_id, title, news_item_id), ...]}
+    """
+
+    def __init__(self, index_path: Union[str, Path], sqlite_profile: Optional[SQLiteProfile] = None):
+        """
+        打开（必要时创建/重建）索引
+
+        Args:
+            index_path: 索引文件路径
+            sqlite_profile: SQLite 连接参数（默认 WAL + NORMAL）
+        """
+        self.index_path = Path(index_path)
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        self.sqlite_profile = sqlite_profile or SQLiteProfile()
+        self._lock = threading.Lock()
+        self._conn = self._open()
+        self.has_fts = self._init_schema()
+
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            str(self.index_path),
+            timeout=self.sqlite_profile.busy_timeout / 1000,
+            check_same_thread=False,
+        )
+        self.sqlite_profile.apply(conn)
+        return conn
+
+    def _init_schema(self) -> bool:
+        """建表，返回是否启用 FTS5；版本不一致或文件损坏时重建"""
+        try:
+            version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        except sqlite3.DatabaseError:
+            version = None
+        if version not in (0, INDEX_VERSION):
+            self._rebuild_file()
+
+        self._conn.executescript(_SCHEMA)
+        try:
+            self._conn.executescript(_FTS_SCHEMA)
+            has_fts = True
+        except sqlite3.OperationalError as e:
+            # SQLite 未编译 FTS5 或版本过低（trigram 需要 3.34+）
+            print(f"[检索索引] FTS5 trigram 不可用，使用扫描模式: {e}")
+            has_fts = False
+        self._conn.execute(f"PRAGMA user_version = {INDEX_VERSION}")
+        self._conn.commit()
+        return has_fts
+
+    def _rebuild_file(self) -> None:
+        """删除旧索引文件后重新打开"""
+        self._conn.close()
+        for suffix in ("", "-wal", "-shm"):
+            Path(f"{self.index_path}{suffix}").unlink(missing_ok=True)
+        print(f"[检索索引] 索引结构已变化，重建: {self.index_path}")
+        self._conn = self._open()
+
+    def get_state(self, date: str) -> Optional[str]:
+        """获取已索引日期记录的日库状态"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT state FROM indexed_days WHERE date = ?", (date,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def index_day(self, date: str, day_conn: sqlite3.Connection, state: str) -> int:
+        """
+        用日库内容全量比对同步某一天的索引条目（签名不一致时使用）
+
+        按日库行 id 比对：新行插入，标题或平台变化的行重建，其余行只更新排序用的
+        last_crawl_time（不触及全文索引）；日库中已不存在的行删除。
+
+        Args:
+            date: 日期字符串（YYYY-MM-DD）
+            day_conn: 日库连接
+            state: 日库状态（db_signature 的返回值）
+
+        Returns:
+            插入和删除的条目数
+        """
+        rows = day_conn.execute(_DAY_TITLES_QUERY).fetchall()
+        crawl_time = day_conn.execute("SELECT MAX(crawl_time) FROM crawl_records").fetchone()[0]
+        with self._lock:
+            existing = self._conn.execute(
+                "SELECT id, item_id, platform_id, title, last_crawl_time FROM titles WHERE date = ?",
+                (date,),
+            ).fetchall()
+            return self._sync_rows(date, rows, existing, state, crawl_time, delete_missing=True)
+
+    def index_crawl(self, date: str, day_conn: sqlite3.Connection, crawl_time: str, state: str) -> int:
+        """
+        保存某次抓取后增量同步索引（写入方使用）
+
+        只读取本批次涉及的行：id 大于已索引的最大行 id 的新行，以及 last_crawl_time
+        为本批次的更新行。索引未同步到上一批次（如之前的更新失败）时退回 index_day。
+
+        Args:
+            date: 日期字符串（YYYY-MM-DD）
+            day_conn: 日库连接（已提交本批次写入）
+            crawl_time: 本批次抓取时间
+            state: 写入后的日库状态（db_signature 的返回值）
+
+        Returns:
+            插入和删除的条目数
+        """
+        previous = day_conn.execute(
+            "SELECT MAX(crawl_time) FROM crawl_records WHERE crawl_time < ?", (crawl_time,)
+        ).fetchone()[0]
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT crawl_time, (SELECT MAX(item_id) FROM titles WHERE date = ?) "
+                "FROM indexed_days WHERE date = ?",
+                (date, date),
+            ).fetchone()
+        indexed_crawl, max_item_id = row if row else (None, None)
+        if indexed_crawl is None or indexed_crawl not in (previous, crawl_time):
+            if previous is not None or row is not None:
+                return self.index_day(date, day_conn, state)
+            # 当天第一个批次：索引中没有该日期，全部行都是新行
+        max_item_id = max_item_id or 0
+
+        rows = day_conn.execute(f"{_DAY_TITLES_QUERY} WHERE id > ?", (max_item_id,)).fetchall()
+        updated = day_conn.execute(
+            f"{_DAY_TITLES_QUERY} WHERE last_crawl_time = ? AND id <= ?", (crawl_time, max_item_id)
+        ).fetchall()
+        with self._lock:
+            existing = []
+            item_ids = [item[0] for item in updated]
+            for start in range(0, len(item_ids), _LOOKUP_CHUNK):
+                chunk = item_ids[start:start + _LOOKUP_CHUNK]
+                existing.extend(self._conn.execute(
+                    f"""
+                    SELECT id, item_id, platform_id, title, last_crawl_time FROM titles
+                    WHERE date = ? AND item_id IN ({','.join('?' for _ in chunk)})
+                    """,
+                    (date, *chunk),
+                ))
+            return self._sync_rows(date, updated + rows, existing, state, crawl_time, delete_missing=False)
+
+    def _sync_rows(
+        self,
+        date: str,
+        rows: List[Tuple],
+        existing: Iterable[Tuple],
+        state: str,
+        crawl_time: Optional[str],
+        delete_missing: bool,
+    ) -> int:
+        """
+        将日库行与已索引行比对后写入（调用方持有 _lock）
+
+        Args:
+            date: 日期字符串
+            rows: 日库行 [(id, platform_id, title, last_crawl_time)]
+            existing: 已索引行 [(id, item_id, platform_id, title, last_crawl_time)]
+            state: 日库状态
+            crawl_time: 已同步到的抓取时间
+            delete_missing: 是否删除 rows 中不存在的已索引行（全量比对时为 True）
+
+        Returns:
+            插入和删除的条目数
+        """
+        try:
+            known = {
+                item_id: (row_id, platform_id, title, last_crawl_time)
+                for row_id, item_id, platform_id, title, last_crawl_time in existing
+            }
+
+            inserts, updates, stale = [], [], []
+            for item_id, platform_id, title, last_crawl_time in rows:
+                old = known.pop(item_id, None)
+                if old is not None and old[1] == platform_id and old[2] == title:
+                    if old[3] != last_crawl_time:
+                        updates.append((last_crawl_time, old[0]))
+                    continue
+                if old is not None:
+                    stale.append((old[0],))
+                inserts.append((date, platform_id, title, str(title).lower(), last_crawl_time, item_id))
+            if delete_missing:
+                stale.extend((old[0],) for old in known.values())
+
+            self._conn.executemany("DELETE FROM titles WHERE id = ?", stale)
+            self._conn.executemany("UPDATE titles SET last_crawl_time = ? WHERE id = ?", updates)
+            self._conn.executemany(
+                """
+                INSERT INTO titles (date, platform_id, title, title_lower, last_crawl_time, item_id)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                inserts,
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO indexed_days (date, state, crawl_time) VALUES (?, ?, ?)",
+                (date, state, crawl_time),
+            )
+            self._conn.commit()
+        except sqlite3.Error:
+            self._conn.rollback()
+            raise
+        return len(inserts) + len(stale)
+
+    def remove_day(self, date: str) -> None:
+        """删除某一天的索引条目（日库被删除时调用）"""
+        with self._lock:
+            self._conn.execute("DELETE FROM titles WHERE date = ?", (date,))
+            self._conn.execute("DELETE FROM indexed_days WHERE date = ?", (date,))
+            self._conn.commit()
+
+    def refresh(
+        self,
+        day_paths: Dict[str, Optional[Path]],
+        sqlite_profile: Optional[SQLiteProfile] = None,
+    ) -> int:
+        """
+        按日库状态补齐索引
+
+        Args:
+            day_paths: {日期: 日库路径}，路径为 None 或文件不存在表示该日无数据
+            sqlite_profile: 打开日库使用的连接参数，默认与索引相同
+
+        Returns:
+            同步的日期数
+        """
+        profile = sqlite_profile or self.sqlite_profile
+        synced = 0
+        for date, db_path in day_paths.items():
+            state = db_signature(db_path) if db_path is not None else None
+            indexed_state = self.get_state(date)
+            if state == indexed_state:
+                continue
+            if state is None:
+                self.remove_day(date)
+                continue
+
+            try:
+                day_conn = profile.connect(db_path, read_only=True)
+                try:
+                    self.index_day(date, day_conn, state)
+                finally:
+                    day_conn.close()
+                synced += 1
+            except sqlite3.Error as e:
+                print(f"[检索索引] 索引日库失败 {db_path}: {e}")
+        return synced
+
+    def search(
+        self,
+        keyword: str,
+        dates: Iterable[str],
+        platform_ids: Optional[List[str]] = None,
+    ) -> Dict[str, List[Tuple[str, str, int]]]:
+        """
+        查询包含关键词的标题（大小写不敏感的子串匹配）
+
+        Args:
+            keyword: 关键词
+            dates: 日期字符串列表
+            platform_ids: 平台 ID 列表，None 或空列表表示所有平台
+
+        Returns:
+            {日期: [(platform_id, title, news_item_id), ...]}，每天内按日库行顺序排列；
+            同一平台的重复标题保留首次出现的位置，news_item_id 取最后一行（与 DaySnapshot 一致）
+        """
+        dates = list(dates)
+        if not dates:
+            return {}
+
+        needle = keyword.lower()
+        conditions = [f"t.date IN ({','.join('?' for _ in dates)})"]
+        params: List = list(dates)
+        if platform_ids:
+            conditions.append(f"t.platform_id IN ({','.join('?' for _ in platform_ids)})")
+            params.extend(platform_ids)
+
+        if self.has_fts and len(needle) >= _TRIGRAM_MIN_LENGTH:
+            source = "titles_fts f JOIN titles t ON t.id = f.rowid"
+            conditions.insert(0, "titles_fts MATCH ?")
+            params.insert(0, '"' + needle.replace('"', '""') + '"')
+        else:
+            source = "titles t"
+            conditions.append("instr(t.title_lower, ?) > 0")
+            params.append(needle)
+
+        query = f"""
+            SELECT t.date, t.platform_id, t.title, t.item_id
+            FROM {source}
+            WHERE {" AND ".join(conditions)}
+            ORDER BY t.date, t.platform_id, t.last_crawl_time, t.item_id
+        """
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+
+        results: Dict[str, List[Tuple[str, str, int]]] = {}
+        positions: Dict[Tuple[str, str, str], int] = {}
+        for date, platform_id, title, item_id in rows:
+            day_results = results.setdefault(date, [])
+            key = (date, platform_id, title)
+            position = positions.get(key)
+            if position is None:
+                positions[key] = len(day_results)
+                day_results.append((platform_id, title, item_id))
+            else:
+                day_results[position] = (platform_id, title, item_id)
+        return results
+
+    def close(self) -> None:
+        """关闭数据库连接"""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,435 @@
+# coding=utf-8
+"""
+单日热榜列式快照
+
+一天的数据原本要在 NewsData/NewsItem、{平台: {标题: {...}}} 的 results 与 title_info
+两份嵌套字典之间反复转换，每一步都复制全部字段，内存峰值由这些重复副本决定。
+
+DaySnapshot 只保存一份列式数据：
+- 标题、平台 ID、抓取时间经 sys.intern 驻留，时间列存为驻留表下标（array）
+- 排名历史拼接为一个 array，按偏移量切分；出现次数、当前排名同样为 array
+- 每个平台只保留 {标题: 行号} 索引（重复标题保留首次位置、取最后一行，与旧字典一致）
+
+消费方通过只读视图访问，视图与原有嵌套字典结构相同，字段字典在访问时按需构建：
+- results_view(): {平台: {标题: {ranks, url, mobileUrl}}}
+- title_info_view(): {平台: {标题: {first_time, last_time, count, ranks, url, mobileUrl}}}
+"""
+
+import sqlite3
+import sys
+from array import array
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from trendradar.storage.base import NewsData, NewsItem
+from trendradar.storage.rank_history import load_rank_history
+
+
+class DaySnapshot:
+    """单日热榜列式快照（只追加）"""
+
+    __slots__ = (
+        "date", "crawl_time", "id_to_name", "failed_ids",
+        "_platform_rows", "_platform_pos", "_platform_col", "_platforms",
+        "_titles", "_urls", "_mobile_urls", "_rank_col", "_counts",
+        "_times", "_time_index", "_first_times", "_last_times",
+        "_rank_offsets", "_rank_values",
+    )
+
+    def __init__(
+        self,
+        date: str = "",
+        crawl_time: str = "",
+        id_to_name: Optional[Dict[str, str]] = None,
+        failed_ids: Optional[List[str]] = None,
+    ):
+        self.date = date
+        self.crawl_time = crawl_time
+        self.id_to_name: Dict[str, str] = dict(id_to_name or {})
+        self.failed_ids: List[str] = list(failed_ids or [])
+
+        # 平台索引：{platform_id: {title: row}}
+        self._platform_rows: Dict[str, Dict[str, int]] = {}
+        self._platforms: List[str] = []
+        self._platform_pos: Dict[str, int] = {}
+        self._platform_col = array("H")
+
+        self._titles: List[str] = []
+        self._urls: List[str] = []
+        self._mobile_urls: List[str] = []
+        self._rank_col = array("I")
+        self._counts = array("I")
+
+        self._times: List[str] = []
+        self._time_index: Dict[str, int] = {}
+        self._first_times = array("H")
+        self._last_times = array("H")
+
+        self._rank_offsets = array("I", [0])
+        self._rank_values = array("I")
+
+    def __len__(self) -> int:
+        """行数（含重复标题）"""
+        return len(self._titles)
+
+    def _intern_time(self, value: str) -> int:
+        index = self._time_index.get(value)
+        if index is None:
+            index = self._time_index[value] = len(self._times)
+            self._times.append(sys.intern(value))
+        return index
+
+    def append(
+        self,
+        platform_id: str,
+        title: str,
+        rank: int,
+        url: str = "",
+        mobile_url: str = "",
+        first_time: str = "",
+        last_time: str = "",
+        count: int = 1,
+        ranks: Optional[Sequence[int]] = None,
+    ) -> int:
+        """
+        追加一行
+
+        Returns:
+            行号
+        """
+        rows = self._platform_rows.get(platform_id)
+        if rows is None:
+            platform_id = sys.intern(platform_id)
+            rows = self._platform_rows[platform_id] = {}
+            self._platform_pos[platform_id] = len(self._platforms)
+            self._platforms.append(platform_id)
+        title = sys.intern(title)
+
+        row = len(self._titles)
+        self._platform_col.append(self._platform_pos[platform_id])
+        self._titles.append(title)
+        self._urls.append(url or "")
+        self._mobile_urls.append(mobile_url or "")
+        self._rank_col.append(rank or 0)
+        self._counts.append(count if count is not None else 1)
+        self._first_times.append(self._intern_time(first_time or ""))
+        self._last_times.append(self._intern_time(last_time or ""))
+        self._rank_values.extend(ranks if ranks is not None else [rank or 0])
+        self._rank_offsets.append(len(self._rank_values))
+
+        # 重复标题：保留首次出现的位置，值取最后一行
+        rows[title] = row
+        return row
+
+    # === 按行读取 ===
+
+    def ranks(self, row: int) -> List[int]:
+        """排名历史（每次调用返回新列表）"""
+        return self._rank_values[self._rank_offsets[row]:self._rank_offsets[row + 1]].tolist()
+
+    def result_entry(self, row: int) -> Dict[str, Any]:
+        """results 格式：{ranks, url, mobileUrl}"""
+        return {
+            "ranks": self.ranks(row),
+            "url": self._urls[row],
+            "mobileUrl": self._mobile_urls[row],
+        }
+
+    def title_info_entry(self, row: int) -> Dict[str, Any]:
+        """title_info 格式：{first_time, last_time, count, ranks, url, mobileUrl}"""
+        return {
+            "first_time": self._times[self._first_times[row]],
+            "last_time": self._times[self._last_times[row]],
+            "count": self._counts[row],
+            "ranks": self.ranks(row),
+            "url": self._urls[row],
+            "mobileUrl": self._mobile_urls[row],
+        }
+
+    # === 视图 ===
+
+    def platform_ids(self) -> List[str]:
+        """平台 ID（按首次出现顺序）"""
+        return list(self._platforms)
+
+    def title_count(self, platform_ids: Optional[Iterable[str]] = None) -> int:
+        """去重后的标题数"""
+        allowed = set(platform_ids) if platform_ids is not None else None
+        return sum(
+            len(rows) for pid, rows in self._platform_rows.items()
+            if allowed is None or pid in allowed
+        )
+
+    def results_view(self, platform_ids: Optional[Iterable[str]] = None) -> "SnapshotView":
+        """{平台: {标题: {ranks, url, mobileUrl}}} 只读视图"""
+        return SnapshotView(self, self.result_entry, platform_ids)
+
+    def title_info_view(self, platform_ids: Optional[Iterable[str]] = None) -> "SnapshotView":
+        """{平台: {标题: {first_time, last_time, count, ranks, url, mobileUrl}}} 只读视图"""
+        return SnapshotView(self, self.title_info_entry, platform_ids)
+
+    def names_for(self, platform_ids: Optional[Iterable[str]] = None) -> Dict[str, str]:
+        """快照中（可按平台过滤）各平台的名称，缺失时使用平台 ID"""
+        allowed = set(platform_ids) if platform_ids is not None else None
+        return {
+            pid: self.id_to_name.get(pid, pid)
+            for pid in self._platforms
+            if allowed is None or pid in allowed
+        }
+
+    # === 转换 ===
+
+    @classmethod
+    def from_news_data(cls, data: NewsData) -> "DaySnapshot":
+        """从 NewsData 构建"""
+        snapshot = cls(data.date, data.crawl_time, data.id_to_name, data.failed_ids)
+        for source_id, news_list in data.items.items():
+            for item in news_list:
+                snapshot.append(
+                    source_id,
+                    item.title,
+                    item.rank,
+                    item.url,
+                    item.mobile_url,
+                    getattr(item, "first_time", item.crawl_time),
+                    getattr(item, "last_time", item.crawl_time),
+                    getattr(item, "count", 1),
+                    getattr(item, "ranks", [item.rank]),
+                )
+        return snapshot
+
+    @classmethod
+    def from_results(
+        cls,
+        results: Dict[str, Dict[str, Any]],
+        id_to_name: Optional[Dict[str, str]] = None,
+        crawl_time: str = "",
+    ) -> "DaySnapshot":
+        """
+        从单次抓取结果 {平台: {标题: {ranks, url, mobileUrl}}} 构建
+
+        首次/最后出现时间均为 crawl_time，出现次数为 1。
+        """
+        snapshot = cls(crawl_time=crawl_time, id_to_name=id_to_name)
+        for source_id, titles_data in results.items():
+            for title, title_data in titles_data.items():
+                ranks = title_data.get("ranks", [])
+                snapshot.append(
+                    source_id,
+                    title,
+                    ranks[0] if ranks else 0,
+                    title_data.get("url", ""),
+                    title_data.get("mobileUrl", ""),
+                    crawl_time,
+                    crawl_time,
+                    1,
+                    ranks,
+                )
+        return snapshot
+
+    def to_news_data(self) -> NewsData:
+        """转换为 NewsData（每一行一个 NewsItem）"""
+        items: Dict[str, List[NewsItem]] = {}
+        for row, title in enumerate(self._titles):
+            platform_id = self._platforms[self._platform_col[row]]
+            items.setdefault(platform_id, []).append(NewsItem(
+                title=title,
+                source_id=platform_id,
+                source_name=self.id_to_name.get(platform_id, platform_id),
+                rank=self._rank_col[row],
+                url=self._urls[row],
+                mobile_url=self._mobile_urls[row],
+                crawl_time=self._times[self._last_times[row]],
+                ranks=self.ranks(row),
+                first_time=self._times[self._first_times[row]],
+                last_time=self._times[self._last_times[row]],
+                count=self._counts[row],
+            ))
+        return NewsData(
+            date=self.date,
+            crawl_time=self.crawl_time,
+            items=items,
+            id_to_name=dict(self.id_to_name),
+            failed_ids=list(self.failed_ids),
+        )
+
+
+class _PlatformView(Mapping):
+    """单个平台的 {标题: 字段字典} 只读视图"""
+
+    __slots__ = ("_rows", "_entry")
+
+    def __init__(self, rows: Dict[str, int], entry: Callable[[int], Dict[str, Any]]):
+        self._rows = rows
+        self._entry = entry
+
+    def __getitem__(self, title: str) -> Dict[str, Any]:
+        return self._entry(self._rows[title])
+
+    def __contains__(self, title: object) -> bool:
+        return title in self._rows
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._rows)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def items(self):  # type: ignore[override]
+        entry = self._entry
+        return ((title, entry(row)) for title, row in self._rows.items())
+
+    def values(self):  # type: ignore[override]
+        entry = self._entry
+        return (entry(row) for row in self._rows.values())
+
+
+class SnapshotView(Mapping):
+    """
+    {平台: {标题: 字段字典}} 只读视图
+
+    字段字典在访问时构建，修改返回的字典不会影响快照。
+    """
+
+    __slots__ = ("_snapshot", "_entry", "_platforms")
+
+    def __init__(
+        self,
+        snapshot: DaySnapshot,
+        entry: Callable[[int], Dict[str, Any]],
+        platform_ids: Optional[Iterable[str]] = None,
+    ):
+        self._snapshot = snapshot
+        self._entry = entry
+        allowed = set(platform_ids) if platform_ids is not None else None
+        self._platforms = [
+            pid for pid in snapshot._platforms
+            if allowed is None or pid in allowed
+        ]
+
+    def __getitem__(self, platform_id: str) -> _PlatformView:
+        if platform_id not in self._platforms:
+            raise KeyError(platform_id)
+        return _PlatformView(self._snapshot._platform_rows[platform_id], self._entry)
+
+    def __contains__(self, platform_id: object) -> bool:
+        return platform_id in self._platforms
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._platforms)
+
+    def __len__(self) -> int:
+        return len(self._platforms)
+
+
+def load_day_snapshot(
+    cursor: sqlite3.Cursor,
+    crawl_date: str,
+    platform_ids: Optional[List[str]] = None,
+    dedupe: bool = True,
+) -> Optional[DaySnapshot]:
+    """
+    从热榜日库直接读取列式快照（不经过 NewsItem）
+
+    行按 (platform_id, last_crawl_time, id) 排序，与 get_today_all_data 一致。
+
+    Args:
+        cursor: 数据库游标
+        crawl_date: 日期字符串
+        platform_ids: 平台 ID 列表，None 表示所有平台
+        dedupe: 排名历史是否去重
+
+    Returns:
+        DaySnapshot；没有数据时返回 None
+    """
+    where = ""
+    params: Sequence[str] = ()
+    if platform_ids:
+        where = f"n.platform_id IN ({','.join('?' for _ in platform_ids)})"
+        params = tuple(platform_ids)
+
+    # 先流式加载排名历史，再逐行读取条目（不整体 fetchall）
+    rank_history_map = load_rank_history(cursor, where, params, dedupe=dedupe)
+
+    cursor.execute(f"""
+        SELECT n.id, n.title, n.platform_id, p.name as platform_name,
+               n.rank, n.url, n.mobile_url,
+               n.first_crawl_time, n.last_crawl_time, n.crawl_count
+        FROM news_items n
+        LEFT JOIN platforms p ON n.platform_id = p.id
+        {"WHERE " + where if where else ""}
+        ORDER BY n.platform_id, n.last_crawl_time, n.id
+    """, params)
+
+    snapshot = DaySnapshot(date=crawl_date)
+    for row in cursor:
+        platform_id = row[2]
+        if platform_id not in snapshot.id_to_name:
+            snapshot.id_to_name[platform_id] = row[3] or platform_id
+        snapshot.append(
+            platform_id, row[1], row[4], row[5], row[6], row[7], row[8], row[9],
+            rank_history_map.pop(row[0], None),
+        )
+    if not len(snapshot):
+        return None
+
+    cursor.execute("""
+        SELECT DISTINCT css.platform_id
+        FROM crawl_source_status css
+        JOIN crawl_records cr ON css.crawl_record_id = cr.id
+        WHERE css.status = 'failed'
+    """)
+    snapshot.failed_ids = [row[0] for row in cursor.fetchall()]
+
+    cursor.execute("SELECT crawl_time FROM crawl_records ORDER BY crawl_time DESC LIMIT 1")
+    time_row = cursor.fetchone()
+    snapshot.crawl_time = time_row[0] if time_row else ""
+    return snapshot
+
+
+# 按 id 部分读取时每次查询的 id 数（低于旧版 SQLite 的 999 个变量上限）
+_ID_CHUNK = 500
+
+
+def load_title_entries(
+    cursor: sqlite3.Cursor,
+    item_ids: Sequence[int],
+    dedupe: bool = True,
+) -> Dict[int, Dict[str, Any]]:
+    """
+    按 news_items.id 读取部分条目的字段字典（格式同 DaySnapshot.title_info_entry）
+
+    用于只需要少量命中条目的场景（如跨日期检索），不加载整天数据。
+
+    Args:
+        cursor: 数据库游标
+        item_ids: news_items.id 列表
+        dedupe: 排名历史是否去重
+
+    Returns:
+        {news_item_id: {first_time, last_time, count, ranks, url, mobileUrl}}，
+        日库中不存在的 id 不出现在结果中
+    """
+    entries: Dict[int, Dict[str, Any]] = {}
+    for start in range(0, len(item_ids), _ID_CHUNK):
+        chunk = tuple(item_ids[start:start + _ID_CHUNK])
+        where = f"n.id IN ({','.join('?' for _ in chunk)})"
+        rank_history_map = load_rank_history(cursor, where, chunk, dedupe=dedupe)
+
+        cursor.execute(f"""
+            SELECT n.id, n.rank, n.url, n.mobile_url,
+                   n.first_crawl_time, n.last_crawl_time, n.crawl_count
+            FROM news_items n
+            WHERE {where}
+        """, chunk)
+        for row in cursor:
+            ranks = rank_history_map.get(row[0])
+            entries[row[0]] = {
+                "first_time": row[4] or "",
+                "last_time": row[5] or "",
+                "count": row[6] if row[6] is not None else 1,
+                "ranks": ranks if ranks is not None else [row[1] or 0],
+                "url": row[2] or "",
+                "mobileUrl": row[3] or "",
+            }
+    return entries
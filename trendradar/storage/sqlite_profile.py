@@ -0,0 +1,168 @@
+# coding=utf-8
+"""
+SQLite 连接参数配置
+
+爬虫写入与 MCP Server 读取共用 output/{news,rss}/*.db，默认 rollback journal 下
+读写互相阻塞。这里统一管理连接 PRAGMA（对应 config.yaml 的 storage.sqlite）：
+
+- journal_mode: WAL 模式下读者不阻塞写者、写者不阻塞读者
+- synchronous: WAL 下 NORMAL 即可保证数据库一致性，写入明显更快
+- mmap_size / cache_size / temp_store: 读取性能
+- busy_timeout: 遇到锁时的等待时间，避免直接抛出 "database is locked"
+"""
+
+import sqlite3
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+
+JOURNAL_MODES = {"delete", "truncate", "persist", "memory", "wal", "off"}
+SYNCHRONOUS_MODES = {"off", "normal", "full", "extra"}
+TEMP_STORE_MODES = {"default", "file", "memory"}
+
+
+@dataclass
+class SQLiteProfile:
+    """
+    SQLite 连接参数
+
+    字符串参数为空时不设置对应 PRAGMA（使用 SQLite 默认值）。
+    """
+    journal_mode: str = "wal"
+    synchronous: str = "normal"
+    mmap_size: int = 268435456       # 256 MB，0 表示禁用 mmap
+    cache_size: int = -16000         # 负数表示 KiB（约 16 MB），正数表示页数
+    temp_store: str = "memory"
+    busy_timeout: int = 5000         # 毫秒
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]]) -> "SQLiteProfile":
+        """
+        从配置创建
+
+        同时接受 loader 输出的大写键（JOURNAL_MODE）和 config.yaml 原始小写键
+        （journal_mode），非法值回退默认值并打印警告。
+
+        Args:
+            config: storage.sqlite 配置字典
+
+        Returns:
+            SQLiteProfile 实例
+        """
+        profile = cls()
+        if not config:
+            return profile
+
+        def get(key: str) -> Any:
+            value = config.get(key.upper())
+            return config.get(key) if value is None else value
+
+        for key, allowed in (
+            ("journal_mode", JOURNAL_MODES),
+            ("synchronous", SYNCHRONOUS_MODES),
+            ("temp_store", TEMP_STORE_MODES),
+        ):
+            value = get(key)
+            if value is None:
+                continue
+            value = str(value).strip().lower()
+            if value and value not in allowed:
+                print(f"[存储] SQLite 配置 {key}={value} 无效，使用默认值 {getattr(profile, key)}")
+                continue
+            setattr(profile, key, value)
+
+        for key in ("mmap_size", "cache_size", "busy_timeout"):
+            value = get(key)
+            if value is None:
+                continue
+            try:
+                setattr(profile, key, int(value))
+            except (TypeError, ValueError):
+                print(f"[存储] SQLite 配置 {key}={value} 无效，使用默认值 {getattr(profile, key)}")
+
+        return profile
+
+    def apply(self, conn: sqlite3.Connection, read_only: bool = False) -> None:
+        """
+        对连接应用 PRAGMA
+
+        journal_mode 与 synchronous 只在写连接上设置：切换 journal_mode 需要写锁，
+        且 WAL 模式是持久化在数据库文件中的，读连接会自动沿用。
+
+        Args:
+            conn: 数据库连接
+            read_only: 是否为只读连接
+        """
+        conn.execute(f"PRAGMA busy_timeout = {self.busy_timeout}")
+
+        if not read_only:
+            if self.journal_mode:
+                try:
+                    conn.execute(f"PRAGMA journal_mode = {self.journal_mode}")
+                except sqlite3.Error as e:
+                    # 部分文件系统（如网络挂载）不支持 WAL，保持原模式继续运行
+                    print(f"[存储] 设置 journal_mode={self.journal_mode} 失败: {e}")
+            if self.synchronous:
+                conn.execute(f"PRAGMA synchronous = {self.synchronous}")
+
+        conn.execute(f"PRAGMA mmap_size = {self.mmap_size}")
+        conn.execute(f"PRAGMA cache_size = {self.cache_size}")
+        if self.temp_store:
+            conn.execute(f"PRAGMA temp_store = {self.temp_store}")
+
+    def connect(self, db_path: Union[str, Path], read_only: bool = False) -> sqlite3.Connection:
+        """
+        打开数据库连接并应用参数
+
+        Args:
+            db_path: 数据库文件路径
+            read_only: 是否为只读连接
+
+        Returns:
+            数据库连接
+        """
+        conn = sqlite3.connect(str(db_path), timeout=self.busy_timeout / 1000)
+        self.apply(conn, read_only=read_only)
+        return conn
+
+
+def checkpoint(conn: sqlite3.Connection) -> None:
+    """
+    将 WAL 内容合并回主数据库文件
+
+    上传/复制 .db 文件前调用，保证单个文件即包含完整数据。非 WAL 模式下为空操作。
+
+    Args:
+        conn: 数据库连接
+    """
+    try:
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    except sqlite3.Error as e:
+        print(f"[存储] WAL checkpoint 失败: {e}")
+
+
+def db_signature(db_path: Union[str, Path]) -> Optional[str]:
+    """
+    获取数据库文件签名（用于判断读取方的缓存/派生数据是否过期）
+
+    WAL 模式下提交的写入先落在 -wal 文件，主文件要等 checkpoint 才变化，
+    因此 -wal 文件的 mtime 和大小也计入签名。
+
+    Args:
+        db_path: 数据库文件路径
+
+    Returns:
+        "mtime_ns:size[:wal_mtime_ns:wal_size]" 字符串，文件不存在时返回 None
+    """
+    try:
+        stat = Path(db_path).stat()
+    except OSError:
+        return None
+    signature = f"{stat.st_mtime_ns}:{stat.st_size}"
+    try:
+        wal_stat = Path(f"{db_path}-wal").stat()
+        signature += f":{wal_stat.st_mtime_ns}:{wal_stat.st_size}"
+    except OSError:
+        pass
+    return signature
@@ -0,0 +1,628 @@
+# coding=utf-8
+"""
+SQLite 批量写入器 - 本地/远程存储后端共用
+
+每次抓取的全部写入在一个事务内完成：
+- 一次查询加载已有记录，在内存中判定新增/更新
+- 预分配自增 ID，用 executemany 批量写入
+- SQL 语句为固定常量，sqlite3 的语句缓存会在多次调用间复用同一预编译语句
+- 批量写入出错时回滚到保存点，回退逐条写入（单条失败不影响其他条目）
+"""
+
+import sqlite3
+from typing import Dict, List, Tuple
+
+from trendradar.storage.base import NewsData, RSSData
+from trendradar.utils.url import normalize_url
+
+
+# ============================================
+# 新闻数据库语句
+# ============================================
+
+UPSERT_PLATFORM_SQL = """
+    INSERT INTO platforms (id, name, updated_at)
+    VALUES (?, ?, ?)
+    ON CONFLICT(id) DO UPDATE SET
+        name = excluded.name,
+        updated_at = excluded.updated_at
+"""
+
+INSERT_FAILED_PLATFORM_SQL = """
+    INSERT OR IGNORE INTO platforms (id, name, updated_at)
+    VALUES (?, ?, ?)
+"""
+
+SELECT_NEWS_ITEM_SQL = """
+    SELECT id, title FROM news_items
+    WHERE url = ? AND platform_id = ?
+"""
+
+INSERT_NEWS_ITEM_SQL = """
+    INSERT INTO news_items
+    (title, platform_id, rank, url, mobile_url,
+     first_crawl_time, last_crawl_time, crawl_count,
+     created_at, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, 1, ?, ?)
+"""
+
+INSERT_NEWS_ITEM_WITH_ID_SQL = """
+    INSERT INTO news_items
+    (id, title, platform_id, rank, url, mobile_url,
+     first_crawl_time, last_crawl_time, crawl_count,
+     created_at, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, 1, ?, ?)
+"""
+
+UPDATE_NEWS_ITEM_SQL = """
+    UPDATE news_items SET
+        title = ?,
+        rank = ?,
+        mobile_url = ?,
+        last_crawl_time = ?,
+        crawl_count = crawl_count + 1,
+        updated_at = ?
+    WHERE id = ?
+"""
+
+INSERT_TITLE_CHANGE_SQL = """
+    INSERT INTO title_changes
+    (news_item_id, old_title, new_title, changed_at)
+    VALUES (?, ?, ?, ?)
+"""
+
+INSERT_RANK_HISTORY_SQL = """
+    INSERT INTO rank_history
+    (news_item_id, rank, crawl_time, created_at)
+    VALUES (?, ?, ?, ?)
+"""
+
+INSERT_CRAWL_RECORD_SQL = """
+    INSERT OR REPLACE INTO crawl_records
+    (crawl_time, total_items, created_at)
+    VALUES (?, ?, ?)
+"""
+
+SELECT_CRAWL_RECORD_SQL = "SELECT id FROM crawl_records WHERE crawl_time = ?"
+
+INSERT_SOURCE_STATUS_SQL = """
+    INSERT OR REPLACE INTO crawl_source_status
+    (crawl_record_id, platform_id, status)
+    VALUES (?, ?, ?)
+"""
+
+# ============================================
+# RSS 数据库语句
+# ============================================
+
+UPSERT_RSS_FEED_SQL = """
+    INSERT INTO rss_feeds (id, name, updated_at)
+    VALUES (?, ?, ?)
+    ON CONFLICT(id) DO UPDATE SET
+        name = excluded.name,
+        updated_at = excluded.updated_at
+"""
+
+INSERT_FAILED_RSS_FEED_SQL = """
+    INSERT OR IGNORE INTO rss_feeds (id, name, updated_at)
+    VALUES (?, ?, ?)
+"""
+
+SELECT_RSS_ITEM_SQL = """
+    SELECT id, title FROM rss_items
+    WHERE url = ? AND feed_id = ?
+"""
+
+INSERT_RSS_ITEM_SQL = """
+    INSERT INTO rss_items
+    (title, feed_id, url, published_at, summary, author,
+     first_crawl_time, last_crawl_time, crawl_count,
+     created_at, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, 1, ?, ?)
+"""
+
+INSERT_RSS_ITEM_WITH_ID_SQL = """
+    INSERT INTO rss_items
+    (id, title, feed_id, url, published_at, summary, author,
+     first_crawl_time, last_crawl_time, crawl_count,
+     created_at, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, 1, ?, ?)
+"""
+
+UPDATE_RSS_ITEM_SQL = """
+    UPDATE rss_items SET
+        title = ?,
+        published_at = ?,
+        summary = ?,
+        author = ?,
+        last_crawl_time = ?,
+        crawl_count = crawl_count + 1,
+        updated_at = ?
+    WHERE id = ?
+"""
+
+INSERT_RSS_CRAWL_RECORD_SQL = """
+    INSERT OR REPLACE INTO rss_crawl_records
+    (crawl_time, total_items, created_at)
+    VALUES (?, ?, ?)
+"""
+
+SELECT_RSS_CRAWL_RECORD_SQL = "SELECT id FROM rss_crawl_records WHERE crawl_time = ?"
+
+INSERT_RSS_CRAWL_STATUS_SQL = """
+    INSERT OR REPLACE INTO rss_crawl_status
+    (crawl_record_id, feed_id, status)
+    VALUES (?, ?, ?)
+"""
+
+
+class SQLiteBatchWriter:
+    """
+    SQLite 批量写入器
+
+    LocalStorageBackend 与 RemoteStorageBackend 的 save_news_data /
+    save_rss_data 共用此写入器，保证两者写入语义一致。
+    """
+
+    def __init__(self, log_prefix: str = ""):
+        """
+        初始化写入器
+
+        Args:
+            log_prefix: 日志前缀（如 "[本地存储]"）
+        """
+        self.log_prefix = log_prefix
+
+    def _log(self, message: str) -> None:
+        """输出带前缀的日志"""
+        print(f"{self.log_prefix} {message}" if self.log_prefix else message)
+
+    # ========================================
+    # 事务入口
+    # ========================================
+
+    def save_news(self, conn: sqlite3.Connection, data: NewsData, now_str: str) -> Tuple[int, int, int]:
+        """
+        在单个事务内写入一次新闻抓取（平台、条目、抓取记录与来源状态）
+
+        失败时回滚整个事务并重新抛出异常。
+
+        Args:
+            conn: 数据库连接
+            data: 新闻数据
+            now_str: 当前时间字符串
+
+        Returns:
+            (新增数, 更新数, 标题变更数) 元组
+        """
+        cursor = conn.cursor()
+        try:
+            # 立即获取写锁：批量路径需要预分配自增 ID，期间不允许其他写入者插入
+            if not conn.in_transaction:
+                cursor.execute("BEGIN IMMEDIATE")
+
+            # 同步平台信息到 platforms 表
+            cursor.executemany(UPSERT_PLATFORM_SQL, [
+                (source_id, source_name, now_str)
+                for source_id, source_name in data.id_to_name.items()
+            ])
+
+            new_count, updated_count, title_changed_count = self.write_news_items(
+                cursor, data, now_str
+            )
+
+            # 记录抓取信息
+            cursor.execute(INSERT_CRAWL_RECORD_SQL,
+                           (data.crawl_time, new_count + updated_count, now_str))
+
+            # 记录成功/失败的来源
+            cursor.execute(SELECT_CRAWL_RECORD_SQL, (data.crawl_time,))
+            record_row = cursor.fetchone()
+            if record_row:
+                crawl_record_id = record_row[0]
+                cursor.executemany(INSERT_SOURCE_STATUS_SQL, [
+                    (crawl_record_id, source_id, "success") for source_id in data.items.keys()
+                ])
+                # 确保失败的平台也在 platforms 表中
+                cursor.executemany(INSERT_FAILED_PLATFORM_SQL, [
+                    (failed_id, failed_id, now_str) for failed_id in data.failed_ids
+                ])
+                cursor.executemany(INSERT_SOURCE_STATUS_SQL, [
+                    (crawl_record_id, failed_id, "failed") for failed_id in data.failed_ids
+                ])
+
+            conn.commit()
+        except Exception:
+            if conn.in_transaction:
+                conn.rollback()
+            raise
+
+        return new_count, updated_count, title_changed_count
+
+    def save_rss(self, conn: sqlite3.Connection, data: RSSData, now_str: str) -> Tuple[int, int]:
+        """
+        在单个事务内写入一次 RSS 抓取（RSS 源、条目、抓取记录与状态）
+
+        失败时回滚整个事务并重新抛出异常。
+
+        Args:
+            conn: 数据库连接
+            data: RSS 数据
+            now_str: 当前时间字符串
+
+        Returns:
+            (新增数, 更新数) 元组
+        """
+        cursor = conn.cursor()
+        try:
+            if not conn.in_transaction:
+                cursor.execute("BEGIN IMMEDIATE")
+
+            # 同步 RSS 源信息到 rss_feeds 表
+            cursor.executemany(UPSERT_RSS_FEED_SQL, [
+                (feed_id, feed_name, now_str)
+                for feed_id, feed_name in data.id_to_name.items()
+            ])
+
+            new_count, updated_count = self.write_rss_items(cursor, data, now_str)
+
+            # 记录抓取信息
+            cursor.execute(INSERT_RSS_CRAWL_RECORD_SQL,
+                           (data.crawl_time, new_count + updated_count, now_str))
+
+            # 记录抓取状态
+            cursor.execute(SELECT_RSS_CRAWL_RECORD_SQL, (data.crawl_time,))
+            record_row = cursor.fetchone()
+            if record_row:
+                crawl_record_id = record_row[0]
+                cursor.executemany(INSERT_RSS_CRAWL_STATUS_SQL, [
+                    (crawl_record_id, feed_id, "success") for feed_id in data.items.keys()
+                ])
+                cursor.executemany(INSERT_FAILED_RSS_FEED_SQL, [
+                    (failed_id, failed_id, now_str) for failed_id in data.failed_ids
+                ])
+                cursor.executemany(INSERT_RSS_CRAWL_STATUS_SQL, [
+                    (crawl_record_id, failed_id, "failed") for failed_id in data.failed_ids
+                ])
+
+            conn.commit()
+        except Exception:
+            if conn.in_transaction:
+                conn.rollback()
+            raise
+
+        return new_count, updated_count
+
+    # ========================================
+    # 条目写入（批量 + 逐条回退）
+    # ========================================
+
+    def _with_fallback(self, cursor: sqlite3.Cursor, savepoint: str, batched, rowwise, *args):
+        """在保存点内执行批量写入，出错时回滚到保存点并改用逐条写入"""
+        cursor.execute(f"SAVEPOINT {savepoint}")
+        try:
+            counts = batched(cursor, *args)
+        except sqlite3.Error as e:
+            self._log(f"批量写入失败，回退逐条写入: {e}")
+            cursor.execute(f"ROLLBACK TO SAVEPOINT {savepoint}")
+            cursor.execute(f"RELEASE SAVEPOINT {savepoint}")
+            return rowwise(cursor, *args)
+
+        cursor.execute(f"RELEASE SAVEPOINT {savepoint}")
+        return counts
+
+    def write_news_items(
+        self, cursor: sqlite3.Cursor, data: NewsData, now_str: str
+    ) -> Tuple[int, int, int]:
+        """
+        写入新闻条目（批量路径，失败时回退逐条路径）
+
+        Args:
+            cursor: 数据库游标（调用方已开启事务）
+            data: 新闻数据
+            now_str: 当前时间字符串
+
+        Returns:
+            (新增数, 更新数, 标题变更数) 元组
+        """
+        return self._with_fallback(
+            cursor, "news_items_batch",
+            self.write_news_items_batched, self.write_news_items_rowwise,
+            data, now_str,
+        )
+
+    def write_rss_items(
+        self, cursor: sqlite3.Cursor, data: RSSData, now_str: str
+    ) -> Tuple[int, int]:
+        """
+        写入 RSS 条目（批量路径，失败时回退逐条路径）
+
+        Args:
+            cursor: 数据库游标（调用方已开启事务）
+            data: RSS 数据
+            now_str: 当前时间字符串
+
+        Returns:
+            (新增数, 更新数) 元组
+        """
+        return self._with_fallback(
+            cursor, "rss_items_batch",
+            self.write_rss_items_batched, self.write_rss_items_rowwise,
+            data, now_str,
+        )
+
+    @staticmethod
+    def next_autoincrement_id(cursor: sqlite3.Cursor, table: str) -> int:
+        """
+        计算 AUTOINCREMENT 表的下一个 ID（需在持有写锁的事务内调用）
+
+        Args:
+            cursor: 数据库游标
+            table: 表名
+
+        Returns:
+            下一个可用 ID
+        """
+        cursor.execute("SELECT seq FROM sqlite_sequence WHERE name = ?", (table,))
+        row = cursor.fetchone()
+        seq = row[0] if row else 0
+
+        cursor.execute(f"SELECT MAX(id) FROM {table}")
+        row = cursor.fetchone()
+        max_id = row[0] if row and row[0] is not None else 0
+
+        return max(seq, max_id) + 1
+
+    @staticmethod
+    def _load_existing(
+        cursor: sqlite3.Cursor, table: str, group_column: str, group_ids: List[str]
+    ) -> Dict[Tuple[str, str], List]:
+        """一次查询加载指定分组下已有记录：(url, group_id) -> [id, title]"""
+        placeholders = ",".join("?" * len(group_ids))
+        cursor.execute(f"""
+            SELECT id, url, {group_column}, title FROM {table}
+            WHERE url != '' AND {group_column} IN ({placeholders})
+        """, group_ids)
+        return {(row[1], row[2]): [row[0], row[3]] for row in cursor.fetchall()}
+
+    def write_news_items_batched(
+        self, cursor: sqlite3.Cursor, data: NewsData, now_str: str
+    ) -> Tuple[int, int, int]:
+        """
+        批量写入新闻条目
+
+        流程：
+        1. 预先标准化所有 URL
+        2. 一次查询加载本次涉及平台的已有 (url, platform_id) -> (id, title)
+        3. 在内存中判定新增/更新/标题变更，并预分配新记录 ID
+        4. 用 executemany 一次性写入 news_items / title_changes / rank_history
+
+        同一批次内重复出现的 URL 与逐条路径一致：后出现的条目视为对先出现条目的更新。
+
+        Args:
+            cursor: 数据库游标（调用方已开启事务并持有写锁）
+            data: 新闻数据
+            now_str: 当前时间字符串
+
+        Returns:
+            (新增数, 更新数, 标题变更数) 元组
+        """
+        crawl_time = data.crawl_time
+
+        # 预先标准化 URL（去除动态参数，如微博的 band_rank）
+        prepared = [
+            (source_id, item, normalize_url(item.url, source_id) if item.url else "")
+            for source_id, news_list in data.items.items()
+            for item in news_list
+        ]
+        if not prepared:
+            return 0, 0, 0
+
+        existing = self._load_existing(cursor, "news_items", "platform_id", list(data.items.keys()))
+        next_id = self.next_autoincrement_id(cursor, "news_items")
+
+        insert_rows = []
+        update_rows = []
+        rank_rows = []
+        title_change_rows = []
+        new_count = 0
+        updated_count = 0
+        title_changed_count = 0
+
+        for source_id, item, normalized_url in prepared:
+            record = existing.get((normalized_url, source_id)) if normalized_url else None
+
+            if record:
+                existing_id, existing_title = record
+
+                # 检查标题是否变化
+                if existing_title != item.title:
+                    title_change_rows.append((existing_id, existing_title, item.title, now_str))
+                    title_changed_count += 1
+                record[1] = item.title
+
+                rank_rows.append((existing_id, item.rank, crawl_time, now_str))
+                update_rows.append((item.title, item.rank, item.mobile_url,
+                                    crawl_time, now_str, existing_id))
+                updated_count += 1
+            else:
+                new_id = next_id
+                next_id += 1
+                insert_rows.append((new_id, item.title, source_id, item.rank, normalized_url,
+                                    item.mobile_url, crawl_time, crawl_time, now_str, now_str))
+                rank_rows.append((new_id, item.rank, crawl_time, now_str))
+                if normalized_url:
+                    existing[(normalized_url, source_id)] = [new_id, item.title]
+                new_count += 1
+
+        # 先插入新记录，同批次内的后续更新可能引用这些 ID
+        if insert_rows:
+            cursor.executemany(INSERT_NEWS_ITEM_WITH_ID_SQL, insert_rows)
+        if title_change_rows:
+            cursor.executemany(INSERT_TITLE_CHANGE_SQL, title_change_rows)
+        if rank_rows:
+            cursor.executemany(INSERT_RANK_HISTORY_SQL, rank_rows)
+        if update_rows:
+            cursor.executemany(UPDATE_NEWS_ITEM_SQL, update_rows)
+
+        return new_count, updated_count, title_changed_count
+
+    def write_news_items_rowwise(
+        self, cursor: sqlite3.Cursor, data: NewsData, now_str: str
+    ) -> Tuple[int, int, int]:
+        """
+        逐条写入新闻条目（每条先查询再更新/插入，单条失败不影响其他条目）
+
+        Args:
+            cursor: 数据库游标
+            data: 新闻数据
+            now_str: 当前时间字符串
+
+        Returns:
+            (新增数, 更新数, 标题变更数) 元组
+        """
+        new_count = 0
+        updated_count = 0
+        title_changed_count = 0
+
+        for source_id, news_list in data.items.items():
+            for item in news_list:
+                try:
+                    # 标准化 URL（去除动态参数，如微博的 band_rank）
+                    normalized_url = normalize_url(item.url, source_id) if item.url else ""
+
+                    existing = None
+                    if normalized_url:
+                        cursor.execute(SELECT_NEWS_ITEM_SQL, (normalized_url, source_id))
+                        existing = cursor.fetchone()
+
+                    if existing:
+                        existing_id, existing_title = existing[0], existing[1]
+
+                        # 检查标题是否变化
+                        if existing_title != item.title:
+                            cursor.execute(INSERT_TITLE_CHANGE_SQL,
+                                           (existing_id, existing_title, item.title, now_str))
+                            title_changed_count += 1
+
+                        cursor.execute(INSERT_RANK_HISTORY_SQL,
+                                       (existing_id, item.rank, data.crawl_time, now_str))
+                        cursor.execute(UPDATE_NEWS_ITEM_SQL,
+                                       (item.title, item.rank, item.mobile_url,
+                                        data.crawl_time, now_str, existing_id))
+                        updated_count += 1
+                    else:
+                        # 新记录（URL 为空时不做去重，直接插入）
+                        cursor.execute(INSERT_NEWS_ITEM_SQL,
+                                       (item.title, source_id, item.rank, normalized_url,
+                                        item.mobile_url, data.crawl_time, data.crawl_time,
+                                        now_str, now_str))
+                        cursor.execute(INSERT_RANK_HISTORY_SQL,
+                                       (cursor.lastrowid, item.rank, data.crawl_time, now_str))
+                        new_count += 1
+
+                except sqlite3.Error as e:
+                    self._log(f"保存新闻条目失败 [{item.title[:30]}...]: {e}")
+
+        return new_count, updated_count, title_changed_count
+
+    def write_rss_items_batched(
+        self, cursor: sqlite3.Cursor, data: RSSData, now_str: str
+    ) -> Tuple[int, int]:
+        """
+        批量写入 RSS 条目
+
+        与新闻条目相同：一次查询加载已有 (url, feed_id)，内存判定后 executemany 写入。
+        同一批次内重复出现的 URL 视为对先出现条目的更新。
+
+        Args:
+            cursor: 数据库游标（调用方已开启事务并持有写锁）
+            data: RSS 数据
+            now_str: 当前时间字符串
+
+        Returns:
+            (新增数, 更新数) 元组
+        """
+        crawl_time = data.crawl_time
+        prepared = [
+            (feed_id, item)
+            for feed_id, rss_list in data.items.items()
+            for item in rss_list
+        ]
+        if not prepared:
+            return 0, 0
+
+        existing = self._load_existing(cursor, "rss_items", "feed_id", list(data.items.keys()))
+        next_id = self.next_autoincrement_id(cursor, "rss_items")
+
+        insert_rows = []
+        update_rows = []
+        new_count = 0
+        updated_count = 0
+
+        for feed_id, item in prepared:
+            record = existing.get((item.url, feed_id)) if item.url else None
+
+            if record:
+                update_rows.append((item.title, item.published_at, item.summary,
+                                    item.author, crawl_time, now_str, record[0]))
+                updated_count += 1
+            else:
+                new_id = next_id
+                next_id += 1
+                insert_rows.append((new_id, item.title, feed_id, item.url or "",
+                                    item.published_at, item.summary, item.author,
+                                    crawl_time, crawl_time, now_str, now_str))
+                if item.url:
+                    existing[(item.url, feed_id)] = [new_id, item.title]
+                new_count += 1
+
+        if insert_rows:
+            cursor.executemany(INSERT_RSS_ITEM_WITH_ID_SQL, insert_rows)
+        if update_rows:
+            cursor.executemany(UPDATE_RSS_ITEM_SQL, update_rows)
+
+        return new_count, updated_count
+
+    def write_rss_items_rowwise(
+        self, cursor: sqlite3.Cursor, data: RSSData, now_str: str
+    ) -> Tuple[int, int]:
+        """
+        逐条写入 RSS 条目（单条失败不影响其他条目）
+
+        Args:
+            cursor: 数据库游标
+            data: RSS 数据
+            now_str: 当前时间字符串
+
+        Returns:
+            (新增数, 更新数) 元组
+        """
+        new_count = 0
+        updated_count = 0
+
+        for feed_id, rss_list in data.items.items():
+            for item in rss_list:
+                try:
+                    # 检查是否已存在（通过 URL + feed_id）
+                    existing = None
+                    if item.url:
+                        cursor.execute(SELECT_RSS_ITEM_SQL, (item.url, feed_id))
+                        existing = cursor.fetchone()
+
+                    if existing:
+                        cursor.execute(UPDATE_RSS_ITEM_SQL,
+                                       (item.title, item.published_at, item.summary,
+                                        item.author, data.crawl_time, now_str, existing[0]))
+                        updated_count += 1
+                    else:
+                        cursor.execute(INSERT_RSS_ITEM_SQL,
+                                       (item.title, feed_id, item.url or "", item.published_at,
+                                        item.summary, item.author, data.crawl_time,
+                                        data.crawl_time, now_str, now_str))
+                        new_count += 1
+
+                except sqlite3.Error as e:
+                    self._log(f"保存 RSS 条目失败 [{item.title[:30]}...]: {e}")
+
+        return new_count, updated_count
@@ -0,0 +1,49 @@
+# coding=utf-8
+"""
+历史标题查询
+
+新增标题检测只需要知道某个批次之前出现过哪些 (platform_id, title)，
+不需要整天数据与排名历史。这里的查询由 idx_news_platform_first_time 覆盖索引
+（schema.sql 与迁移 v1 创建）支撑，本地与远程后端共用。
+"""
+
+import sqlite3
+from typing import Dict, List, Optional, Set
+
+
+def load_historical_titles(
+    cursor: sqlite3.Cursor,
+    before_time: str,
+    platform_ids: Optional[List[str]] = None,
+) -> Optional[Dict[str, Set[str]]]:
+    """
+    读取首次出现时间早于指定批次的标题
+
+    Args:
+        cursor: 数据库游标
+        before_time: 批次时间（HH-MM），只返回 first_crawl_time < before_time 的标题
+        platform_ids: 平台 ID 列表，None 表示所有平台
+
+    Returns:
+        {platform_id: {title}}（只包含非空集合）；当天没有任何数据时返回 None
+    """
+    cursor.execute("SELECT 1 FROM news_items LIMIT 1")
+    if cursor.fetchone() is None:
+        return None
+
+    query = """
+        SELECT DISTINCT platform_id, title FROM news_items
+        WHERE first_crawl_time < ?
+    """
+    params: List[str] = [before_time]
+    if platform_ids is not None:
+        if not platform_ids:
+            return {}
+        placeholders = ",".join("?" * len(platform_ids))
+        query += f" AND platform_id IN ({placeholders})"
+        params.extend(platform_ids)
+
+    historical_titles: Dict[str, Set[str]] = {}
+    for platform_id, title in cursor.execute(query, params):
+        historical_titles.setdefault(platform_id, set()).add(title)
+    return historical_titles